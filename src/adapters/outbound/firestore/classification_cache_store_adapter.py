@@ -0,0 +1,52 @@
+import datetime
+
+import google.api_core.exceptions as google_api_exceptions
+import google.cloud.firestore as google_cloud_firestore
+
+import src.adapters.outbound.firestore.errors as firestore_errors
+import src.adapters.outbound.firestore.paths as firestore_paths
+import src.ports.classification_cache_store_port as classification_cache_store_port
+
+
+class FirestoreClassificationCacheStoreAdapter(
+    classification_cache_store_port.ClassificationCacheStorePort
+):
+    def __init__(self, client: google_cloud_firestore.Client) -> None:
+        self._client = client
+
+    def get(self, cache_key: str, now: datetime.datetime) -> str | None:
+        cache_document = firestore_paths.classification_cache_document(self._client, cache_key)
+        try:
+            snapshot = cache_document.get()
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read classification cache entry from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read classification cache entry from firestore"
+            ) from error
+        if not snapshot.exists:
+            return None
+        cache_data = snapshot.to_dict() or {}
+        value = cache_data.get("value")
+        expires_at = cache_data.get("expires_at")
+        # TTL deletion is lazy, so expired documents can still be read for a while.
+        if not isinstance(value, str) or not isinstance(expires_at, datetime.datetime):
+            return None
+        if expires_at <= now:
+            return None
+        return value
+
+    def put(self, cache_key: str, value: str, expires_at: datetime.datetime) -> None:
+        cache_document = firestore_paths.classification_cache_document(self._client, cache_key)
+        try:
+            cache_document.set({"value": value, "expires_at": expires_at})
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to save classification cache entry in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to save classification cache entry in firestore"
+            ) from error
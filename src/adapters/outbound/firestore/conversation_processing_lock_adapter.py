@@ -12,6 +12,7 @@ class FirestoreConversationProcessingLockAdapter(
     conversation_processing_lock_port.ConversationProcessingLockPort
 ):
     _lock_timeout_seconds = 120
+    _retention_seconds = 24 * 60 * 60
 
     def __init__(self, client: google_cloud_firestore.Client) -> None:
         self._client = client
@@ -34,6 +35,7 @@ class FirestoreConversationProcessingLockAdapter(
             "holder_id": holder_id,
             "status": "LOCKED",
             "acquired_at": acquired_at,
+            "expires_at": acquired_at + datetime.timedelta(seconds=self._retention_seconds),
         }
         lock_expiration_time = acquired_at - datetime.timedelta(seconds=self._lock_timeout_seconds)
         transaction = self._client.transaction()
@@ -83,6 +85,7 @@ class FirestoreConversationProcessingLockAdapter(
         tenant_id: str,
         conversation_id: str,
         holder_id: str,
+        released_at: datetime.datetime,
     ) -> None:
         lock_document = firestore_paths.tenant_conversation_processing_lock_document(
             self._client,
@@ -92,6 +95,7 @@ class FirestoreConversationProcessingLockAdapter(
         release_data: dict[str, object] = {
             "status": "RELEASED",
             "holder_id": holder_id,
+            "expires_at": released_at + datetime.timedelta(seconds=self._retention_seconds),
         }
         try:
             lock_document.set(release_data, merge=True)
@@ -103,3 +107,34 @@ class FirestoreConversationProcessingLockAdapter(
             raise firestore_errors.FirestoreRepositoryError(
                 "failed to release conversation processing lock in firestore"
             ) from error
+
+    def delete_expired(self, now: datetime.datetime, limit: int) -> int:
+        deleted_count = 0
+        try:
+            bulk_writer = self._client.bulk_writer()
+            for tenant_document in firestore_paths.tenants_collection(
+                self._client
+            ).list_documents():
+                if deleted_count >= limit:
+                    break
+                expired_locks_query = (
+                    tenant_document.collection(
+                        firestore_paths.CONVERSATION_PROCESSING_LOCKS_COLLECTION
+                    )
+                    .where("expires_at", "<=", now)
+                    .select([])
+                    .limit(limit - deleted_count)
+                )
+                for snapshot in expired_locks_query.stream():
+                    bulk_writer.delete(snapshot.reference)
+                    deleted_count += 1
+            bulk_writer.close()  # type: ignore
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to delete expired conversation processing locks from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to delete expired conversation processing locks from firestore"
+            ) from error
+        return deleted_count
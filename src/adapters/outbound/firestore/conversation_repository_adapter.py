@@ -1,20 +1,59 @@
+import datetime
+import gzip
+
 import google.api_core.exceptions as google_api_exceptions
 import google.cloud.firestore as google_cloud_firestore
+import pydantic
 
 import src.adapters.outbound.firestore.errors as firestore_errors
 import src.adapters.outbound.firestore.model_mapper as firestore_model_mapper
 import src.adapters.outbound.firestore.paths as firestore_paths
+import src.adapters.outbound.firestore.unit_of_work_adapter as firestore_unit_of_work_adapter
 import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.conversation_summary as conversation_summary_entity
 import src.domain.entities.message as message_entity
+import src.domain.entities.message_search_posting as message_search_posting_entity
 import src.domain.entities.whatsapp_user as whatsapp_user_entity
+import src.infra.logs as app_logs
+import src.ports.background_task_runner_port as background_task_runner_port
 import src.ports.conversation_repository_port as conversation_repository_port
+import src.services.message_search_tokenizer as message_search_tokenizer
+
+logger = app_logs.get_logger(__name__)
 
 
 class FirestoreConversationRepositoryAdapter(
     conversation_repository_port.ConversationRepositoryPort
 ):
-    def __init__(self, client: google_cloud_firestore.Client) -> None:
+    _max_batch_size = 500
+    _gzip_json_encoding = "gzip+json"
+    _json_encoding = "json"
+    _summary_field_names = frozenset(
+        {
+            "id",
+            "tenant_id",
+            "whatsapp_user_id",
+            "last_message_preview",
+            "updated_at",
+            "control_mode",
+        }
+    )
+    _summary_identity_field_names = frozenset({"id", "tenant_id", "whatsapp_user_id"})
+    _summaries_projection_name = "conversation_summaries"
+    _document_id_field_path = "__name__"
+
+    def __init__(
+        self,
+        client: google_cloud_firestore.Client,
+        unit_of_work: firestore_unit_of_work_adapter.FirestoreUnitOfWorkAdapter | None = None,
+        compress_subsessions: bool = True,
+        search_index_runner: background_task_runner_port.BackgroundTaskRunnerPort | None = None,
+    ) -> None:
         self._client = client
+        self._unit_of_work = unit_of_work
+        self._compress_subsessions = compress_subsessions
+        self._search_index_runner = search_index_runner
+        self._summaries_backfilled_tenant_ids: set[str] = set()
 
     def save_whatsapp_user(self, whatsapp_user: whatsapp_user_entity.WhatsappUser) -> None:
         whatsapp_user_document = firestore_paths.tenant_whatsapp_user_document(
@@ -23,6 +62,10 @@ class FirestoreConversationRepositoryAdapter(
             whatsapp_user.id,
         )
         whatsapp_user_data = firestore_model_mapper.model_to_document(whatsapp_user)
+        pending_batch = self._current_batch()
+        if pending_batch is not None:
+            pending_batch.set(whatsapp_user_document, whatsapp_user_data)
+            return
         try:
             whatsapp_user_document.set(whatsapp_user_data)
         except google_api_exceptions.GoogleAPICallError as error:
@@ -71,33 +114,79 @@ class FirestoreConversationRepositoryAdapter(
             conversation.tenant_id,
             conversation.id,
         )
-        conversation_lookup_document = firestore_paths.tenant_conversation_lookup_document(
+        conversation_summary_document = firestore_paths.tenant_conversation_summary_document(
             self._client,
             conversation.tenant_id,
-            conversation.whatsapp_user_id,
+            conversation.id,
         )
-        conversation_copy = conversation.model_copy(deep=True)
-        existing_conversation = self.get_conversation_by_id(conversation.tenant_id, conversation.id)
-        if existing_conversation is not None:
-            conversation_copy.messages = [
-                message.model_copy(deep=True) for message in existing_conversation.messages
-            ]
-        conversation_data = firestore_model_mapper.model_to_document(conversation_copy)
-        lookup_data: dict[str, str] = {"conversation_id": conversation.id}
-
-        batch = self._client.batch()
-        batch.set(conversation_document, conversation_data)
-        batch.set(conversation_lookup_document, lookup_data)
-        try:
-            batch.commit()
-        except google_api_exceptions.GoogleAPICallError as error:
-            raise firestore_errors.FirestoreRepositoryError(
-                "failed to save conversation in firestore"
-            ) from error
-        except google_api_exceptions.RetryError as error:
-            raise firestore_errors.FirestoreRepositoryError(
-                "failed to save conversation in firestore"
-            ) from error
+        pending_batch = self._current_batch()
+        batch = pending_batch if pending_batch is not None else self._client.batch()
+        if conversation.is_persisted():
+            dirty_field_names = set(conversation.dirty_fields()) - {"messages", "message_seq"}
+            if not dirty_field_names:
+                return
+            conversation_update_data = conversation.model_dump(
+                mode="python",
+                include=dirty_field_names - {"subsessions", "message_ids"},
+            )
+            if "message_ids" in dirty_field_names:
+                appended_message_ids = conversation.appended_message_ids()
+                conversation_update_data["message_ids"] = (
+                    google_cloud_firestore.ArrayUnion(appended_message_ids)
+                    if appended_message_ids is not None
+                    else conversation.message_ids
+                )
+            if "subsessions" in dirty_field_names:
+                self._enlist_subsession_writes(batch, conversation)
+                conversation_update_data["subsessions"] = google_cloud_firestore.DELETE_FIELD
+            batch.update(conversation_document, conversation_update_data)
+            dirty_summary_field_names = dirty_field_names & self._summary_field_names
+            if dirty_summary_field_names:
+                summary_data = firestore_model_mapper.model_to_document(conversation.to_summary())
+                if self._is_summary_projection_backfilled(conversation.tenant_id):
+                    # Merge only what this entity changed so a stale copy cannot clobber fields
+                    # another writer updated; identity fields are immutable.
+                    summary_data = {
+                        field_name: summary_data[field_name]
+                        for field_name in dirty_summary_field_names
+                        | self._summary_identity_field_names
+                    }
+                # Before the backfill the summary doc may not exist, so it gets every field.
+                batch.set(conversation_summary_document, summary_data, merge=True)
+        else:
+            conversation_lookup_document = firestore_paths.tenant_conversation_lookup_document(
+                self._client,
+                conversation.tenant_id,
+                conversation.whatsapp_user_id,
+            )
+            lookup_data: dict[str, str] = {"conversation_id": conversation.id}
+            conversation_fields_data = firestore_model_mapper.model_to_document(conversation)
+            conversation_fields_data.pop("messages", None)
+            conversation_fields_data.pop("message_seq", None)
+            conversation_fields_data.pop("subsessions", None)
+            batch.set(
+                conversation_document,
+                conversation_fields_data,
+                merge=list(conversation_fields_data.keys()),
+            )
+            batch.set(conversation_lookup_document, lookup_data)
+            batch.set(
+                conversation_summary_document,
+                firestore_model_mapper.model_to_document(conversation.to_summary()),
+            )
+            self._enlist_subsession_writes(batch, conversation)
+        if pending_batch is None:
+            try:
+                batch.commit()
+            except google_api_exceptions.GoogleAPICallError as error:
+                raise firestore_errors.FirestoreRepositoryError(
+                    "failed to save conversation in firestore"
+                ) from error
+            except google_api_exceptions.RetryError as error:
+                raise firestore_errors.FirestoreRepositoryError(
+                    "failed to save conversation in firestore"
+                ) from error
+        conversation.mark_persisted()
 
     def get_conversation_by_whatsapp_user(
         self,
@@ -164,6 +253,7 @@ class FirestoreConversationRepositoryAdapter(
         )
         if conversation.tenant_id != tenant_id:
             return None
+        conversation.mark_persisted()
         return conversation
 
     def list_conversations(self, tenant_id: str) -> list[conversation_entity.Conversation]:
@@ -193,76 +283,378 @@ class FirestoreConversationRepositoryAdapter(
                 "conversation",
             )
             if conversation.tenant_id == tenant_id:
+                conversation.mark_persisted()
                 conversations.append(conversation)
         return conversations
 
+    def list_conversation_summaries(
+        self,
+        tenant_id: str,
+        limit: int | None = None,
+        after_updated_at: datetime.datetime | None = None,
+        after_conversation_id: str | None = None,
+    ) -> list[conversation_summary_entity.ConversationSummary]:
+        self._ensure_conversation_summaries_backfilled(tenant_id)
+        summaries_query = (
+            firestore_paths.tenant_conversation_summaries_collection(self._client, tenant_id)
+            .order_by("updated_at", direction=google_cloud_firestore.Query.DESCENDING)
+            .order_by(
+                self._document_id_field_path,
+                direction=google_cloud_firestore.Query.DESCENDING,
+            )
+        )
+        if after_updated_at is not None:
+            cursor_values: dict[str, object] = {"updated_at": after_updated_at}
+            if after_conversation_id is not None:
+                cursor_values[self._document_id_field_path] = after_conversation_id
+            summaries_query = summaries_query.start_after(cursor_values)
+        if limit is not None:
+            summaries_query = summaries_query.limit(limit)
+        return self._stream_conversation_summaries(summaries_query)
+
+    def list_changed_conversation_summaries(
+        self,
+        tenant_id: str,
+        limit: int,
+        after_updated_at: datetime.datetime,
+        after_conversation_id: str | None = None,
+    ) -> list[conversation_summary_entity.ConversationSummary]:
+        self._ensure_conversation_summaries_backfilled(tenant_id)
+        cursor_values: dict[str, object] = {"updated_at": after_updated_at}
+        if after_conversation_id is not None:
+            cursor_values[self._document_id_field_path] = after_conversation_id
+        changed_summaries_query = (
+            firestore_paths.tenant_conversation_summaries_collection(self._client, tenant_id)
+            .order_by("updated_at", direction=google_cloud_firestore.Query.ASCENDING)
+            .order_by(
+                self._document_id_field_path,
+                direction=google_cloud_firestore.Query.ASCENDING,
+            )
+            .start_after(cursor_values)
+            .limit(limit)
+        )
+        return self._stream_conversation_summaries(changed_summaries_query)
+
     def save_message(self, message: message_entity.Message) -> None:
+        message_document = firestore_paths.conversation_message_document(
+            self._client,
+            message.tenant_id,
+            message.conversation_id,
+            message.id,
+        )
         conversation_document = firestore_paths.tenant_conversation_document(
             self._client,
             message.tenant_id,
             message.conversation_id,
         )
-        transaction = self._client.transaction()
-
-        @google_cloud_firestore.transactional  # type: ignore
-        def _append_message(
-            current_transaction: google_cloud_firestore.Transaction,
-        ) -> None:
-            snapshot = conversation_document.get(transaction=current_transaction)
-            if not snapshot.exists:
-                raise firestore_errors.FirestoreRepositoryError(
-                    "conversation not found in firestore for message"
-                )
-            conversation_raw_data = snapshot.to_dict()
-            if conversation_raw_data is None:
-                raise firestore_errors.FirestoreRepositoryError(
-                    "conversation not found in firestore for message"
+        message_data = firestore_model_mapper.model_to_document(message)
+        message_seq_data = {"message_seq": google_cloud_firestore.Increment(1)}
+        pending_batch = self._current_batch()
+        if pending_batch is not None:
+            pending_batch.create(message_document, message_data)
+            pending_batch.update(conversation_document, message_seq_data)
+            self._index_message_for_search(message)
+            return
+        batch = self._client.batch()
+        batch.create(message_document, message_data)
+        batch.update(conversation_document, message_seq_data)
+        try:
+            batch.commit()
+        except google_api_exceptions.AlreadyExists:
+            return
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to save message in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to save message in firestore"
+            ) from error
+        self._index_message_for_search(message)
+
+    def list_messages(self, tenant_id: str, conversation_id: str) -> list[message_entity.Message]:
+        legacy_messages = self._get_legacy_messages(tenant_id, conversation_id)
+        if legacy_messages is None:
+            return []
+        return self._list_all_messages(tenant_id, conversation_id, legacy_messages)
+
+    def has_message_with_provider_message_id(
+        self, tenant_id: str, conversation_id: str, provider_message_id: str
+    ) -> bool:
+        # Legacy embedded messages are checked by callers on the conversation they already loaded.
+        provider_message_query = (
+            firestore_paths.conversation_messages_collection(
+                self._client,
+                tenant_id,
+                conversation_id,
+            )
+            .where("provider_message_id", "==", provider_message_id)
+            .select([])
+            .limit(1)
+        )
+        try:
+            return any(True for _ in provider_message_query.stream())
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to look up message by provider id in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to look up message by provider id in firestore"
+            ) from error
+
+    def list_recent_messages(
+        self, tenant_id: str, conversation_id: str, limit: int
+    ) -> list[message_entity.Message]:
+        if limit <= 0:
+            return []
+        legacy_messages = self._get_legacy_messages(tenant_id, conversation_id)
+        if legacy_messages is None:
+            return []
+        if legacy_messages:
+            return self._list_all_messages(tenant_id, conversation_id, legacy_messages)[-limit:]
+        recent_messages_query = (
+            firestore_paths.conversation_messages_collection(
+                self._client,
+                tenant_id,
+                conversation_id,
+            )
+            .order_by("created_at", direction=google_cloud_firestore.Query.DESCENDING)
+            .limit(limit)
+        )
+        recent_messages: list[message_entity.Message] = []
+        try:
+            for snapshot in recent_messages_query.stream():
+                message_raw_data = snapshot.to_dict()
+                if message_raw_data is None:
+                    continue
+                recent_messages.append(
+                    firestore_model_mapper.parse_document(
+                        message_raw_data,
+                        message_entity.Message,
+                        "message",
+                    )
                 )
-            conversation = firestore_model_mapper.parse_document(
-                conversation_raw_data,
-                conversation_entity.Conversation,
-                "conversation",
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list recent messages from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list recent messages from firestore"
+            ) from error
+        recent_messages.reverse()
+        return recent_messages
+
+    def list_messages_page(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        limit: int,
+        before_created_at: datetime.datetime | None = None,
+        before_message_id: str | None = None,
+        after_created_at: datetime.datetime | None = None,
+        after_message_id: str | None = None,
+    ) -> list[message_entity.Message]:
+        if limit <= 0:
+            return []
+        legacy_messages = self._get_legacy_messages(tenant_id, conversation_id)
+        if legacy_messages is None:
+            return []
+        if legacy_messages:
+            # Conversations written before the subcollection are paged in memory.
+            messages = sorted(
+                self._list_all_messages(tenant_id, conversation_id, legacy_messages),
+                key=lambda item: (item.created_at, item.id),
             )
-            if conversation.tenant_id != message.tenant_id:
-                raise firestore_errors.FirestoreRepositoryError(
-                    "conversation tenant mismatch in firestore for message"
+            if after_created_at is not None:
+                after_key = (after_created_at, after_message_id or "")
+                return [
+                    message for message in messages if (message.created_at, message.id) > after_key
+                ][:limit]
+            if before_created_at is not None:
+                before_key = (before_created_at, before_message_id or "")
+                messages = [
+                    message for message in messages if (message.created_at, message.id) < before_key
+                ]
+            return messages[-limit:]
+
+        ascending = after_created_at is not None
+        direction = (
+            google_cloud_firestore.Query.ASCENDING
+            if ascending
+            else google_cloud_firestore.Query.DESCENDING
+        )
+        messages_query = (
+            firestore_paths.conversation_messages_collection(
+                self._client,
+                tenant_id,
+                conversation_id,
+            )
+            .order_by("created_at", direction=direction)
+            .order_by(self._document_id_field_path, direction=direction)
+        )
+        cursor_created_at = after_created_at if ascending else before_created_at
+        cursor_message_id = after_message_id if ascending else before_message_id
+        if cursor_created_at is not None:
+            cursor_values: dict[str, object] = {"created_at": cursor_created_at}
+            if cursor_message_id is not None:
+                cursor_values[self._document_id_field_path] = cursor_message_id
+            messages_query = messages_query.start_after(cursor_values)
+        messages_query = messages_query.limit(limit)
+
+        page_messages: list[message_entity.Message] = []
+        try:
+            for snapshot in messages_query.stream():
+                message_raw_data = snapshot.to_dict()
+                if message_raw_data is None:
+                    continue
+                page_messages.append(
+                    firestore_model_mapper.parse_document(
+                        message_raw_data,
+                        message_entity.Message,
+                        "message",
+                    )
                 )
-            updated_conversation = conversation.model_copy(deep=True)
-            updated_conversation.messages.append(message.model_copy(deep=True))
-            conversation_data = firestore_model_mapper.model_to_document(updated_conversation)
-            current_transaction.set(conversation_document, conversation_data, merge=False)
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list messages page from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list messages page from firestore"
+            ) from error
+        if not ascending:
+            page_messages.reverse()
+        return page_messages
 
+    def get_message_seq(self, tenant_id: str, conversation_id: str) -> int:
+        conversation_document = firestore_paths.tenant_conversation_document(
+            self._client,
+            tenant_id,
+            conversation_id,
+        )
         try:
-            _append_message(transaction)
+            snapshot = conversation_document.get(field_paths=["tenant_id", "message_seq"])
         except google_api_exceptions.GoogleAPICallError as error:
             raise firestore_errors.FirestoreRepositoryError(
-                "failed to save message in firestore"
+                "failed to read message sequence from firestore"
             ) from error
         except google_api_exceptions.RetryError as error:
             raise firestore_errors.FirestoreRepositoryError(
-                "failed to save message in firestore"
+                "failed to read message sequence from firestore"
             ) from error
+        if not snapshot.exists:
+            return 0
+        conversation_raw_data = snapshot.to_dict()
+        if conversation_raw_data is None or conversation_raw_data.get("tenant_id") != tenant_id:
+            return 0
+        message_seq_value = conversation_raw_data.get("message_seq", 0)
+        if not isinstance(message_seq_value, int):
+            raise firestore_errors.FirestoreRepositoryError(
+                "invalid message sequence format in firestore"
+            )
+        return message_seq_value
 
-    def list_messages(self, tenant_id: str, conversation_id: str) -> list[message_entity.Message]:
+    def list_subsessions(
+        self, tenant_id: str, conversation_id: str
+    ) -> list[conversation_entity.ConversationSubsession]:
         conversation = self.get_conversation_by_id(tenant_id, conversation_id)
         if conversation is None:
             return []
-        return [message.model_copy(deep=True) for message in conversation.messages]
+        if conversation.subsessions:
+            return conversation.subsessions
+        subsessions_query = firestore_paths.conversation_subsessions_collection(
+            self._client,
+            tenant_id,
+            conversation_id,
+        ).order_by("position")
+        subsessions: list[conversation_entity.ConversationSubsession] = []
+        try:
+            for snapshot in subsessions_query.stream():
+                subsession_raw_data = snapshot.to_dict()
+                if subsession_raw_data is None:
+                    continue
+                subsessions.append(self._subsession_from_document(subsession_raw_data))
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list conversation subsessions from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list conversation subsessions from firestore"
+            ) from error
+        return subsessions
+
+    def get_latest_subsession(
+        self, tenant_id: str, conversation_id: str
+    ) -> conversation_entity.ConversationSubsession | None:
+        # Legacy embedded subsessions are read by callers from the conversation they loaded.
+        latest_subsession_query = (
+            firestore_paths.conversation_subsessions_collection(
+                self._client,
+                tenant_id,
+                conversation_id,
+            )
+            .order_by("position", direction=google_cloud_firestore.Query.DESCENDING)
+            .limit(1)
+        )
+        try:
+            for snapshot in latest_subsession_query.stream():
+                subsession_raw_data = snapshot.to_dict()
+                if subsession_raw_data is None:
+                    continue
+                return self._subsession_from_document(subsession_raw_data)
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read latest conversation subsession from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read latest conversation subsession from firestore"
+            ) from error
+        return None
 
     def delete_messages(self, tenant_id: str, conversation_id: str) -> None:
-        conversation = self.get_conversation_by_id(tenant_id, conversation_id)
-        if conversation is None:
+        legacy_messages = self._read_legacy_messages(tenant_id, conversation_id)
+        if legacy_messages is None:
             return
-        updated_conversation = conversation.model_copy(deep=True)
-        updated_conversation.messages = []
         conversation_document = firestore_paths.tenant_conversation_document(
             self._client,
             tenant_id,
             conversation_id,
         )
-        conversation_data = firestore_model_mapper.model_to_document(updated_conversation)
+        messages_collection = firestore_paths.conversation_messages_collection(
+            self._client,
+            tenant_id,
+            conversation_id,
+        )
         try:
-            conversation_document.set(conversation_data, merge=False)
+            deleted_references: list[google_cloud_firestore.DocumentReference] = []
+            for snapshot in messages_collection.select(["content"]).stream():
+                deleted_references.append(snapshot.reference)
+                message_raw_data = snapshot.to_dict() or {}
+                message_content = message_raw_data.get("content")
+                if not isinstance(message_content, str):
+                    continue
+                for term in message_search_tokenizer.count_index_terms(message_content):
+                    deleted_references.append(
+                        firestore_paths.tenant_message_search_posting_document(
+                            self._client,
+                            tenant_id,
+                            term,
+                            snapshot.id,
+                        )
+                    )
+            for chunk_start in range(0, len(deleted_references), self._max_batch_size):
+                batch = self._client.batch()
+                for deleted_reference in deleted_references[
+                    chunk_start : chunk_start + self._max_batch_size
+                ]:
+                    batch.delete(deleted_reference)
+                batch.commit()
+            if legacy_messages:
+                conversation_document.update({"messages": []})
         except google_api_exceptions.GoogleAPICallError as error:
             raise firestore_errors.FirestoreRepositoryError(
                 "failed to delete messages from firestore"
@@ -271,3 +663,491 @@ class FirestoreConversationRepositoryAdapter(
             raise firestore_errors.FirestoreRepositoryError(
                 "failed to delete messages from firestore"
             ) from error
+
+    def search_message_postings(
+        self, tenant_id: str, terms: list[str], limit_per_term: int
+    ) -> list[message_search_posting_entity.MessageSearchPosting]:
+        postings: list[message_search_posting_entity.MessageSearchPosting] = []
+        try:
+            for term in terms:
+                postings_query = (
+                    firestore_paths.tenant_message_search_postings_collection(
+                        self._client,
+                        tenant_id,
+                        term,
+                    )
+                    .order_by("created_at", direction=google_cloud_firestore.Query.DESCENDING)
+                    .limit(limit_per_term)
+                )
+                for snapshot in postings_query.stream():
+                    posting_raw_data = snapshot.to_dict()
+                    if posting_raw_data is None:
+                        continue
+                    postings.append(
+                        firestore_model_mapper.parse_document(
+                            posting_raw_data,
+                            message_search_posting_entity.MessageSearchPosting,
+                            "message search posting",
+                        )
+                    )
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to search message postings in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to search message postings in firestore"
+            ) from error
+        return postings
+
+    def list_messages_by_ids(
+        self, tenant_id: str, message_keys: list[tuple[str, str]]
+    ) -> list[message_entity.Message]:
+        if not message_keys:
+            return []
+        message_references = [
+            firestore_paths.conversation_message_document(
+                self._client,
+                tenant_id,
+                conversation_id,
+                message_id,
+            )
+            for conversation_id, message_id in message_keys
+        ]
+        try:
+            snapshot_by_path = {
+                snapshot.reference.path: snapshot
+                for snapshot in self._client.get_all(message_references)
+            }
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read messages from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read messages from firestore"
+            ) from error
+
+        messages: list[message_entity.Message] = []
+        for message_reference in message_references:
+            snapshot = snapshot_by_path.get(message_reference.path)
+            if snapshot is None or not snapshot.exists:
+                continue
+            message_raw_data = snapshot.to_dict()
+            if message_raw_data is None or message_raw_data.get("tenant_id") != tenant_id:
+                continue
+            messages.append(
+                firestore_model_mapper.parse_document(
+                    message_raw_data,
+                    message_entity.Message,
+                    "message",
+                )
+            )
+        return messages
+
+    def _list_all_messages(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        legacy_messages: list[message_entity.Message],
+    ) -> list[message_entity.Message]:
+        messages_query = firestore_paths.conversation_messages_collection(
+            self._client,
+            tenant_id,
+            conversation_id,
+        ).order_by("created_at")
+        messages_by_id: dict[str, message_entity.Message] = {
+            message.id: message for message in legacy_messages
+        }
+        try:
+            for snapshot in messages_query.stream():
+                message_raw_data = snapshot.to_dict()
+                if message_raw_data is None:
+                    continue
+                message = firestore_model_mapper.parse_document(
+                    message_raw_data,
+                    message_entity.Message,
+                    "message",
+                )
+                messages_by_id[message.id] = message
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list messages from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list messages from firestore"
+            ) from error
+        if not legacy_messages:
+            return list(messages_by_id.values())
+        # Conversations written before the subcollection still carry embedded messages.
+        return sorted(messages_by_id.values(), key=lambda item: item.created_at)
+
+    def _get_legacy_messages(
+        self, tenant_id: str, conversation_id: str
+    ) -> list[message_entity.Message] | None:
+        legacy_messages = self._read_legacy_messages(tenant_id, conversation_id)
+        if legacy_messages and self._migrate_legacy_messages(
+            tenant_id, conversation_id, legacy_messages
+        ):
+            return []
+        return legacy_messages
+
+    def _read_legacy_messages(
+        self, tenant_id: str, conversation_id: str
+    ) -> list[message_entity.Message] | None:
+        # Field mask: windowed reads only need to know whether embedded messages still exist.
+        conversation_document = firestore_paths.tenant_conversation_document(
+            self._client,
+            tenant_id,
+            conversation_id,
+        )
+        try:
+            snapshot = conversation_document.get(field_paths=["tenant_id", "messages"])
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read conversation from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read conversation from firestore"
+            ) from error
+        if not snapshot.exists:
+            return None
+        conversation_raw_data = snapshot.to_dict()
+        if conversation_raw_data is None or conversation_raw_data.get("tenant_id") != tenant_id:
+            return None
+        legacy_messages_value = conversation_raw_data.get("messages") or []
+        if not isinstance(legacy_messages_value, list):
+            raise firestore_errors.FirestoreRepositoryError(
+                "invalid conversation messages format in firestore"
+            )
+        return [
+            firestore_model_mapper.parse_document(
+                message_raw_data, message_entity.Message, "message"
+            )
+            for message_raw_data in legacy_messages_value
+        ]
+
+    def _migrate_legacy_messages(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        legacy_messages: list[message_entity.Message],
+    ) -> bool:
+        # Lazy migration: the first read of a conversation that still embeds messages copies
+        # them into the subcollection and drops the embedded field. The field is only dropped
+        # in the last batch, so a failed run is retried by the next read.
+        conversation_document = firestore_paths.tenant_conversation_document(
+            self._client,
+            tenant_id,
+            conversation_id,
+        )
+        messages_collection = firestore_paths.conversation_messages_collection(
+            self._client,
+            tenant_id,
+            conversation_id,
+        )
+        try:
+            stored_message_ids = {
+                snapshot.id for snapshot in messages_collection.select([]).stream()
+            }
+            migrated_messages = [
+                message for message in legacy_messages if message.id not in stored_message_ids
+            ]
+            for chunk_start in range(0, len(migrated_messages), self._max_batch_size):
+                batch = self._client.batch()
+                for message in migrated_messages[chunk_start : chunk_start + self._max_batch_size]:
+                    batch.set(
+                        firestore_paths.conversation_message_document(
+                            self._client,
+                            tenant_id,
+                            conversation_id,
+                            message.id,
+                        ),
+                        firestore_model_mapper.model_to_document(message),
+                    )
+                batch.commit()
+            conversation_document.update({"messages": google_cloud_firestore.DELETE_FIELD})
+        except (
+            google_api_exceptions.GoogleAPICallError,
+            google_api_exceptions.RetryError,
+        ) as error:
+            logger.warning(
+                "conversation.legacy_messages_migration_failed",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="conversation.legacy_messages_migration_failed",
+                        message="embedded messages kept on the conversation, migration retried on next read",
+                        data={
+                            "tenant_id": tenant_id,
+                            "conversation_id": conversation_id,
+                            "legacy_message_count": len(legacy_messages),
+                            "error_message": str(error),
+                        },
+                    )
+                },
+            )
+            return False
+        for message in migrated_messages:
+            self._index_message_for_search(message)
+        return True
+
+    def _index_message_for_search(self, message: message_entity.Message) -> None:
+        # Postings are written in their own batch off the webhook hot path. A posting may land
+        # before its message commits; search hydrates through list_messages_by_ids, which skips
+        # messages that do not exist. The message is already saved at this point, so an indexing
+        # failure is logged rather than raised to the caller.
+        def write_postings() -> None:
+            try:
+                self._write_search_postings(message)
+            except firestore_errors.FirestoreRepositoryError as error:
+                logger.warning(
+                    "conversation_search.index_failed",
+                    extra={
+                        "event_data": app_logs.build_log_event(
+                            event_name="conversation_search.index_failed",
+                            message="message saved but its search postings were not written",
+                            data={
+                                "tenant_id": message.tenant_id,
+                                "conversation_id": message.conversation_id,
+                                "message_id": message.id,
+                                "error_message": str(error),
+                            },
+                        )
+                    },
+                )
+
+        if self._search_index_runner is not None and self._search_index_runner.submit(
+            f"{message.tenant_id}:{message.conversation_id}:{message.id}",
+            write_postings,
+        ):
+            return
+        write_postings()
+
+    def _write_search_postings(self, message: message_entity.Message) -> None:
+        search_posting_writes = self._build_search_posting_writes(message)
+        try:
+            for chunk_start in range(0, len(search_posting_writes), self._max_batch_size):
+                batch = self._client.batch()
+                for posting_document, posting_data in search_posting_writes[
+                    chunk_start : chunk_start + self._max_batch_size
+                ]:
+                    batch.set(posting_document, posting_data)
+                batch.commit()
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to index message for search in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to index message for search in firestore"
+            ) from error
+
+    def _build_search_posting_writes(
+        self, message: message_entity.Message
+    ) -> list[tuple[google_cloud_firestore.DocumentReference, dict[str, object]]]:
+        search_posting_writes: list[
+            tuple[google_cloud_firestore.DocumentReference, dict[str, object]]
+        ] = []
+        for term, term_frequency in message_search_tokenizer.count_index_terms(
+            message.content
+        ).items():
+            posting = message_search_posting_entity.MessageSearchPosting(
+                term=term,
+                tenant_id=message.tenant_id,
+                conversation_id=message.conversation_id,
+                message_id=message.id,
+                created_at=message.created_at,
+                term_frequency=term_frequency,
+            )
+            search_posting_writes.append(
+                (
+                    firestore_paths.tenant_message_search_posting_document(
+                        self._client,
+                        message.tenant_id,
+                        term,
+                        message.id,
+                    ),
+                    firestore_model_mapper.model_to_document(posting),
+                )
+            )
+        return search_posting_writes
+
+    def _stream_conversation_summaries(
+        self,
+        summaries_query: google_cloud_firestore.Query,
+    ) -> list[conversation_summary_entity.ConversationSummary]:
+        try:
+            snapshots = list(summaries_query.stream())
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list conversation summaries from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to list conversation summaries from firestore"
+            ) from error
+
+        summaries: list[conversation_summary_entity.ConversationSummary] = []
+        for snapshot in snapshots:
+            summary_raw_data = snapshot.to_dict()
+            if summary_raw_data is None:
+                continue
+            summaries.append(
+                firestore_model_mapper.parse_document(
+                    summary_raw_data,
+                    conversation_summary_entity.ConversationSummary,
+                    "conversation summary",
+                )
+            )
+        return summaries
+
+    def _is_summary_projection_backfilled(self, tenant_id: str) -> bool:
+        if tenant_id in self._summaries_backfilled_tenant_ids:
+            return True
+        backfill_document = firestore_paths.tenant_projection_backfill_document(
+            self._client,
+            tenant_id,
+            self._summaries_projection_name,
+        )
+        try:
+            backfill_exists = bool(backfill_document.get().exists)
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read conversation summary backfill from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read conversation summary backfill from firestore"
+            ) from error
+        if backfill_exists:
+            self._summaries_backfilled_tenant_ids.add(tenant_id)
+        return backfill_exists
+
+    def _ensure_conversation_summaries_backfilled(self, tenant_id: str) -> None:
+        if self._is_summary_projection_backfilled(tenant_id):
+            return
+        backfill_document = firestore_paths.tenant_projection_backfill_document(
+            self._client,
+            tenant_id,
+            self._summaries_projection_name,
+        )
+        conversations_query = firestore_paths.tenant_conversations_collection(
+            self._client,
+            tenant_id,
+        ).select(sorted(self._summary_field_names))
+        try:
+            # Conversations written before the projection existed have no summary yet.
+            # Projections written after the scan started are newer than the scan, so an
+            # existing summary only gets the fields it lacks, never overwritten ones.
+            for snapshot in conversations_query.stream():
+                summary_raw_data = snapshot.to_dict()
+                if summary_raw_data is None:
+                    continue
+                summary = firestore_model_mapper.parse_document(
+                    summary_raw_data,
+                    conversation_summary_entity.ConversationSummary,
+                    "conversation summary",
+                )
+                summary_document = firestore_paths.tenant_conversation_summary_document(
+                    self._client,
+                    tenant_id,
+                    summary.id,
+                )
+                summary_data = firestore_model_mapper.model_to_document(summary)
+                try:
+                    summary_document.create(summary_data)
+                except google_api_exceptions.AlreadyExists:
+                    existing_summary_data = summary_document.get().to_dict() or {}
+                    missing_summary_data = {
+                        field_name: field_value
+                        for field_name, field_value in summary_data.items()
+                        if field_name not in existing_summary_data
+                    }
+                    if missing_summary_data:
+                        summary_document.set(missing_summary_data, merge=True)
+            backfill_document.set({"completed_at": google_cloud_firestore.SERVER_TIMESTAMP})
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to backfill conversation summaries in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to backfill conversation summaries in firestore"
+            ) from error
+        self._summaries_backfilled_tenant_ids.add(tenant_id)
+
+    def _enlist_subsession_writes(
+        self,
+        batch: google_cloud_firestore.WriteBatch,
+        conversation: conversation_entity.Conversation,
+    ) -> None:
+        first_position = conversation.subsessions_count - len(conversation.subsessions)
+        for offset, subsession in enumerate(conversation.subsessions):
+            position = first_position + offset
+            subsession_document = firestore_paths.conversation_subsession_document(
+                self._client,
+                conversation.tenant_id,
+                conversation.id,
+                position,
+            )
+            batch.set(
+                subsession_document,
+                self._subsession_to_document(conversation, position, subsession),
+            )
+
+    def _subsession_to_document(
+        self,
+        conversation: conversation_entity.Conversation,
+        position: int,
+        subsession: conversation_entity.ConversationSubsession,
+    ) -> dict[str, object]:
+        subsession_data: dict[str, object] = {
+            "tenant_id": conversation.tenant_id,
+            "conversation_id": conversation.id,
+            "position": position,
+            "archived_at": subsession.archived_at,
+            "scheduling_request_id": subsession.scheduling_request_id,
+        }
+        if self._compress_subsessions:
+            subsession_data["encoding"] = self._gzip_json_encoding
+            subsession_data["payload"] = gzip.compress(subsession.model_dump_json().encode("utf-8"))
+            return subsession_data
+        subsession_data["encoding"] = self._json_encoding
+        subsession_data["subsession"] = firestore_model_mapper.model_to_document(subsession)
+        return subsession_data
+
+    def _subsession_from_document(
+        self,
+        subsession_raw_data: dict[str, object],
+    ) -> conversation_entity.ConversationSubsession:
+        if subsession_raw_data.get("encoding") == self._gzip_json_encoding:
+            payload_value = subsession_raw_data.get("payload")
+            if not isinstance(payload_value, bytes):
+                raise firestore_errors.FirestoreRepositoryError(
+                    "invalid conversation subsession format in firestore"
+                )
+            try:
+                return conversation_entity.ConversationSubsession.model_validate_json(
+                    gzip.decompress(payload_value)
+                )
+            except (OSError, pydantic.ValidationError) as error:
+                raise firestore_errors.FirestoreRepositoryError(
+                    "invalid conversation subsession format in firestore"
+                ) from error
+        subsession_value = subsession_raw_data.get("subsession")
+        if not isinstance(subsession_value, dict):
+            raise firestore_errors.FirestoreRepositoryError(
+                "invalid conversation subsession format in firestore"
+            )
+        return firestore_model_mapper.parse_document(
+            subsession_value,
+            conversation_entity.ConversationSubsession,
+            "conversation subsession",
+        )
+
+    def _current_batch(self) -> google_cloud_firestore.WriteBatch | None:
+        if self._unit_of_work is None:
+            return None
+        return self._unit_of_work.current_batch()
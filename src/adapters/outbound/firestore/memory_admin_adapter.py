@@ -71,6 +71,24 @@ class FirestoreMemoryAdminAdapter(memory_admin_port.MemoryAdminPort):
                     tenant_document.collection(firestore_paths.BLACKLIST_ENTRIES_COLLECTION),
                     chunk_size=200,
                 )
+                self._client.recursive_delete(
+                    tenant_document.collection(
+                        firestore_paths.CONVERSATION_PROCESSING_LOCKS_COLLECTION
+                    ),
+                    chunk_size=200,
+                )
+                self._client.recursive_delete(
+                    tenant_document.collection(firestore_paths.CONVERSATION_SUMMARIES_COLLECTION),
+                    chunk_size=200,
+                )
+                self._client.recursive_delete(
+                    tenant_document.collection(firestore_paths.PROJECTION_BACKFILLS_COLLECTION),
+                    chunk_size=200,
+                )
+                self._client.recursive_delete(
+                    tenant_document.collection(firestore_paths.MESSAGE_SEARCH_TERMS_COLLECTION),
+                    chunk_size=200,
+                )
         except google_api_exceptions.GoogleAPICallError as error:
             raise firestore_errors.FirestoreRepositoryError(
                 "failed to reset firestore chat state"
@@ -12,7 +12,12 @@ PATIENTS_COLLECTION = "patients"
 MANUAL_APPOINTMENTS_COLLECTION = "manual_appointments"
 CONVERSATIONS_COLLECTION = "conversations"
 MESSAGES_COLLECTION = "messages"
+SUBSESSIONS_COLLECTION = "subsessions"
 CONVERSATION_LOOKUP_COLLECTION = "conversation_lookup"
+CONVERSATION_SUMMARIES_COLLECTION = "conversation_summaries"
+PROJECTION_BACKFILLS_COLLECTION = "projection_backfills"
+MESSAGE_SEARCH_TERMS_COLLECTION = "message_search_terms"
+POSTINGS_COLLECTION = "postings"
 SCHEDULING_REQUESTS_COLLECTION = "scheduling_requests"
 PROCESSED_WEBHOOK_EVENTS_COLLECTION = "processed_webhook_events"
 BLACKLIST_ENTRIES_COLLECTION = "blacklist_entries"
@@ -26,6 +31,7 @@ WHATSAPP_SIGNUP_STATE_INDEX_COLLECTION = "wa_signup_state"
 GOOGLE_OAUTH_STATE_INDEX_COLLECTION = "google_oauth_state"
 
 REFRESH_TOKENS_COLLECTION = "refresh_tokens"
+CLASSIFICATION_CACHE_COLLECTION = "classification_cache"
 
 
 def _encode_key(value: str) -> str:
@@ -162,6 +168,55 @@ def tenant_conversation_lookup_document(
     )
 
 
+def tenant_conversation_summaries_collection(
+    client: google_cloud_firestore.Client,
+    tenant_id: str,
+) -> google_cloud_firestore.CollectionReference:
+    return tenant_document(client, tenant_id).collection(CONVERSATION_SUMMARIES_COLLECTION)
+
+
+def tenant_conversation_summary_document(
+    client: google_cloud_firestore.Client,
+    tenant_id: str,
+    conversation_id: str,
+) -> google_cloud_firestore.DocumentReference:
+    return tenant_conversation_summaries_collection(client, tenant_id).document(conversation_id)
+
+
+def tenant_projection_backfill_document(
+    client: google_cloud_firestore.Client,
+    tenant_id: str,
+    projection_name: str,
+) -> google_cloud_firestore.DocumentReference:
+    return (
+        tenant_document(client, tenant_id)
+        .collection(PROJECTION_BACKFILLS_COLLECTION)
+        .document(projection_name)
+    )
+
+
+def tenant_message_search_postings_collection(
+    client: google_cloud_firestore.Client,
+    tenant_id: str,
+    term: str,
+) -> google_cloud_firestore.CollectionReference:
+    return (
+        tenant_document(client, tenant_id)
+        .collection(MESSAGE_SEARCH_TERMS_COLLECTION)
+        .document(term)
+        .collection(POSTINGS_COLLECTION)
+    )
+
+
+def tenant_message_search_posting_document(
+    client: google_cloud_firestore.Client,
+    tenant_id: str,
+    term: str,
+    message_id: str,
+) -> google_cloud_firestore.DocumentReference:
+    return tenant_message_search_postings_collection(client, tenant_id, term).document(message_id)
+
+
 def conversation_messages_collection(
     client: google_cloud_firestore.Client,
     tenant_id: str,
@@ -181,6 +236,27 @@ def conversation_message_document(
     return conversation_messages_collection(client, tenant_id, conversation_id).document(message_id)
 
 
+def conversation_subsessions_collection(
+    client: google_cloud_firestore.Client,
+    tenant_id: str,
+    conversation_id: str,
+) -> google_cloud_firestore.CollectionReference:
+    return tenant_conversation_document(client, tenant_id, conversation_id).collection(
+        SUBSESSIONS_COLLECTION
+    )
+
+
+def conversation_subsession_document(
+    client: google_cloud_firestore.Client,
+    tenant_id: str,
+    conversation_id: str,
+    position: int,
+) -> google_cloud_firestore.DocumentReference:
+    return conversation_subsessions_collection(client, tenant_id, conversation_id).document(
+        f"{position:06d}"
+    )
+
+
 def tenant_scheduling_request_document(
     client: google_cloud_firestore.Client,
     tenant_id: str,
@@ -313,3 +389,52 @@ def refresh_token_document(
     jti: str,
 ) -> google_cloud_firestore.DocumentReference:
     return client.collection(REFRESH_TOKENS_COLLECTION).document(jti)
+
+
+def classification_cache_document(
+    client: google_cloud_firestore.Client,
+    cache_key: str,
+) -> google_cloud_firestore.DocumentReference:
+    return client.collection(CLASSIFICATION_CACHE_COLLECTION).document(_encode_key(cache_key))
+
+
+def async_tenant_whatsapp_connection_document(
+    client: google_cloud_firestore.AsyncClient,
+    tenant_id: str,
+) -> google_cloud_firestore.AsyncDocumentReference:
+    connection_document: google_cloud_firestore.AsyncDocumentReference = (
+        client.collection(TENANTS_COLLECTION)
+        .document(tenant_id)
+        .collection(WHATSAPP_CONNECTION_COLLECTION)
+        .document("default")
+    )
+    return connection_document
+
+
+def async_tenant_processed_webhook_event_document(
+    client: google_cloud_firestore.AsyncClient,
+    tenant_id: str,
+    provider_event_id: str,
+) -> google_cloud_firestore.AsyncDocumentReference:
+    event_key = _encode_key(provider_event_id)
+    event_document: google_cloud_firestore.AsyncDocumentReference = (
+        client.collection(TENANTS_COLLECTION)
+        .document(tenant_id)
+        .collection(PROCESSED_WEBHOOK_EVENTS_COLLECTION)
+        .document(event_key)
+    )
+    return event_document
+
+
+def async_whatsapp_phone_index_document(
+    client: google_cloud_firestore.AsyncClient,
+    phone_number_id: str,
+) -> google_cloud_firestore.AsyncDocumentReference:
+    phone_key = _encode_key(phone_number_id)
+    phone_index_document: google_cloud_firestore.AsyncDocumentReference = (
+        client.collection(INDEXES_COLLECTION)
+        .document(WHATSAPP_PHONE_INDEX_COLLECTION)
+        .collection(WHATSAPP_PHONE_INDEX_COLLECTION)
+        .document(phone_key)
+    )
+    return phone_index_document
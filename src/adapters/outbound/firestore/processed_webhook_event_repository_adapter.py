@@ -1,4 +1,6 @@
+import asyncio
 import datetime
+import uuid
 
 import google.api_core.exceptions as google_api_exceptions
 import google.cloud.firestore as google_cloud_firestore
@@ -6,6 +8,7 @@ import google.cloud.firestore as google_cloud_firestore
 import src.adapters.outbound.firestore.errors as firestore_errors
 import src.adapters.outbound.firestore.model_mapper as firestore_model_mapper
 import src.adapters.outbound.firestore.paths as firestore_paths
+import src.adapters.outbound.firestore.unit_of_work_adapter as firestore_unit_of_work_adapter
 import src.domain.entities.processed_webhook_event as processed_webhook_event_entity
 import src.ports.processed_webhook_event_repository_port as processed_webhook_event_repository_port
 
@@ -14,9 +17,21 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
     processed_webhook_event_repository_port.ProcessedWebhookEventRepositoryPort
 ):
     _claim_timeout_seconds = 120
+    _max_batch_size = 500
+    # Meta retries undelivered webhooks for up to 7 days.
+    _retention_seconds = 8 * 24 * 60 * 60
 
-    def __init__(self, client: google_cloud_firestore.Client) -> None:
+    def __init__(
+        self,
+        client: google_cloud_firestore.Client,
+        unit_of_work: firestore_unit_of_work_adapter.FirestoreUnitOfWorkAdapter | None = None,
+        async_client: google_cloud_firestore.AsyncClient | None = None,
+    ) -> None:
         self._client = client
+        self._unit_of_work = unit_of_work
+        self._async_client = async_client
+        # Written on every claim so this instance only ever refreshes or releases its own.
+        self._claim_holder_id = uuid.uuid4().hex
 
     def claim_for_processing(
         self,
@@ -29,15 +44,7 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
             tenant_id,
             provider_event_id,
         )
-        event_data: dict[str, object] = {
-            "tenant_id": tenant_id,
-            "provider_event_id": provider_event_id,
-            "status": "CLAIMED",
-            "claimed_at": claimed_at,
-            "processed_at": None,
-            "failed_at": None,
-            "failure_reason": None,
-        }
+        event_data = self._build_claim_data(tenant_id, provider_event_id, claimed_at)
         claim_expiration_time = claimed_at - datetime.timedelta(seconds=self._claim_timeout_seconds)
         transaction = self._client.transaction()
 
@@ -50,24 +57,9 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
                 current_transaction.create(event_document, event_data)
                 return True
 
-            current_data = snapshot.to_dict()
-            if current_data is None:
-                return False
-
-            current_status = current_data.get("status")
-            if current_status == "FAILED":
+            if self._is_claimable(snapshot.to_dict(), claim_expiration_time):
                 current_transaction.set(event_document, event_data, merge=True)
                 return True
-
-            if current_status == "CLAIMED":
-                claimed_at_value = current_data.get("claimed_at")
-                if (
-                    isinstance(claimed_at_value, datetime.datetime)
-                    and claimed_at_value <= claim_expiration_time
-                ):
-                    current_transaction.set(event_document, event_data, merge=True)
-                    return True
-
             return False
 
         try:
@@ -81,6 +73,44 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
                 "failed to claim processed webhook event in firestore"
             ) from error
 
+    def claim_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        unique_provider_event_ids = list(dict.fromkeys(provider_event_ids))
+        claim_results: dict[str, bool] = {}
+        for chunk_start in range(0, len(unique_provider_event_ids), self._max_batch_size):
+            chunk_provider_event_ids = unique_provider_event_ids[
+                chunk_start : chunk_start + self._max_batch_size
+            ]
+            claim_results.update(self._claim_chunk(tenant_id, chunk_provider_event_ids, claimed_at))
+        return claim_results
+
+    async def aclaim_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        if self._async_client is None:
+            return await asyncio.to_thread(
+                self.claim_many, tenant_id, provider_event_ids, claimed_at
+            )
+        unique_provider_event_ids = list(dict.fromkeys(provider_event_ids))
+        claim_results: dict[str, bool] = {}
+        for chunk_start in range(0, len(unique_provider_event_ids), self._max_batch_size):
+            chunk_provider_event_ids = unique_provider_event_ids[
+                chunk_start : chunk_start + self._max_batch_size
+            ]
+            claim_results.update(
+                await self._aclaim_chunk(
+                    self._async_client, tenant_id, chunk_provider_event_ids, claimed_at
+                )
+            )
+        return claim_results
+
     def mark_processed(
         self,
         tenant_id: str,
@@ -99,7 +129,12 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
             "processed_at": processed_at,
             "failed_at": None,
             "failure_reason": None,
+            "expires_at": self._build_expires_at(processed_at),
         }
+        pending_batch = self._current_batch()
+        if pending_batch is not None:
+            pending_batch.set(event_document, event_data, merge=True)
+            return
         try:
             event_document.set(event_data, merge=True)
         except google_api_exceptions.GoogleAPICallError as error:
@@ -111,6 +146,44 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
                 "failed to mark processed webhook event in firestore"
             ) from error
 
+    def mark_processed_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        processed_at: datetime.datetime,
+    ) -> None:
+        unique_provider_event_ids = list(dict.fromkeys(provider_event_ids))
+        for chunk_start in range(0, len(unique_provider_event_ids), self._max_batch_size):
+            batch = self._client.batch()
+            for provider_event_id in unique_provider_event_ids[
+                chunk_start : chunk_start + self._max_batch_size
+            ]:
+                event_document = firestore_paths.tenant_processed_webhook_event_document(
+                    self._client,
+                    tenant_id,
+                    provider_event_id,
+                )
+                event_data: dict[str, object] = {
+                    "tenant_id": tenant_id,
+                    "provider_event_id": provider_event_id,
+                    "status": "PROCESSED",
+                    "processed_at": processed_at,
+                    "failed_at": None,
+                    "failure_reason": None,
+                    "expires_at": self._build_expires_at(processed_at),
+                }
+                batch.set(event_document, event_data, merge=True)
+            try:
+                batch.commit()
+            except google_api_exceptions.GoogleAPICallError as error:
+                raise firestore_errors.FirestoreRepositoryError(
+                    "failed to mark processed webhook events in firestore"
+                ) from error
+            except google_api_exceptions.RetryError as error:
+                raise firestore_errors.FirestoreRepositoryError(
+                    "failed to mark processed webhook events in firestore"
+                ) from error
+
     def mark_failed(
         self,
         tenant_id: str,
@@ -124,14 +197,25 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
             provider_event_id,
         )
         event_data: dict[str, object] = {
-            "tenant_id": tenant_id,
-            "provider_event_id": provider_event_id,
             "status": "FAILED",
             "failed_at": failed_at,
             "failure_reason": failure_reason,
+            "expires_at": self._build_expires_at(failed_at),
         }
+        transaction = self._client.transaction()
+
+        @google_cloud_firestore.transactional
+        def _mark_failed(current_transaction: google_cloud_firestore.Transaction) -> None:
+            snapshot = event_document.get(transaction=current_transaction)
+            current_data = snapshot.to_dict() if snapshot.exists else None
+            # Only our own in-flight claim may be released; a PROCESSED event or a claim
+            # held by another instance must not become claimable again.
+            if not self._is_own_claim(current_data):
+                return
+            current_transaction.update(event_document, event_data)
+
         try:
-            event_document.set(event_data, merge=True)
+            _mark_failed(transaction)
         except google_api_exceptions.GoogleAPICallError as error:
             raise firestore_errors.FirestoreRepositoryError(
                 "failed to mark failed webhook event in firestore"
@@ -141,6 +225,42 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
                 "failed to mark failed webhook event in firestore"
             ) from error
 
+    def refresh_claim(
+        self,
+        tenant_id: str,
+        provider_event_id: str,
+        claimed_at: datetime.datetime,
+    ) -> bool:
+        event_document = firestore_paths.tenant_processed_webhook_event_document(
+            self._client,
+            tenant_id,
+            provider_event_id,
+        )
+        event_data: dict[str, object] = {
+            "claimed_at": claimed_at,
+            "expires_at": self._build_expires_at(claimed_at),
+        }
+        transaction = self._client.transaction()
+
+        @google_cloud_firestore.transactional
+        def _refresh(current_transaction: google_cloud_firestore.Transaction) -> bool:
+            snapshot = event_document.get(transaction=current_transaction)
+            if not self._is_own_claim(snapshot.to_dict() if snapshot.exists else None):
+                return False
+            current_transaction.update(event_document, event_data)
+            return True
+
+        try:
+            return bool(_refresh(transaction))
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to refresh webhook event claim in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to refresh webhook event claim in firestore"
+            ) from error
+
     def exists(self, tenant_id: str, provider_event_id: str) -> bool:
         event_document = firestore_paths.tenant_processed_webhook_event_document(
             self._client,
@@ -166,6 +286,7 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
             event.provider_event_id,
         )
         event_data = firestore_model_mapper.model_to_document(event)
+        event_data["expires_at"] = self._build_expires_at(event.processed_at)
         try:
             event_document.set(event_data)
         except google_api_exceptions.GoogleAPICallError as error:
@@ -176,3 +297,192 @@ class FirestoreProcessedWebhookEventRepositoryAdapter(
             raise firestore_errors.FirestoreRepositoryError(
                 "failed to save processed webhook event in firestore"
             ) from error
+
+    def delete_expired(self, now: datetime.datetime, limit: int) -> int:
+        deleted_count = 0
+        try:
+            bulk_writer = self._client.bulk_writer()
+            for tenant_document in firestore_paths.tenants_collection(
+                self._client
+            ).list_documents():
+                if deleted_count >= limit:
+                    break
+                expired_events_query = (
+                    tenant_document.collection(firestore_paths.PROCESSED_WEBHOOK_EVENTS_COLLECTION)
+                    .where("expires_at", "<=", now)
+                    .select([])
+                    .limit(limit - deleted_count)
+                )
+                for snapshot in expired_events_query.stream():
+                    bulk_writer.delete(snapshot.reference)
+                    deleted_count += 1
+            bulk_writer.close()  # type: ignore
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to delete expired webhook events from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to delete expired webhook events from firestore"
+            ) from error
+        return deleted_count
+
+    def _build_expires_at(self, value: datetime.datetime) -> datetime.datetime:
+        return value + datetime.timedelta(seconds=self._retention_seconds)
+
+    def _claim_chunk(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        event_documents = {
+            provider_event_id: firestore_paths.tenant_processed_webhook_event_document(
+                self._client,
+                tenant_id,
+                provider_event_id,
+            )
+            for provider_event_id in provider_event_ids
+        }
+        claim_expiration_time = claimed_at - datetime.timedelta(seconds=self._claim_timeout_seconds)
+        transaction = self._client.transaction()
+
+        @google_cloud_firestore.transactional
+        def _claim_all(
+            current_transaction: google_cloud_firestore.Transaction,
+        ) -> dict[str, bool]:
+            snapshot_by_document_id = {
+                snapshot.id: snapshot
+                for snapshot in current_transaction.get_all(list(event_documents.values()))
+            }
+            claim_results: dict[str, bool] = {}
+            for provider_event_id, event_document in event_documents.items():
+                event_data = self._build_claim_data(tenant_id, provider_event_id, claimed_at)
+                snapshot = snapshot_by_document_id.get(event_document.id)
+                if snapshot is None or not snapshot.exists:
+                    current_transaction.create(event_document, event_data)
+                    claim_results[provider_event_id] = True
+                    continue
+                if self._is_claimable(snapshot.to_dict(), claim_expiration_time):
+                    current_transaction.set(event_document, event_data, merge=True)
+                    claim_results[provider_event_id] = True
+                    continue
+                claim_results[provider_event_id] = False
+            return claim_results
+
+        try:
+            return dict(_claim_all(transaction))
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to claim processed webhook events in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to claim processed webhook events in firestore"
+            ) from error
+
+    async def _aclaim_chunk(
+        self,
+        async_client: google_cloud_firestore.AsyncClient,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        event_documents = {
+            provider_event_id: firestore_paths.async_tenant_processed_webhook_event_document(
+                async_client,
+                tenant_id,
+                provider_event_id,
+            )
+            for provider_event_id in provider_event_ids
+        }
+        claim_expiration_time = claimed_at - datetime.timedelta(seconds=self._claim_timeout_seconds)
+        transaction = async_client.transaction()
+
+        @google_cloud_firestore.async_transactional
+        async def _claim_all(
+            current_transaction: google_cloud_firestore.AsyncTransaction,
+        ) -> dict[str, bool]:
+            snapshot_by_document_id = {
+                snapshot.id: snapshot
+                async for snapshot in await current_transaction.get_all(
+                    list(event_documents.values())
+                )
+            }
+            claim_results: dict[str, bool] = {}
+            for provider_event_id, event_document in event_documents.items():
+                event_data = self._build_claim_data(tenant_id, provider_event_id, claimed_at)
+                snapshot = snapshot_by_document_id.get(event_document.id)
+                if snapshot is None or not snapshot.exists:
+                    current_transaction.create(event_document, event_data)
+                    claim_results[provider_event_id] = True
+                    continue
+                if self._is_claimable(snapshot.to_dict(), claim_expiration_time):
+                    current_transaction.set(event_document, event_data, merge=True)
+                    claim_results[provider_event_id] = True
+                    continue
+                claim_results[provider_event_id] = False
+            return claim_results
+
+        try:
+            return dict(await _claim_all(transaction))
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to claim processed webhook events in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to claim processed webhook events in firestore"
+            ) from error
+
+    def _build_claim_data(
+        self,
+        tenant_id: str,
+        provider_event_id: str,
+        claimed_at: datetime.datetime,
+    ) -> dict[str, object]:
+        return {
+            "tenant_id": tenant_id,
+            "provider_event_id": provider_event_id,
+            "status": "CLAIMED",
+            "claimed_at": claimed_at,
+            "claim_holder_id": self._claim_holder_id,
+            "processed_at": None,
+            "failed_at": None,
+            "failure_reason": None,
+            "expires_at": self._build_expires_at(claimed_at),
+        }
+
+    def _current_batch(self) -> google_cloud_firestore.WriteBatch | None:
+        if self._unit_of_work is None:
+            return None
+        return self._unit_of_work.current_batch()
+
+    def _is_own_claim(self, current_data: dict[str, object] | None) -> bool:
+        return (
+            current_data is not None
+            and current_data.get("status") == "CLAIMED"
+            and current_data.get("claim_holder_id") == self._claim_holder_id
+        )
+
+    def _is_claimable(
+        self,
+        current_data: dict[str, object] | None,
+        claim_expiration_time: datetime.datetime,
+    ) -> bool:
+        if current_data is None:
+            return False
+
+        current_status = current_data.get("status")
+        if current_status == "FAILED":
+            return True
+
+        if current_status == "CLAIMED":
+            claimed_at_value = current_data.get("claimed_at")
+            if (
+                isinstance(claimed_at_value, datetime.datetime)
+                and claimed_at_value <= claim_expiration_time
+            ):
+                return True
+
+        return False
@@ -0,0 +1,44 @@
+import collections.abc
+import contextlib
+import threading
+
+import google.api_core.exceptions as google_api_exceptions
+import google.cloud.firestore as google_cloud_firestore
+
+import src.adapters.outbound.firestore.errors as firestore_errors
+import src.ports.unit_of_work_port as unit_of_work_port
+
+
+class FirestoreUnitOfWorkAdapter(unit_of_work_port.UnitOfWorkPort):
+    def __init__(self, client: google_cloud_firestore.Client) -> None:
+        self._client = client
+        self._local = threading.local()
+
+    def current_batch(self) -> google_cloud_firestore.WriteBatch | None:
+        batch: google_cloud_firestore.WriteBatch | None = getattr(self._local, "batch", None)
+        return batch
+
+    @contextlib.contextmanager
+    def atomic(self) -> collections.abc.Iterator[None]:
+        if self.current_batch() is not None:
+            yield
+            return
+
+        batch = self._client.batch()
+        self._local.batch = batch
+        try:
+            yield
+        finally:
+            self._local.batch = None
+        if len(batch) == 0:
+            return
+        try:
+            batch.commit()
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to commit unit of work in firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to commit unit of work in firestore"
+            ) from error
@@ -0,0 +1,171 @@
+import google.api_core.exceptions as google_api_exceptions
+import google.cloud.firestore as google_cloud_firestore
+
+import src.adapters.outbound.firestore.errors as firestore_errors
+import src.adapters.outbound.firestore.model_mapper as firestore_model_mapper
+import src.adapters.outbound.firestore.paths as firestore_paths
+import src.domain.entities.agent_profile as agent_profile_entity
+import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.patient as patient_entity
+import src.domain.entities.whatsapp_connection as whatsapp_connection_entity
+import src.domain.entities.whatsapp_user as whatsapp_user_entity
+import src.ports.webhook_event_context_loader_port as webhook_event_context_loader_port
+import src.services.dto.webhook_dto as webhook_dto
+
+
+class FirestoreWebhookEventContextLoaderAdapter(
+    webhook_event_context_loader_port.WebhookEventContextLoaderPort
+):
+    def __init__(self, client: google_cloud_firestore.Client) -> None:
+        self._client = client
+
+    def load(
+        self,
+        phone_number_id: str,
+        whatsapp_user_id: str,
+    ) -> webhook_dto.WebhookEventContextDTO | None:
+        phone_index_document = firestore_paths.whatsapp_phone_index_document(
+            self._client,
+            phone_number_id,
+        )
+        index_raw_data = self._get_all([phone_index_document]).get(phone_index_document.path)
+        if index_raw_data is None:
+            return None
+        tenant_id = index_raw_data.get("tenant_id")
+        if not isinstance(tenant_id, str):
+            raise firestore_errors.FirestoreRepositoryError(
+                "invalid whatsapp phone index format in firestore"
+            )
+
+        connection_document = firestore_paths.tenant_whatsapp_connection_document(
+            self._client, tenant_id
+        )
+        blacklist_entry_document = firestore_paths.tenant_blacklist_entry_document(
+            self._client, tenant_id, whatsapp_user_id
+        )
+        whatsapp_user_document = firestore_paths.tenant_whatsapp_user_document(
+            self._client, tenant_id, whatsapp_user_id
+        )
+        conversation_lookup_document = firestore_paths.tenant_conversation_lookup_document(
+            self._client, tenant_id, whatsapp_user_id
+        )
+        patient_document = firestore_paths.tenant_patient_document(
+            self._client, tenant_id, whatsapp_user_id
+        )
+        agent_profile_document = firestore_paths.tenant_agent_profile_document(
+            self._client, tenant_id
+        )
+        raw_data_by_path = self._get_all(
+            [
+                connection_document,
+                blacklist_entry_document,
+                whatsapp_user_document,
+                conversation_lookup_document,
+                patient_document,
+                agent_profile_document,
+            ]
+        )
+
+        connection_raw_data = raw_data_by_path.get(connection_document.path)
+        if connection_raw_data is None:
+            return None
+        connection = firestore_model_mapper.parse_document(
+            connection_raw_data,
+            whatsapp_connection_entity.WhatsappConnection,
+            "whatsapp connection",
+        )
+
+        whatsapp_user: whatsapp_user_entity.WhatsappUser | None = None
+        whatsapp_user_raw_data = raw_data_by_path.get(whatsapp_user_document.path)
+        if whatsapp_user_raw_data is not None:
+            whatsapp_user = firestore_model_mapper.parse_document(
+                whatsapp_user_raw_data,
+                whatsapp_user_entity.WhatsappUser,
+                "whatsapp user",
+            )
+
+        known_patient: patient_entity.Patient | None = None
+        patient_raw_data = raw_data_by_path.get(patient_document.path)
+        if patient_raw_data is not None:
+            known_patient = firestore_model_mapper.parse_document(
+                patient_raw_data,
+                patient_entity.Patient,
+                "patient",
+            )
+            if known_patient.tenant_id != tenant_id:
+                known_patient = None
+
+        agent_profile: agent_profile_entity.AgentProfile | None = None
+        agent_profile_raw_data = raw_data_by_path.get(agent_profile_document.path)
+        if agent_profile_raw_data is not None:
+            agent_profile = firestore_model_mapper.parse_document(
+                agent_profile_raw_data,
+                agent_profile_entity.AgentProfile,
+                "agent profile",
+            )
+
+        return webhook_dto.WebhookEventContextDTO(
+            connection=connection,
+            is_blacklisted=blacklist_entry_document.path in raw_data_by_path,
+            whatsapp_user=whatsapp_user,
+            conversation=self._load_conversation(
+                tenant_id, raw_data_by_path.get(conversation_lookup_document.path)
+            ),
+            known_patient=known_patient,
+            agent_profile=agent_profile,
+        )
+
+    def _load_conversation(
+        self,
+        tenant_id: str,
+        lookup_raw_data: dict[str, object] | None,
+    ) -> conversation_entity.Conversation | None:
+        if lookup_raw_data is None:
+            return None
+        conversation_id = lookup_raw_data.get("conversation_id")
+        if not isinstance(conversation_id, str):
+            raise firestore_errors.FirestoreRepositoryError(
+                "invalid conversation lookup format in firestore"
+            )
+        conversation_document = firestore_paths.tenant_conversation_document(
+            self._client, tenant_id, conversation_id
+        )
+        conversation_raw_data = self._get_all([conversation_document]).get(
+            conversation_document.path
+        )
+        if conversation_raw_data is None:
+            return None
+        conversation = firestore_model_mapper.parse_document(
+            conversation_raw_data,
+            conversation_entity.Conversation,
+            "conversation",
+        )
+        if conversation.tenant_id != tenant_id:
+            return None
+        conversation.mark_persisted()
+        return conversation
+
+    def _get_all(
+        self,
+        documents: list[google_cloud_firestore.DocumentReference],
+    ) -> dict[str, dict[str, object]]:
+        try:
+            snapshots = list(self._client.get_all(documents))
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read webhook event context from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read webhook event context from firestore"
+            ) from error
+
+        raw_data_by_path: dict[str, dict[str, object]] = {}
+        for snapshot in snapshots:
+            if not snapshot.exists:
+                continue
+            raw_data = snapshot.to_dict()
+            if raw_data is None:
+                continue
+            raw_data_by_path[snapshot.reference.path] = raw_data
+        return raw_data_by_path
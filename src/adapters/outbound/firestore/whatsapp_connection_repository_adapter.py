@@ -1,3 +1,5 @@
+import asyncio
+
 import google.api_core.exceptions as google_api_exceptions
 import google.cloud.firestore as google_cloud_firestore
 
@@ -11,8 +13,13 @@ import src.ports.whatsapp_connection_repository_port as whatsapp_connection_repo
 class FirestoreWhatsappConnectionRepositoryAdapter(
     whatsapp_connection_repository_port.WhatsappConnectionRepositoryPort
 ):
-    def __init__(self, client: google_cloud_firestore.Client) -> None:
+    def __init__(
+        self,
+        client: google_cloud_firestore.Client,
+        async_client: google_cloud_firestore.AsyncClient | None = None,
+    ) -> None:
         self._client = client
+        self._async_client = async_client
 
     def save(self, connection: whatsapp_connection_entity.WhatsappConnection) -> None:
         connection_document = firestore_paths.tenant_whatsapp_connection_document(
@@ -133,6 +140,50 @@ class FirestoreWhatsappConnectionRepositoryAdapter(
             )
         return self.get_by_tenant_id(tenant_id_value)
 
+    async def aget_by_phone_number_id(
+        self,
+        phone_number_id: str,
+    ) -> whatsapp_connection_entity.WhatsappConnection | None:
+        if self._async_client is None:
+            return await asyncio.to_thread(self.get_by_phone_number_id, phone_number_id)
+        phone_index_document = firestore_paths.async_whatsapp_phone_index_document(
+            self._async_client,
+            phone_number_id,
+        )
+        try:
+            index_snapshot = await phone_index_document.get()
+            if not index_snapshot.exists:
+                return None
+            index_raw_data = index_snapshot.to_dict()
+            if index_raw_data is None:
+                return None
+            tenant_id_value = index_raw_data.get("tenant_id")
+            if not isinstance(tenant_id_value, str):
+                raise firestore_errors.FirestoreRepositoryError(
+                    "invalid whatsapp phone index format in firestore"
+                )
+            connection_snapshot = await firestore_paths.async_tenant_whatsapp_connection_document(
+                self._async_client, tenant_id_value
+            ).get()
+        except google_api_exceptions.GoogleAPICallError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read whatsapp connection from firestore"
+            ) from error
+        except google_api_exceptions.RetryError as error:
+            raise firestore_errors.FirestoreRepositoryError(
+                "failed to read whatsapp connection from firestore"
+            ) from error
+        if not connection_snapshot.exists:
+            return None
+        connection_raw_data = connection_snapshot.to_dict()
+        if connection_raw_data is None:
+            return None
+        return firestore_model_mapper.parse_document(
+            connection_raw_data,
+            whatsapp_connection_entity.WhatsappConnection,
+            "whatsapp connection",
+        )
+
     def get_by_embedded_signup_state(
         self,
         embedded_signup_state: str,
@@ -8,6 +8,7 @@ class InMemoryConversationProcessingLockAdapter(
     conversation_processing_lock_port.ConversationProcessingLockPort
 ):
     _lock_timeout_seconds = 120
+    _retention_seconds = 24 * 60 * 60
 
     def __init__(self, store: in_memory_store.InMemoryStore) -> None:
         self._store = store
@@ -24,19 +25,15 @@ class InMemoryConversationProcessingLockAdapter(
             existing = self._store.conversation_processing_locks.get(key)
 
             if existing is None:
-                self._store.conversation_processing_locks[key] = {
-                    "holder_id": holder_id,
-                    "status": "LOCKED",
-                    "acquired_at": acquired_at,
-                }
+                self._store.conversation_processing_locks[key] = self._build_locked_state(
+                    holder_id, acquired_at
+                )
                 return True
 
             if existing["status"] == "RELEASED":
-                self._store.conversation_processing_locks[key] = {
-                    "holder_id": holder_id,
-                    "status": "LOCKED",
-                    "acquired_at": acquired_at,
-                }
+                self._store.conversation_processing_locks[key] = self._build_locked_state(
+                    holder_id, acquired_at
+                )
                 return True
 
             if existing["status"] == "LOCKED":
@@ -46,11 +43,9 @@ class InMemoryConversationProcessingLockAdapter(
                         seconds=self._lock_timeout_seconds
                     )
                     if lock_expiration <= acquired_at:
-                        self._store.conversation_processing_locks[key] = {
-                            "holder_id": holder_id,
-                            "status": "LOCKED",
-                            "acquired_at": acquired_at,
-                        }
+                        self._store.conversation_processing_locks[key] = self._build_locked_state(
+                            holder_id, acquired_at
+                        )
                         return True
 
             return False
@@ -60,9 +55,38 @@ class InMemoryConversationProcessingLockAdapter(
         tenant_id: str,
         conversation_id: str,
         holder_id: str,
+        released_at: datetime.datetime,
     ) -> None:
         with self._store.lock:
             key = (tenant_id, conversation_id)
             existing = self._store.conversation_processing_locks.get(key)
             if existing is not None and existing["holder_id"] == holder_id:
                 existing["status"] = "RELEASED"
+                existing["expires_at"] = released_at + datetime.timedelta(
+                    seconds=self._retention_seconds
+                )
+
+    def delete_expired(self, now: datetime.datetime, limit: int) -> int:
+        with self._store.lock:
+            expired_keys: list[tuple[str, str]] = []
+            for key, lock_state in self._store.conversation_processing_locks.items():
+                if len(expired_keys) >= limit:
+                    break
+                expires_at = lock_state.get("expires_at")
+                if isinstance(expires_at, datetime.datetime) and expires_at <= now:
+                    expired_keys.append(key)
+            for key in expired_keys:
+                del self._store.conversation_processing_locks[key]
+            return len(expired_keys)
+
+    def _build_locked_state(
+        self,
+        holder_id: str,
+        acquired_at: datetime.datetime,
+    ) -> dict[str, object]:
+        return {
+            "holder_id": holder_id,
+            "status": "LOCKED",
+            "acquired_at": acquired_at,
+            "expires_at": acquired_at + datetime.timedelta(seconds=self._retention_seconds),
+        }
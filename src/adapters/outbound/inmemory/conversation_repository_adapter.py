@@ -1,8 +1,13 @@
+import datetime
+
 import src.adapters.outbound.inmemory.store as in_memory_store
 import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.conversation_summary as conversation_summary_entity
 import src.domain.entities.message as message_entity
+import src.domain.entities.message_search_posting as message_search_posting_entity
 import src.domain.entities.whatsapp_user as whatsapp_user_entity
 import src.ports.conversation_repository_port as conversation_repository_port
+import src.services.message_search_tokenizer as message_search_tokenizer
 
 
 class InMemoryConversationRepositoryAdapter(
@@ -36,6 +41,7 @@ class InMemoryConversationRepositoryAdapter(
                 conversation_copy.messages = [
                     message.model_copy(deep=True) for message in existing_conversation.messages
                 ]
+                conversation_copy.message_seq = existing_conversation.message_seq
             self._store.conversation_by_tenant_and_wa_user[key] = conversation_copy
             self._store.conversation_by_id[conversation.id] = conversation_copy
             self._store.messages_by_conversation_id[conversation.id] = [
@@ -72,6 +78,49 @@ class InMemoryConversationRepositoryAdapter(
                     conversations.append(conversation.model_copy(deep=True))
             return conversations
 
+    def list_conversation_summaries(
+        self,
+        tenant_id: str,
+        limit: int | None = None,
+        after_updated_at: datetime.datetime | None = None,
+        after_conversation_id: str | None = None,
+    ) -> list[conversation_summary_entity.ConversationSummary]:
+        with self._store.lock:
+            summaries = [
+                conversation.to_summary()
+                for conversation in self._store.conversation_by_id.values()
+                if conversation.tenant_id == tenant_id
+            ]
+        summaries.sort(key=lambda item: (item.updated_at, item.id), reverse=True)
+        if after_updated_at is not None:
+            cursor_key = (after_updated_at, after_conversation_id or "")
+            summaries = [
+                summary for summary in summaries if (summary.updated_at, summary.id) < cursor_key
+            ]
+        if limit is not None:
+            summaries = summaries[:limit]
+        return summaries
+
+    def list_changed_conversation_summaries(
+        self,
+        tenant_id: str,
+        limit: int,
+        after_updated_at: datetime.datetime,
+        after_conversation_id: str | None = None,
+    ) -> list[conversation_summary_entity.ConversationSummary]:
+        with self._store.lock:
+            summaries = [
+                conversation.to_summary()
+                for conversation in self._store.conversation_by_id.values()
+                if conversation.tenant_id == tenant_id
+            ]
+        cursor_key = (after_updated_at, after_conversation_id or "")
+        changed_summaries = sorted(
+            (summary for summary in summaries if (summary.updated_at, summary.id) > cursor_key),
+            key=lambda item: (item.updated_at, item.id),
+        )
+        return changed_summaries[:limit]
+
     def save_message(self, message: message_entity.Message) -> None:
         with self._store.lock:
             conversation = self._store.conversation_by_id.get(message.conversation_id)
@@ -80,6 +129,7 @@ class InMemoryConversationRepositoryAdapter(
             updated_conversation = conversation.model_copy(deep=True)
             updated_message = message.model_copy(deep=True)
             updated_conversation.messages.append(updated_message)
+            updated_conversation.message_seq += 1
             conversation_key = (
                 updated_conversation.tenant_id,
                 updated_conversation.whatsapp_user_id,
@@ -102,6 +152,71 @@ class InMemoryConversationRepositoryAdapter(
             message_list = self._store.messages_by_conversation_id.get(conversation_id, [])
             return [message.model_copy(deep=True) for message in message_list]
 
+    def has_message_with_provider_message_id(
+        self, tenant_id: str, conversation_id: str, provider_message_id: str
+    ) -> bool:
+        return any(
+            message.provider_message_id == provider_message_id
+            for message in self.list_messages(tenant_id, conversation_id)
+        )
+
+    def list_recent_messages(
+        self, tenant_id: str, conversation_id: str, limit: int
+    ) -> list[message_entity.Message]:
+        if limit <= 0:
+            return []
+        return self.list_messages(tenant_id, conversation_id)[-limit:]
+
+    def list_messages_page(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        limit: int,
+        before_created_at: datetime.datetime | None = None,
+        before_message_id: str | None = None,
+        after_created_at: datetime.datetime | None = None,
+        after_message_id: str | None = None,
+    ) -> list[message_entity.Message]:
+        if limit <= 0:
+            return []
+        messages = sorted(
+            self.list_messages(tenant_id, conversation_id),
+            key=lambda item: (item.created_at, item.id),
+        )
+        if after_created_at is not None:
+            after_key = (after_created_at, after_message_id or "")
+            return [
+                message for message in messages if (message.created_at, message.id) > after_key
+            ][:limit]
+        if before_created_at is not None:
+            before_key = (before_created_at, before_message_id or "")
+            messages = [
+                message for message in messages if (message.created_at, message.id) < before_key
+            ]
+        return messages[-limit:]
+
+    def get_message_seq(self, tenant_id: str, conversation_id: str) -> int:
+        with self._store.lock:
+            conversation = self._store.conversation_by_id.get(conversation_id)
+            if conversation is None or conversation.tenant_id != tenant_id:
+                return 0
+            return conversation.message_seq
+
+    def list_subsessions(
+        self, tenant_id: str, conversation_id: str
+    ) -> list[conversation_entity.ConversationSubsession]:
+        with self._store.lock:
+            conversation = self._store.conversation_by_id.get(conversation_id)
+            if conversation is None or conversation.tenant_id != tenant_id:
+                return []
+            return [subsession.model_copy(deep=True) for subsession in conversation.subsessions]
+
+    def get_latest_subsession(
+        self, tenant_id: str, conversation_id: str
+    ) -> conversation_entity.ConversationSubsession | None:
+        subsessions = self.list_subsessions(tenant_id, conversation_id)
+        return subsessions[-1] if subsessions else None
+
     def delete_messages(self, tenant_id: str, conversation_id: str) -> None:
         with self._store.lock:
             conversation = self._store.conversation_by_id.get(conversation_id)
@@ -117,3 +232,46 @@ class InMemoryConversationRepositoryAdapter(
             self._store.conversation_by_tenant_and_wa_user[conversation_key] = updated_conversation
             self._store.messages_by_conversation_id[conversation_id] = []
             self._store.flush()
+
+    def search_message_postings(
+        self, tenant_id: str, terms: list[str], limit_per_term: int
+    ) -> list[message_search_posting_entity.MessageSearchPosting]:
+        with self._store.lock:
+            term_counts_by_message = [
+                (message, message_search_tokenizer.count_index_terms(message.content))
+                for conversation in self._store.conversation_by_id.values()
+                if conversation.tenant_id == tenant_id
+                for message in self._store.messages_by_conversation_id.get(conversation.id, [])
+            ]
+        postings: list[message_search_posting_entity.MessageSearchPosting] = []
+        for term in terms:
+            term_postings = [
+                message_search_posting_entity.MessageSearchPosting(
+                    term=term,
+                    tenant_id=tenant_id,
+                    conversation_id=message.conversation_id,
+                    message_id=message.id,
+                    created_at=message.created_at,
+                    term_frequency=term_counts[term],
+                )
+                for message, term_counts in term_counts_by_message
+                if term in term_counts
+            ]
+            term_postings.sort(key=lambda item: item.created_at, reverse=True)
+            postings.extend(term_postings[:limit_per_term])
+        return postings
+
+    def list_messages_by_ids(
+        self, tenant_id: str, message_keys: list[tuple[str, str]]
+    ) -> list[message_entity.Message]:
+        messages: list[message_entity.Message] = []
+        with self._store.lock:
+            for conversation_id, message_id in message_keys:
+                conversation = self._store.conversation_by_id.get(conversation_id)
+                if conversation is None or conversation.tenant_id != tenant_id:
+                    continue
+                for message in self._store.messages_by_conversation_id.get(conversation_id, []):
+                    if message.id == message_id:
+                        messages.append(message.model_copy(deep=True))
+                        break
+        return messages
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 
 import src.adapters.outbound.inmemory.store as in_memory_store
@@ -9,6 +10,8 @@ class InMemoryProcessedWebhookEventRepositoryAdapter(
     processed_webhook_event_repository_port.ProcessedWebhookEventRepositoryPort
 ):
     _claim_timeout_seconds = 120
+    # Meta retries undelivered webhooks for up to 7 days.
+    _retention_seconds = 8 * 24 * 60 * 60
 
     def __init__(self, store: in_memory_store.InMemoryStore) -> None:
         self._store = store
@@ -39,24 +42,82 @@ class InMemoryProcessedWebhookEventRepositoryAdapter(
                 return False
 
             self._store.processed_events.add(key)
+            self._store.processed_event_expires_at[key] = self._build_expires_at(claimed_at)
             self._status_by_key[key] = "CLAIMED"
             self._claimed_at_by_key[key] = claimed_at
             self._store.flush()
             return True
 
+    def claim_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        with self._store.lock:
+            claim_results: dict[str, bool] = {}
+            for provider_event_id in provider_event_ids:
+                if provider_event_id in claim_results:
+                    continue
+                claim_results[provider_event_id] = self.claim_for_processing(
+                    tenant_id=tenant_id,
+                    provider_event_id=provider_event_id,
+                    claimed_at=claimed_at,
+                )
+            return claim_results
+
+    async def aclaim_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        # The store lock is shared with worker threads, so it is never taken on the event loop.
+        return await asyncio.to_thread(self.claim_many, tenant_id, provider_event_ids, claimed_at)
+
+    def refresh_claim(
+        self,
+        tenant_id: str,
+        provider_event_id: str,
+        claimed_at: datetime.datetime,
+    ) -> bool:
+        # Claim status lives on this adapter, so every CLAIMED entry is this instance's own.
+        with self._store.lock:
+            key = (tenant_id, provider_event_id)
+            if self._status_by_key.get(key) != "CLAIMED":
+                return False
+            self._claimed_at_by_key[key] = claimed_at
+            self._store.processed_event_expires_at[key] = self._build_expires_at(claimed_at)
+            self._store.flush()
+            return True
+
     def mark_processed(
         self,
         tenant_id: str,
         provider_event_id: str,
         processed_at: datetime.datetime,
     ) -> None:
-        del processed_at
         with self._store.lock:
             key = (tenant_id, provider_event_id)
             self._store.processed_events.add(key)
+            self._store.processed_event_expires_at[key] = self._build_expires_at(processed_at)
             self._status_by_key[key] = "PROCESSED"
             self._store.flush()
 
+    def mark_processed_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        processed_at: datetime.datetime,
+    ) -> None:
+        with self._store.lock:
+            for provider_event_id in provider_event_ids:
+                key = (tenant_id, provider_event_id)
+                self._store.processed_events.add(key)
+                self._store.processed_event_expires_at[key] = self._build_expires_at(processed_at)
+                self._status_by_key[key] = "PROCESSED"
+            self._store.flush()
+
     def mark_failed(
         self,
         tenant_id: str,
@@ -64,11 +125,13 @@ class InMemoryProcessedWebhookEventRepositoryAdapter(
         failed_at: datetime.datetime,
         failure_reason: str,
     ) -> None:
-        del failed_at
         del failure_reason
         with self._store.lock:
             key = (tenant_id, provider_event_id)
+            if self._status_by_key.get(key) != "CLAIMED":
+                return
             self._store.processed_events.add(key)
+            self._store.processed_event_expires_at[key] = self._build_expires_at(failed_at)
             self._status_by_key[key] = "FAILED"
             self._store.flush()
 
@@ -80,4 +143,25 @@ class InMemoryProcessedWebhookEventRepositoryAdapter(
         with self._store.lock:
             key = (event.tenant_id, event.provider_event_id)
             self._store.processed_events.add(key)
+            self._store.processed_event_expires_at[key] = self._build_expires_at(event.processed_at)
             self._store.flush()
+
+    def delete_expired(self, now: datetime.datetime, limit: int) -> int:
+        with self._store.lock:
+            expired_keys: list[tuple[str, str]] = []
+            for key, expires_at in self._store.processed_event_expires_at.items():
+                if len(expired_keys) >= limit:
+                    break
+                if expires_at <= now:
+                    expired_keys.append(key)
+            for key in expired_keys:
+                self._store.processed_events.discard(key)
+                del self._store.processed_event_expires_at[key]
+                self._status_by_key.pop(key, None)
+                self._claimed_at_by_key.pop(key, None)
+            if expired_keys:
+                self._store.flush()
+            return len(expired_keys)
+
+    def _build_expires_at(self, value: datetime.datetime) -> datetime.datetime:
+        return value + datetime.timedelta(seconds=self._retention_seconds)
@@ -1,3 +1,6 @@
+import collections.abc
+import contextlib
+import datetime
 import pathlib
 import threading
 
@@ -26,6 +29,7 @@ class InMemoryStore:
     def __init__(self, persistence_file_path: str | None = None) -> None:
         self.lock = threading.RLock()
         self._persistence_file_path = persistence_file_path
+        self._flush_deferral = threading.local()
 
         self.tenants_by_id: dict[str, tenant_entity.Tenant] = {}
         self.users_by_email: dict[str, user_entity.User] = {}
@@ -54,6 +58,7 @@ class InMemoryStore:
         self.manual_appointment_ids_by_tenant: dict[str, list[str]] = {}
         self.manual_appointment_ids_by_patient: dict[tuple[str, str], list[str]] = {}
         self.processed_events: set[tuple[str, str]] = set()
+        self.processed_event_expires_at: dict[tuple[str, str], datetime.datetime] = {}
         self.conversation_processing_locks: dict[tuple[str, str], dict[str, object]] = {}
         self.blacklist_by_tenant_and_wa_user: dict[
             tuple[str, str], blacklist_entry_entity.BlacklistEntry
@@ -71,9 +76,22 @@ class InMemoryStore:
             self._clear_chat_state()
             self.flush()
 
+    @contextlib.contextmanager
+    def deferred_flush(self) -> collections.abc.Iterator[None]:
+        deferral_depth: int = getattr(self._flush_deferral, "depth", 0)
+        self._flush_deferral.depth = deferral_depth + 1
+        try:
+            yield
+        finally:
+            self._flush_deferral.depth = deferral_depth
+        if deferral_depth == 0:
+            self.flush()
+
     def flush(self) -> None:
         if self._persistence_file_path is None:
             return
+        if getattr(self._flush_deferral, "depth", 0) > 0:
+            return
 
         with self.lock:
             snapshot_path = pathlib.Path(self._persistence_file_path)
@@ -132,6 +150,7 @@ class InMemoryStore:
                 store_snapshot.ProcessedEventSnapshot(
                     tenant_id=tenant_id,
                     provider_event_id=provider_event_id,
+                    expires_at=self.processed_event_expires_at.get((tenant_id, provider_event_id)),
                 )
             )
 
@@ -282,6 +301,8 @@ class InMemoryStore:
         for processed_event in snapshot.processed_events:
             event_key = (processed_event.tenant_id, processed_event.provider_event_id)
             self.processed_events.add(event_key)
+            if processed_event.expires_at is not None:
+                self.processed_event_expires_at[event_key] = processed_event.expires_at
 
         for blacklist_entry in snapshot.blacklist_entries:
             blacklist_entry_copy = blacklist_entry.model_copy(deep=True)
@@ -317,6 +338,7 @@ class InMemoryStore:
         self.scheduling_request_ids_by_conversation = {}
         self.messages_by_conversation_id = {}
         self.processed_events = set()
+        self.processed_event_expires_at = {}
         self.conversation_processing_locks = {}
         self.whatsapp_user_by_tenant_and_id = {}
         self.patient_by_tenant_and_wa_user = {}
@@ -1,3 +1,5 @@
+import datetime
+
 import pydantic
 
 import src.domain.entities.agent_profile as agent_profile_entity
@@ -17,6 +19,7 @@ import src.domain.entities.whatsapp_user as whatsapp_user_entity
 class ProcessedEventSnapshot(pydantic.BaseModel):
     tenant_id: str
     provider_event_id: str
+    expires_at: datetime.datetime | None = None
 
 
 class InMemoryStoreSnapshot(pydantic.BaseModel):
@@ -0,0 +1,12 @@
+import contextlib
+
+import src.adapters.outbound.inmemory.store as in_memory_store
+import src.ports.unit_of_work_port as unit_of_work_port
+
+
+class InMemoryUnitOfWorkAdapter(unit_of_work_port.UnitOfWorkPort):
+    def __init__(self, store: in_memory_store.InMemoryStore) -> None:
+        self._store = store
+
+    def atomic(self) -> contextlib.AbstractContextManager[None]:
+        return self._store.deferred_flush()
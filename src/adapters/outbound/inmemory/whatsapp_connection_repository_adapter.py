@@ -1,3 +1,5 @@
+import asyncio
+
 import src.adapters.outbound.inmemory.store as in_memory_store
 import src.domain.entities.whatsapp_connection as whatsapp_connection_entity
 import src.ports.whatsapp_connection_repository_port as whatsapp_connection_repository_port
@@ -55,6 +57,11 @@ class InMemoryWhatsappConnectionRepositoryAdapter(
                 return None
             return connection.model_copy(deep=True)
 
+    async def aget_by_phone_number_id(
+        self, phone_number_id: str
+    ) -> whatsapp_connection_entity.WhatsappConnection | None:
+        return await asyncio.to_thread(self.get_by_phone_number_id, phone_number_id)
+
     def get_by_embedded_signup_state(
         self, embedded_signup_state: str
     ) -> whatsapp_connection_entity.WhatsappConnection | None:
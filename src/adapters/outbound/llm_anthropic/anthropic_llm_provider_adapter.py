@@ -1,3 +1,4 @@
+import collections.abc
 import json
 import typing
 
@@ -9,6 +10,8 @@ import src.services.exceptions as service_exceptions
 
 
 class AnthropicLlmProviderAdapter(llm_provider_port.LlmProviderPort):
+    _request_url = "https://api.anthropic.com/v1/messages"
+
     def __init__(
         self,
         api_key: str,
@@ -22,12 +25,54 @@ class AnthropicLlmProviderAdapter(llm_provider_port.LlmProviderPort):
         self._api_version = api_version
         self._max_tokens = max_tokens
         self._client = httpx.Client(timeout=timeout_seconds)
+        self._async_client = httpx.AsyncClient(timeout=timeout_seconds)
 
     def generate_reply(self, prompt_input: llm_dto.GenerateReplyInputDTO) -> llm_dto.AgentReplyDTO:
+        request_headers, request_payload = self._build_request(prompt_input)
+        try:
+            response = self._client.post(
+                self._request_url,
+                headers=request_headers,
+                json=request_payload,
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (httpx.HTTPError, json.JSONDecodeError) as error:
+            raise self._translate_provider_error(error) from error
+        return self._parse_reply(payload)
+
+    async def agenerate_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> llm_dto.AgentReplyDTO:
+        request_headers, request_payload = self._build_request(prompt_input)
+        try:
+            response = await self._async_client.post(
+                self._request_url,
+                headers=request_headers,
+                json=request_payload,
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (httpx.HTTPError, json.JSONDecodeError) as error:
+            raise self._translate_provider_error(error) from error
+        return self._parse_reply(payload)
+
+    async def aclose(self) -> None:
+        self._client.close()
+        await self._async_client.aclose()
+
+    def stream_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> collections.abc.Generator[llm_dto.ReplyStreamChunkDTO, None, None]:
+        # Tools are not sent to Anthropic, so there are no calls to dispatch early.
+        yield llm_dto.ReplyStreamChunkDTO(text=self.generate_reply(prompt_input).content)
+
+    def _build_request(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> tuple[dict[str, str], dict[str, typing.Any]]:
         if not self._api_key:
             raise service_exceptions.ExternalProviderError("ANTHROPIC_API_KEY is required")
 
-        request_url = "https://api.anthropic.com/v1/messages"
         request_headers = {
             "x-api-key": self._api_key,
             "anthropic-version": self._api_version,
@@ -52,32 +97,24 @@ class AnthropicLlmProviderAdapter(llm_provider_port.LlmProviderPort):
             "system": prompt_input.system_prompt,
             "messages": request_messages,
         }
-
-        try:
-            response = self._client.post(
-                request_url,
-                headers=request_headers,
-                json=request_payload,
-            )
-            response.raise_for_status()
-            payload = response.json()
-        except httpx.TimeoutException as error:
-            raise service_exceptions.ExternalProviderError("timeout calling anthropic") from error
-        except httpx.RequestError as error:
-            raise service_exceptions.ExternalProviderError(
-                "network error calling anthropic"
-            ) from error
-        except httpx.HTTPStatusError as error:
+        return request_headers, request_payload
+
+    def _translate_provider_error(
+        self, error: httpx.HTTPError | json.JSONDecodeError
+    ) -> service_exceptions.ExternalProviderError:
+        if isinstance(error, httpx.TimeoutException):
+            return service_exceptions.ExternalProviderError("timeout calling anthropic")
+        if isinstance(error, httpx.HTTPStatusError):
             status_code = error.response.status_code
             provider_detail = self._extract_error_detail(error.response)
-            raise service_exceptions.ExternalProviderError(
+            return service_exceptions.ExternalProviderError(
                 f"anthropic rejected the request (status={status_code}, detail={provider_detail})"
-            ) from error
-        except json.JSONDecodeError as error:
-            raise service_exceptions.ExternalProviderError(
-                "invalid response from anthropic"
-            ) from error
+            )
+        if isinstance(error, httpx.HTTPError):
+            return service_exceptions.ExternalProviderError("network error calling anthropic")
+        return service_exceptions.ExternalProviderError("invalid response from anthropic")
 
+    def _parse_reply(self, payload: object) -> llm_dto.AgentReplyDTO:
         if not isinstance(payload, dict):
             raise service_exceptions.ExternalProviderError("anthropic payload is invalid")
 
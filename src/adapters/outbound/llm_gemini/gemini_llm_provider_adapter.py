@@ -1,4 +1,6 @@
 import collections.abc
+import contextlib
+import time
 import typing
 
 import google.auth.exceptions as google_auth_exceptions
@@ -14,6 +16,12 @@ import src.services.exceptions as service_exceptions
 
 
 class GeminiLlmProviderAdapter(llm_provider_port.LlmProviderPort):
+    _provider_errors = (
+        google_auth_exceptions.DefaultCredentialsError,
+        httpx.RequestError,
+        genai_errors.APIError,
+    )
+
     def __init__(
         self,
         project_id: str,
@@ -33,106 +41,212 @@ class GeminiLlmProviderAdapter(llm_provider_port.LlmProviderPort):
             self._tracer = tracer
 
     def generate_reply(self, prompt_input: llm_dto.GenerateReplyInputDTO) -> llm_dto.AgentReplyDTO:
-        trace_inputs: dict[str, object] = {
-            "messages_count": len(prompt_input.messages),
-            "tools_count": len(prompt_input.tools),
-            "function_call_results_count": len(prompt_input.function_call_results),
-            "system_prompt_chars": len(prompt_input.system_prompt),
-        }
-        trace_metadata: dict[str, object] = {
-            "llm_provider": "gemini",
-            "model": self._model,
-            "location": self._location,
-        }
-        with self._tracer.trace(
-            name="gemini.generate_reply",
-            run_type="llm",
-            inputs=trace_inputs,
-            metadata=trace_metadata,
-            tags=["llm", "gemini"],
-        ) as trace_run:
-            if not self._project_id:
-                trace_run.set_error("GOOGLE_CLOUD_PROJECT is required")
-                raise service_exceptions.ExternalProviderError("GOOGLE_CLOUD_PROJECT is required")
-
-            if not self._location:
-                trace_run.set_error("GEMINI_LOCATION is required")
-                raise service_exceptions.ExternalProviderError("GEMINI_LOCATION is required")
-
-            request_contents = self._build_request_contents(prompt_input)
-            request_config: genai_types.GenerateContentConfigDict = {
-                "system_instruction": prompt_input.system_prompt,
-                "max_output_tokens": self._max_output_tokens,
-            }
-            tools = self._build_tools(prompt_input)
-            if tools:
-                function_calling_config: genai_types.FunctionCallingConfigDict = {
-                    "mode": genai_types.FunctionCallingConfigMode.AUTO,
-                }
-                tool_config: genai_types.ToolConfigDict = {
-                    "function_calling_config": function_calling_config,
-                }
-                request_config["tools"] = tools
-                request_config["tool_config"] = tool_config
+        with self._trace_generate_reply(prompt_input) as trace_run:
+            request_contents, request_config = self._build_request(prompt_input, trace_run)
             client = self._get_client()
-
             try:
                 response = client.models.generate_content(
                     model=self._model,
                     contents=request_contents,
                     config=request_config,
                 )
-            except google_auth_exceptions.DefaultCredentialsError as error:
-                trace_run.set_error("google application default credentials are required")
-                raise service_exceptions.ExternalProviderError(
-                    "google application default credentials are required"
-                ) from error
-            except httpx.TimeoutException as error:
-                trace_run.set_error("timeout calling gemini")
-                raise service_exceptions.ExternalProviderError("timeout calling gemini") from error
-            except httpx.RequestError as error:
-                trace_run.set_error("network error calling gemini")
-                raise service_exceptions.ExternalProviderError(
-                    "network error calling gemini"
-                ) from error
-            except genai_errors.ClientError as error:
-                detail = self._extract_api_error_detail(error)
-                trace_run.set_error(
-                    f"gemini rejected the request (status={error.code}, detail={detail})"
+            except self._provider_errors as error:
+                raise self._translate_provider_error(error, trace_run) from error
+            return self._build_agent_reply(response, trace_run)
+
+    async def agenerate_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> llm_dto.AgentReplyDTO:
+        with self._trace_generate_reply(prompt_input) as trace_run:
+            request_contents, request_config = self._build_request(prompt_input, trace_run)
+            client = self._get_client()
+            try:
+                response = await client.aio.models.generate_content(
+                    model=self._model,
+                    contents=request_contents,
+                    config=request_config,
+                )
+            except self._provider_errors as error:
+                raise self._translate_provider_error(error, trace_run) from error
+            return self._build_agent_reply(response, trace_run)
+
+    async def aclose(self) -> None:
+        if self._client is None:
+            return
+        await self._client.aio.aclose()
+        self._client.close()
+        self._client = None
+
+    def stream_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> collections.abc.Generator[llm_dto.ReplyStreamChunkDTO, None, None]:
+        # A `with` trace would keep its context active in the consumer across each yield.
+        trace_run = self._tracer.start_run(**self._build_trace_arguments(prompt_input))
+        stream_started_at = time.perf_counter()
+        first_chunk_ms: int | None = None
+        has_text_reply = False
+        function_calls_count = 0
+        try:
+            request_contents, request_config = self._build_request(prompt_input, trace_run)
+            client = self._get_client()
+            last_response: genai_types.GenerateContentResponse | None = None
+            try:
+                for response in client.models.generate_content_stream(
+                    model=self._model,
+                    contents=request_contents,
+                    config=request_config,
+                ):
+                    last_response = response
+                    if first_chunk_ms is None:
+                        first_chunk_ms = int((time.perf_counter() - stream_started_at) * 1000)
+                    candidate_parts = self._extract_first_candidate_parts(response)
+                    for part in candidate_parts:
+                        if isinstance(part.text, str) and part.text and not part.thought:
+                            has_text_reply = has_text_reply or bool(part.text.strip())
+                            yield llm_dto.ReplyStreamChunkDTO(text=part.text)
+                    # Gemini emits each function call whole, so it can be dispatched right away.
+                    for function_call in self._extract_function_calls_from_candidate_parts(
+                        candidate_parts
+                    ):
+                        function_calls_count += 1
+                        yield llm_dto.ReplyStreamChunkDTO(function_call=function_call)
+            except self._provider_errors as error:
+                raise self._translate_provider_error(error, trace_run) from error
+
+            if not has_text_reply and function_calls_count == 0:
+                empty_content_error_message = (
+                    self._build_empty_content_error_message(last_response)
+                    if last_response is not None
+                    else "gemini returned empty content (candidates=0)"
                 )
-                raise service_exceptions.ExternalProviderError(
-                    f"gemini rejected the request (status={error.code}, detail={detail})"
-                ) from error
-            except genai_errors.ServerError as error:
-                detail = self._extract_api_error_detail(error)
-                trace_run.set_error(f"gemini server error (status={error.code}, detail={detail})")
-                raise service_exceptions.ExternalProviderError(
-                    f"gemini server error (status={error.code}, detail={detail})"
-                ) from error
-            except genai_errors.APIError as error:
-                detail = self._extract_api_error_detail(error)
-                trace_run.set_error(f"gemini api error (status={error.code}, detail={detail})")
-                raise service_exceptions.ExternalProviderError(
-                    f"gemini api error (status={error.code}, detail={detail})"
-                ) from error
-
-            function_calls = self._extract_function_calls(response)
-            reply_text = self._extract_reply_text(response)
-            if reply_text is None and not function_calls:
-                empty_content_error_message = self._build_empty_content_error_message(response)
                 trace_run.set_error(empty_content_error_message)
                 raise service_exceptions.ExternalProviderError(empty_content_error_message)
-
             trace_run.set_outputs(
                 {
-                    "has_text_reply": reply_text is not None and reply_text != "",
-                    "function_calls_count": len(function_calls),
+                    "stream_outcome": "completed",
+                    "has_text_reply": has_text_reply,
+                    "function_calls_count": function_calls_count,
+                    "first_chunk_ms": first_chunk_ms,
                 }
             )
-            return llm_dto.AgentReplyDTO(
-                content=reply_text if reply_text is not None else "",
-                function_calls=function_calls,
+        except GeneratorExit:
+            trace_run.set_outputs(
+                {
+                    "stream_outcome": "closed_by_consumer",
+                    "has_text_reply": has_text_reply,
+                    "function_calls_count": function_calls_count,
+                    "first_chunk_ms": first_chunk_ms,
+                }
             )
+            raise
+        finally:
+            if not trace_run.is_ended():
+                trace_run.set_error("gemini stream ended unexpectedly")
+
+    def _trace_generate_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> contextlib.AbstractContextManager[langsmith_tracer.LangsmithTraceRun]:
+        return self._tracer.trace(**self._build_trace_arguments(prompt_input))
+
+    def _build_trace_arguments(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> dict[str, typing.Any]:
+        trace_inputs: dict[str, object] = {
+            "messages_count": len(prompt_input.messages),
+            "tools_count": len(prompt_input.tools),
+            "function_call_results_count": len(prompt_input.function_call_results),
+            "system_prompt_chars": len(prompt_input.system_prompt),
+        }
+        trace_metadata: dict[str, object] = {
+            "llm_provider": "gemini",
+            "model": self._model,
+            "location": self._location,
+        }
+        return {
+            "name": "gemini.generate_reply",
+            "run_type": "llm",
+            "inputs": trace_inputs,
+            "metadata": trace_metadata,
+            "tags": ["llm", "gemini"],
+        }
+
+    def _build_request(
+        self,
+        prompt_input: llm_dto.GenerateReplyInputDTO,
+        trace_run: langsmith_tracer.LangsmithTraceRun,
+    ) -> tuple[list[dict[str, typing.Any]], genai_types.GenerateContentConfigDict]:
+        if not self._project_id:
+            trace_run.set_error("GOOGLE_CLOUD_PROJECT is required")
+            raise service_exceptions.ExternalProviderError("GOOGLE_CLOUD_PROJECT is required")
+
+        if not self._location:
+            trace_run.set_error("GEMINI_LOCATION is required")
+            raise service_exceptions.ExternalProviderError("GEMINI_LOCATION is required")
+
+        request_contents = self._build_request_contents(prompt_input)
+        request_config: genai_types.GenerateContentConfigDict = {
+            "system_instruction": prompt_input.system_prompt,
+            "max_output_tokens": self._max_output_tokens,
+        }
+        tools = self._build_tools(prompt_input)
+        if tools:
+            function_calling_config: genai_types.FunctionCallingConfigDict = {
+                "mode": genai_types.FunctionCallingConfigMode.AUTO,
+            }
+            tool_config: genai_types.ToolConfigDict = {
+                "function_calling_config": function_calling_config,
+            }
+            request_config["tools"] = tools
+            request_config["tool_config"] = tool_config
+        return request_contents, request_config
+
+    def _translate_provider_error(
+        self,
+        error: Exception,
+        trace_run: langsmith_tracer.LangsmithTraceRun,
+    ) -> service_exceptions.ExternalProviderError:
+        if isinstance(error, google_auth_exceptions.DefaultCredentialsError):
+            error_message = "google application default credentials are required"
+        elif isinstance(error, httpx.TimeoutException):
+            error_message = "timeout calling gemini"
+        elif isinstance(error, httpx.RequestError):
+            error_message = "network error calling gemini"
+        elif isinstance(error, genai_errors.ClientError):
+            detail = self._extract_api_error_detail(error)
+            error_message = f"gemini rejected the request (status={error.code}, detail={detail})"
+        elif isinstance(error, genai_errors.ServerError):
+            detail = self._extract_api_error_detail(error)
+            error_message = f"gemini server error (status={error.code}, detail={detail})"
+        elif isinstance(error, genai_errors.APIError):
+            detail = self._extract_api_error_detail(error)
+            error_message = f"gemini api error (status={error.code}, detail={detail})"
+        else:
+            error_message = f"unexpected error calling gemini ({type(error).__name__})"
+        trace_run.set_error(error_message)
+        return service_exceptions.ExternalProviderError(error_message)
+
+    def _build_agent_reply(
+        self,
+        response: genai_types.GenerateContentResponse,
+        trace_run: langsmith_tracer.LangsmithTraceRun,
+    ) -> llm_dto.AgentReplyDTO:
+        function_calls = self._extract_function_calls(response)
+        reply_text = self._extract_reply_text(response)
+        if reply_text is None and not function_calls:
+            empty_content_error_message = self._build_empty_content_error_message(response)
+            trace_run.set_error(empty_content_error_message)
+            raise service_exceptions.ExternalProviderError(empty_content_error_message)
+
+        trace_run.set_outputs(
+            {
+                "has_text_reply": reply_text is not None and reply_text != "",
+                "function_calls_count": len(function_calls),
+            }
+        )
+        return llm_dto.AgentReplyDTO(
+            content=reply_text if reply_text is not None else "",
+            function_calls=function_calls,
+        )
 
     def _get_client(self) -> genai.Client:
         if self._client is None:
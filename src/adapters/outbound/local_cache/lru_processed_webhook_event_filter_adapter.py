@@ -0,0 +1,57 @@
+import collections
+import threading
+
+import src.ports.processed_webhook_event_filter_port as processed_webhook_event_filter_port
+import src.services.dto.webhook_dto as webhook_dto
+
+
+class LruProcessedWebhookEventFilterAdapter(
+    processed_webhook_event_filter_port.ProcessedWebhookEventFilterPort
+):
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("dedup filter capacity must be at least 1")
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._recent_event_keys: collections.OrderedDict[str, None] = collections.OrderedDict()
+        self._hit_total = 0
+        self._miss_total = 0
+        self._eviction_total = 0
+
+    def is_known_processed(self, tenant_id: str, provider_event_id: str) -> bool:
+        event_key = self._build_event_key(tenant_id, provider_event_id)
+        with self._lock:
+            if event_key not in self._recent_event_keys:
+                self._miss_total += 1
+                return False
+            self._recent_event_keys.move_to_end(event_key)
+            self._hit_total += 1
+            return True
+
+    def remember_processed(self, tenant_id: str, provider_event_ids: list[str]) -> None:
+        with self._lock:
+            for provider_event_id in provider_event_ids:
+                event_key = self._build_event_key(tenant_id, provider_event_id)
+                self._recent_event_keys[event_key] = None
+                self._recent_event_keys.move_to_end(event_key)
+                while len(self._recent_event_keys) > self._capacity:
+                    self._recent_event_keys.popitem(last=False)
+                    self._eviction_total += 1
+
+    def forget(self, tenant_id: str, provider_event_id: str) -> None:
+        event_key = self._build_event_key(tenant_id, provider_event_id)
+        with self._lock:
+            self._recent_event_keys.pop(event_key, None)
+
+    def get_metrics(self) -> webhook_dto.WebhookDedupFilterMetricsDTO:
+        with self._lock:
+            return webhook_dto.WebhookDedupFilterMetricsDTO(
+                capacity=self._capacity,
+                tracked_event_count=len(self._recent_event_keys),
+                hit_total=self._hit_total,
+                miss_total=self._miss_total,
+                eviction_total=self._eviction_total,
+            )
+
+    def _build_event_key(self, tenant_id: str, provider_event_id: str) -> str:
+        return f"{tenant_id}:{provider_event_id}"
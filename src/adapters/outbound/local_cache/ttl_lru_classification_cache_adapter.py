@@ -0,0 +1,117 @@
+import collections
+import datetime
+import threading
+
+import src.infra.logs as app_logs
+import src.ports.classification_cache_port as classification_cache_port
+import src.ports.classification_cache_store_port as classification_cache_store_port
+import src.ports.clock_port as clock_port
+import src.services.dto.llm_dto as llm_dto
+
+logger = app_logs.get_logger(__name__)
+
+
+class TtlLruClassificationCacheAdapter(classification_cache_port.ClassificationCachePort):
+    def __init__(
+        self,
+        capacity: int,
+        ttl_seconds: int,
+        clock: clock_port.ClockPort,
+        key_namespace: str,
+        store: classification_cache_store_port.ClassificationCacheStorePort | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("classification cache capacity must be at least 1")
+        if ttl_seconds < 1:
+            raise ValueError("classification cache ttl_seconds must be at least 1")
+        self._capacity = capacity
+        self._ttl = datetime.timedelta(seconds=ttl_seconds)
+        self._clock = clock
+        self._key_namespace = key_namespace
+        self._store = store
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[str, tuple[str, datetime.datetime]] = (
+            collections.OrderedDict()
+        )
+        self._hit_total = 0
+        self._miss_total = 0
+        self._store_hit_total = 0
+
+    def get(self, cache_key: str) -> str | None:
+        namespaced_key = self._namespaced_key(cache_key)
+        now_value = self._clock.now()
+        with self._lock:
+            entry = self._entries.get(namespaced_key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now_value:
+                    self._entries.move_to_end(namespaced_key)
+                    self._hit_total += 1
+                    return value
+                del self._entries[namespaced_key]
+
+        stored_value = self._get_from_store(namespaced_key, now_value)
+        with self._lock:
+            if stored_value is None:
+                self._miss_total += 1
+                return None
+            self._hit_total += 1
+            self._store_hit_total += 1
+            self._remember(namespaced_key, stored_value, now_value + self._ttl)
+        return stored_value
+
+    def put(self, cache_key: str, value: str) -> None:
+        namespaced_key = self._namespaced_key(cache_key)
+        expires_at = self._clock.now() + self._ttl
+        with self._lock:
+            self._remember(namespaced_key, value, expires_at)
+        if self._store is None:
+            return
+        try:
+            self._store.put(namespaced_key, value, expires_at)
+        except Exception:
+            self._log_store_failure("put")
+
+    def get_metrics(self) -> llm_dto.ClassificationCacheMetricsDTO:
+        with self._lock:
+            lookup_total = self._hit_total + self._miss_total
+            return llm_dto.ClassificationCacheMetricsDTO(
+                capacity=self._capacity,
+                entry_count=len(self._entries),
+                hit_total=self._hit_total,
+                miss_total=self._miss_total,
+                store_hit_total=self._store_hit_total,
+                hit_rate=self._hit_total / lookup_total if lookup_total else 0.0,
+            )
+
+    def _namespaced_key(self, cache_key: str) -> str:
+        return f"{self._key_namespace}:{cache_key}"
+
+    def _remember(self, namespaced_key: str, value: str, expires_at: datetime.datetime) -> None:
+        self._entries[namespaced_key] = (value, expires_at)
+        self._entries.move_to_end(namespaced_key)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def _get_from_store(self, namespaced_key: str, now_value: datetime.datetime) -> str | None:
+        if self._store is None:
+            return None
+        try:
+            return self._store.get(namespaced_key, now_value)
+        except Exception:
+            # The cache is best effort: a store outage only costs an LLM call.
+            self._log_store_failure("get")
+            return None
+
+    def _log_store_failure(self, operation: str) -> None:
+        logger.warning(
+            "classification_cache.store_failed",
+            exc_info=True,
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="classification_cache.store_failed",
+                    message="persistent classification cache operation failed",
+                    data={"operation": operation},
+                )
+            },
+        )
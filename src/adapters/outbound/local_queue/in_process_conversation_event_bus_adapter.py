@@ -0,0 +1,155 @@
+import asyncio
+import contextlib
+import queue
+import threading
+import uuid
+
+import src.infra.logs as app_logs
+import src.ports.conversation_event_bus_port as conversation_event_bus_port
+import src.services.dto.conversation_dto as conversation_dto
+
+logger = app_logs.get_logger(__name__)
+
+
+class _Subscription:
+    def __init__(self, subscription_id: str, tenant_id: str, queue_size: int) -> None:
+        self.subscription_id = subscription_id
+        self.tenant_id = tenant_id
+        self.events: queue.Queue[conversation_dto.ConversationStreamEventDTO | None] = queue.Queue(
+            maxsize=queue_size
+        )
+        self.active = True
+        self.async_waiter: tuple[asyncio.AbstractEventLoop, asyncio.Event] | None = None
+
+    def wake_async_waiter(self) -> None:
+        async_waiter = self.async_waiter
+        if async_waiter is None:
+            return
+        waiter_loop, waiter_event = async_waiter
+        # Publishers run on worker threads; the waiter lives on the server event loop.
+        with contextlib.suppress(RuntimeError):
+            waiter_loop.call_soon_threadsafe(waiter_event.set)
+
+
+class InProcessConversationEventBusAdapter(conversation_event_bus_port.ConversationEventBusPort):
+    def __init__(self, max_subscribers_per_tenant: int, subscriber_queue_size: int = 256) -> None:
+        if max_subscribers_per_tenant < 1:
+            raise ValueError("conversation event bus max_subscribers_per_tenant must be at least 1")
+        if subscriber_queue_size < 1:
+            raise ValueError("conversation event bus subscriber_queue_size must be at least 1")
+        self._max_subscribers_per_tenant = max_subscribers_per_tenant
+        self._subscriber_queue_size = subscriber_queue_size
+        self._lock = threading.Lock()
+        self._subscription_by_id: dict[str, _Subscription] = {}
+        self._subscription_ids_by_tenant: dict[str, set[str]] = {}
+        self._accepting = True
+
+    def publish(self, event: conversation_dto.ConversationStreamEventDTO) -> None:
+        with self._lock:
+            subscriptions = [
+                self._subscription_by_id[subscription_id]
+                for subscription_id in self._subscription_ids_by_tenant.get(event.tenant_id, ())
+            ]
+        for subscription in subscriptions:
+            try:
+                subscription.events.put_nowait(event)
+                subscription.wake_async_waiter()
+            except queue.Full:
+                # Slow consumers are disconnected; they resync through the changes endpoint.
+                self._close(subscription.subscription_id)
+                logger.warning(
+                    "conversation.stream.subscriber_overflow",
+                    extra={
+                        "event_data": app_logs.build_log_event(
+                            event_name="conversation.stream.subscriber_overflow",
+                            message="conversation stream subscriber closed after queue overflow",
+                            data={
+                                "tenant_id": event.tenant_id,
+                                "subscriber_queue_size": self._subscriber_queue_size,
+                            },
+                        )
+                    },
+                )
+
+    def subscribe(self, tenant_id: str) -> str | None:
+        with self._lock:
+            if not self._accepting:
+                return None
+            tenant_subscription_ids = self._subscription_ids_by_tenant.setdefault(tenant_id, set())
+            if len(tenant_subscription_ids) >= self._max_subscribers_per_tenant:
+                return None
+            subscription_id = uuid.uuid4().hex
+            tenant_subscription_ids.add(subscription_id)
+            self._subscription_by_id[subscription_id] = _Subscription(
+                subscription_id=subscription_id,
+                tenant_id=tenant_id,
+                queue_size=self._subscriber_queue_size,
+            )
+            return subscription_id
+
+    def next_event(
+        self,
+        subscription_id: str,
+        timeout_seconds: float,
+    ) -> conversation_dto.ConversationStreamEventDTO | None:
+        with self._lock:
+            subscription = self._subscription_by_id.get(subscription_id)
+        if subscription is None:
+            return None
+        try:
+            return subscription.events.get(timeout=max(timeout_seconds, 0.0))
+        except queue.Empty:
+            return None
+
+    async def anext_event(
+        self,
+        subscription_id: str,
+        timeout_seconds: float,
+    ) -> conversation_dto.ConversationStreamEventDTO | None:
+        with self._lock:
+            subscription = self._subscription_by_id.get(subscription_id)
+        if subscription is None:
+            return None
+        waiter_event = asyncio.Event()
+        subscription.async_waiter = (asyncio.get_running_loop(), waiter_event)
+        try:
+            # Re-checked after registering the waiter so a concurrent publish is never missed.
+            with contextlib.suppress(queue.Empty):
+                return subscription.events.get_nowait()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(waiter_event.wait(), timeout=max(timeout_seconds, 0.0))
+            with contextlib.suppress(queue.Empty):
+                return subscription.events.get_nowait()
+            return None
+        finally:
+            subscription.async_waiter = None
+
+    def is_active(self, subscription_id: str) -> bool:
+        with self._lock:
+            subscription = self._subscription_by_id.get(subscription_id)
+            return subscription is not None and subscription.active
+
+    def unsubscribe(self, subscription_id: str) -> None:
+        self._close(subscription_id)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._accepting = False
+            subscription_ids = list(self._subscription_by_id.keys())
+        for subscription_id in subscription_ids:
+            self._close(subscription_id)
+
+    def _close(self, subscription_id: str) -> None:
+        with self._lock:
+            subscription = self._subscription_by_id.pop(subscription_id, None)
+            if subscription is None:
+                return
+            subscription.active = False
+            tenant_subscription_ids = self._subscription_ids_by_tenant.get(subscription.tenant_id)
+            if tenant_subscription_ids is not None:
+                tenant_subscription_ids.discard(subscription_id)
+                if not tenant_subscription_ids:
+                    del self._subscription_ids_by_tenant[subscription.tenant_id]
+        with contextlib.suppress(queue.Full):
+            subscription.events.put_nowait(None)
+        subscription.wake_async_waiter()
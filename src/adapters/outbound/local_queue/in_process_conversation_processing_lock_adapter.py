@@ -0,0 +1,47 @@
+import datetime
+import threading
+
+import src.ports.conversation_processing_lock_port as conversation_processing_lock_port
+
+
+class InProcessConversationProcessingLockAdapter(
+    conversation_processing_lock_port.ConversationProcessingLockPort
+):
+    # With single-instance routing every turn of a conversation runs in this process, so a
+    # holder map guarded by a thread lock replaces the Firestore lock document.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._holder_id_by_key: dict[tuple[str, str], str] = {}
+
+    def try_acquire(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        holder_id: str,
+        acquired_at: datetime.datetime,
+    ) -> bool:
+        del acquired_at
+        key = (tenant_id, conversation_id)
+        with self._lock:
+            if key in self._holder_id_by_key:
+                return False
+            self._holder_id_by_key[key] = holder_id
+            return True
+
+    def release(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        holder_id: str,
+        released_at: datetime.datetime,
+    ) -> None:
+        del released_at
+        key = (tenant_id, conversation_id)
+        with self._lock:
+            if self._holder_id_by_key.get(key) == holder_id:
+                del self._holder_id_by_key[key]
+
+    def delete_expired(self, now: datetime.datetime, limit: int) -> int:
+        # Locks are dropped on release, so there is never anything left to expire.
+        del now, limit
+        return 0
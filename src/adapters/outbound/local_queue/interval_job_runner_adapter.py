@@ -0,0 +1,48 @@
+import threading
+
+import src.infra.logs as app_logs
+import src.ports.periodic_job_runner_port as periodic_job_runner_port
+
+logger = app_logs.get_logger(__name__)
+
+
+class IntervalJobRunnerAdapter(periodic_job_runner_port.PeriodicJobRunnerPort):
+    def __init__(self, interval_seconds: float, name: str) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval job runner interval_seconds must be positive")
+        self._interval_seconds = interval_seconds
+        self._name = name
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, job: periodic_job_runner_port.PeriodicJob) -> None:
+        if self._thread is not None:
+            raise RuntimeError("interval job runner is already started")
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(job,),
+            name=self._name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def shutdown(self, timeout_seconds: float) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(max(timeout_seconds, 0.0))
+
+    def _run(self, job: periodic_job_runner_port.PeriodicJob) -> None:
+        while not self._stop_event.wait(self._interval_seconds):
+            try:
+                job()
+            except Exception:
+                logger.exception(
+                    "periodic_job.failed",
+                    extra={
+                        "event_data": app_logs.build_log_event(
+                            event_name="periodic_job.failed",
+                            message="periodic background job raised an unexpected error",
+                            data={"job_name": self._name},
+                        )
+                    },
+                )
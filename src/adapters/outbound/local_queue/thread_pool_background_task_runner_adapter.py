@@ -0,0 +1,76 @@
+import concurrent.futures
+import threading
+import time
+
+import src.infra.logs as app_logs
+import src.ports.background_task_runner_port as background_task_runner_port
+
+logger = app_logs.get_logger(__name__)
+
+
+class ThreadPoolBackgroundTaskRunnerAdapter(background_task_runner_port.BackgroundTaskRunnerPort):
+    def __init__(self, worker_count: int, name: str) -> None:
+        if worker_count < 1:
+            raise ValueError("background task runner worker_count must be at least 1")
+        self._name = name
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=worker_count,
+            thread_name_prefix=name,
+        )
+        self._lock = threading.Lock()
+        self._futures_by_key: dict[str, concurrent.futures.Future[None]] = {}
+        self._accepting = True
+
+    def submit(self, task_key: str, task: background_task_runner_port.BackgroundTask) -> bool:
+        with self._lock:
+            # One in-flight task per key: a later run picks up whatever this one missed.
+            if not self._accepting or task_key in self._futures_by_key:
+                return False
+            future = self._executor.submit(self._run_task, task_key, task)
+            self._futures_by_key[task_key] = future
+        return True
+
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        deadline = time.monotonic() + max(drain_timeout_seconds, 0.0)
+        with self._lock:
+            self._accepting = False
+            running_futures = list(self._futures_by_key.values())
+        _, not_done = concurrent.futures.wait(
+            running_futures,
+            timeout=max(deadline - time.monotonic(), 0.0),
+        )
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(
+            "background_tasks.shutdown",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="background_tasks.shutdown",
+                    message="background task runner stopped",
+                    data={
+                        "runner_name": self._name,
+                        "unfinished_tasks": len(not_done),
+                    },
+                )
+            },
+        )
+
+    def _run_task(self, task_key: str, task: background_task_runner_port.BackgroundTask) -> None:
+        try:
+            task()
+        except Exception:
+            logger.exception(
+                "background_tasks.task_failed",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="background_tasks.task_failed",
+                        message="background task raised an unexpected error",
+                        data={
+                            "runner_name": self._name,
+                            "task_key": task_key,
+                        },
+                    )
+                },
+            )
+        finally:
+            with self._lock:
+                self._futures_by_key.pop(task_key, None)
@@ -0,0 +1,221 @@
+import math
+import queue
+import threading
+import time
+import zlib
+
+import src.infra.logs as app_logs
+import src.ports.webhook_event_queue_port as webhook_event_queue_port
+import src.services.dto.webhook_dto as webhook_dto
+
+logger = app_logs.get_logger(__name__)
+
+
+class ThreadPoolWebhookEventQueueAdapter(webhook_event_queue_port.WebhookEventQueuePort):
+    _poll_interval_seconds = 0.2
+
+    def __init__(self, worker_count: int, max_queue_size: int) -> None:
+        if worker_count < 1:
+            raise ValueError("webhook queue worker_count must be at least 1")
+        if max_queue_size < 1:
+            raise ValueError("webhook queue max_queue_size must be at least 1")
+        self._worker_count = worker_count
+        self._max_queue_size = max_queue_size
+        shard_capacity = math.ceil(max_queue_size / worker_count)
+        self._shard_queues: list[queue.Queue[webhook_dto.IncomingMessageEventDTO]] = [
+            queue.Queue(maxsize=shard_capacity) for _ in range(worker_count)
+        ]
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._workers: list[threading.Thread] = []
+        self._handler: webhook_event_queue_port.WebhookEventHandler | None = None
+        self._accepting = False
+        self._pending_count = 0
+        self._in_flight = 0
+        self._submitted_total = 0
+        self._completed_total = 0
+        self._failed_total = 0
+        self._rejected_total = 0
+        self._dropped_total = 0
+
+    def start(self, handler: webhook_event_queue_port.WebhookEventHandler) -> None:
+        with self._condition:
+            if self._handler is not None:
+                raise RuntimeError("webhook event queue is already started")
+            self._handler = handler
+            self._accepting = True
+        for worker_index in range(self._worker_count):
+            worker = threading.Thread(
+                target=self._run_worker,
+                args=(self._shard_queues[worker_index],),
+                name=f"webhook-worker-{worker_index}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, event: webhook_dto.IncomingMessageEventDTO) -> bool:
+        shard_index = self._resolve_shard_index(event)
+        shard_queue = self._shard_queues[shard_index]
+        with self._condition:
+            if not self._accepting:
+                self._rejected_total += 1
+                return False
+            try:
+                shard_queue.put_nowait(event)
+            except queue.Full:
+                self._rejected_total += 1
+                queue_depth = shard_queue.qsize()
+                rejected_total = self._rejected_total
+            else:
+                self._pending_count += 1
+                self._submitted_total += 1
+                return True
+
+        logger.warning(
+            "webhook.queue.rejected",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="webhook.queue.rejected",
+                    message="webhook event queue is full, caller must apply backpressure",
+                    data={
+                        "provider_event_id": event.provider_event_id,
+                        "shard_index": shard_index,
+                        "queue_depth": queue_depth,
+                        "max_queue_size": self._max_queue_size,
+                        "rejected_total": rejected_total,
+                    },
+                )
+            },
+        )
+        return False
+
+    def get_metrics(self) -> webhook_dto.WebhookEventQueueMetricsDTO:
+        with self._condition:
+            return webhook_dto.WebhookEventQueueMetricsDTO(
+                accepting=self._accepting,
+                worker_count=self._worker_count,
+                max_queue_size=self._max_queue_size,
+                queue_depth=sum(shard_queue.qsize() for shard_queue in self._shard_queues),
+                in_flight=self._in_flight,
+                submitted_total=self._submitted_total,
+                completed_total=self._completed_total,
+                failed_total=self._failed_total,
+                rejected_total=self._rejected_total,
+                dropped_total=self._dropped_total,
+            )
+
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        deadline = time.monotonic() + max(drain_timeout_seconds, 0.0)
+        with self._condition:
+            self._accepting = False
+            while self._pending_count > 0:
+                remaining_seconds = deadline - time.monotonic()
+                if remaining_seconds <= 0:
+                    break
+                self._condition.wait(remaining_seconds)
+            drained = self._pending_count == 0
+
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.join(max(deadline - time.monotonic(), self._poll_interval_seconds))
+
+        metrics = self.get_metrics()
+        log_data: dict[str, object] = {
+            "drained": drained,
+            "queue_depth": metrics.queue_depth,
+            "in_flight": metrics.in_flight,
+            "completed_total": metrics.completed_total,
+            "failed_total": metrics.failed_total,
+            "dropped_total": metrics.dropped_total,
+        }
+        if drained:
+            logger.info(
+                "webhook.queue.drained",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="webhook.queue.drained",
+                        message="webhook event queue drained on shutdown",
+                        data=log_data,
+                    )
+                },
+            )
+            return
+        logger.warning(
+            "webhook.queue.drain_timeout",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="webhook.queue.drain_timeout",
+                    message="webhook event queue did not drain before shutdown timeout",
+                    data=log_data,
+                )
+            },
+        )
+
+    def _resolve_shard_index(self, event: webhook_dto.IncomingMessageEventDTO) -> int:
+        conversation_key = f"{event.phone_number_id}:{event.whatsapp_user_id}"
+        return zlib.crc32(conversation_key.encode("utf-8")) % self._worker_count
+
+    def _run_worker(self, shard_queue: queue.Queue[webhook_dto.IncomingMessageEventDTO]) -> None:
+        while True:
+            try:
+                event = shard_queue.get(timeout=self._poll_interval_seconds)
+            except queue.Empty:
+                if self._stop_event.is_set():
+                    return
+                continue
+
+            if self._stop_event.is_set():
+                self._finish_event(shard_queue, dropped=True, failed=False)
+                logger.warning(
+                    "webhook.queue.event_dropped",
+                    extra={
+                        "event_data": app_logs.build_log_event(
+                            event_name="webhook.queue.event_dropped",
+                            message="queued webhook event dropped after shutdown timeout",
+                            data={"provider_event_id": event.provider_event_id},
+                        )
+                    },
+                )
+                continue
+
+            with self._condition:
+                self._in_flight += 1
+            failed = False
+            try:
+                handler = self._handler
+                if handler is not None:
+                    handler(event)
+            except Exception:
+                failed = True
+                logger.exception(
+                    "webhook.queue.handler_failed",
+                    extra={
+                        "event_data": app_logs.build_log_event(
+                            event_name="webhook.queue.handler_failed",
+                            message="queued webhook event handler raised an unexpected error",
+                            data={"provider_event_id": event.provider_event_id},
+                        )
+                    },
+                )
+            finally:
+                with self._condition:
+                    self._in_flight -= 1
+                self._finish_event(shard_queue, dropped=False, failed=failed)
+
+    def _finish_event(
+        self,
+        shard_queue: queue.Queue[webhook_dto.IncomingMessageEventDTO],
+        dropped: bool,
+        failed: bool,
+    ) -> None:
+        with self._condition:
+            self._pending_count -= 1
+            if dropped:
+                self._dropped_total += 1
+            elif failed:
+                self._failed_total += 1
+            else:
+                self._completed_total += 1
+            self._condition.notify_all()
+        shard_queue.task_done()
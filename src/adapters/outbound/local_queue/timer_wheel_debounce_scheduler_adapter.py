@@ -0,0 +1,196 @@
+import concurrent.futures
+import math
+import threading
+import time
+
+import src.infra.logs as app_logs
+import src.ports.conversation_debounce_scheduler_port as conversation_debounce_scheduler_port
+
+logger = app_logs.get_logger(__name__)
+
+ConversationKey = tuple[str, str]
+
+
+class _TimerEntry:
+    def __init__(
+        self,
+        key: ConversationKey,
+        slot_index: int,
+        remaining_rounds: int,
+        callback: conversation_debounce_scheduler_port.DebouncedCallback,
+    ) -> None:
+        self.key = key
+        self.slot_index = slot_index
+        self.remaining_rounds = remaining_rounds
+        self.callback = callback
+
+
+class TimerWheelDebounceSchedulerAdapter(
+    conversation_debounce_scheduler_port.ConversationDebounceSchedulerPort
+):
+    def __init__(
+        self,
+        worker_count: int,
+        tick_seconds: float = 0.1,
+        wheel_size: int = 512,
+    ) -> None:
+        if worker_count < 1:
+            raise ValueError("debounce scheduler worker_count must be at least 1")
+        if tick_seconds <= 0:
+            raise ValueError("debounce scheduler tick_seconds must be positive")
+        if wheel_size < 1:
+            raise ValueError("debounce scheduler wheel_size must be at least 1")
+        self._tick_seconds = tick_seconds
+        self._wheel_size = wheel_size
+        self._slots: list[dict[ConversationKey, _TimerEntry]] = [{} for _ in range(wheel_size)]
+        self._entry_by_key: dict[ConversationKey, _TimerEntry] = {}
+        self._current_slot_index = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=worker_count,
+            thread_name_prefix="debounce-worker",
+        )
+        self._running_futures: set[concurrent.futures.Future[None]] = set()
+        self._running_keys: set[ConversationKey] = set()
+        self._accepting = True
+        self._ticker = threading.Thread(
+            target=self._run_ticker,
+            name="debounce-timer-wheel",
+            daemon=True,
+        )
+        self._ticker.start()
+
+    def schedule(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        delay_seconds: float,
+        callback: conversation_debounce_scheduler_port.DebouncedCallback,
+    ) -> bool:
+        key = (tenant_id, conversation_id)
+        delay_ticks = max(1, math.ceil(delay_seconds / self._tick_seconds))
+        with self._lock:
+            if not self._accepting:
+                raise RuntimeError("debounce scheduler is shut down")
+            existing_entry = self._entry_by_key.pop(key, None)
+            if existing_entry is not None:
+                self._slots[existing_entry.slot_index].pop(key, None)
+            slot_index = (self._current_slot_index + delay_ticks) % self._wheel_size
+            entry = _TimerEntry(
+                key=key,
+                slot_index=slot_index,
+                remaining_rounds=(delay_ticks - 1) // self._wheel_size,
+                callback=callback,
+            )
+            self._slots[slot_index][key] = entry
+            self._entry_by_key[key] = entry
+        return existing_entry is not None
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._entry_by_key)
+
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        deadline = time.monotonic() + max(drain_timeout_seconds, 0.0)
+        with self._lock:
+            self._accepting = False
+            pending_entries = list(self._entry_by_key.values())
+            self._entry_by_key = {}
+            self._slots = [{} for _ in range(self._wheel_size)]
+        self._stop_event.set()
+        self._ticker.join(max(deadline - time.monotonic(), self._tick_seconds))
+
+        self._wait_running_callbacks(deadline)
+        for entry in pending_entries:
+            self._dispatch(entry)
+        not_done = self._wait_running_callbacks(deadline)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(
+            "webhook.debounce_scheduler.shutdown",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="webhook.debounce_scheduler.shutdown",
+                    message="debounce scheduler flushed pending timers on shutdown",
+                    data={
+                        "flushed_timers": len(pending_entries),
+                        "unfinished_callbacks": len(not_done),
+                    },
+                )
+            },
+        )
+
+    def _run_ticker(self) -> None:
+        next_tick_at = time.monotonic() + self._tick_seconds
+        while not self._stop_event.wait(max(next_tick_at - time.monotonic(), 0.0)):
+            next_tick_at += self._tick_seconds
+            self._advance_one_tick()
+
+    def _advance_one_tick(self) -> None:
+        due_entries: list[_TimerEntry] = []
+        with self._lock:
+            self._current_slot_index = (self._current_slot_index + 1) % self._wheel_size
+            slot = self._slots[self._current_slot_index]
+            next_slot_index = (self._current_slot_index + 1) % self._wheel_size
+            for key, entry in list(slot.items()):
+                if entry.remaining_rounds > 0:
+                    entry.remaining_rounds -= 1
+                    continue
+                del slot[key]
+                if key in self._running_keys:
+                    # Keep callbacks of one conversation serial: retry on the next tick.
+                    entry.slot_index = next_slot_index
+                    self._slots[next_slot_index][key] = entry
+                    continue
+                self._entry_by_key.pop(key, None)
+                due_entries.append(entry)
+        for entry in due_entries:
+            self._dispatch(entry)
+
+    def _dispatch(self, entry: _TimerEntry) -> None:
+        with self._lock:
+            self._running_keys.add(entry.key)
+        try:
+            future = self._executor.submit(self._run_callback, entry)
+        except RuntimeError:
+            with self._lock:
+                self._running_keys.discard(entry.key)
+            return
+        with self._lock:
+            self._running_futures.add(future)
+        future.add_done_callback(self._forget_future)
+
+    def _forget_future(self, future: concurrent.futures.Future[None]) -> None:
+        with self._lock:
+            self._running_futures.discard(future)
+
+    def _wait_running_callbacks(self, deadline: float) -> set[concurrent.futures.Future[None]]:
+        with self._lock:
+            running_futures = list(self._running_futures)
+        _, not_done = concurrent.futures.wait(
+            running_futures,
+            timeout=max(deadline - time.monotonic(), 0.0),
+        )
+        return not_done
+
+    def _run_callback(self, entry: _TimerEntry) -> None:
+        try:
+            entry.callback()
+        except Exception:
+            tenant_id, conversation_id = entry.key
+            logger.exception(
+                "webhook.debounce_scheduler.callback_failed",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="webhook.debounce_scheduler.callback_failed",
+                        message="debounced conversation callback raised an unexpected error",
+                        data={
+                            "tenant_id": tenant_id,
+                            "conversation_id": conversation_id,
+                        },
+                    )
+                },
+            )
+        finally:
+            with self._lock:
+                self._running_keys.discard(entry.key)
@@ -3,6 +3,7 @@ import typing
 
 import pydantic
 
+import src.domain.entities.conversation_summary as conversation_summary_entity
 import src.domain.entities.message as message_entity
 
 
@@ -23,14 +24,70 @@ class Conversation(pydantic.BaseModel):
     last_message_preview: str | None
     message_ids: list[str]
     messages: list[message_entity.Message] = pydantic.Field(default_factory=list)
+    message_seq: int = 0
     control_mode: typing.Literal["AI", "HUMAN"] = "AI"
     subsessions: list[ConversationSubsession] = pydantic.Field(default_factory=list)
+    subsessions_count: int = 0
+    last_subsession_archived_at: datetime.datetime | None = None
+    subsession_request_ids: list[str] = pydantic.Field(default_factory=list)
+    running_summary: str | None = None
+    summarized_through_at: datetime.datetime | None = None
+    summarized_through_message_id: str | None = None
+    _persisted_state: dict[str, object] | None = pydantic.PrivateAttr(default=None)
+
+    @pydantic.model_validator(mode="after")
+    def sync_subsession_index(self) -> "Conversation":
+        # Documents written before cold storage only carry the embedded subsessions.
+        if self.subsessions_count < len(self.subsessions):
+            self.subsessions_count = len(self.subsessions)
+            self.last_subsession_archived_at = self.subsessions[-1].archived_at
+            self.subsession_request_ids = [
+                subsession.scheduling_request_id for subsession in self.subsessions
+            ]
+        return self
+
+    def mark_persisted(self) -> None:
+        self._persisted_state = self.model_dump(mode="python")
+
+    def is_persisted(self) -> bool:
+        return self._persisted_state is not None
+
+    def dirty_fields(self) -> list[str]:
+        current_state = self.model_dump(mode="python")
+        if self._persisted_state is None:
+            return list(current_state.keys())
+        return [
+            field_name
+            for field_name, field_value in current_state.items()
+            if self._persisted_state.get(field_name) != field_value
+        ]
+
+    def appended_message_ids(self) -> list[str] | None:
+        # None when message_ids changed other than by appending (or was never persisted).
+        if self._persisted_state is None:
+            return None
+        persisted_message_ids = self._persisted_state.get("message_ids")
+        if not isinstance(persisted_message_ids, list):
+            return None
+        if self.message_ids[: len(persisted_message_ids)] != persisted_message_ids:
+            return None
+        return self.message_ids[len(persisted_message_ids) :]
 
     def append_message(self, message_id: str, preview: str, now: datetime.datetime) -> None:
         self.message_ids.append(message_id)
         self.last_message_preview = preview[:120]
         self.updated_at = now
 
+    def to_summary(self) -> conversation_summary_entity.ConversationSummary:
+        return conversation_summary_entity.ConversationSummary(
+            id=self.id,
+            tenant_id=self.tenant_id,
+            whatsapp_user_id=self.whatsapp_user_id,
+            last_message_preview=self.last_message_preview,
+            updated_at=self.updated_at,
+            control_mode=self.control_mode,
+        )
+
     def set_control_mode(
         self,
         control_mode: typing.Literal["AI", "HUMAN"],
@@ -39,6 +96,30 @@ class Conversation(pydantic.BaseModel):
         self.control_mode = control_mode
         self.updated_at = now
 
+    def fold_into_running_summary(
+        self,
+        running_summary: str,
+        summarized_through_at: datetime.datetime,
+        summarized_through_message_id: str,
+    ) -> None:
+        # Background bookkeeping: leaves updated_at alone so inbox ordering is unaffected.
+        self.running_summary = running_summary
+        self.summarized_through_at = summarized_through_at
+        self.summarized_through_message_id = summarized_through_message_id
+
+    def clear_running_summary(self) -> None:
+        self.running_summary = None
+        self.summarized_through_at = None
+        self.summarized_through_message_id = None
+
+    def is_summarized_message(self, message: message_entity.Message) -> bool:
+        if self.summarized_through_at is None:
+            return False
+        return (message.created_at, message.id) <= (
+            self.summarized_through_at,
+            self.summarized_through_message_id or "",
+        )
+
     def archive_current_session(
         self,
         scheduling_request_id: str,
@@ -65,6 +146,9 @@ class Conversation(pydantic.BaseModel):
             messages=active_messages,
         )
         self.subsessions.append(session_snapshot)
+        self.subsessions_count += 1
+        self.last_subsession_archived_at = now
+        self.subsession_request_ids.append(scheduling_request_id)
         self.message_ids = []
         self.messages = []
         self.last_message_preview = None
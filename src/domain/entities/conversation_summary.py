@@ -0,0 +1,13 @@
+import datetime
+import typing
+
+import pydantic
+
+
+class ConversationSummary(pydantic.BaseModel):
+    id: str
+    tenant_id: str
+    whatsapp_user_id: str
+    last_message_preview: str | None
+    updated_at: datetime.datetime
+    control_mode: typing.Literal["AI", "HUMAN"] = "AI"
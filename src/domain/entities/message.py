@@ -1,8 +1,15 @@
 import datetime
+import math
 import typing
 
 import pydantic
 
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_token_count(text: str) -> int:
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
 
 class Message(pydantic.BaseModel):
     id: str
@@ -13,6 +20,7 @@ class Message(pydantic.BaseModel):
     content: str
     provider_message_id: str | None
     created_at: datetime.datetime
+    token_estimate: int | None = None
 
     @pydantic.field_validator("content")
     @classmethod
@@ -21,3 +29,9 @@ class Message(pydantic.BaseModel):
         if not normalized_value:
             raise ValueError("message content cannot be empty")
         return normalized_value
+
+    @pydantic.model_validator(mode="after")
+    def fill_token_estimate(self) -> "Message":
+        if self.token_estimate is None:
+            self.token_estimate = estimate_token_count(self.content)
+        return self
@@ -0,0 +1,12 @@
+import datetime
+
+import pydantic
+
+
+class MessageSearchPosting(pydantic.BaseModel):
+    term: str
+    tenant_id: str
+    conversation_id: str
+    message_id: str
+    created_at: datetime.datetime
+    term_frequency: int
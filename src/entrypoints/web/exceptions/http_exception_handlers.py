@@ -75,6 +75,17 @@ def register_exception_handlers(app: fastapi.FastAPI) -> None:
             content={"detail": str(error)},
         )
 
+    @app.exception_handler(service_exceptions.CapacityExceededError)
+    async def handle_capacity_exceeded_error(
+        request: fastapi.Request,
+        error: service_exceptions.CapacityExceededError,
+    ) -> fastapi_responses.JSONResponse:
+        return _build_json_response(
+            request=request,
+            status_code=429,
+            content={"detail": str(error)},
+        )
+
     @app.exception_handler(service_exceptions.ExternalProviderError)
     async def handle_external_provider_error(
         request: fastapi.Request,
@@ -1,3 +1,9 @@
+import asyncio
+import collections.abc
+import contextlib
+import typing
+
+import anyio.to_thread as anyio_to_thread
 import fastapi
 import fastapi.middleware.cors as fastapi_cors
 
@@ -21,8 +27,21 @@ import src.infra.container as app_container
 import src.infra.logs as app_logs
 
 
+@contextlib.asynccontextmanager
+async def _lifespan(app: fastapi.FastAPI) -> collections.abc.AsyncIterator[None]:
+    container = typing.cast(app_container.AppContainer, app.state.container)
+    # Sync routes block on Firestore and provider I/O; the anyio default of 40 threads
+    # otherwise caps in-flight requests per instance.
+    anyio_to_thread.current_default_thread_limiter().total_tokens = (
+        container.settings.http_threadpool_size
+    )
+    yield
+    await asyncio.to_thread(container.shutdown)
+    await container.llm_provider_adapter.aclose()
+
+
 def create_app() -> fastapi.FastAPI:
-    app = fastapi.FastAPI(title="AI Agent WhatsApp MVP", version="0.1.0")
+    app = fastapi.FastAPI(title="AI Agent WhatsApp MVP", version="0.1.0", lifespan=_lifespan)
     app.state.container = app_container.AppContainer()
     app_logs.configure_logging(app.state.container.settings.log_level)
     app.add_middleware(
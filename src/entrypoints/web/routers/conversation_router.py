@@ -1,4 +1,5 @@
 import fastapi
+import fastapi.responses as fastapi_responses
 
 import src.entrypoints.web.dependencies as http_dependencies
 import src.infra.container as app_container
@@ -10,19 +11,75 @@ router = fastapi.APIRouter(prefix="/v1/conversations", tags=["conversations"])
 
 @router.get("", response_model=conversation_dto.ConversationListResponseDTO)
 def list_conversations(
+    limit: int | None = fastapi.Query(default=None, ge=1, le=200),
+    after: str | None = fastapi.Query(default=None),
     claims: auth_dto.TokenClaimsDTO = fastapi.Depends(http_dependencies.get_current_claims),
     container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
 ) -> conversation_dto.ConversationListResponseDTO:
-    return container.conversation_query_service.list_conversations(claims.tenant_id)
+    return container.conversation_query_service.list_conversations(
+        claims.tenant_id,
+        limit=limit,
+        after=after,
+    )
+
+
+@router.get("/changes", response_model=conversation_dto.ConversationChangesResponseDTO)
+def list_changes(
+    since: str | None = fastapi.Query(default=None),
+    limit: int | None = fastapi.Query(default=None, ge=1, le=200),
+    claims: auth_dto.TokenClaimsDTO = fastapi.Depends(http_dependencies.get_current_claims),
+    container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
+) -> conversation_dto.ConversationChangesResponseDTO:
+    return container.conversation_query_service.list_changes(
+        claims.tenant_id,
+        since=since,
+        limit=limit,
+    )
+
+
+@router.get("/search", response_model=conversation_dto.ConversationSearchResponseDTO)
+def search_messages(
+    q: str = fastapi.Query(min_length=1, max_length=200),
+    limit: int | None = fastapi.Query(default=None, ge=1, le=50),
+    claims: auth_dto.TokenClaimsDTO = fastapi.Depends(http_dependencies.get_current_claims),
+    container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
+) -> conversation_dto.ConversationSearchResponseDTO:
+    return container.conversation_query_service.search_messages(
+        claims.tenant_id,
+        q,
+        limit=limit,
+    )
+
+
+@router.get("/stream")
+async def stream_conversation_events(
+    claims: auth_dto.TokenClaimsDTO = fastapi.Depends(http_dependencies.get_current_claims),
+    container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
+) -> fastapi_responses.StreamingResponse:
+    subscription_id = container.conversation_stream_service.open_stream(claims.tenant_id)
+    return fastapi_responses.StreamingResponse(
+        container.conversation_stream_service.aiter_events(subscription_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{conversation_id}/messages", response_model=conversation_dto.MessageListResponseDTO)
 def list_messages(
     conversation_id: str,
+    limit: int | None = fastapi.Query(default=None, ge=1, le=200),
+    before: str | None = fastapi.Query(default=None),
+    after: str | None = fastapi.Query(default=None),
     claims: auth_dto.TokenClaimsDTO = fastapi.Depends(http_dependencies.get_current_claims),
     container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
 ) -> conversation_dto.MessageListResponseDTO:
-    return container.conversation_query_service.list_messages(claims.tenant_id, conversation_id)
+    return container.conversation_query_service.list_messages(
+        claims.tenant_id,
+        conversation_id,
+        limit=limit,
+        before=before,
+        after=after,
+    )
 
 
 @router.put(
@@ -1,8 +1,34 @@
 import fastapi
 
+import src.entrypoints.web.dependencies as http_dependencies
+import src.infra.container as app_container
+import src.services.dto.llm_dto as llm_dto
+import src.services.dto.webhook_dto as webhook_dto
+
 router = fastapi.APIRouter(tags=["health"])
 
 
 @router.get("/healthz")
 def healthz() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/healthz/webhook-queue", response_model=webhook_dto.WebhookEventQueueMetricsDTO)
+def webhook_queue_metrics(
+    container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
+) -> webhook_dto.WebhookEventQueueMetricsDTO:
+    return container.webhook_service.get_event_queue_metrics()
+
+
+@router.get("/healthz/webhook-dedup", response_model=webhook_dto.WebhookDedupFilterMetricsDTO)
+def webhook_dedup_filter_metrics(
+    container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
+) -> webhook_dto.WebhookDedupFilterMetricsDTO:
+    return container.webhook_service.get_dedup_filter_metrics()
+
+
+@router.get("/healthz/classification-cache", response_model=llm_dto.ClassificationCacheMetricsDTO)
+def classification_cache_metrics(
+    container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
+) -> llm_dto.ClassificationCacheMetricsDTO:
+    return container.webhook_service.get_classification_cache_metrics()
@@ -24,8 +24,8 @@ def verify_whatsapp_webhook(
 
 
 @router.post("/whatsapp", response_model=webhook_dto.WebhookEventResponseDTO)
-def receive_whatsapp_webhook(
+async def receive_whatsapp_webhook(
     payload: dict[str, object],
     container: app_container.AppContainer = fastapi.Depends(http_dependencies.get_container),
 ) -> webhook_dto.WebhookEventResponseDTO:
-    return container.webhook_service.process_payload(payload)
+    return await container.webhook_service.aaccept_payload(payload)
@@ -1,5 +1,6 @@
 import src.adapters.outbound.firestore.agent_profile_repository_adapter as agent_profile_repository_adapter
 import src.adapters.outbound.firestore.blacklist_repository_adapter as blacklist_repository_adapter
+import src.adapters.outbound.firestore.classification_cache_store_adapter as classification_cache_store_adapter
 import src.adapters.outbound.firestore.client_factory as firestore_client_factory
 import src.adapters.outbound.firestore.conversation_processing_lock_adapter as conversation_processing_lock_adapter
 import src.adapters.outbound.firestore.conversation_repository_adapter as conversation_repository_adapter
@@ -11,10 +12,20 @@ import src.adapters.outbound.firestore.processed_webhook_event_repository_adapte
 import src.adapters.outbound.firestore.refresh_token_repository_adapter as refresh_token_repository_adapter
 import src.adapters.outbound.firestore.scheduling_repository_adapter as scheduling_repository_adapter
 import src.adapters.outbound.firestore.tenant_repository_adapter as tenant_repository_adapter
+import src.adapters.outbound.firestore.unit_of_work_adapter as firestore_unit_of_work_adapter
 import src.adapters.outbound.firestore.user_repository_adapter as user_repository_adapter
+import src.adapters.outbound.firestore.webhook_event_context_loader_adapter as webhook_event_context_loader_adapter
 import src.adapters.outbound.firestore.whatsapp_connection_repository_adapter as whatsapp_connection_repository_adapter
 import src.adapters.outbound.google_calendar.google_calendar_provider_adapter as google_calendar_provider_adapter
 import src.adapters.outbound.llm_gemini.gemini_llm_provider_adapter as gemini_llm_provider_adapter
+import src.adapters.outbound.local_cache.lru_processed_webhook_event_filter_adapter as lru_processed_webhook_event_filter_adapter
+import src.adapters.outbound.local_cache.ttl_lru_classification_cache_adapter as ttl_lru_classification_cache_adapter
+import src.adapters.outbound.local_queue.in_process_conversation_event_bus_adapter as in_process_conversation_event_bus_adapter
+import src.adapters.outbound.local_queue.in_process_conversation_processing_lock_adapter as in_process_conversation_processing_lock_adapter
+import src.adapters.outbound.local_queue.interval_job_runner_adapter as interval_job_runner_adapter
+import src.adapters.outbound.local_queue.thread_pool_background_task_runner_adapter as thread_pool_background_task_runner_adapter
+import src.adapters.outbound.local_queue.thread_pool_webhook_event_queue_adapter as thread_pool_webhook_event_queue_adapter
+import src.adapters.outbound.local_queue.timer_wheel_debounce_scheduler_adapter as timer_wheel_debounce_scheduler_adapter
 import src.adapters.outbound.secret_manager.app_config_secret_loader_adapter as app_config_secret_loader_adapter
 import src.adapters.outbound.security.jwt_provider_adapter as jwt_provider_adapter
 import src.adapters.outbound.security.password_hasher_adapter as password_hasher_adapter
@@ -22,12 +33,22 @@ import src.adapters.outbound.whatsapp_meta.meta_whatsapp_provider_adapter as met
 import src.infra.langsmith_tracer as langsmith_tracer
 import src.infra.settings as app_settings
 import src.infra.system_adapters as system_adapters
+import src.ports.background_task_runner_port as background_task_runner_port
+import src.ports.classification_cache_port as classification_cache_port
+import src.ports.classification_cache_store_port as classification_cache_store_port
+import src.ports.conversation_debounce_scheduler_port as conversation_debounce_scheduler_port
+import src.ports.conversation_processing_lock_port as conversation_processing_lock_port
+import src.ports.periodic_job_runner_port as periodic_job_runner_port
+import src.ports.processed_webhook_event_filter_port as processed_webhook_event_filter_port
+import src.ports.webhook_event_queue_port as webhook_event_queue_port
 import src.services.agentic.workflow_engine as workflow_engine
 import src.services.use_cases.agent_service as agent_service
 import src.services.use_cases.auth_service as auth_service
 import src.services.use_cases.blacklist_service as blacklist_service
 import src.services.use_cases.conversation_control_service as conversation_control_service
 import src.services.use_cases.conversation_query_service as conversation_query_service
+import src.services.use_cases.conversation_stream_service as conversation_stream_service
+import src.services.use_cases.conversation_summary_service as conversation_summary_service
 import src.services.use_cases.google_calendar_onboarding_service as google_calendar_onboarding_service
 import src.services.use_cases.manual_appointment_service as manual_appointment_service
 import src.services.use_cases.memory_admin_service as memory_admin_service
@@ -35,6 +56,7 @@ import src.services.use_cases.onboarding_status_service as onboarding_status_ser
 import src.services.use_cases.patient_query_service as patient_query_service
 import src.services.use_cases.scheduling_inbox_service as scheduling_inbox_service
 import src.services.use_cases.scheduling_service as scheduling_service
+import src.services.use_cases.storage_compaction_service as storage_compaction_service
 import src.services.use_cases.webhook_service as webhook_service
 import src.services.use_cases.whatsapp_onboarding_service as whatsapp_onboarding_service
 
@@ -58,6 +80,11 @@ class AppContainer:
             project_id=self.settings.google_cloud_project_id,
             database_id=self.settings.firestore_database_id,
         )
+        # Only the webhook ingress claim runs on the event loop; every other port stays sync.
+        self.firestore_async_client = firestore_client_factory.build_async_client(
+            project_id=self.settings.google_cloud_project_id,
+            database_id=self.settings.firestore_database_id,
+        )
 
         self.tenant_repository = tenant_repository_adapter.FirestoreTenantRepositoryAdapter(
             self.firestore_client
@@ -72,15 +99,27 @@ class AppContainer:
         )
         self.whatsapp_connection_repository = (
             whatsapp_connection_repository_adapter.FirestoreWhatsappConnectionRepositoryAdapter(
-                self.firestore_client
+                self.firestore_client,
+                async_client=self.firestore_async_client,
             )
         )
         self.google_calendar_connection_repository = google_calendar_connection_repository_adapter.FirestoreGoogleCalendarConnectionRepositoryAdapter(
             self.firestore_client
         )
+        self.unit_of_work = firestore_unit_of_work_adapter.FirestoreUnitOfWorkAdapter(
+            self.firestore_client
+        )
+        self.message_search_index_runner = (
+            thread_pool_background_task_runner_adapter.ThreadPoolBackgroundTaskRunnerAdapter(
+                worker_count=2,
+                name="message-search-index",
+            )
+        )
         self.conversation_repository = (
             conversation_repository_adapter.FirestoreConversationRepositoryAdapter(
-                self.firestore_client
+                self.firestore_client,
+                unit_of_work=self.unit_of_work,
+                search_index_runner=self.message_search_index_runner,
             )
         )
         self.scheduling_repository = (
@@ -89,13 +128,21 @@ class AppContainer:
             )
         )
         self.processed_webhook_event_repository = processed_webhook_event_repository_adapter.FirestoreProcessedWebhookEventRepositoryAdapter(
-            self.firestore_client
-        )
-        self.conversation_processing_lock = (
-            conversation_processing_lock_adapter.FirestoreConversationProcessingLockAdapter(
-                self.firestore_client
+            self.firestore_client,
+            unit_of_work=self.unit_of_work,
+            async_client=self.firestore_async_client,
+        )
+        self.conversation_processing_lock: (
+            conversation_processing_lock_port.ConversationProcessingLockPort
+        )
+        if self.settings.webhook_single_instance_routing:
+            self.conversation_processing_lock = in_process_conversation_processing_lock_adapter.InProcessConversationProcessingLockAdapter()
+        else:
+            self.conversation_processing_lock = (
+                conversation_processing_lock_adapter.FirestoreConversationProcessingLockAdapter(
+                    self.firestore_client
+                )
             )
-        )
         self.blacklist_repository = (
             blacklist_repository_adapter.FirestoreBlacklistRepositoryAdapter(self.firestore_client)
         )
@@ -183,6 +230,9 @@ class AppContainer:
                 clock=self.clock_adapter,
             )
         )
+        self.conversation_event_bus = in_process_conversation_event_bus_adapter.InProcessConversationEventBusAdapter(
+            max_subscribers_per_tenant=self.settings.conversation_stream_max_subscribers_per_tenant,
+        )
         self.scheduling_service = scheduling_service.SchedulingService(
             scheduling_repository=self.scheduling_repository,
             conversation_repository=self.conversation_repository,
@@ -190,6 +240,7 @@ class AppContainer:
             id_generator=self.id_generator_adapter,
             clock=self.clock_adapter,
             agent_workflow=self.agent_workflow_engine,
+            conversation_event_bus=self.conversation_event_bus,
         )
         self.scheduling_inbox_service = scheduling_inbox_service.SchedulingInboxService(
             scheduling_repository=self.scheduling_repository,
@@ -203,6 +254,7 @@ class AppContainer:
             llm_provider=self.llm_provider_adapter,
             agent_profile_repository=self.agent_profile_repository,
             default_system_prompt=self.settings.default_system_prompt,
+            conversation_event_bus=self.conversation_event_bus,
         )
         self.manual_appointment_service = manual_appointment_service.ManualAppointmentService(
             manual_appointment_repository=self.manual_appointment_repository,
@@ -212,6 +264,79 @@ class AppContainer:
             clock=self.clock_adapter,
         )
 
+        self.webhook_event_queue: webhook_event_queue_port.WebhookEventQueuePort | None = None
+        if self.settings.webhook_async_processing_enabled:
+            self.webhook_event_queue = (
+                thread_pool_webhook_event_queue_adapter.ThreadPoolWebhookEventQueueAdapter(
+                    worker_count=self.settings.webhook_worker_count,
+                    max_queue_size=self.settings.webhook_queue_max_size,
+                )
+            )
+        self.conversation_debounce_scheduler: (
+            conversation_debounce_scheduler_port.ConversationDebounceSchedulerPort | None
+        ) = None
+        if self.settings.webhook_debounce_scheduler_enabled:
+            self.conversation_debounce_scheduler = (
+                timer_wheel_debounce_scheduler_adapter.TimerWheelDebounceSchedulerAdapter(
+                    worker_count=self.settings.webhook_debounce_worker_count,
+                )
+            )
+        self.webhook_event_context_loader = (
+            webhook_event_context_loader_adapter.FirestoreWebhookEventContextLoaderAdapter(
+                self.firestore_client
+            )
+        )
+        self.processed_webhook_event_filter: (
+            processed_webhook_event_filter_port.ProcessedWebhookEventFilterPort | None
+        ) = None
+        if self.settings.webhook_dedup_filter_enabled:
+            self.processed_webhook_event_filter = (
+                lru_processed_webhook_event_filter_adapter.LruProcessedWebhookEventFilterAdapter(
+                    capacity=self.settings.webhook_dedup_filter_capacity,
+                )
+            )
+        self.conversation_summary_task_runner: (
+            background_task_runner_port.BackgroundTaskRunnerPort | None
+        ) = None
+        self.conversation_summary_service: (
+            conversation_summary_service.ConversationSummaryService | None
+        ) = None
+        if self.settings.conversation_summary_enabled:
+            self.conversation_summary_task_runner = (
+                thread_pool_background_task_runner_adapter.ThreadPoolBackgroundTaskRunnerAdapter(
+                    worker_count=self.settings.conversation_summary_worker_count,
+                    name="conversation-summary",
+                )
+            )
+            self.conversation_summary_service = (
+                conversation_summary_service.ConversationSummaryService(
+                    conversation_repository=self.conversation_repository,
+                    llm_provider=self.llm_provider_adapter,
+                    task_runner=self.conversation_summary_task_runner,
+                    history_token_budget=self.settings.conversation_summary_history_token_budget,
+                    context_message_limit=self.settings.conversation_context_messages,
+                )
+            )
+        self.classification_cache: classification_cache_port.ClassificationCachePort | None = None
+        if self.settings.classification_cache_enabled:
+            classification_cache_store: (
+                classification_cache_store_port.ClassificationCacheStorePort | None
+            ) = None
+            if self.settings.classification_cache_persistent:
+                classification_cache_store = (
+                    classification_cache_store_adapter.FirestoreClassificationCacheStoreAdapter(
+                        self.firestore_client
+                    )
+                )
+            self.classification_cache = (
+                ttl_lru_classification_cache_adapter.TtlLruClassificationCacheAdapter(
+                    capacity=self.settings.classification_cache_capacity,
+                    ttl_seconds=self.settings.classification_cache_ttl_seconds,
+                    clock=self.clock_adapter,
+                    key_namespace=self.settings.gemini_model,
+                    store=classification_cache_store,
+                )
+            )
         self.webhook_service = webhook_service.WebhookService(
             whatsapp_connection_repository=self.whatsapp_connection_repository,
             conversation_repository=self.conversation_repository,
@@ -227,9 +352,22 @@ class AppContainer:
             clock=self.clock_adapter,
             default_system_prompt=self.settings.default_system_prompt,
             context_message_limit=self.settings.conversation_context_messages,
+            context_token_budget=self.settings.conversation_context_token_budget,
             tracer=self.langsmith_tracer,
             agent_workflow=self.agent_workflow_engine,
-        )
+            event_queue=self.webhook_event_queue,
+            debounce_scheduler=self.conversation_debounce_scheduler,
+            payload_partition_concurrency=self.settings.webhook_payload_concurrency,
+            processed_event_filter=self.processed_webhook_event_filter,
+            event_context_loader=self.webhook_event_context_loader,
+            unit_of_work=self.unit_of_work,
+            conversation_event_bus=self.conversation_event_bus,
+            conversation_summarizer=self.conversation_summary_service,
+            stream_llm_replies=self.settings.llm_streaming_enabled,
+            classification_cache=self.classification_cache,
+        )
+        if self.webhook_event_queue is not None:
+            self.webhook_event_queue.start(self.webhook_service.process_queued_event)
 
         self.conversation_query_service = conversation_query_service.ConversationQueryService(
             conversation_repository=self.conversation_repository,
@@ -238,7 +376,24 @@ class AppContainer:
             conversation_repository=self.conversation_repository,
             scheduling_repository=self.scheduling_repository,
             clock=self.clock_adapter,
+            conversation_event_bus=self.conversation_event_bus,
+        )
+        self.conversation_stream_service = conversation_stream_service.ConversationStreamService(
+            conversation_event_bus=self.conversation_event_bus,
+            heartbeat_seconds=self.settings.conversation_stream_heartbeat_seconds,
+        )
+        self.storage_compaction_service = storage_compaction_service.StorageCompactionService(
+            processed_webhook_event_repository=self.processed_webhook_event_repository,
+            conversation_processing_lock=self.conversation_processing_lock,
+            clock=self.clock_adapter,
         )
+        self.storage_compaction_runner: periodic_job_runner_port.PeriodicJobRunnerPort | None = None
+        if self.settings.storage_compaction_enabled:
+            self.storage_compaction_runner = interval_job_runner_adapter.IntervalJobRunnerAdapter(
+                interval_seconds=self.settings.storage_compaction_interval_seconds,
+                name="storage-compaction",
+            )
+            self.storage_compaction_runner.start(self.storage_compaction_service.compact_expired)
         self.blacklist_service = blacklist_service.BlacklistService(
             blacklist_repository=self.blacklist_repository,
             clock=self.clock_adapter,
@@ -257,3 +412,25 @@ class AppContainer:
             google_calendar_onboarding_service=self.google_calendar_onboarding_service,
             clock=self.clock_adapter,
         )
+
+    def shutdown(self) -> None:
+        self.conversation_event_bus.shutdown()
+        if self.storage_compaction_runner is not None:
+            self.storage_compaction_runner.shutdown(
+                timeout_seconds=self.settings.webhook_queue_drain_timeout_seconds
+            )
+        if self.webhook_event_queue is not None:
+            self.webhook_event_queue.shutdown(
+                drain_timeout_seconds=self.settings.webhook_queue_drain_timeout_seconds
+            )
+        if self.conversation_debounce_scheduler is not None:
+            self.conversation_debounce_scheduler.shutdown(
+                drain_timeout_seconds=self.settings.webhook_queue_drain_timeout_seconds
+            )
+        if self.conversation_summary_task_runner is not None:
+            self.conversation_summary_task_runner.shutdown(
+                drain_timeout_seconds=self.settings.webhook_queue_drain_timeout_seconds
+            )
+        self.message_search_index_runner.shutdown(
+            drain_timeout_seconds=self.settings.webhook_queue_drain_timeout_seconds
+        )
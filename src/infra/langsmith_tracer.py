@@ -3,6 +3,7 @@ import typing
 
 import langsmith.client as langsmith_client
 import langsmith.run_helpers as langsmith_run_helpers
+import langsmith.run_trees as langsmith_run_trees
 
 import src.infra.logs as app_logs
 
@@ -10,10 +11,14 @@ logger = app_logs.get_logger(__name__)
 
 
 class LangsmithTraceRun:
-    def __init__(self, run_tree: typing.Any | None) -> None:
+    def __init__(self, run_tree: typing.Any | None, patch_on_end: bool = False) -> None:
         self._run_tree = run_tree
+        self._patch_on_end = patch_on_end
         self._ended = False
 
+    def is_ended(self) -> bool:
+        return self._ended
+
     def add_metadata(self, metadata: dict[str, object]) -> None:
         if self._run_tree is None:
             return
@@ -28,6 +33,7 @@ class LangsmithTraceRun:
             return
         self._run_tree.end(outputs=outputs)
         self._ended = True
+        self._patch_if_detached()
 
     def set_error(self, error_message: str) -> None:
         if self._run_tree is None:
@@ -36,6 +42,24 @@ class LangsmithTraceRun:
             return
         self._run_tree.end(error=error_message)
         self._ended = True
+        self._patch_if_detached()
+
+    def _patch_if_detached(self) -> None:
+        if not self._patch_on_end or self._run_tree is None:
+            return
+        try:
+            self._run_tree.patch()
+        except Exception as error:
+            logger.warning(
+                "langsmith.trace_failed",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="langsmith.trace_failed",
+                        message="langsmith run could not be finished",
+                        data={"error_message": str(error)},
+                    )
+                },
+            )
 
 
 class LangsmithTracer:
@@ -161,6 +185,52 @@ class LangsmithTracer:
                 body_error=body_error,
             )
 
+    def start_run(
+        self,
+        *,
+        name: str,
+        run_type: str,
+        inputs: typing.Mapping[str, object] | None = None,
+        metadata: typing.Mapping[str, object] | None = None,
+        tags: list[str] | None = None,
+    ) -> LangsmithTraceRun:
+        # Unlike `trace`, this sets no context variables, so generators can yield while the run
+        # is open. The caller ends it with `set_outputs` or `set_error`.
+        if not self.is_enabled():
+            return LangsmithTraceRun(None)
+
+        run_inputs = dict(inputs) if inputs is not None else {}
+        run_extra: dict[str, typing.Any] = {}
+        run_metadata = self._build_metadata(metadata)
+        if run_metadata is not None:
+            run_extra["metadata"] = run_metadata
+        combined_tags = self._combine_tags(tags)
+        try:
+            parent_run = langsmith_run_helpers.get_current_run_tree()
+            if parent_run is not None:
+                run_tree = parent_run.create_child(
+                    name=name,
+                    run_type=typing.cast(langsmith_client.RUN_TYPE_T, run_type),
+                    inputs=run_inputs,
+                    tags=combined_tags,
+                    extra=run_extra,
+                )
+            else:
+                run_tree = langsmith_run_trees.RunTree(
+                    name=name,
+                    run_type=run_type,
+                    inputs=run_inputs,
+                    project_name=self._project_name,
+                    tags=combined_tags,
+                    extra=run_extra,
+                    ls_client=self._client,
+                )
+            run_tree.post()
+        except Exception as error:
+            self._log_trace_failure(name=name, run_type=run_type, error=error)
+            return LangsmithTraceRun(None)
+        return LangsmithTraceRun(run_tree, patch_on_end=True)
+
     def _close_context_safely(
         self,
         *,
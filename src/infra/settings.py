@@ -12,6 +12,7 @@ class Settings(pydantic.BaseModel):
     jwt_refresh_ttl_seconds: int
     default_system_prompt: str
     conversation_context_messages: int
+    conversation_context_token_budget: int
     firestore_database_id: str
     cors_allowed_origins: list[str]
     frontend_app_base_url: str
@@ -38,6 +39,29 @@ class Settings(pydantic.BaseModel):
     langsmith_tags: list[str]
     log_level: str
     log_include_request_summary: bool
+    webhook_async_processing_enabled: bool
+    webhook_worker_count: int
+    webhook_queue_max_size: int
+    webhook_queue_drain_timeout_seconds: int
+    webhook_debounce_scheduler_enabled: bool
+    webhook_debounce_worker_count: int
+    webhook_single_instance_routing: bool
+    webhook_payload_concurrency: int
+    webhook_dedup_filter_enabled: bool
+    webhook_dedup_filter_capacity: int
+    conversation_stream_max_subscribers_per_tenant: int
+    conversation_stream_heartbeat_seconds: int
+    storage_compaction_enabled: bool
+    storage_compaction_interval_seconds: int
+    conversation_summary_enabled: bool
+    conversation_summary_history_token_budget: int
+    conversation_summary_worker_count: int
+    http_threadpool_size: int
+    llm_streaming_enabled: bool
+    classification_cache_enabled: bool
+    classification_cache_capacity: int
+    classification_cache_ttl_seconds: int
+    classification_cache_persistent: bool
 
     @classmethod
     def from_secret_json(cls, raw_app_config_json: str, adc_project_id: str) -> "Settings":
@@ -69,7 +93,10 @@ class Settings(pydantic.BaseModel):
                 ),
             ),
             conversation_context_messages=int(
-                app_config_overrides.get("CONTEXT_MESSAGE_LIMIT", "12")
+                app_config_overrides.get("CONTEXT_MESSAGE_LIMIT", "40")
+            ),
+            conversation_context_token_budget=int(
+                app_config_overrides.get("CONTEXT_TOKEN_BUDGET", "8000")
             ),
             firestore_database_id=normalized_firestore_database_id,
             cors_allowed_origins=cors_allowed_origins,
@@ -133,6 +160,87 @@ class Settings(pydantic.BaseModel):
                 "false",
             ).lower()
             == "true",
+            webhook_async_processing_enabled=app_config_overrides.get(
+                "WEBHOOK_ASYNC_PROCESSING_ENABLED",
+                "false",
+            ).lower()
+            == "true",
+            webhook_worker_count=int(app_config_overrides.get("WEBHOOK_WORKER_COUNT", "4")),
+            webhook_queue_max_size=int(app_config_overrides.get("WEBHOOK_QUEUE_MAX_SIZE", "200")),
+            webhook_queue_drain_timeout_seconds=int(
+                app_config_overrides.get("WEBHOOK_QUEUE_DRAIN_TIMEOUT_SECONDS", "8")
+            ),
+            webhook_debounce_scheduler_enabled=app_config_overrides.get(
+                "WEBHOOK_DEBOUNCE_SCHEDULER_ENABLED",
+                "false",
+            ).lower()
+            == "true",
+            webhook_debounce_worker_count=int(
+                app_config_overrides.get("WEBHOOK_DEBOUNCE_WORKER_COUNT", "4")
+            ),
+            webhook_single_instance_routing=app_config_overrides.get(
+                "WEBHOOK_SINGLE_INSTANCE_ROUTING",
+                "false",
+            ).lower()
+            == "true",
+            webhook_payload_concurrency=int(
+                app_config_overrides.get("WEBHOOK_PAYLOAD_CONCURRENCY", "4")
+            ),
+            webhook_dedup_filter_enabled=app_config_overrides.get(
+                "WEBHOOK_DEDUP_FILTER_ENABLED",
+                "false",
+            ).lower()
+            == "true",
+            webhook_dedup_filter_capacity=int(
+                app_config_overrides.get("WEBHOOK_DEDUP_FILTER_CAPACITY", "10000")
+            ),
+            conversation_stream_max_subscribers_per_tenant=int(
+                app_config_overrides.get("CONVERSATION_STREAM_MAX_SUBSCRIBERS_PER_TENANT", "20")
+            ),
+            conversation_stream_heartbeat_seconds=int(
+                app_config_overrides.get("CONVERSATION_STREAM_HEARTBEAT_SECONDS", "15")
+            ),
+            storage_compaction_enabled=app_config_overrides.get(
+                "STORAGE_COMPACTION_ENABLED",
+                "true",
+            ).lower()
+            == "true",
+            storage_compaction_interval_seconds=int(
+                app_config_overrides.get("STORAGE_COMPACTION_INTERVAL_SECONDS", "3600")
+            ),
+            conversation_summary_enabled=app_config_overrides.get(
+                "CONVERSATION_SUMMARY_ENABLED",
+                "false",
+            ).lower()
+            == "true",
+            conversation_summary_history_token_budget=int(
+                app_config_overrides.get("CONVERSATION_SUMMARY_HISTORY_TOKEN_BUDGET", "4000")
+            ),
+            conversation_summary_worker_count=int(
+                app_config_overrides.get("CONVERSATION_SUMMARY_WORKER_COUNT", "2")
+            ),
+            http_threadpool_size=int(app_config_overrides.get("HTTP_THREADPOOL_SIZE", "100")),
+            llm_streaming_enabled=app_config_overrides.get(
+                "LLM_STREAMING_ENABLED",
+                "true",
+            ).lower()
+            == "true",
+            classification_cache_enabled=app_config_overrides.get(
+                "CLASSIFICATION_CACHE_ENABLED",
+                "true",
+            ).lower()
+            == "true",
+            classification_cache_capacity=int(
+                app_config_overrides.get("CLASSIFICATION_CACHE_CAPACITY", "5000")
+            ),
+            classification_cache_ttl_seconds=int(
+                app_config_overrides.get("CLASSIFICATION_CACHE_TTL_SECONDS", "86400")
+            ),
+            classification_cache_persistent=app_config_overrides.get(
+                "CLASSIFICATION_CACHE_PERSISTENT",
+                "false",
+            ).lower()
+            == "true",
         )
 
     _INSECURE_DEV_DEFAULT = "dev-secret-change-me"
@@ -0,0 +1,14 @@
+import abc
+import typing
+
+BackgroundTask = typing.Callable[[], None]
+
+
+class BackgroundTaskRunnerPort(abc.ABC):
+    @abc.abstractmethod
+    def submit(self, task_key: str, task: BackgroundTask) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        raise NotImplementedError
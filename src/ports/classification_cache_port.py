@@ -0,0 +1,17 @@
+import abc
+
+import src.services.dto.llm_dto as llm_dto
+
+
+class ClassificationCachePort(abc.ABC):
+    @abc.abstractmethod
+    def get(self, cache_key: str) -> str | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def put(self, cache_key: str, value: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_metrics(self) -> llm_dto.ClassificationCacheMetricsDTO:
+        raise NotImplementedError
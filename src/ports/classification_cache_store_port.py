@@ -0,0 +1,12 @@
+import abc
+import datetime
+
+
+class ClassificationCacheStorePort(abc.ABC):
+    @abc.abstractmethod
+    def get(self, cache_key: str, now: datetime.datetime) -> str | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def put(self, cache_key: str, value: str, expires_at: datetime.datetime) -> None:
+        raise NotImplementedError
@@ -0,0 +1,24 @@
+import abc
+import typing
+
+DebouncedCallback = typing.Callable[[], None]
+
+
+class ConversationDebounceSchedulerPort(abc.ABC):
+    @abc.abstractmethod
+    def schedule(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        delay_seconds: float,
+        callback: DebouncedCallback,
+    ) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def pending_count(self) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        raise NotImplementedError
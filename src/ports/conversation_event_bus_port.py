@@ -0,0 +1,41 @@
+import abc
+
+import src.services.dto.conversation_dto as conversation_dto
+
+
+class ConversationEventBusPort(abc.ABC):
+    @abc.abstractmethod
+    def publish(self, event: conversation_dto.ConversationStreamEventDTO) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def subscribe(self, tenant_id: str) -> str | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def next_event(
+        self,
+        subscription_id: str,
+        timeout_seconds: float,
+    ) -> conversation_dto.ConversationStreamEventDTO | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def anext_event(
+        self,
+        subscription_id: str,
+        timeout_seconds: float,
+    ) -> conversation_dto.ConversationStreamEventDTO | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def is_active(self, subscription_id: str) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def unsubscribe(self, subscription_id: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def shutdown(self) -> None:
+        raise NotImplementedError
@@ -19,5 +19,10 @@ class ConversationProcessingLockPort(abc.ABC):
         tenant_id: str,
         conversation_id: str,
         holder_id: str,
+        released_at: datetime.datetime,
     ) -> None:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete_expired(self, now: datetime.datetime, limit: int) -> int:
+        raise NotImplementedError
@@ -1,7 +1,10 @@
 import abc
+import datetime
 
 import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.conversation_summary as conversation_summary_entity
 import src.domain.entities.message as message_entity
+import src.domain.entities.message_search_posting as message_search_posting_entity
 import src.domain.entities.whatsapp_user as whatsapp_user_entity
 
 
@@ -36,6 +39,26 @@ class ConversationRepositoryPort(abc.ABC):
     def list_conversations(self, tenant_id: str) -> list[conversation_entity.Conversation]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def list_conversation_summaries(
+        self,
+        tenant_id: str,
+        limit: int | None = None,
+        after_updated_at: datetime.datetime | None = None,
+        after_conversation_id: str | None = None,
+    ) -> list[conversation_summary_entity.ConversationSummary]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_changed_conversation_summaries(
+        self,
+        tenant_id: str,
+        limit: int,
+        after_updated_at: datetime.datetime,
+        after_conversation_id: str | None = None,
+    ) -> list[conversation_summary_entity.ConversationSummary]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def save_message(self, message: message_entity.Message) -> None:
         raise NotImplementedError
@@ -44,6 +67,59 @@ class ConversationRepositoryPort(abc.ABC):
     def list_messages(self, tenant_id: str, conversation_id: str) -> list[message_entity.Message]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def has_message_with_provider_message_id(
+        self, tenant_id: str, conversation_id: str, provider_message_id: str
+    ) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_recent_messages(
+        self, tenant_id: str, conversation_id: str, limit: int
+    ) -> list[message_entity.Message]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_messages_page(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        limit: int,
+        before_created_at: datetime.datetime | None = None,
+        before_message_id: str | None = None,
+        after_created_at: datetime.datetime | None = None,
+        after_message_id: str | None = None,
+    ) -> list[message_entity.Message]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_message_seq(self, tenant_id: str, conversation_id: str) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_subsessions(
+        self, tenant_id: str, conversation_id: str
+    ) -> list[conversation_entity.ConversationSubsession]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_latest_subsession(
+        self, tenant_id: str, conversation_id: str
+    ) -> conversation_entity.ConversationSubsession | None:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def delete_messages(self, tenant_id: str, conversation_id: str) -> None:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def search_message_postings(
+        self, tenant_id: str, terms: list[str], limit_per_term: int
+    ) -> list[message_search_posting_entity.MessageSearchPosting]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list_messages_by_ids(
+        self, tenant_id: str, message_keys: list[tuple[str, str]]
+    ) -> list[message_entity.Message]:
+        raise NotImplementedError
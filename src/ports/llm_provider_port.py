@@ -1,4 +1,5 @@
 import abc
+import collections.abc
 
 import src.services.dto.llm_dto as llm_dto
 
@@ -7,3 +8,19 @@ class LlmProviderPort(abc.ABC):
     @abc.abstractmethod
     def generate_reply(self, prompt_input: llm_dto.GenerateReplyInputDTO) -> llm_dto.AgentReplyDTO:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    async def agenerate_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> llm_dto.AgentReplyDTO:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def aclose(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stream_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> collections.abc.Generator[llm_dto.ReplyStreamChunkDTO, None, None]:
+        raise NotImplementedError
@@ -0,0 +1,14 @@
+import abc
+import typing
+
+PeriodicJob = typing.Callable[[], None]
+
+
+class PeriodicJobRunnerPort(abc.ABC):
+    @abc.abstractmethod
+    def start(self, job: PeriodicJob) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def shutdown(self, timeout_seconds: float) -> None:
+        raise NotImplementedError
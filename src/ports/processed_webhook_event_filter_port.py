@@ -0,0 +1,21 @@
+import abc
+
+import src.services.dto.webhook_dto as webhook_dto
+
+
+class ProcessedWebhookEventFilterPort(abc.ABC):
+    @abc.abstractmethod
+    def is_known_processed(self, tenant_id: str, provider_event_id: str) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remember_processed(self, tenant_id: str, provider_event_ids: list[str]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def forget(self, tenant_id: str, provider_event_id: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_metrics(self) -> webhook_dto.WebhookDedupFilterMetricsDTO:
+        raise NotImplementedError
@@ -14,6 +14,33 @@ class ProcessedWebhookEventRepositoryPort(abc.ABC):
     ) -> bool:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def claim_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def aclaim_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def refresh_claim(
+        self,
+        tenant_id: str,
+        provider_event_id: str,
+        claimed_at: datetime.datetime,
+    ) -> bool:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def mark_processed(
         self,
@@ -23,6 +50,15 @@ class ProcessedWebhookEventRepositoryPort(abc.ABC):
     ) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def mark_processed_many(
+        self,
+        tenant_id: str,
+        provider_event_ids: list[str],
+        processed_at: datetime.datetime,
+    ) -> None:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def mark_failed(
         self,
@@ -40,3 +76,7 @@ class ProcessedWebhookEventRepositoryPort(abc.ABC):
     @abc.abstractmethod
     def save(self, event: processed_webhook_event_entity.ProcessedWebhookEvent) -> None:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete_expired(self, now: datetime.datetime, limit: int) -> int:
+        raise NotImplementedError
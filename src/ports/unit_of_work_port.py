@@ -0,0 +1,8 @@
+import abc
+import contextlib
+
+
+class UnitOfWorkPort(abc.ABC):
+    @abc.abstractmethod
+    def atomic(self) -> contextlib.AbstractContextManager[None]:
+        raise NotImplementedError
@@ -0,0 +1,13 @@
+import abc
+
+import src.services.dto.webhook_dto as webhook_dto
+
+
+class WebhookEventContextLoaderPort(abc.ABC):
+    @abc.abstractmethod
+    def load(
+        self,
+        phone_number_id: str,
+        whatsapp_user_id: str,
+    ) -> webhook_dto.WebhookEventContextDTO | None:
+        raise NotImplementedError
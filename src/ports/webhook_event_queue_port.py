@@ -0,0 +1,24 @@
+import abc
+import typing
+
+import src.services.dto.webhook_dto as webhook_dto
+
+WebhookEventHandler = typing.Callable[[webhook_dto.IncomingMessageEventDTO], None]
+
+
+class WebhookEventQueuePort(abc.ABC):
+    @abc.abstractmethod
+    def start(self, handler: WebhookEventHandler) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def submit(self, event: webhook_dto.IncomingMessageEventDTO) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_metrics(self) -> webhook_dto.WebhookEventQueueMetricsDTO:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        raise NotImplementedError
@@ -20,6 +20,12 @@ class WhatsappConnectionRepositoryPort(abc.ABC):
     ) -> whatsapp_connection_entity.WhatsappConnection | None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def aget_by_phone_number_id(
+        self, phone_number_id: str
+    ) -> whatsapp_connection_entity.WhatsappConnection | None:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_by_embedded_signup_state(
         self, embedded_signup_state: str
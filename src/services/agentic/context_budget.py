@@ -0,0 +1,60 @@
+import json
+
+import src.domain.entities.message as message_entity
+import src.services.dto.llm_dto as llm_dto
+
+
+class TokenBudgetContextBuilder:
+    _per_message_overhead_tokens = 4
+
+    def __init__(self, token_budget: int) -> None:
+        if token_budget < 1:
+            raise ValueError("context token_budget must be at least 1")
+        self._token_budget = token_budget
+
+    def estimate_reserved_tokens(
+        self,
+        system_prompt: str,
+        tools: list[llm_dto.FunctionDeclarationDTO],
+        function_call_results: list[llm_dto.FunctionCallResultDTO],
+    ) -> int:
+        reserved_tokens = message_entity.estimate_token_count(system_prompt)
+        if tools:
+            tools_payload = json.dumps(
+                [tool.model_dump(mode="json") for tool in tools], ensure_ascii=False
+            )
+            reserved_tokens += message_entity.estimate_token_count(tools_payload)
+        if function_call_results:
+            function_call_results_payload = json.dumps(
+                [
+                    function_call_result.model_dump(
+                        mode="json", exclude={"function_call": {"thought_signature"}}
+                    )
+                    for function_call_result in function_call_results
+                ],
+                ensure_ascii=False,
+                default=str,
+            )
+            reserved_tokens += message_entity.estimate_token_count(function_call_results_payload)
+        return reserved_tokens
+
+    def select_messages(
+        self,
+        messages: list[llm_dto.ChatMessageDTO],
+        reserved_tokens: int,
+    ) -> list[llm_dto.ChatMessageDTO]:
+        remaining_tokens = self._token_budget - reserved_tokens
+        selected_messages: list[llm_dto.ChatMessageDTO] = []
+        for message in reversed(messages):
+            message_tokens = self._per_message_overhead_tokens + (
+                message.token_estimate
+                if message.token_estimate is not None
+                else message_entity.estimate_token_count(message.content)
+            )
+            # The latest message is always sent, even when it alone exceeds the budget.
+            if selected_messages and message_tokens > remaining_tokens:
+                break
+            selected_messages.append(message)
+            remaining_tokens -= message_tokens
+        selected_messages.reverse()
+        return selected_messages
@@ -16,6 +16,7 @@ class RuntimePromptBuilder:
         self,
         runtime_context: agentic_state_models.RuntimePromptContext,
         known_patient: patient_entity.Patient | None,
+        conversation_summary: str | None = None,
     ) -> str:
         prompt_lines = [
             "INSTRUCCIONES RUNTIME (PRIORIDAD ALTA):",
@@ -64,6 +65,13 @@ class RuntimePromptBuilder:
                     "If patient data is already known and still valid, do not ask for it again.",
                 ]
             )
+        if conversation_summary:
+            prompt_lines.extend(
+                [
+                    "Resumen de la conversacion previa (no vuelvas a pedir datos que ya aparecen aqui):",
+                    conversation_summary,
+                ]
+            )
 
         prompt_lines.append(
             "Tools habilitadas en este turno (usa solo estas y ninguna otra): "
@@ -0,0 +1,21 @@
+import hashlib
+import json
+import re
+import unicodedata
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_EDGE_PUNCTUATION = " .,;:!?¡¿\"'"
+
+
+def normalize_classification_text(text: str) -> str:
+    normalized_text = unicodedata.normalize("NFKC", text).casefold()
+    normalized_text = _WHITESPACE_PATTERN.sub(" ", normalized_text)
+    return normalized_text.strip(_EDGE_PUNCTUATION)
+
+
+def build_classification_cache_key(system_prompt: str, user_text: str, context: str) -> str:
+    key_payload = json.dumps(
+        [system_prompt, normalize_classification_text(user_text), context],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(key_payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,34 @@
+import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.message as message_entity
+import src.services.dto.conversation_dto as conversation_dto
+
+
+def build_message_appended_event(
+    message: message_entity.Message,
+) -> conversation_dto.ConversationStreamEventDTO:
+    return conversation_dto.ConversationStreamEventDTO(
+        event_type="message_appended",
+        tenant_id=message.tenant_id,
+        conversation_id=message.conversation_id,
+        occurred_at=message.created_at,
+        message=conversation_dto.MessageDTO(
+            message_id=message.id,
+            conversation_id=message.conversation_id,
+            role=message.role,
+            direction=message.direction,
+            content=message.content,
+            created_at=message.created_at,
+        ),
+    )
+
+
+def build_control_mode_changed_event(
+    conversation: conversation_entity.Conversation,
+) -> conversation_dto.ConversationStreamEventDTO:
+    return conversation_dto.ConversationStreamEventDTO(
+        event_type="control_mode_changed",
+        tenant_id=conversation.tenant_id,
+        conversation_id=conversation.id,
+        occurred_at=conversation.updated_at,
+        control_mode=conversation.control_mode,
+    )
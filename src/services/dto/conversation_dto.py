@@ -23,10 +23,51 @@ class MessageDTO(pydantic.BaseModel):
 
 class ConversationListResponseDTO(pydantic.BaseModel):
     items: list[ConversationSummaryDTO]
+    next_cursor: str | None = None
 
 
 class MessageListResponseDTO(pydantic.BaseModel):
     items: list[MessageDTO]
+    before_cursor: str | None = None
+    after_cursor: str | None = None
+
+
+class TruncatedConversationMessagesDTO(pydantic.BaseModel):
+    conversation_id: str
+    after_cursor: str
+
+
+class ConversationChangesResponseDTO(pydantic.BaseModel):
+    conversations: list[ConversationSummaryDTO]
+    messages: list[MessageDTO]
+    next_cursor: str
+    has_more: bool
+    truncated_conversations: list[TruncatedConversationMessagesDTO] = pydantic.Field(
+        default_factory=list
+    )
+
+
+class ConversationSearchHitDTO(pydantic.BaseModel):
+    conversation_id: str
+    message_id: str
+    role: str
+    direction: str
+    snippet: str
+    created_at: datetime.datetime
+    score: float
+
+
+class ConversationSearchResponseDTO(pydantic.BaseModel):
+    items: list[ConversationSearchHitDTO]
+
+
+class ConversationStreamEventDTO(pydantic.BaseModel):
+    event_type: typing.Literal["message_appended", "control_mode_changed"]
+    tenant_id: str
+    conversation_id: str
+    occurred_at: datetime.datetime
+    message: MessageDTO | None = None
+    control_mode: typing.Literal["AI", "HUMAN"] | None = None
 
 
 class UpdateConversationControlModeDTO(pydantic.BaseModel):
@@ -4,6 +4,7 @@ import pydantic
 class ChatMessageDTO(pydantic.BaseModel):
     role: str
     content: str
+    token_estimate: int | None = None
 
 
 class FunctionDeclarationDTO(pydantic.BaseModel):
@@ -40,3 +41,17 @@ class GenerateReplyInputDTO(pydantic.BaseModel):
 class AgentReplyDTO(pydantic.BaseModel):
     content: str
     function_calls: list[FunctionCallDTO] = pydantic.Field(default_factory=list)
+
+
+class ReplyStreamChunkDTO(pydantic.BaseModel):
+    text: str = ""
+    function_call: FunctionCallDTO | None = None
+
+
+class ClassificationCacheMetricsDTO(pydantic.BaseModel):
+    capacity: int
+    entry_count: int
+    hit_total: int
+    miss_total: int
+    store_hit_total: int
+    hit_rate: float
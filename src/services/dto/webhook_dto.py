@@ -2,6 +2,12 @@ import typing
 
 import pydantic
 
+import src.domain.entities.agent_profile as agent_profile_entity
+import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.patient as patient_entity
+import src.domain.entities.whatsapp_connection as whatsapp_connection_entity
+import src.domain.entities.whatsapp_user as whatsapp_user_entity
+
 
 class WebhookVerificationDTO(pydantic.BaseModel):
     mode: str
@@ -22,3 +28,33 @@ class IncomingMessageEventDTO(pydantic.BaseModel):
 
 class WebhookEventResponseDTO(pydantic.BaseModel):
     status: str
+
+
+class WebhookEventQueueMetricsDTO(pydantic.BaseModel):
+    accepting: bool
+    worker_count: int
+    max_queue_size: int
+    queue_depth: int
+    in_flight: int
+    submitted_total: int
+    completed_total: int
+    failed_total: int
+    rejected_total: int
+    dropped_total: int
+
+
+class WebhookDedupFilterMetricsDTO(pydantic.BaseModel):
+    capacity: int
+    tracked_event_count: int
+    hit_total: int
+    miss_total: int
+    eviction_total: int
+
+
+class WebhookEventContextDTO(pydantic.BaseModel):
+    connection: whatsapp_connection_entity.WhatsappConnection
+    is_blacklisted: bool
+    whatsapp_user: whatsapp_user_entity.WhatsappUser | None
+    conversation: conversation_entity.Conversation | None
+    known_patient: patient_entity.Patient | None
+    agent_profile: agent_profile_entity.AgentProfile | None
@@ -22,5 +22,9 @@ class InvalidStateError(ServiceError):
     """Raised when requested state transition is invalid."""
 
 
+class CapacityExceededError(ServiceError):
+    """Raised when a bounded shared resource has no room for another client."""
+
+
 class ExternalProviderError(ServiceError):
     """Raised when external adapter cannot complete operation."""
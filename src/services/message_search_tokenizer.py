@@ -0,0 +1,67 @@
+import collections.abc
+import re
+import unicodedata
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+_MIN_TERM_LENGTH = 2
+_SPANISH_STOP_WORDS = frozenset(
+    {
+        "al",
+        "como",
+        "con",
+        "de",
+        "del",
+        "el",
+        "en",
+        "es",
+        "la",
+        "las",
+        "le",
+        "lo",
+        "los",
+        "me",
+        "mi",
+        "no",
+        "para",
+        "pero",
+        "por",
+        "que",
+        "se",
+        "si",
+        "su",
+        "sus",
+        "te",
+        "tu",
+        "un",
+        "una",
+        "y",
+        "ya",
+    }
+)
+
+
+def fold_search_text(value: str) -> str:
+    return unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii").lower()
+
+
+def iter_search_terms(text: str) -> collections.abc.Iterator[tuple[str, int, int]]:
+    for word_match in _WORD_PATTERN.finditer(text):
+        term = fold_search_text(word_match.group())
+        if len(term) < _MIN_TERM_LENGTH or term in _SPANISH_STOP_WORDS:
+            continue
+        yield term, word_match.start(), word_match.end()
+
+
+def tokenize_search_query(query: str) -> list[str]:
+    terms: list[str] = []
+    for term, _, _ in iter_search_terms(query):
+        if term not in terms:
+            terms.append(term)
+    return terms
+
+
+def count_index_terms(text: str) -> dict[str, int]:
+    term_counts: collections.Counter[str] = collections.Counter(
+        term for term, _, _ in iter_search_terms(text)
+    )
+    return dict(term_counts)
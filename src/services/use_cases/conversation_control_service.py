@@ -1,8 +1,10 @@
 import src.infra.logs as app_logs
 import src.ports.clock_port as clock_port
+import src.ports.conversation_event_bus_port as conversation_event_bus_port
 import src.ports.conversation_repository_port as conversation_repository_port
 import src.ports.scheduling_repository_port as scheduling_repository_port
 import src.services.constants as service_constants
+import src.services.conversation_stream_events as conversation_stream_events
 import src.services.dto.auth_dto as auth_dto
 import src.services.dto.conversation_dto as conversation_dto
 import src.services.exceptions as service_exceptions
@@ -16,10 +18,12 @@ class ConversationControlService:
         conversation_repository: conversation_repository_port.ConversationRepositoryPort,
         scheduling_repository: scheduling_repository_port.SchedulingRepositoryPort,
         clock: clock_port.ClockPort,
+        conversation_event_bus: conversation_event_bus_port.ConversationEventBusPort | None = None,
     ) -> None:
         self._conversation_repository = conversation_repository
         self._scheduling_repository = scheduling_repository
         self._clock = clock
+        self._conversation_event_bus = conversation_event_bus
 
     def update_control_mode(
         self,
@@ -39,6 +43,9 @@ class ConversationControlService:
         now_value = self._clock.now()
         conversation.set_control_mode(update_dto.control_mode, now_value)
         self._conversation_repository.save_conversation(conversation)
+        self._publish_conversation_event(
+            conversation_stream_events.build_control_mode_changed_event(conversation)
+        )
         logger.info(
             "conversation.control_mode_changed",
             extra={
@@ -97,6 +104,7 @@ class ConversationControlService:
         conversation.messages = []
         conversation.last_message_preview = None
         conversation.updated_at = now_value
+        conversation.clear_running_summary()
         self._conversation_repository.save_conversation(conversation)
         self._conversation_repository.delete_messages(claims.tenant_id, conversation_id)
         logger.info(
@@ -117,3 +125,11 @@ class ConversationControlService:
     def _ensure_owner(self, claims: auth_dto.TokenClaimsDTO) -> None:
         if claims.role != service_constants.DEFAULT_OWNER_ROLE:
             raise service_exceptions.AuthorizationError("owner role required")
+
+    def _publish_conversation_event(
+        self,
+        stream_event: conversation_dto.ConversationStreamEventDTO,
+    ) -> None:
+        if self._conversation_event_bus is None:
+            return
+        self._conversation_event_bus.publish(stream_event)
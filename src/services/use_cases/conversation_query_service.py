@@ -1,56 +1,339 @@
+import base64
+import binascii
+import datetime
+import json
+import math
+
+import src.domain.entities.conversation_summary as conversation_summary_entity
+import src.domain.entities.message as message_entity
 import src.ports.conversation_repository_port as conversation_repository_port
 import src.services.dto.conversation_dto as conversation_dto
 import src.services.exceptions as service_exceptions
+import src.services.message_search_tokenizer as message_search_tokenizer
 
 
 class ConversationQueryService:
+    _default_page_limit = 50
+    _change_feed_message_limit = 200
+    _change_feed_origin = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+    _default_search_limit = 20
+    _max_search_terms = 8
+    _search_candidates_per_term = 200
+    _search_snippet_radius = 60
+
     def __init__(
         self,
         conversation_repository: conversation_repository_port.ConversationRepositoryPort,
     ) -> None:
         self._conversation_repository = conversation_repository
 
-    def list_conversations(self, tenant_id: str) -> conversation_dto.ConversationListResponseDTO:
-        conversations = self._conversation_repository.list_conversations(tenant_id)
-        sorted_conversations = sorted(conversations, key=lambda item: item.updated_at, reverse=True)
+    def list_conversations(
+        self,
+        tenant_id: str,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> conversation_dto.ConversationListResponseDTO:
+        after_updated_at: datetime.datetime | None = None
+        after_conversation_id: str | None = None
+        if after is not None:
+            after_updated_at, after_conversation_id = self._decode_cursor(after)
+            if limit is None:
+                limit = self._default_page_limit
+        summaries = self._conversation_repository.list_conversation_summaries(
+            tenant_id,
+            limit=limit + 1 if limit is not None else None,
+            after_updated_at=after_updated_at,
+            after_conversation_id=after_conversation_id,
+        )
+        next_cursor: str | None = None
+        if limit is not None and len(summaries) > limit:
+            summaries = summaries[:limit]
+            next_cursor = self._encode_cursor(summaries[-1].updated_at, summaries[-1].id)
 
         items: list[conversation_dto.ConversationSummaryDTO] = []
-        for conversation in sorted_conversations:
-            item = conversation_dto.ConversationSummaryDTO(
-                conversation_id=conversation.id,
-                whatsapp_user_id=conversation.whatsapp_user_id,
-                last_message_preview=conversation.last_message_preview,
-                updated_at=conversation.updated_at,
-                control_mode=conversation.control_mode,
-            )
-            items.append(item)
+        for summary in summaries:
+            items.append(self._build_conversation_summary_dto(summary))
 
-        return conversation_dto.ConversationListResponseDTO(items=items)
+        return conversation_dto.ConversationListResponseDTO(items=items, next_cursor=next_cursor)
 
     def list_messages(
         self,
         tenant_id: str,
         conversation_id: str,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
     ) -> conversation_dto.MessageListResponseDTO:
+        if before is not None and after is not None:
+            raise service_exceptions.InvalidStateError(
+                "before and after cursors cannot be combined"
+            )
         conversation = self._conversation_repository.get_conversation_by_id(
             tenant_id, conversation_id
         )
         if conversation is None:
             raise service_exceptions.EntityNotFoundError("conversation not found")
 
-        messages = self._conversation_repository.list_messages(tenant_id, conversation_id)
-        sorted_messages = sorted(messages, key=lambda item: item.created_at)
+        if limit is None and before is None and after is None:
+            messages = self._conversation_repository.list_messages(tenant_id, conversation_id)
+            sorted_messages = sorted(messages, key=lambda item: item.created_at)
+            return conversation_dto.MessageListResponseDTO(
+                items=[self._build_message_dto(message) for message in sorted_messages]
+            )
+
+        page_limit = limit if limit is not None else self._default_page_limit
+        before_created_at: datetime.datetime | None = None
+        before_message_id: str | None = None
+        after_created_at: datetime.datetime | None = None
+        after_message_id: str | None = None
+        if before is not None:
+            before_created_at, before_message_id = self._decode_cursor(before)
+        if after is not None:
+            after_created_at, after_message_id = self._decode_cursor(after)
+        page_messages = self._conversation_repository.list_messages_page(
+            tenant_id,
+            conversation_id,
+            limit=page_limit + 1,
+            before_created_at=before_created_at,
+            before_message_id=before_message_id,
+            after_created_at=after_created_at,
+            after_message_id=after_message_id,
+        )
+        has_more = len(page_messages) > page_limit
+        if has_more and after is not None:
+            page_messages = page_messages[:page_limit]
+        elif has_more:
+            page_messages = page_messages[-page_limit:]
+
+        before_cursor: str | None = None
+        after_cursor: str | None = None
+        if page_messages:
+            if has_more or after is not None:
+                before_cursor = self._encode_cursor(
+                    page_messages[0].created_at, page_messages[0].id
+                )
+            after_cursor = self._encode_cursor(page_messages[-1].created_at, page_messages[-1].id)
+        elif after is not None:
+            after_cursor = after
+        return conversation_dto.MessageListResponseDTO(
+            items=[self._build_message_dto(message) for message in page_messages],
+            before_cursor=before_cursor,
+            after_cursor=after_cursor,
+        )
+
+    def list_changes(
+        self,
+        tenant_id: str,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> conversation_dto.ConversationChangesResponseDTO:
+        if since is None:
+            latest_summaries = self._conversation_repository.list_conversation_summaries(
+                tenant_id,
+                limit=1,
+            )
+            if latest_summaries:
+                next_cursor = self._encode_cursor(
+                    latest_summaries[0].updated_at, latest_summaries[0].id
+                )
+            else:
+                next_cursor = self._encode_cursor(self._change_feed_origin, "")
+            return conversation_dto.ConversationChangesResponseDTO(
+                conversations=[],
+                messages=[],
+                next_cursor=next_cursor,
+                has_more=False,
+            )
+
+        since_at, since_conversation_id = self._decode_cursor(since)
+        # Pages of one sync share the lower bound of its first page, so a conversation that
+        # lands on a later page still returns messages created before the previous page cursor.
+        sync_from_at = self._decode_sync_from(since) or since_at
+        page_limit = limit if limit is not None else self._default_page_limit
+        changed_summaries = self._conversation_repository.list_changed_conversation_summaries(
+            tenant_id,
+            limit=page_limit + 1,
+            after_updated_at=since_at,
+            after_conversation_id=since_conversation_id or None,
+        )
+        has_more = len(changed_summaries) > page_limit
+        changed_summaries = changed_summaries[:page_limit]
+
+        changed_messages: list[message_entity.Message] = []
+        truncated_conversations: list[conversation_dto.TruncatedConversationMessagesDTO] = []
+        for summary in changed_summaries:
+            conversation_messages = self._conversation_repository.list_messages_page(
+                tenant_id,
+                summary.id,
+                limit=self._change_feed_message_limit + 1,
+                after_created_at=sync_from_at,
+            )
+            if len(conversation_messages) > self._change_feed_message_limit:
+                conversation_messages = conversation_messages[: self._change_feed_message_limit]
+                truncated_conversations.append(
+                    conversation_dto.TruncatedConversationMessagesDTO(
+                        conversation_id=summary.id,
+                        after_cursor=self._encode_cursor(
+                            conversation_messages[-1].created_at, conversation_messages[-1].id
+                        ),
+                    )
+                )
+            changed_messages.extend(conversation_messages)
+        changed_messages.sort(key=lambda item: (item.created_at, item.id))
 
-        items: list[conversation_dto.MessageDTO] = []
-        for message in sorted_messages:
-            item = conversation_dto.MessageDTO(
-                message_id=message.id,
-                conversation_id=message.conversation_id,
-                role=message.role,
-                direction=message.direction,
-                content=message.content,
-                created_at=message.created_at,
+        next_cursor = since
+        if changed_summaries:
+            next_cursor = self._encode_cursor(
+                changed_summaries[-1].updated_at,
+                changed_summaries[-1].id,
+                sync_from_at=sync_from_at if has_more else None,
             )
-            items.append(item)
+        return conversation_dto.ConversationChangesResponseDTO(
+            conversations=[
+                self._build_conversation_summary_dto(summary) for summary in changed_summaries
+            ],
+            messages=[self._build_message_dto(message) for message in changed_messages],
+            next_cursor=next_cursor,
+            has_more=has_more,
+            truncated_conversations=truncated_conversations,
+        )
+
+    def search_messages(
+        self,
+        tenant_id: str,
+        query: str,
+        limit: int | None = None,
+    ) -> conversation_dto.ConversationSearchResponseDTO:
+        terms = message_search_tokenizer.tokenize_search_query(query)[: self._max_search_terms]
+        if not terms:
+            raise service_exceptions.InvalidStateError(
+                "search query must contain at least one searchable word"
+            )
+        postings = self._conversation_repository.search_message_postings(
+            tenant_id,
+            terms,
+            limit_per_term=self._search_candidates_per_term,
+        )
+        score_by_message_key: dict[tuple[str, str], float] = {}
+        created_at_by_message_key: dict[tuple[str, str], datetime.datetime] = {}
+        for posting in postings:
+            message_key = (posting.conversation_id, posting.message_id)
+            score_by_message_key[message_key] = (
+                score_by_message_key.get(message_key, 0.0)
+                + 1.0
+                + math.log(max(posting.term_frequency, 1))
+            )
+            created_at_by_message_key[message_key] = posting.created_at
+        ranked_message_keys = sorted(
+            score_by_message_key,
+            key=lambda item: (score_by_message_key[item], created_at_by_message_key[item]),
+            reverse=True,
+        )[: limit if limit is not None else self._default_search_limit]
+
+        message_by_key = {
+            (message.conversation_id, message.id): message
+            for message in self._conversation_repository.list_messages_by_ids(
+                tenant_id,
+                ranked_message_keys,
+            )
+        }
+        items: list[conversation_dto.ConversationSearchHitDTO] = []
+        for message_key in ranked_message_keys:
+            message = message_by_key.get(message_key)
+            if message is None:
+                continue
+            items.append(
+                conversation_dto.ConversationSearchHitDTO(
+                    conversation_id=message.conversation_id,
+                    message_id=message.id,
+                    role=message.role,
+                    direction=message.direction,
+                    snippet=self._build_search_snippet(message.content, terms),
+                    created_at=message.created_at,
+                    score=round(score_by_message_key[message_key], 4),
+                )
+            )
+        return conversation_dto.ConversationSearchResponseDTO(items=items)
+
+    def _build_search_snippet(self, content: str, terms: list[str]) -> str:
+        match_start, match_end = 0, 0
+        for term, term_start, term_end in message_search_tokenizer.iter_search_terms(content):
+            if term in terms:
+                match_start, match_end = term_start, term_end
+                break
+        snippet_start = max(match_start - self._search_snippet_radius, 0)
+        snippet_end = min(match_end + self._search_snippet_radius, len(content))
+        snippet = content[snippet_start:snippet_end].strip()
+        if snippet_start > 0:
+            snippet = f"...{snippet}"
+        if snippet_end < len(content):
+            snippet = f"{snippet}..."
+        return snippet
+
+    def _build_conversation_summary_dto(
+        self,
+        summary: conversation_summary_entity.ConversationSummary,
+    ) -> conversation_dto.ConversationSummaryDTO:
+        return conversation_dto.ConversationSummaryDTO(
+            conversation_id=summary.id,
+            whatsapp_user_id=summary.whatsapp_user_id,
+            last_message_preview=summary.last_message_preview,
+            updated_at=summary.updated_at,
+            control_mode=summary.control_mode,
+        )
+
+    def _build_message_dto(self, message: message_entity.Message) -> conversation_dto.MessageDTO:
+        return conversation_dto.MessageDTO(
+            message_id=message.id,
+            conversation_id=message.conversation_id,
+            role=message.role,
+            direction=message.direction,
+            content=message.content,
+            created_at=message.created_at,
+        )
+
+    def _encode_cursor(
+        self,
+        position_at: datetime.datetime,
+        entity_id: str,
+        sync_from_at: datetime.datetime | None = None,
+    ) -> str:
+        cursor_values: dict[str, str] = {"at": position_at.isoformat(), "id": entity_id}
+        if sync_from_at is not None:
+            cursor_values["from"] = sync_from_at.isoformat()
+        cursor_payload = json.dumps(cursor_values)
+        encoded = base64.urlsafe_b64encode(cursor_payload.encode("utf-8")).decode("ascii")
+        return encoded.rstrip("=")
+
+    def _decode_cursor(self, cursor: str) -> tuple[datetime.datetime, str]:
+        cursor_payload = self._decode_cursor_payload(cursor)
+        position_at_value = cursor_payload.get("at")
+        entity_id = cursor_payload.get("id")
+        if not isinstance(position_at_value, str) or not isinstance(entity_id, str):
+            raise service_exceptions.InvalidStateError("invalid pagination cursor")
+        try:
+            position_at = datetime.datetime.fromisoformat(position_at_value)
+        except ValueError as error:
+            raise service_exceptions.InvalidStateError("invalid pagination cursor") from error
+        return position_at, entity_id
+
+    def _decode_sync_from(self, cursor: str) -> datetime.datetime | None:
+        sync_from_value = self._decode_cursor_payload(cursor).get("from")
+        if sync_from_value is None:
+            return None
+        if not isinstance(sync_from_value, str):
+            raise service_exceptions.InvalidStateError("invalid pagination cursor")
+        try:
+            return datetime.datetime.fromisoformat(sync_from_value)
+        except ValueError as error:
+            raise service_exceptions.InvalidStateError("invalid pagination cursor") from error
 
-        return conversation_dto.MessageListResponseDTO(items=items)
+    def _decode_cursor_payload(self, cursor: str) -> dict[str, object]:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        try:
+            cursor_payload = json.loads(base64.urlsafe_b64decode(padded_cursor.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError) as error:
+            raise service_exceptions.InvalidStateError("invalid pagination cursor") from error
+        if not isinstance(cursor_payload, dict):
+            raise service_exceptions.InvalidStateError("invalid pagination cursor")
+        return cursor_payload
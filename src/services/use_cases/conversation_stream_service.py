@@ -0,0 +1,51 @@
+import collections.abc
+
+import src.ports.conversation_event_bus_port as conversation_event_bus_port
+import src.services.exceptions as service_exceptions
+
+
+class ConversationStreamService:
+    def __init__(
+        self,
+        conversation_event_bus: conversation_event_bus_port.ConversationEventBusPort,
+        heartbeat_seconds: float,
+    ) -> None:
+        self._conversation_event_bus = conversation_event_bus
+        self._heartbeat_seconds = heartbeat_seconds
+
+    def open_stream(self, tenant_id: str) -> str:
+        subscription_id = self._conversation_event_bus.subscribe(tenant_id)
+        if subscription_id is None:
+            raise service_exceptions.CapacityExceededError(
+                "too many open conversation streams for tenant"
+            )
+        return subscription_id
+
+    async def aiter_events(self, subscription_id: str) -> collections.abc.AsyncIterator[str]:
+        try:
+            while self._conversation_event_bus.is_active(subscription_id):
+                stream_event = await self._conversation_event_bus.anext_event(
+                    subscription_id,
+                    timeout_seconds=self._heartbeat_seconds,
+                )
+                if stream_event is None:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"event: {stream_event.event_type}\ndata: {stream_event.model_dump_json()}\n\n"
+        finally:
+            self._conversation_event_bus.unsubscribe(subscription_id)
+
+    def iter_events(self, subscription_id: str) -> collections.abc.Generator[str, None, None]:
+        try:
+            while self._conversation_event_bus.is_active(subscription_id):
+                stream_event = self._conversation_event_bus.next_event(
+                    subscription_id,
+                    timeout_seconds=self._heartbeat_seconds,
+                )
+                if stream_event is None:
+                    # Comment frames keep proxies from closing idle connections.
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"event: {stream_event.event_type}\ndata: {stream_event.model_dump_json()}\n\n"
+        finally:
+            self._conversation_event_bus.unsubscribe(subscription_id)
@@ -0,0 +1,202 @@
+import datetime
+
+import src.domain.entities.message as message_entity
+import src.infra.logs as app_logs
+import src.ports.background_task_runner_port as background_task_runner_port
+import src.ports.conversation_repository_port as conversation_repository_port
+import src.ports.llm_provider_port as llm_provider_port
+import src.services.dto.llm_dto as llm_dto
+import src.services.exceptions as service_exceptions
+
+logger = app_logs.get_logger(__name__)
+
+_SPEAKER_BY_ROLE = {
+    "user": "Paciente",
+    "assistant": "Asistente",
+    "human_agent": "Profesional",
+    "system": "Sistema",
+}
+
+
+class ConversationSummaryService:
+    _page_size = 100
+    _per_message_overhead_tokens = 4
+    _max_summary_chars = 2000
+    _summary_cursor_origin = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+
+    def __init__(
+        self,
+        conversation_repository: conversation_repository_port.ConversationRepositoryPort,
+        llm_provider: llm_provider_port.LlmProviderPort,
+        task_runner: background_task_runner_port.BackgroundTaskRunnerPort | None,
+        history_token_budget: int,
+        context_message_limit: int,
+    ) -> None:
+        if history_token_budget < 1:
+            raise ValueError("summary history_token_budget must be at least 1")
+        if context_message_limit < 1:
+            raise ValueError("summary context_message_limit must be at least 1")
+        self._conversation_repository = conversation_repository
+        self._llm_provider = llm_provider
+        self._task_runner = task_runner
+        self._history_token_budget = history_token_budget
+        self._context_message_limit = context_message_limit
+
+    def needs_refresh(self, active_messages: list[message_entity.Message]) -> bool:
+        if len(active_messages) >= self._context_message_limit:
+            return True
+        return self._count_history_tokens(active_messages) > self._history_token_budget
+
+    def request_refresh(self, tenant_id: str, conversation_id: str) -> None:
+        if self._task_runner is None:
+            self.refresh(tenant_id, conversation_id)
+            return
+
+        def run_refresh() -> None:
+            self.refresh(tenant_id, conversation_id)
+
+        self._task_runner.submit(f"{tenant_id}:{conversation_id}", run_refresh)
+
+    def refresh(self, tenant_id: str, conversation_id: str) -> bool:
+        conversation = self._conversation_repository.get_conversation_by_id(
+            tenant_id, conversation_id
+        )
+        if conversation is None:
+            return False
+        unsummarized_messages = self._conversation_repository.list_messages_page(
+            tenant_id,
+            conversation_id,
+            limit=self._page_size + 1,
+            after_created_at=conversation.summarized_through_at or self._summary_cursor_origin,
+            after_message_id=conversation.summarized_through_message_id,
+        )
+        overflow_messages = self._select_overflow_messages(unsummarized_messages)
+        if not overflow_messages:
+            return False
+
+        llm_input = llm_dto.GenerateReplyInputDTO(
+            system_prompt=self._build_summary_system_prompt(),
+            messages=[
+                llm_dto.ChatMessageDTO(
+                    role="user",
+                    content=self._build_summary_user_prompt(
+                        conversation.running_summary, overflow_messages
+                    ),
+                )
+            ],
+        )
+        try:
+            summary_reply = self._llm_provider.generate_reply(llm_input)
+        except service_exceptions.ExternalProviderError as error:
+            logger.warning(
+                "conversation.summary.refresh_failed",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="conversation.summary.refresh_failed",
+                        message="running conversation summary could not be refreshed",
+                        data={
+                            "tenant_id": tenant_id,
+                            "conversation_id": conversation_id,
+                            "error_type": type(error).__name__,
+                            "error_message": str(error),
+                        },
+                    )
+                },
+            )
+            return False
+        running_summary = summary_reply.content.strip()[: self._max_summary_chars]
+        if not running_summary:
+            return False
+
+        # Re-read so fields written by the reply path since the first read are not clobbered.
+        fresh_conversation = self._conversation_repository.get_conversation_by_id(
+            tenant_id, conversation_id
+        )
+        if fresh_conversation is None or (
+            fresh_conversation.summarized_through_at,
+            fresh_conversation.summarized_through_message_id,
+        ) != (conversation.summarized_through_at, conversation.summarized_through_message_id):
+            return False
+        last_folded_message = overflow_messages[-1]
+        fresh_conversation.fold_into_running_summary(
+            running_summary=running_summary,
+            summarized_through_at=last_folded_message.created_at,
+            summarized_through_message_id=last_folded_message.id,
+        )
+        self._conversation_repository.save_conversation(fresh_conversation)
+        logger.info(
+            "conversation.summary.refreshed",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="conversation.summary.refreshed",
+                    message="overflowing history folded into running conversation summary",
+                    data={
+                        "tenant_id": tenant_id,
+                        "conversation_id": conversation_id,
+                        "folded_messages_count": len(overflow_messages),
+                        "summary_chars": len(running_summary),
+                    },
+                )
+            },
+        )
+        return True
+
+    def _select_overflow_messages(
+        self, unsummarized_messages: list[message_entity.Message]
+    ) -> list[message_entity.Message]:
+        if len(unsummarized_messages) > self._page_size:
+            # More unsummarized history follows: fold this page and let later runs catch up.
+            return unsummarized_messages[: self._page_size]
+        # Keeping only half the window leaves headroom, so folding runs every few turns
+        # instead of on every reply once a chat is long.
+        remaining_tokens = self._history_token_budget // 2
+        kept_messages_count = 0
+        for message in reversed(unsummarized_messages):
+            message_tokens = self._count_history_tokens([message])
+            if (
+                kept_messages_count >= max(self._context_message_limit // 2, 1)
+                or message_tokens > remaining_tokens
+            ):
+                break
+            remaining_tokens -= message_tokens
+            kept_messages_count += 1
+        if kept_messages_count == 0 and unsummarized_messages:
+            kept_messages_count = 1
+        return unsummarized_messages[: len(unsummarized_messages) - kept_messages_count]
+
+    def _count_history_tokens(self, messages: list[message_entity.Message]) -> int:
+        return sum(
+            self._per_message_overhead_tokens
+            + (
+                message.token_estimate
+                if message.token_estimate is not None
+                else message_entity.estimate_token_count(message.content)
+            )
+            for message in messages
+        )
+
+    def _build_summary_system_prompt(self) -> str:
+        return (
+            "Eres un asistente que mantiene la memoria de una conversacion de WhatsApp "
+            "entre un paciente y un consultorio de psicologia. "
+            "Combina el resumen previo con los mensajes nuevos en un unico resumen actualizado. "
+            "Conserva datos del paciente (nombre, edad, email, ubicacion, telefono), "
+            "motivo de consulta, modalidad, preferencias horarias, citas agendadas o canceladas "
+            "y acuerdos pendientes. Si un dato nuevo contradice uno previo, conserva el nuevo. "
+            "Escribe en espanol, en tercera persona, maximo 120 palabras, sin saludos ni opiniones. "
+            "Responde solo con el resumen."
+        )
+
+    def _build_summary_user_prompt(
+        self,
+        running_summary: str | None,
+        messages: list[message_entity.Message],
+    ) -> str:
+        transcript_lines = [
+            f"{_SPEAKER_BY_ROLE.get(message.role, 'Sistema')}: {message.content}"
+            for message in messages
+        ]
+        return (
+            f"Resumen previo: {running_summary or '(sin resumen previo)'}\n"
+            "Mensajes nuevos:\n" + "\n".join(transcript_lines)
+        )
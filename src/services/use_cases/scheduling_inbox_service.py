@@ -5,6 +5,7 @@ import src.domain.entities.scheduling_slot as scheduling_slot_entity
 import src.infra.logs as app_logs
 import src.ports.agent_profile_repository_port as agent_profile_repository_port
 import src.ports.clock_port as clock_port
+import src.ports.conversation_event_bus_port as conversation_event_bus_port
 import src.ports.conversation_repository_port as conversation_repository_port
 import src.ports.id_generator_port as id_generator_port
 import src.ports.llm_provider_port as llm_provider_port
@@ -13,7 +14,9 @@ import src.ports.whatsapp_connection_repository_port as whatsapp_connection_repo
 import src.ports.whatsapp_provider_port as whatsapp_provider_port
 import src.services.agentic.prompt_builder as prompt_builder
 import src.services.constants as service_constants
+import src.services.conversation_stream_events as conversation_stream_events
 import src.services.dto.auth_dto as auth_dto
+import src.services.dto.conversation_dto as conversation_dto
 import src.services.dto.llm_dto as llm_dto
 import src.services.dto.scheduling_dto as scheduling_dto
 import src.services.exceptions as service_exceptions
@@ -44,6 +47,7 @@ class SchedulingInboxService:
             agent_profile_repository_port.AgentProfileRepositoryPort | None
         ) = None,
         default_system_prompt: str | None = None,
+        conversation_event_bus: conversation_event_bus_port.ConversationEventBusPort | None = None,
     ) -> None:
         self._scheduling_repository = scheduling_repository
         self._scheduling_service = scheduling_service
@@ -56,6 +60,7 @@ class SchedulingInboxService:
         self._llm_provider = llm_provider
         self._agent_profile_repository = agent_profile_repository
         self._default_system_prompt = default_system_prompt
+        self._conversation_event_bus = conversation_event_bus
         self._prompt_builder = prompt_builder.RuntimePromptBuilder()
 
     def list_requests(
@@ -122,6 +127,9 @@ class SchedulingInboxService:
             outbound_message.created_at,
         )
         self._conversation_repository.save_conversation(conversation)
+        self._publish_conversation_event(
+            conversation_stream_events.build_message_appended_event(outbound_message)
+        )
 
         return scheduling_dto.ConsultationReviewDecisionResponseDTO(
             status=request.status,
@@ -186,6 +194,9 @@ class SchedulingInboxService:
             outbound_message.created_at,
         )
         self._conversation_repository.save_conversation(conversation)
+        self._publish_conversation_event(
+            conversation_stream_events.build_message_appended_event(outbound_message)
+        )
 
         return scheduling_dto.PaymentReviewDecisionResponseDTO(
             status=request.status,
@@ -289,6 +300,9 @@ class SchedulingInboxService:
             outbound_message.created_at,
         )
         self._conversation_repository.save_conversation(conversation)
+        self._publish_conversation_event(
+            conversation_stream_events.build_message_appended_event(outbound_message)
+        )
         logger.info(
             "scheduling.professional_slots_submitted",
             extra={
@@ -549,3 +563,11 @@ class SchedulingInboxService:
     def _ensure_owner(self, claims: auth_dto.TokenClaimsDTO) -> None:
         if claims.role != service_constants.DEFAULT_OWNER_ROLE:
             raise service_exceptions.AuthorizationError("owner role required")
+
+    def _publish_conversation_event(
+        self,
+        stream_event: conversation_dto.ConversationStreamEventDTO,
+    ) -> None:
+        if self._conversation_event_bus is None:
+            return
+        self._conversation_event_bus.publish(stream_event)
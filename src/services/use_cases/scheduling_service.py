@@ -6,11 +6,14 @@ import src.domain.entities.scheduling_slot as scheduling_slot_entity
 import src.infra.logs as app_logs
 import src.ports.agent_workflow_port as agent_workflow_port
 import src.ports.clock_port as clock_port
+import src.ports.conversation_event_bus_port as conversation_event_bus_port
 import src.ports.conversation_repository_port as conversation_repository_port
 import src.ports.id_generator_port as id_generator_port
 import src.ports.scheduling_repository_port as scheduling_repository_port
 import src.services.agentic.workflow_engine as workflow_engine
+import src.services.conversation_stream_events as conversation_stream_events
 import src.services.dto.agent_workflow_dto as agent_workflow_dto
+import src.services.dto.conversation_dto as conversation_dto
 import src.services.dto.scheduling_dto as scheduling_dto
 import src.services.exceptions as service_exceptions
 import src.services.use_cases.google_calendar_onboarding_service as google_calendar_onboarding_service
@@ -76,12 +79,14 @@ class SchedulingService:
         id_generator: id_generator_port.IdGeneratorPort,
         clock: clock_port.ClockPort,
         agent_workflow: agent_workflow_port.AgentWorkflowPort | None = None,
+        conversation_event_bus: conversation_event_bus_port.ConversationEventBusPort | None = None,
     ) -> None:
         self._scheduling_repository = scheduling_repository
         self._conversation_repository = conversation_repository
         self._google_calendar_onboarding_service = google_calendar_onboarding_service
         self._id_generator = id_generator
         self._clock = clock
+        self._conversation_event_bus = conversation_event_bus
         self._agent_workflow: agent_workflow_port.AgentWorkflowPort
         if agent_workflow is None:
             self._agent_workflow = workflow_engine.LangGraphAgentWorkflowEngine()
@@ -697,7 +702,7 @@ class SchedulingService:
                         "request_id": scheduling_request_id,
                         "calendar_event_id": calendar_event_id,
                         "archived_messages_count": len(sorted_active_messages),
-                        "subsessions_count": len(conversation.subsessions),
+                        "subsessions_count": conversation.subsessions_count,
                     },
                 )
             },
@@ -958,6 +963,9 @@ class SchedulingService:
         now_value = self._clock.now()
         conversation.set_control_mode("HUMAN", now_value)
         self._conversation_repository.save_conversation(conversation)
+        self._publish_conversation_event(
+            conversation_stream_events.build_control_mode_changed_event(conversation)
+        )
 
         request_list = self._scheduling_repository.list_requests_by_conversation(
             tenant_id,
@@ -1259,3 +1267,11 @@ class SchedulingService:
             updated_at=request.updated_at,
             slots=slots,
         )
+
+    def _publish_conversation_event(
+        self,
+        stream_event: conversation_dto.ConversationStreamEventDTO,
+    ) -> None:
+        if self._conversation_event_bus is None:
+            return
+        self._conversation_event_bus.publish(stream_event)
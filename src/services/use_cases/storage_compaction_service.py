@@ -0,0 +1,46 @@
+import src.infra.logs as app_logs
+import src.ports.clock_port as clock_port
+import src.ports.conversation_processing_lock_port as conversation_processing_lock_port
+import src.ports.processed_webhook_event_repository_port as processed_webhook_event_repository_port
+
+logger = app_logs.get_logger(__name__)
+
+
+class StorageCompactionService:
+    _delete_limit_per_run = 5000
+
+    def __init__(
+        self,
+        processed_webhook_event_repository: (
+            processed_webhook_event_repository_port.ProcessedWebhookEventRepositoryPort
+        ),
+        conversation_processing_lock: conversation_processing_lock_port.ConversationProcessingLockPort,
+        clock: clock_port.ClockPort,
+    ) -> None:
+        self._processed_webhook_event_repository = processed_webhook_event_repository
+        self._conversation_processing_lock = conversation_processing_lock
+        self._clock = clock
+
+    def compact_expired(self) -> None:
+        now_value = self._clock.now()
+        deleted_webhook_events = self._processed_webhook_event_repository.delete_expired(
+            now_value,
+            limit=self._delete_limit_per_run,
+        )
+        deleted_processing_locks = self._conversation_processing_lock.delete_expired(
+            now_value,
+            limit=self._delete_limit_per_run,
+        )
+        logger.info(
+            "storage.compaction.completed",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="storage.compaction.completed",
+                    message="expired idempotency and lock documents deleted",
+                    data={
+                        "deleted_webhook_events": deleted_webhook_events,
+                        "deleted_processing_locks": deleted_processing_locks,
+                    },
+                )
+            },
+        )
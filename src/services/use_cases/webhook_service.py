@@ -1,10 +1,18 @@
+import asyncio
+import collections.abc
+import concurrent.futures
+import contextlib
+import datetime
+import itertools
 import re
+import threading
 import time
 import typing
 import unicodedata
 
 import pydantic
 
+import src.domain.entities.agent_profile as agent_profile_entity
 import src.domain.entities.conversation as conversation_entity
 import src.domain.entities.message as message_entity
 import src.domain.entities.patient as patient_entity
@@ -15,25 +23,37 @@ import src.infra.logs as app_logs
 import src.ports.agent_profile_repository_port as agent_profile_repository_port
 import src.ports.agent_workflow_port as agent_workflow_port
 import src.ports.blacklist_repository_port as blacklist_repository_port
+import src.ports.classification_cache_port as classification_cache_port
 import src.ports.clock_port as clock_port
+import src.ports.conversation_debounce_scheduler_port as conversation_debounce_scheduler_port
+import src.ports.conversation_event_bus_port as conversation_event_bus_port
 import src.ports.conversation_processing_lock_port as conversation_processing_lock_port
 import src.ports.conversation_repository_port as conversation_repository_port
 import src.ports.id_generator_port as id_generator_port
 import src.ports.llm_provider_port as llm_provider_port
 import src.ports.patient_repository_port as patient_repository_port
+import src.ports.processed_webhook_event_filter_port as processed_webhook_event_filter_port
 import src.ports.processed_webhook_event_repository_port as processed_webhook_event_repository_port
+import src.ports.unit_of_work_port as unit_of_work_port
+import src.ports.webhook_event_context_loader_port as webhook_event_context_loader_port
+import src.ports.webhook_event_queue_port as webhook_event_queue_port
 import src.ports.whatsapp_connection_repository_port as whatsapp_connection_repository_port
 import src.ports.whatsapp_provider_port as whatsapp_provider_port
+import src.services.agentic.context_budget as context_budget
 import src.services.agentic.prompt_builder as prompt_builder
 import src.services.agentic.state_models as agentic_state_models
 import src.services.agentic.tool_registry as tool_registry
 import src.services.agentic.workflow_engine as workflow_engine
+import src.services.classification_cache_keys as classification_cache_keys
+import src.services.conversation_stream_events as conversation_stream_events
 import src.services.dto.agent_workflow_dto as agent_workflow_dto
+import src.services.dto.conversation_dto as conversation_dto
 import src.services.dto.llm_dto as llm_dto
 import src.services.dto.scheduling_dto as scheduling_dto
 import src.services.dto.webhook_dto as webhook_dto
 import src.services.exceptions as service_exceptions
 import src.services.scheduling_slot_formatter as scheduling_slot_formatter
+import src.services.use_cases.conversation_summary_service as conversation_summary_service
 import src.services.use_cases.scheduling_service as scheduling_service
 
 logger = app_logs.get_logger(__name__)
@@ -70,6 +90,8 @@ class WebhookConversationWorkflowRuntimeAdapter(
         latest_user_text: str,
         llm_messages: list[llm_dto.ChatMessageDTO],
         known_patient: patient_entity.Patient | None,
+        agent_profile: agent_profile_entity.AgentProfile | None = None,
+        conversation_summary: str | None = None,
     ) -> None:
         self._webhook_service = webhook_service
         self._tenant_id = tenant_id
@@ -78,6 +100,8 @@ class WebhookConversationWorkflowRuntimeAdapter(
         self._latest_user_text = latest_user_text
         self._llm_messages = llm_messages
         self._known_patient = known_patient
+        self._agent_profile = agent_profile
+        self._conversation_summary = conversation_summary
 
     def load_runtime_prompt_context(self) -> RuntimePromptContext:
         return self._webhook_service._resolve_runtime_prompt_context(
@@ -119,10 +143,13 @@ class WebhookConversationWorkflowRuntimeAdapter(
         self,
         runtime_context: RuntimePromptContext,
     ) -> str:
-        base_prompt = self._webhook_service._resolve_agent_system_prompt(self._tenant_id)
+        base_prompt = self._webhook_service._resolve_agent_system_prompt(
+            self._tenant_id, agent_profile=self._agent_profile
+        )
         runtime_prompt = self._webhook_service._prompt_builder.build_runtime_system_prompt(
             runtime_context=runtime_context,
             known_patient=self._known_patient,
+            conversation_summary=self._conversation_summary,
         )
         return self._webhook_service._prompt_builder.compose_base_and_runtime_system_prompt(
             base_system_prompt=base_prompt,
@@ -136,6 +163,8 @@ class WebhookConversationWorkflowRuntimeAdapter(
             whatsapp_user_id=self._whatsapp_user_id,
             llm_messages=self._llm_messages,
             known_patient=self._known_patient,
+            agent_profile=self._agent_profile,
+            conversation_summary=self._conversation_summary,
         )
 
 
@@ -164,6 +193,21 @@ class WebhookService:
         tool_definition_registry: tool_registry.ToolDefinitionRegistry | None = None,
         conversation_processing_lock: conversation_processing_lock_port.ConversationProcessingLockPort
         | None = None,
+        event_queue: webhook_event_queue_port.WebhookEventQueuePort | None = None,
+        debounce_scheduler: conversation_debounce_scheduler_port.ConversationDebounceSchedulerPort
+        | None = None,
+        payload_partition_concurrency: int = 1,
+        processed_event_filter: processed_webhook_event_filter_port.ProcessedWebhookEventFilterPort
+        | None = None,
+        event_context_loader: webhook_event_context_loader_port.WebhookEventContextLoaderPort
+        | None = None,
+        unit_of_work: unit_of_work_port.UnitOfWorkPort | None = None,
+        conversation_event_bus: conversation_event_bus_port.ConversationEventBusPort | None = None,
+        context_token_budget: int | None = None,
+        conversation_summarizer: conversation_summary_service.ConversationSummaryService
+        | None = None,
+        stream_llm_replies: bool = False,
+        classification_cache: classification_cache_port.ClassificationCachePort | None = None,
     ) -> None:
         self._whatsapp_connection_repository = whatsapp_connection_repository
         self._conversation_repository = conversation_repository
@@ -172,6 +216,14 @@ class WebhookService:
         self._blacklist_repository = blacklist_repository
         self._agent_profile_repository = agent_profile_repository
         self._conversation_processing_lock = conversation_processing_lock
+        self._event_queue = event_queue
+        self._debounce_scheduler = debounce_scheduler
+        self._payload_partition_concurrency = payload_partition_concurrency
+        self._processed_event_filter = processed_event_filter
+        self._event_context_loader = event_context_loader
+        self._unit_of_work = unit_of_work
+        self._conversation_event_bus = conversation_event_bus
+        self._deferred_processed_marks = threading.local()
         self._scheduling_service = scheduling_service
         self._llm_provider = llm_provider
         self._whatsapp_provider = whatsapp_provider
@@ -179,6 +231,14 @@ class WebhookService:
         self._clock = clock
         self._default_system_prompt = default_system_prompt
         self._context_message_limit = context_message_limit
+        self._conversation_summarizer = conversation_summarizer
+        self._stream_llm_replies = stream_llm_replies
+        self._classification_cache = classification_cache
+        self._context_budget_builder: context_budget.TokenBudgetContextBuilder | None = None
+        if context_token_budget is not None:
+            self._context_budget_builder = context_budget.TokenBudgetContextBuilder(
+                context_token_budget
+            )
         self._agent_workflow: agent_workflow_port.AgentWorkflowPort
         if agent_workflow is None:
             self._agent_workflow = workflow_engine.LangGraphAgentWorkflowEngine()
@@ -200,6 +260,9 @@ class WebhookService:
         self._max_debounce_reprocess_iterations = 3
         self._google_network_retry_backoff_seconds = [1.0, 2.0, 4.0]
         self._llm_empty_content_retry_backoff_seconds = [0.5, 1.0]
+        # Half the repositories' 120 s claim timeout, so a long partition renews each claim
+        # before it can expire and be taken over by a redelivery.
+        self._claim_refresh_after = datetime.timedelta(seconds=60)
         self._professional_signature = "Psi. Alejandra Escobar"
         self._email_pattern = re.compile(
             r"^[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+$"
@@ -215,6 +278,39 @@ class WebhookService:
             self._sleep_seconds = time.sleep
 
     def process_payload(self, payload: dict[str, object]) -> webhook_dto.WebhookEventResponseDTO:
+        events = self._parse_payload_events(payload)
+        self._process_events(events)
+        return webhook_dto.WebhookEventResponseDTO(status="processed")
+
+    def accept_payload(self, payload: dict[str, object]) -> webhook_dto.WebhookEventResponseDTO:
+        if self._event_queue is None:
+            return self.process_payload(payload)
+
+        rejected_events = self._enqueue_payload_events(payload)
+        if rejected_events:
+            self._process_events(rejected_events)
+            return webhook_dto.WebhookEventResponseDTO(status="processed")
+        return webhook_dto.WebhookEventResponseDTO(status="accepted")
+
+    async def aaccept_payload(
+        self, payload: dict[str, object]
+    ) -> webhook_dto.WebhookEventResponseDTO:
+        # Enqueueing never blocks. The inline fallback claims its events on the event loop
+        # and only hands the claimed events to a thread for the synchronous conversation turn.
+        if self._event_queue is None:
+            events = self._parse_payload_events(payload)
+        else:
+            events = self._enqueue_payload_events(payload)
+            if not events:
+                return webhook_dto.WebhookEventResponseDTO(status="accepted")
+        claimed_at = self._clock.now()
+        event_claims = await self._aclaim_events(events, claimed_at)
+        await asyncio.to_thread(self._process_events, events, event_claims, claimed_at)
+        return webhook_dto.WebhookEventResponseDTO(status="processed")
+
+    def _parse_payload_events(
+        self, payload: dict[str, object]
+    ) -> list[webhook_dto.IncomingMessageEventDTO]:
         events = self._whatsapp_provider.parse_incoming_message_events(payload)
         logger.info(
             "webhook.received",
@@ -226,30 +322,279 @@ class WebhookService:
                 )
             },
         )
+        return events
+
+    def _enqueue_payload_events(
+        self, payload: dict[str, object]
+    ) -> list[webhook_dto.IncomingMessageEventDTO]:
+        if self._event_queue is None:
+            raise service_exceptions.InvalidStateError("webhook event queue is not configured")
+        events = self._whatsapp_provider.parse_incoming_message_events(payload)
+        rejected_events: list[webhook_dto.IncomingMessageEventDTO] = []
         for event in events:
-            try:
-                self._process_event(event)
-            except service_exceptions.ServiceError as error:
-                self._mark_event_failed_by_phone_number(
-                    phone_number_id=event.phone_number_id,
-                    provider_event_id=event.provider_event_id,
-                    failure_reason=str(error),
+            if not self._event_queue.submit(event):
+                rejected_events.append(event)
+        logger.info(
+            "webhook.received",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="webhook.received",
+                    message="webhook payload parsed and enqueued",
+                    data={
+                        "event_count": len(events),
+                        "enqueued_count": len(events) - len(rejected_events),
+                        "inline_count": len(rejected_events),
+                    },
                 )
-                raise
-            except ValueError as error:
-                self._mark_event_failed_by_phone_number(
-                    phone_number_id=event.phone_number_id,
-                    provider_event_id=event.provider_event_id,
-                    failure_reason=str(error),
+            },
+        )
+        return rejected_events
+
+    def process_queued_event(self, event: webhook_dto.IncomingMessageEventDTO) -> None:
+        try:
+            self._process_event(event)
+        except (service_exceptions.ServiceError, ValueError) as error:
+            self._mark_event_failed_by_phone_number(
+                phone_number_id=event.phone_number_id,
+                provider_event_id=event.provider_event_id,
+                failure_reason=str(error),
+            )
+            logger.error(
+                "webhook.queued_event_failed",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="webhook.queued_event_failed",
+                        message="queued webhook event processing failed",
+                        data={
+                            "provider_event_id": event.provider_event_id,
+                            "error_type": type(error).__name__,
+                            "error_message": str(error),
+                        },
+                    )
+                },
+            )
+
+    def get_event_queue_metrics(self) -> webhook_dto.WebhookEventQueueMetricsDTO:
+        if self._event_queue is None:
+            raise service_exceptions.EntityNotFoundError("webhook event queue is not enabled")
+        return self._event_queue.get_metrics()
+
+    def get_classification_cache_metrics(self) -> llm_dto.ClassificationCacheMetricsDTO:
+        if self._classification_cache is None:
+            raise service_exceptions.EntityNotFoundError("classification cache is not enabled")
+        return self._classification_cache.get_metrics()
+
+    def get_dedup_filter_metrics(self) -> webhook_dto.WebhookDedupFilterMetricsDTO:
+        if self._processed_event_filter is None:
+            raise service_exceptions.EntityNotFoundError("webhook dedup filter is not enabled")
+        return self._processed_event_filter.get_metrics()
+
+    def _process_events(
+        self,
+        events: list[webhook_dto.IncomingMessageEventDTO],
+        event_claims: list[tuple[str | None, bool | None]] | None = None,
+        claimed_at: datetime.datetime | None = None,
+    ) -> None:
+        if event_claims is None:
+            claimed_at = self._clock.now()
+            event_claims = self._claim_events(events, claimed_at)
+        claims_taken_at = claimed_at if claimed_at is not None else self._clock.now()
+        partitions: dict[
+            tuple[str, str],
+            list[tuple[webhook_dto.IncomingMessageEventDTO, str | None, bool | None]],
+        ] = {}
+        for event, (tenant_id, claim_result) in zip(events, event_claims, strict=True):
+            partition_key = (event.phone_number_id, event.whatsapp_user_id)
+            partitions.setdefault(partition_key, []).append((event, tenant_id, claim_result))
+
+        partition_errors: list[Exception | None]
+        if len(partitions) <= 1 or self._payload_partition_concurrency <= 1:
+            partition_errors = [
+                self._process_event_partition(partition_events, claims_taken_at)
+                for partition_events in partitions.values()
+            ]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self._payload_partition_concurrency, len(partitions)),
+                thread_name_prefix="webhook-partition",
+            ) as executor:
+                partition_errors = list(
+                    executor.map(
+                        self._process_event_partition,
+                        partitions.values(),
+                        itertools.repeat(claims_taken_at),
+                    )
                 )
-                raise
-        return webhook_dto.WebhookEventResponseDTO(status="processed")
 
-    def _process_event(self, event: webhook_dto.IncomingMessageEventDTO) -> None:
-        connection = self._whatsapp_connection_repository.get_by_phone_number_id(
-            event.phone_number_id
+        for partition_error in partition_errors:
+            if partition_error is not None:
+                raise partition_error
+
+    def _claim_events(
+        self,
+        events: list[webhook_dto.IncomingMessageEventDTO],
+        claimed_at: datetime.datetime,
+    ) -> list[tuple[str | None, bool | None]]:
+        tenant_id_by_phone_number_id: dict[str, str | None] = {}
+        for event in events:
+            if event.phone_number_id not in tenant_id_by_phone_number_id:
+                connection = self._whatsapp_connection_repository.get_by_phone_number_id(
+                    event.phone_number_id
+                )
+                tenant_id_by_phone_number_id[event.phone_number_id] = (
+                    connection.tenant_id if connection is not None else None
+                )
+
+        claim_results_by_key: dict[tuple[str, str], bool] = {}
+        for tenant_id, provider_event_ids in self._group_claimable_event_ids(
+            events, tenant_id_by_phone_number_id
+        ).items():
+            tenant_claim_results = self._processed_webhook_event_repository.claim_many(
+                tenant_id=tenant_id,
+                provider_event_ids=provider_event_ids,
+                claimed_at=claimed_at,
+            )
+            for provider_event_id, event_claimed in tenant_claim_results.items():
+                claim_results_by_key[(tenant_id, provider_event_id)] = event_claimed
+        return self._order_claim_results(events, tenant_id_by_phone_number_id, claim_results_by_key)
+
+    async def _aclaim_events(
+        self,
+        events: list[webhook_dto.IncomingMessageEventDTO],
+        claimed_at: datetime.datetime,
+    ) -> list[tuple[str | None, bool | None]]:
+        phone_number_ids = list(dict.fromkeys(event.phone_number_id for event in events))
+        connections = await asyncio.gather(
+            *(
+                self._whatsapp_connection_repository.aget_by_phone_number_id(phone_number_id)
+                for phone_number_id in phone_number_ids
+            )
         )
-        if connection is None:
+        tenant_id_by_phone_number_id = {
+            phone_number_id: connection.tenant_id if connection is not None else None
+            for phone_number_id, connection in zip(phone_number_ids, connections, strict=True)
+        }
+
+        provider_event_ids_by_tenant = self._group_claimable_event_ids(
+            events, tenant_id_by_phone_number_id
+        )
+        tenant_claim_results = await asyncio.gather(
+            *(
+                self._processed_webhook_event_repository.aclaim_many(
+                    tenant_id=tenant_id,
+                    provider_event_ids=provider_event_ids,
+                    claimed_at=claimed_at,
+                )
+                for tenant_id, provider_event_ids in provider_event_ids_by_tenant.items()
+            )
+        )
+        claim_results_by_key: dict[tuple[str, str], bool] = {}
+        for tenant_id, claim_results in zip(
+            provider_event_ids_by_tenant, tenant_claim_results, strict=True
+        ):
+            for provider_event_id, event_claimed in claim_results.items():
+                claim_results_by_key[(tenant_id, provider_event_id)] = event_claimed
+        return self._order_claim_results(events, tenant_id_by_phone_number_id, claim_results_by_key)
+
+    def _group_claimable_event_ids(
+        self,
+        events: list[webhook_dto.IncomingMessageEventDTO],
+        tenant_id_by_phone_number_id: dict[str, str | None],
+    ) -> dict[str, list[str]]:
+        provider_event_ids_by_tenant: dict[str, list[str]] = {}
+        for event in events:
+            tenant_id = tenant_id_by_phone_number_id[event.phone_number_id]
+            if tenant_id is not None and not self._is_known_processed_locally(
+                tenant_id, event.provider_event_id
+            ):
+                provider_event_ids_by_tenant.setdefault(tenant_id, []).append(
+                    event.provider_event_id
+                )
+        return provider_event_ids_by_tenant
+
+    def _order_claim_results(
+        self,
+        events: list[webhook_dto.IncomingMessageEventDTO],
+        tenant_id_by_phone_number_id: dict[str, str | None],
+        claim_results_by_key: dict[tuple[str, str], bool],
+    ) -> list[tuple[str | None, bool | None]]:
+        event_claims: list[tuple[str | None, bool | None]] = []
+        for event in events:
+            tenant_id = tenant_id_by_phone_number_id[event.phone_number_id]
+            if tenant_id is None:
+                event_claims.append((None, None))
+                continue
+            event_claims.append(
+                (tenant_id, claim_results_by_key.pop((tenant_id, event.provider_event_id), False))
+            )
+        return event_claims
+
+    def _process_event_partition(
+        self,
+        events: list[tuple[webhook_dto.IncomingMessageEventDTO, str | None, bool | None]],
+        claimed_at: datetime.datetime,
+    ) -> Exception | None:
+        self._deferred_processed_marks.by_tenant = {}
+        try:
+            for event_index, (event, tenant_id, claim_result) in enumerate(events):
+                if tenant_id is not None and claim_result is True:
+                    claim_result = self._refresh_event_claim_if_stale(event, tenant_id, claimed_at)
+                try:
+                    self._process_event(event, claim_result=claim_result, tenant_id=tenant_id)
+                except (service_exceptions.ServiceError, ValueError) as error:
+                    skipped_events = events[event_index + 1 :]
+                    # A False claim means the event is already processed or owned by another
+                    # instance, so it must not be released for redelivery.
+                    released_events = [
+                        released_event
+                        for released_event, _, released_claim_result in [
+                            (event, tenant_id, claim_result),
+                            *skipped_events,
+                        ]
+                        if released_claim_result is not False
+                    ]
+                    for failed_event in released_events:
+                        self._discard_deferred_processed_mark(failed_event.provider_event_id)
+                        self._mark_event_failed_by_phone_number(
+                            phone_number_id=failed_event.phone_number_id,
+                            provider_event_id=failed_event.provider_event_id,
+                            failure_reason=str(error),
+                        )
+                    logger.error(
+                        "webhook.partition_failed",
+                        extra={
+                            "event_data": app_logs.build_log_event(
+                                event_name="webhook.partition_failed",
+                                message="webhook event failed, remaining events of the conversation left for redelivery",
+                                data={
+                                    "phone_number_id": event.phone_number_id,
+                                    "provider_event_id": event.provider_event_id,
+                                    "skipped_event_count": len(skipped_events),
+                                    "error_type": type(error).__name__,
+                                    "error_message": str(error),
+                                },
+                            )
+                        },
+                    )
+                    return error
+            return None
+        finally:
+            self._flush_deferred_processed_marks()
+
+    def _process_event(
+        self,
+        event: webhook_dto.IncomingMessageEventDTO,
+        claim_result: bool | None = None,
+        tenant_id: str | None = None,
+    ) -> None:
+        # Payload events arrive already claimed against the phone-index tenant, so duplicates
+        # and local filter hits are dropped before the event context is read.
+        if claim_result is False and tenant_id is not None:
+            self._log_duplicate_skipped(tenant_id, event.provider_event_id)
+            return
+
+        event_context = self._load_event_context(event)
+        if event_context is None:
             logger.warning(
                 "webhook.event.skipped",
                 extra={
@@ -265,29 +610,25 @@ class WebhookService:
             )
             return
 
+        connection = event_context.connection
         tenant_id = connection.tenant_id
-        event_claimed = self._processed_webhook_event_repository.claim_for_processing(
-            tenant_id=tenant_id,
-            provider_event_id=event.provider_event_id,
-            claimed_at=self._clock.now(),
-        )
-        if not event_claimed:
-            logger.info(
-                "webhook.duplicate_skipped",
-                extra={
-                    "event_data": app_logs.build_log_event(
-                        event_name="webhook.duplicate_skipped",
-                        message="duplicate webhook event skipped",
-                        data={
-                            "tenant_id": tenant_id,
-                            "provider_event_id": event.provider_event_id,
-                        },
-                    )
-                },
+        if claim_result is None and self._is_known_processed_locally(
+            tenant_id, event.provider_event_id
+        ):
+            event_claimed = False
+        elif claim_result is None:
+            event_claimed = self._processed_webhook_event_repository.claim_for_processing(
+                tenant_id=tenant_id,
+                provider_event_id=event.provider_event_id,
+                claimed_at=self._clock.now(),
             )
+        else:
+            event_claimed = claim_result
+        if not event_claimed:
+            self._log_duplicate_skipped(tenant_id, event.provider_event_id)
             return
 
-        if self._blacklist_repository.exists(tenant_id, event.whatsapp_user_id):
+        if event_context.is_blacklisted:
             logger.info(
                 "webhook.blacklist_blocked",
                 extra={
@@ -307,11 +648,89 @@ class WebhookService:
         if connection.access_token is None or connection.phone_number_id is None:
             raise service_exceptions.InvalidStateError("whatsapp connection is missing credentials")
 
-        now_value = self._clock.now()
-        whatsapp_user = self._conversation_repository.get_whatsapp_user(
-            tenant_id,
-            event.whatsapp_user_id,
+        unit_of_work_scope: contextlib.AbstractContextManager[None] = contextlib.nullcontext()
+        if self._unit_of_work is not None:
+            unit_of_work_scope = self._unit_of_work.atomic()
+        stream_events: list[conversation_dto.ConversationStreamEventDTO] = []
+        with unit_of_work_scope:
+            persisted_event = self._persist_incoming_event(
+                event, event_context, tenant_id, stream_events
+            )
+        self._publish_conversation_events(stream_events)
+        if persisted_event is None:
+            return
+        conversation, inbound_message = persisted_event
+
+        debounce_delay = self._resolve_debounce_delay_seconds(
+            tenant_id, agent_profile=event_context.agent_profile
         )
+        if self._debounce_scheduler is not None and debounce_delay > 0:
+            self._schedule_debounced_ai_reply(
+                connection=connection,
+                tenant_id=tenant_id,
+                conversation_id=conversation.id,
+                event=event,
+                inbound_message=inbound_message,
+                debounce_delay=debounce_delay,
+            )
+            self._mark_event_processed(tenant_id, event.provider_event_id)
+            return
+
+        lock_holder_id: str | None = None
+        if self._conversation_processing_lock is not None:
+            lock_holder_id = self._id_generator.new_id()
+            lock_acquired = self._conversation_processing_lock.try_acquire(
+                tenant_id=tenant_id,
+                conversation_id=conversation.id,
+                holder_id=lock_holder_id,
+                acquired_at=self._clock.now(),
+            )
+            if not lock_acquired:
+                self._mark_event_processed(tenant_id, event.provider_event_id)
+                logger.info(
+                    "webhook.debounce_deferred",
+                    extra={
+                        "event_data": app_logs.build_log_event(
+                            event_name="webhook.debounce_deferred",
+                            message="message persisted, another handler holds conversation lock",
+                            data={
+                                "tenant_id": tenant_id,
+                                "conversation_id": conversation.id,
+                                "provider_event_id": event.provider_event_id,
+                            },
+                        )
+                    },
+                )
+                return
+
+        try:
+            self._process_ai_reply_with_debounce(
+                connection=connection,
+                conversation=conversation,
+                tenant_id=tenant_id,
+                event=event,
+                inbound_message=inbound_message,
+                debounce_delay=debounce_delay,
+                event_context=event_context,
+            )
+        finally:
+            if self._conversation_processing_lock is not None and lock_holder_id is not None:
+                self._conversation_processing_lock.release(
+                    tenant_id=tenant_id,
+                    conversation_id=conversation.id,
+                    holder_id=lock_holder_id,
+                    released_at=self._clock.now(),
+                )
+
+    def _persist_incoming_event(
+        self,
+        event: webhook_dto.IncomingMessageEventDTO,
+        event_context: webhook_dto.WebhookEventContextDTO,
+        tenant_id: str,
+        stream_events: list[conversation_dto.ConversationStreamEventDTO],
+    ) -> tuple[conversation_entity.Conversation, message_entity.Message] | None:
+        now_value = self._clock.now()
+        whatsapp_user = event_context.whatsapp_user
         if whatsapp_user is None:
             whatsapp_user = whatsapp_user_entity.WhatsappUser(
                 id=event.whatsapp_user_id,
@@ -321,10 +740,7 @@ class WebhookService:
             )
             self._conversation_repository.save_whatsapp_user(whatsapp_user)
 
-        conversation = self._conversation_repository.get_conversation_by_whatsapp_user(
-            tenant_id,
-            event.whatsapp_user_id,
-        )
+        conversation = event_context.conversation
         if conversation is None:
             conversation = conversation_entity.Conversation(
                 id=self._id_generator.new_id(),
@@ -355,7 +771,7 @@ class WebhookService:
                     )
                 },
             )
-            return
+            return None
 
         if event.source == "OWNER_APP":
             owner_message = message_entity.Message(
@@ -376,6 +792,12 @@ class WebhookService:
             )
             conversation.set_control_mode("HUMAN", owner_message.created_at)
             self._conversation_repository.save_conversation(conversation)
+            stream_events.append(
+                conversation_stream_events.build_message_appended_event(owner_message)
+            )
+            stream_events.append(
+                conversation_stream_events.build_control_mode_changed_event(conversation)
+            )
             self._mark_event_processed(tenant_id, event.provider_event_id)
             logger.info(
                 "webhook.owner_handoff_human",
@@ -392,7 +814,7 @@ class WebhookService:
                     )
                 },
             )
-            return
+            return None
 
         inbound_message = message_entity.Message(
             id=self._id_generator.new_id(),
@@ -407,6 +829,9 @@ class WebhookService:
         self._conversation_repository.save_message(inbound_message)
         conversation.append_message(inbound_message.id, inbound_message.content, now_value)
         self._conversation_repository.save_conversation(conversation)
+        stream_events.append(
+            conversation_stream_events.build_message_appended_event(inbound_message)
+        )
 
         if conversation.control_mode == "HUMAN":
             self._mark_event_processed(tenant_id, event.provider_event_id)
@@ -424,6 +849,72 @@ class WebhookService:
                     )
                 },
             )
+            return None
+        return conversation, inbound_message
+
+    def _schedule_debounced_ai_reply(
+        self,
+        connection: whatsapp_connection_entity.WhatsappConnection,
+        tenant_id: str,
+        conversation_id: str,
+        event: webhook_dto.IncomingMessageEventDTO,
+        inbound_message: message_entity.Message,
+        debounce_delay: float,
+    ) -> None:
+        if self._debounce_scheduler is None:
+            raise service_exceptions.InvalidStateError("debounce scheduler is not configured")
+
+        def run_debounced_ai_reply() -> None:
+            self._run_debounced_ai_reply(
+                connection=connection,
+                tenant_id=tenant_id,
+                conversation_id=conversation_id,
+                event=event,
+                inbound_message=inbound_message,
+                debounce_delay=debounce_delay,
+            )
+
+        deadline_reset = self._debounce_scheduler.schedule(
+            tenant_id=tenant_id,
+            conversation_id=conversation_id,
+            delay_seconds=debounce_delay,
+            callback=run_debounced_ai_reply,
+        )
+        logger.info(
+            "webhook.debounce_scheduled",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="webhook.debounce_scheduled",
+                    message="ai reply scheduled after conversation debounce window",
+                    data={
+                        "tenant_id": tenant_id,
+                        "conversation_id": conversation_id,
+                        "provider_event_id": event.provider_event_id,
+                        "debounce_delay_seconds": debounce_delay,
+                        "deadline_reset": deadline_reset,
+                    },
+                )
+            },
+        )
+
+    def _run_debounced_ai_reply(
+        self,
+        connection: whatsapp_connection_entity.WhatsappConnection,
+        tenant_id: str,
+        conversation_id: str,
+        event: webhook_dto.IncomingMessageEventDTO,
+        inbound_message: message_entity.Message,
+        debounce_delay: float,
+    ) -> None:
+        conversation = self._conversation_repository.get_conversation_by_id(
+            tenant_id, conversation_id
+        )
+        if conversation is None or conversation.control_mode == "HUMAN":
+            return
+        latest_messages = self._conversation_repository.list_recent_messages(
+            tenant_id, conversation_id, limit=1
+        )
+        if latest_messages and latest_messages[-1].role != "user":
             return
 
         lock_holder_id: str | None = None
@@ -431,25 +922,18 @@ class WebhookService:
             lock_holder_id = self._id_generator.new_id()
             lock_acquired = self._conversation_processing_lock.try_acquire(
                 tenant_id=tenant_id,
-                conversation_id=conversation.id,
+                conversation_id=conversation_id,
                 holder_id=lock_holder_id,
                 acquired_at=self._clock.now(),
             )
             if not lock_acquired:
-                self._mark_event_processed(tenant_id, event.provider_event_id)
-                logger.info(
-                    "webhook.debounce_deferred",
-                    extra={
-                        "event_data": app_logs.build_log_event(
-                            event_name="webhook.debounce_deferred",
-                            message="message persisted, another handler holds conversation lock",
-                            data={
-                                "tenant_id": tenant_id,
-                                "conversation_id": conversation.id,
-                                "provider_event_id": event.provider_event_id,
-                            },
-                        )
-                    },
+                self._schedule_debounced_ai_reply(
+                    connection=connection,
+                    tenant_id=tenant_id,
+                    conversation_id=conversation_id,
+                    event=event,
+                    inbound_message=inbound_message,
+                    debounce_delay=debounce_delay,
                 )
                 return
 
@@ -460,13 +944,32 @@ class WebhookService:
                 tenant_id=tenant_id,
                 event=event,
                 inbound_message=inbound_message,
+                debounce_delay=0,
+            )
+        except (service_exceptions.ServiceError, ValueError) as error:
+            logger.error(
+                "webhook.debounced_reply_failed",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="webhook.debounced_reply_failed",
+                        message="debounced ai reply failed after webhook event was acknowledged",
+                        data={
+                            "tenant_id": tenant_id,
+                            "conversation_id": conversation_id,
+                            "provider_event_id": event.provider_event_id,
+                            "error_type": type(error).__name__,
+                            "error_message": str(error),
+                        },
+                    )
+                },
             )
         finally:
             if self._conversation_processing_lock is not None and lock_holder_id is not None:
                 self._conversation_processing_lock.release(
                     tenant_id=tenant_id,
-                    conversation_id=conversation.id,
+                    conversation_id=conversation_id,
                     holder_id=lock_holder_id,
+                    released_at=self._clock.now(),
                 )
 
     def _process_ai_reply_with_debounce(
@@ -476,31 +979,49 @@ class WebhookService:
         tenant_id: str,
         event: webhook_dto.IncomingMessageEventDTO,
         inbound_message: message_entity.Message,
+        debounce_delay: float | None = None,
+        event_context: webhook_dto.WebhookEventContextDTO | None = None,
     ) -> None:
-        messages_count_snapshot = len(
-            self._conversation_repository.list_messages(tenant_id, conversation.id)
+        message_seq_snapshot = self._conversation_repository.get_message_seq(
+            tenant_id, conversation.id
         )
-        debounce_delay = self._resolve_debounce_delay_seconds(tenant_id)
+        if debounce_delay is None:
+            debounce_delay = self._resolve_debounce_delay_seconds(tenant_id)
 
         for debounce_iteration in range(self._max_debounce_reprocess_iterations):
-            history = self._conversation_repository.list_messages(tenant_id, conversation.id)
-            history_messages = history[-self._context_message_limit :]
+            history_messages = self._conversation_repository.list_recent_messages(
+                tenant_id, conversation.id, limit=self._context_message_limit
+            )
+            if self._conversation_summarizer is not None:
+                # Messages already folded into running_summary reach the model through the prompt.
+                history_messages = [
+                    message
+                    for message in history_messages[:-1]
+                    if not conversation.is_summarized_message(message)
+                ] + history_messages[-1:]
             llm_messages: list[llm_dto.ChatMessageDTO] = []
             for message in history_messages:
                 message_role = message.role
                 if message_role == "human_agent":
                     message_role = "assistant"
                 llm_messages.append(
-                    llm_dto.ChatMessageDTO(role=message_role, content=message.content)
+                    llm_dto.ChatMessageDTO(
+                        role=message_role,
+                        content=message.content,
+                        token_estimate=message.token_estimate,
+                    )
                 )
             latest_user_text = (
                 history_messages[-1].content if history_messages else inbound_message.content
             )
-            known_patient = self._patient_repository.get_by_whatsapp_user(
-                tenant_id=tenant_id,
-                whatsapp_user_id=event.whatsapp_user_id,
-            )
-            subsessions_count_before_ai_reply = len(conversation.subsessions)
+            if event_context is not None and debounce_iteration == 0:
+                known_patient = event_context.known_patient
+            else:
+                known_patient = self._patient_repository.get_by_whatsapp_user(
+                    tenant_id=tenant_id,
+                    whatsapp_user_id=event.whatsapp_user_id,
+                )
+            subsessions_count_before_ai_reply = conversation.subsessions_count
 
             trace_inputs: dict[str, object] = {
                 "tenant_id": tenant_id,
@@ -527,6 +1048,12 @@ class WebhookService:
                         latest_user_text=latest_user_text,
                         llm_messages=llm_messages,
                         known_patient=known_patient,
+                        agent_profile=event_context.agent_profile
+                        if event_context is not None
+                        else None,
+                        conversation_summary=conversation.running_summary
+                        if self._conversation_summarizer is not None
+                        else None,
                     )
                     workflow_result = self._agent_workflow.run_conversation_flow(
                         input_dto=agent_workflow_dto.ConversationWorkflowInputDTO(
@@ -576,11 +1103,12 @@ class WebhookService:
                     if debounce_delay > 0:
                         self._sleep_seconds(debounce_delay)
 
-                    fresh_messages = self._conversation_repository.list_messages(
+                    fresh_message_seq = self._conversation_repository.get_message_seq(
                         tenant_id, conversation.id
                     )
-                    if len(fresh_messages) > messages_count_snapshot:
-                        messages_count_snapshot = len(fresh_messages)
+                    if fresh_message_seq > message_seq_snapshot:
+                        previous_message_seq = message_seq_snapshot
+                        message_seq_snapshot = fresh_message_seq
                         trace_run.set_outputs(
                             {
                                 "outcome": "debounce_reprocessing",
@@ -598,8 +1126,8 @@ class WebhookService:
                                         "conversation_id": conversation.id,
                                         "provider_event_id": event.provider_event_id,
                                         "debounce_iteration": debounce_iteration,
-                                        "previous_count": messages_count_snapshot,
-                                        "current_count": len(fresh_messages),
+                                        "previous_message_seq": previous_message_seq,
+                                        "current_message_seq": fresh_message_seq,
                                     },
                                 )
                             },
@@ -619,6 +1147,11 @@ class WebhookService:
                             conversation_id=conversation.id,
                             subsessions_count_before_ai_reply=subsessions_count_before_ai_reply,
                         )
+                    if (
+                        self._conversation_summarizer is not None
+                        and self._conversation_summarizer.needs_refresh(history_messages)
+                    ):
+                        self._conversation_summarizer.request_refresh(tenant_id, conversation.id)
                 except service_exceptions.ExternalProviderError as error:
                     trace_run.set_error(str(error))
                     logger.error(
@@ -803,6 +1336,9 @@ class WebhookService:
             outbound_message.created_at,
         )
         self._conversation_repository.save_conversation(latest_conversation)
+        self._publish_conversation_events(
+            [conversation_stream_events.build_message_appended_event(outbound_message)]
+        )
         return outbound_message_provider_id
 
     def _archive_new_active_messages_into_latest_subsession_if_booking_occurred(
@@ -818,9 +1354,17 @@ class WebhookService:
         if latest_conversation is None:
             raise service_exceptions.EntityNotFoundError("conversation not found")
 
-        if len(latest_conversation.subsessions) <= subsessions_count_before_ai_reply:
+        if latest_conversation.subsessions_count <= subsessions_count_before_ai_reply:
             return
 
+        if not latest_conversation.subsessions:
+            stored_latest_subsession = self._conversation_repository.get_latest_subsession(
+                tenant_id,
+                conversation_id,
+            )
+            if stored_latest_subsession is None:
+                return
+            latest_conversation.subsessions = [stored_latest_subsession]
         latest_subsession = latest_conversation.subsessions[-1]
         active_messages = self._conversation_repository.list_messages(
             tenant_id,
@@ -857,7 +1401,7 @@ class WebhookService:
                         "tenant_id": tenant_id,
                         "conversation_id": conversation_id,
                         "appended_messages_count": appended_messages_count,
-                        "subsessions_count": len(latest_conversation.subsessions),
+                        "subsessions_count": latest_conversation.subsessions_count,
                     },
                 )
             },
@@ -870,6 +1414,8 @@ class WebhookService:
         whatsapp_user_id: str,
         llm_messages: list[llm_dto.ChatMessageDTO],
         known_patient: patient_entity.Patient | None,
+        agent_profile: agent_profile_entity.AgentProfile | None = None,
+        conversation_summary: str | None = None,
     ) -> str:
         trace_inputs = {
             "tenant_id": tenant_id,
@@ -884,7 +1430,9 @@ class WebhookService:
             inputs=trace_inputs,
             tags=["webhook", "agent"],
         ) as trace_run:
-            base_system_prompt = self._resolve_agent_system_prompt(tenant_id)
+            base_system_prompt = self._resolve_agent_system_prompt(
+                tenant_id, agent_profile=agent_profile
+            )
             current_known_patient = known_patient
             function_call_results: list[llm_dto.FunctionCallResultDTO] = []
             for iteration_index in range(self._max_function_call_iterations):
@@ -898,14 +1446,25 @@ class WebhookService:
                     runtime_prompt=self._build_runtime_system_prompt(
                         runtime_context=runtime_prompt_context,
                         known_patient=current_known_patient,
+                        conversation_summary=conversation_summary,
                     ),
                 )
                 tool_definitions = self._build_tool_definitions(
                     enabled_tool_names=runtime_prompt_context.enabled_tool_names
                 )
+                context_messages = llm_messages
+                if self._context_budget_builder is not None:
+                    context_messages = self._context_budget_builder.select_messages(
+                        llm_messages,
+                        reserved_tokens=self._context_budget_builder.estimate_reserved_tokens(
+                            system_prompt=system_prompt,
+                            tools=tool_definitions,
+                            function_call_results=function_call_results,
+                        ),
+                    )
                 llm_input = llm_dto.GenerateReplyInputDTO(
                     system_prompt=system_prompt,
-                    messages=llm_messages,
+                    messages=context_messages,
                     tools=tool_definitions,
                     function_call_results=function_call_results,
                 )
@@ -914,21 +1473,34 @@ class WebhookService:
                         "runtime_state": runtime_prompt_context.state,
                         "runtime_enabled_tools": runtime_prompt_context.enabled_tool_names,
                         "runtime_request_id": runtime_prompt_context.request_id,
+                        "context_messages_count": len(context_messages),
                     }
                 )
-                llm_reply = self._request_llm_reply_with_retry(
+                reply_text_parts: list[str] = []
+                function_calls_count = 0
+                llm_started_at = time.perf_counter()
+                reply_chunks = self._iter_llm_reply_chunks(
                     tenant_id=tenant_id,
                     conversation_id=conversation_id,
                     llm_input=llm_input,
                 )
-                if llm_reply.function_calls:
-                    trace_run.add_metadata(
-                        {
-                            "last_iteration": iteration_index + 1,
-                            "last_function_calls_count": len(llm_reply.function_calls),
-                        }
-                    )
-                    for function_call in llm_reply.function_calls:
+                # Closing ends the provider stream even when a tool call returns mid-stream.
+                with contextlib.closing(reply_chunks):
+                    for reply_chunk in reply_chunks:
+                        if function_calls_count == 0 and not reply_text_parts:
+                            trace_run.add_metadata(
+                                {
+                                    "llm_first_chunk_ms": int(
+                                        (time.perf_counter() - llm_started_at) * 1000
+                                    ),
+                                }
+                            )
+                        function_call = reply_chunk.function_call
+                        if function_call is None:
+                            reply_text_parts.append(reply_chunk.text)
+                            continue
+                        # Each call runs as soon as it is complete, while the model may still be streaming.
+                        function_calls_count += 1
                         function_response_payload = self._execute_function_call(
                             tenant_id=tenant_id,
                             conversation_id=conversation_id,
@@ -962,30 +1534,48 @@ class WebhookService:
                                 tenant_id=tenant_id,
                                 whatsapp_user_id=whatsapp_user_id,
                             )
+                if function_calls_count:
+                    trace_run.add_metadata(
+                        {
+                            "last_iteration": iteration_index + 1,
+                            "last_function_calls_count": function_calls_count,
+                        }
+                    )
                     continue
 
-                if llm_reply.content.strip():
+                reply_content = "".join(reply_text_parts).strip()
+                if reply_content:
                     trace_run.set_outputs(
                         {
                             "outcome": "assistant_text",
-                            "content_chars": len(llm_reply.content),
+                            "content_chars": len(reply_content),
                             "iteration": iteration_index + 1,
                         }
                     )
-                    return llm_reply.content
+                    return reply_content
                 continue
 
             trace_run.set_error("llm returned empty content")
             raise service_exceptions.ExternalProviderError("llm returned empty content")
 
-    def _resolve_debounce_delay_seconds(self, tenant_id: str) -> int:
-        agent_profile = self._agent_profile_repository.get_by_tenant_id(tenant_id)
+    def _resolve_debounce_delay_seconds(
+        self,
+        tenant_id: str,
+        agent_profile: agent_profile_entity.AgentProfile | None = None,
+    ) -> int:
+        if agent_profile is None:
+            agent_profile = self._agent_profile_repository.get_by_tenant_id(tenant_id)
         if agent_profile is None:
             return 0
         return agent_profile.message_debounce_delay_seconds
 
-    def _resolve_agent_system_prompt(self, tenant_id: str) -> str:
-        agent_profile = self._agent_profile_repository.get_by_tenant_id(tenant_id)
+    def _resolve_agent_system_prompt(
+        self,
+        tenant_id: str,
+        agent_profile: agent_profile_entity.AgentProfile | None = None,
+    ) -> str:
+        if agent_profile is None:
+            agent_profile = self._agent_profile_repository.get_by_tenant_id(tenant_id)
         if agent_profile is None:
             raise service_exceptions.ExternalProviderError(
                 "agent system prompt is not configured for this tenant"
@@ -1006,10 +1596,12 @@ class WebhookService:
         self,
         runtime_context: RuntimePromptContext,
         known_patient: patient_entity.Patient | None,
+        conversation_summary: str | None = None,
     ) -> str:
         return self._prompt_builder.build_runtime_system_prompt(
             runtime_context=runtime_context,
             known_patient=known_patient,
+            conversation_summary=conversation_summary,
         )
 
     def _build_runtime_state_specific_instructions(
@@ -1168,6 +1760,47 @@ class WebhookService:
             missing_fields.append("patient_phone")
         return missing_fields
 
+    def _iter_llm_reply_chunks(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        llm_input: llm_dto.GenerateReplyInputDTO,
+    ) -> collections.abc.Generator[llm_dto.ReplyStreamChunkDTO, None, None]:
+        if not self._stream_llm_replies:
+            llm_reply = self._request_llm_reply_with_retry(
+                tenant_id=tenant_id,
+                conversation_id=conversation_id,
+                llm_input=llm_input,
+            )
+            if llm_reply.function_calls:
+                for function_call in llm_reply.function_calls:
+                    yield llm_dto.ReplyStreamChunkDTO(function_call=function_call)
+                return
+            yield llm_dto.ReplyStreamChunkDTO(text=llm_reply.content)
+            return
+
+        attempt = 0
+        while True:
+            function_call_yielded = False
+            try:
+                with contextlib.closing(self._llm_provider.stream_reply(llm_input)) as reply_stream:
+                    for reply_chunk in reply_stream:
+                        function_call_yielded = (
+                            function_call_yielded or reply_chunk.function_call is not None
+                        )
+                        yield reply_chunk
+                return
+            except service_exceptions.ExternalProviderError as error:
+                # Tools already ran for this stream, so replaying it could repeat side effects.
+                if function_call_yielded or not self._wait_before_llm_retry(
+                    tenant_id=tenant_id,
+                    conversation_id=conversation_id,
+                    error=error,
+                    attempt=attempt,
+                ):
+                    raise
+            attempt += 1
+
     def _request_llm_reply_with_retry(
         self,
         tenant_id: str,
@@ -1184,32 +1817,47 @@ class WebhookService:
                     return llm_reply
                 raise service_exceptions.ExternalProviderError("llm returned empty content")
             except service_exceptions.ExternalProviderError as error:
-                error_message = str(error)
-                if not self._is_llm_empty_content_error(error_message):
+                if not self._wait_before_llm_retry(
+                    tenant_id=tenant_id,
+                    conversation_id=conversation_id,
+                    error=error,
+                    attempt=attempt,
+                ):
                     raise
 
-                if attempt >= len(self._llm_empty_content_retry_backoff_seconds):
-                    raise
+        raise service_exceptions.ExternalProviderError("llm returned empty content")
 
-                delay_seconds = self._llm_empty_content_retry_backoff_seconds[attempt]
-                logger.warning(
-                    "webhook.llm.retry_empty_content",
-                    extra={
-                        "event_data": app_logs.build_log_event(
-                            event_name="webhook.llm.retry_empty_content",
-                            message="retrying llm generation because provider returned empty content",
-                            data={
-                                "tenant_id": tenant_id,
-                                "conversation_id": conversation_id,
-                                "attempt": attempt + 1,
-                                "delay_seconds": delay_seconds,
-                            },
-                        )
+    def _wait_before_llm_retry(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        error: service_exceptions.ExternalProviderError,
+        attempt: int,
+    ) -> bool:
+        if not self._is_llm_empty_content_error(str(error)):
+            return False
+
+        if attempt >= len(self._llm_empty_content_retry_backoff_seconds):
+            return False
+
+        delay_seconds = self._llm_empty_content_retry_backoff_seconds[attempt]
+        logger.warning(
+            "webhook.llm.retry_empty_content",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="webhook.llm.retry_empty_content",
+                    message="retrying llm generation because provider returned empty content",
+                    data={
+                        "tenant_id": tenant_id,
+                        "conversation_id": conversation_id,
+                        "attempt": attempt + 1,
+                        "delay_seconds": delay_seconds,
                     },
                 )
-                self._sleep_seconds(delay_seconds)
-
-        raise service_exceptions.ExternalProviderError("llm returned empty content")
+            },
+        )
+        self._sleep_seconds(delay_seconds)
+        return True
 
     def _execute_function_call(
         self,
@@ -1666,6 +2314,26 @@ class WebhookService:
             return []
         return llm_reply.function_calls
 
+    def _generate_classification_reply(
+        self,
+        llm_input: llm_dto.GenerateReplyInputDTO,
+        user_text: str,
+        context: str,
+    ) -> str:
+        if self._classification_cache is None:
+            return self._llm_provider.generate_reply(llm_input).content
+        cache_key = classification_cache_keys.build_classification_cache_key(
+            system_prompt=llm_input.system_prompt,
+            user_text=user_text,
+            context=context,
+        )
+        cached_reply = self._classification_cache.get(cache_key)
+        if cached_reply is not None:
+            return cached_reply
+        reply_content = self._llm_provider.generate_reply(llm_input).content
+        self._classification_cache.put(cache_key, reply_content)
+        return reply_content
+
     def _should_execute_explicit_override_function(
         self,
         function_name: str,
@@ -1717,14 +2385,18 @@ class WebhookService:
             ],
         )
         try:
-            llm_reply = self._llm_provider.generate_reply(llm_input)
+            reply_content = self._generate_classification_reply(
+                llm_input=llm_input,
+                user_text=latest_user_text,
+                context=f"{target_intent}\n{previous_assistant_message}",
+            )
         except service_exceptions.ExternalProviderError:
             return False
 
         normalized_reply = (
             unicodedata.normalize(
                 "NFKD",
-                llm_reply.content,
+                reply_content,
             )
             .encode("ascii", "ignore")
             .decode("ascii")
@@ -1833,11 +2505,15 @@ class WebhookService:
             ],
         )
         try:
-            llm_reply = self._llm_provider.generate_reply(llm_input)
+            reply_content = self._generate_classification_reply(
+                llm_input=llm_input,
+                user_text=latest_user_text,
+                context=options_block,
+            )
         except service_exceptions.ExternalProviderError:
             return None
 
-        resolved_text = llm_reply.content.strip()
+        resolved_text = reply_content.strip()
         if not self._numeric_pattern.fullmatch(resolved_text):
             return None
         option_number = str(int(resolved_text))
@@ -1906,11 +2582,15 @@ class WebhookService:
             ],
         )
         try:
-            llm_reply = self._llm_provider.generate_reply(llm_input)
+            reply_content = self._generate_classification_reply(
+                llm_input=llm_input,
+                user_text=latest_user_text,
+                context=options_block,
+            )
         except service_exceptions.ExternalProviderError:
             return None
 
-        resolved_text = llm_reply.content.strip()
+        resolved_text = reply_content.strip()
         if not resolved_text:
             return None
         normalized_upper = resolved_text.upper()
@@ -2659,6 +3339,15 @@ class WebhookService:
     ) -> list[llm_dto.FunctionDeclarationDTO]:
         return self._tool_registry.build_tool_definitions(enabled_tool_names=enabled_tool_names)
 
+    def _publish_conversation_events(
+        self,
+        stream_events: list[conversation_dto.ConversationStreamEventDTO],
+    ) -> None:
+        if self._conversation_event_bus is None:
+            return
+        for stream_event in stream_events:
+            self._conversation_event_bus.publish(stream_event)
+
     def _conversation_has_provider_message_id(
         self,
         conversation: conversation_entity.Conversation,
@@ -2667,6 +3356,14 @@ class WebhookService:
         for message in conversation.messages:
             if message.provider_message_id == provider_message_id:
                 return True
+        if self._conversation_repository.has_message_with_provider_message_id(
+            conversation.tenant_id,
+            conversation.id,
+            provider_message_id,
+        ):
+            return True
+        # Only legacy conversations still embed subsessions; messages archived to cold storage
+        # are not scanned here, so redeliveries of those rely on the webhook event claim alone.
         for subsession in conversation.subsessions:
             for message in subsession.messages:
                 if message.provider_message_id == provider_message_id:
@@ -2727,11 +3424,130 @@ class WebhookService:
         return str(value)
 
     def _mark_event_processed(self, tenant_id: str, provider_event_id: str) -> None:
+        deferred_by_tenant: dict[str, list[str]] | None = getattr(
+            self._deferred_processed_marks, "by_tenant", None
+        )
+        if deferred_by_tenant is not None:
+            deferred_by_tenant.setdefault(tenant_id, []).append(provider_event_id)
+            return
         self._processed_webhook_event_repository.mark_processed(
             tenant_id=tenant_id,
             provider_event_id=provider_event_id,
             processed_at=self._clock.now(),
         )
+        if self._processed_event_filter is not None:
+            self._processed_event_filter.remember_processed(tenant_id, [provider_event_id])
+
+    def _load_event_context(
+        self, event: webhook_dto.IncomingMessageEventDTO
+    ) -> webhook_dto.WebhookEventContextDTO | None:
+        if self._event_context_loader is not None:
+            return self._event_context_loader.load(
+                phone_number_id=event.phone_number_id,
+                whatsapp_user_id=event.whatsapp_user_id,
+            )
+
+        connection = self._whatsapp_connection_repository.get_by_phone_number_id(
+            event.phone_number_id
+        )
+        if connection is None:
+            return None
+        tenant_id = connection.tenant_id
+        return webhook_dto.WebhookEventContextDTO(
+            connection=connection,
+            is_blacklisted=self._blacklist_repository.exists(tenant_id, event.whatsapp_user_id),
+            whatsapp_user=self._conversation_repository.get_whatsapp_user(
+                tenant_id, event.whatsapp_user_id
+            ),
+            conversation=self._conversation_repository.get_conversation_by_whatsapp_user(
+                tenant_id, event.whatsapp_user_id
+            ),
+            known_patient=self._patient_repository.get_by_whatsapp_user(
+                tenant_id=tenant_id,
+                whatsapp_user_id=event.whatsapp_user_id,
+            ),
+            agent_profile=self._agent_profile_repository.get_by_tenant_id(tenant_id),
+        )
+
+    def _is_known_processed_locally(self, tenant_id: str, provider_event_id: str) -> bool:
+        if self._processed_event_filter is None:
+            return False
+        return self._processed_event_filter.is_known_processed(tenant_id, provider_event_id)
+
+    def _discard_deferred_processed_mark(self, provider_event_id: str) -> None:
+        deferred_by_tenant: dict[str, list[str]] | None = getattr(
+            self._deferred_processed_marks, "by_tenant", None
+        )
+        if deferred_by_tenant is None:
+            return
+        for provider_event_ids in deferred_by_tenant.values():
+            while provider_event_id in provider_event_ids:
+                provider_event_ids.remove(provider_event_id)
+
+    def _flush_deferred_processed_marks(self) -> None:
+        deferred_by_tenant: dict[str, list[str]] | None = getattr(
+            self._deferred_processed_marks, "by_tenant", None
+        )
+        self._deferred_processed_marks.by_tenant = None
+        if not deferred_by_tenant:
+            return
+        processed_at = self._clock.now()
+        for tenant_id, provider_event_ids in deferred_by_tenant.items():
+            self._processed_webhook_event_repository.mark_processed_many(
+                tenant_id=tenant_id,
+                provider_event_ids=provider_event_ids,
+                processed_at=processed_at,
+            )
+            if self._processed_event_filter is not None:
+                self._processed_event_filter.remember_processed(tenant_id, provider_event_ids)
+
+    def _refresh_event_claim_if_stale(
+        self,
+        event: webhook_dto.IncomingMessageEventDTO,
+        tenant_id: str,
+        claimed_at: datetime.datetime,
+    ) -> bool:
+        refreshed_at = self._clock.now()
+        if refreshed_at - claimed_at < self._claim_refresh_after:
+            return True
+        # Events already handled in this partition must be marked before their claims lapse.
+        self._flush_deferred_processed_marks()
+        self._deferred_processed_marks.by_tenant = {}
+        claim_refreshed = self._processed_webhook_event_repository.refresh_claim(
+            tenant_id=tenant_id,
+            provider_event_id=event.provider_event_id,
+            claimed_at=refreshed_at,
+        )
+        if not claim_refreshed:
+            logger.warning(
+                "webhook.claim_lost",
+                extra={
+                    "event_data": app_logs.build_log_event(
+                        event_name="webhook.claim_lost",
+                        message="webhook event claim expired before processing, event skipped",
+                        data={
+                            "tenant_id": tenant_id,
+                            "provider_event_id": event.provider_event_id,
+                        },
+                    )
+                },
+            )
+        return claim_refreshed
+
+    def _log_duplicate_skipped(self, tenant_id: str, provider_event_id: str) -> None:
+        logger.info(
+            "webhook.duplicate_skipped",
+            extra={
+                "event_data": app_logs.build_log_event(
+                    event_name="webhook.duplicate_skipped",
+                    message="duplicate webhook event skipped",
+                    data={
+                        "tenant_id": tenant_id,
+                        "provider_event_id": provider_event_id,
+                    },
+                )
+            },
+        )
 
     def _mark_event_failed_by_phone_number(
         self,
@@ -2743,8 +3559,8 @@ class WebhookService:
         if connection is None:
             return
         tenant_id = connection.tenant_id
-        if not self._processed_webhook_event_repository.exists(tenant_id, provider_event_id):
-            return
+        if self._processed_event_filter is not None:
+            self._processed_event_filter.forget(tenant_id, provider_event_id)
         try:
             self._processed_webhook_event_repository.mark_failed(
                 tenant_id=tenant_id,
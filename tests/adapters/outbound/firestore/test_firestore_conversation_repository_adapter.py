@@ -0,0 +1,363 @@
+import datetime
+import typing
+
+import google.api_core.exceptions as google_api_exceptions
+import google.cloud.firestore as google_cloud_firestore
+import pytest
+
+import src.adapters.outbound.firestore.conversation_repository_adapter as conversation_repository_adapter
+import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.message as message_entity
+import tests.fakes.fake_adapters as fake_adapters
+import tests.fakes.fake_firestore as fake_firestore
+
+STARTED_AT = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+CONVERSATION_PATH = "tenants/tenant-1/conversations/conv-1"
+
+
+def build_repository(
+    client: fake_firestore.FakeFirestoreClient,
+    search_index_runner: fake_adapters.FakeBackgroundTaskRunner | None = None,
+) -> conversation_repository_adapter.FirestoreConversationRepositoryAdapter:
+    return conversation_repository_adapter.FirestoreConversationRepositoryAdapter(
+        typing.cast(google_cloud_firestore.Client, client),
+        search_index_runner=search_index_runner,
+    )
+
+
+def build_conversation() -> conversation_entity.Conversation:
+    return conversation_entity.Conversation(
+        id="conv-1",
+        tenant_id="tenant-1",
+        whatsapp_user_id="wa-1",
+        started_at=STARTED_AT,
+        updated_at=STARTED_AT,
+        last_message_preview=None,
+        message_ids=[],
+    )
+
+
+def build_message(index: int, content: str | None = None) -> message_entity.Message:
+    return message_entity.Message(
+        id=f"msg-{index}",
+        conversation_id="conv-1",
+        tenant_id="tenant-1",
+        direction="INBOUND",
+        role="user",
+        content=content or f"hola {index}",
+        provider_message_id=f"wamid-{index}",
+        created_at=STARTED_AT + datetime.timedelta(minutes=index),
+    )
+
+
+def test_save_message_appends_to_subcollection_and_bumps_message_seq() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+
+    for index in [1, 0]:
+        repository.save_message(build_message(index))
+    repository.save_message(build_message(1))
+
+    assert "messages" not in client.documents[CONVERSATION_PATH]
+    assert client.documents[CONVERSATION_PATH]["message_seq"] == 2
+    assert f"{CONVERSATION_PATH}/messages/msg-0" in client.documents
+    assert [message.id for message in repository.list_messages("tenant-1", "conv-1")] == [
+        "msg-0",
+        "msg-1",
+    ]
+    assert repository.get_message_seq("tenant-1", "conv-1") == 2
+
+
+def test_list_messages_merges_legacy_embedded_messages_in_created_order() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    client.documents[CONVERSATION_PATH]["messages"] = [
+        build_message(0).model_dump(mode="python"),
+        build_message(2).model_dump(mode="python"),
+    ]
+
+    repository.save_message(build_message(1))
+
+    assert [message.id for message in repository.list_messages("tenant-1", "conv-1")] == [
+        "msg-0",
+        "msg-1",
+        "msg-2",
+    ]
+    assert repository.list_messages("tenant-2", "conv-1") == []
+
+
+def test_has_message_with_provider_message_id_queries_subcollection() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    repository.save_message(build_message(0))
+    client.read_log.clear()
+
+    assert repository.has_message_with_provider_message_id("tenant-1", "conv-1", "wamid-0")
+    assert not repository.has_message_with_provider_message_id("tenant-1", "conv-1", "wamid-9")
+    assert client.read_log == []
+
+
+def test_delete_messages_removes_subcollection_postings_and_legacy_messages() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    repository.save_message(build_message(0, content="ansiedad terapia"))
+    repository.save_message(build_message(1, content="ansiedad"))
+    client.documents[CONVERSATION_PATH]["messages"] = [build_message(2).model_dump(mode="python")]
+    assert [path for path in client.documents if "/postings/" in path]
+
+    repository.delete_messages("tenant-1", "conv-1")
+
+    assert repository.list_messages("tenant-1", "conv-1") == []
+    assert client.documents[CONVERSATION_PATH]["messages"] == []
+    assert not [path for path in client.documents if "/messages/" in path]
+    assert not [path for path in client.documents if "/postings/" in path]
+    assert repository.get_message_seq("tenant-1", "conv-1") == 2
+
+
+def test_windowed_message_reads_only_fetch_legacy_messages_field() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    for index in range(4):
+        repository.save_message(build_message(index))
+    client.read_log.clear()
+
+    recent_messages = repository.list_recent_messages("tenant-1", "conv-1", limit=2)
+    page_messages = repository.list_messages_page(
+        "tenant-1",
+        "conv-1",
+        limit=2,
+        after_created_at=STARTED_AT,
+        after_message_id="msg-0",
+    )
+
+    assert [message.id for message in recent_messages] == ["msg-2", "msg-3"]
+    assert [message.id for message in page_messages] == ["msg-1", "msg-2"]
+    assert client.read_log == [(CONVERSATION_PATH, ["tenant_id", "messages"])] * 2
+    assert repository.list_recent_messages("tenant-2", "conv-1", limit=2) == []
+
+
+def test_reading_legacy_conversation_migrates_embedded_messages_to_subcollection() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    repository.save_message(build_message(1, content="hola de nuevo"))
+    client.documents[CONVERSATION_PATH]["messages"] = [
+        build_message(0, content="dolor de muelas").model_dump(mode="python"),
+        build_message(1).model_dump(mode="python"),
+    ]
+
+    recent_messages = repository.list_recent_messages("tenant-1", "conv-1", limit=5)
+
+    assert [message.content for message in recent_messages] == ["dolor de muelas", "hola de nuevo"]
+    assert "messages" not in client.documents[CONVERSATION_PATH]
+    assert client.documents[f"{CONVERSATION_PATH}/messages/msg-0"]["content"] == "dolor de muelas"
+    assert client.documents[f"{CONVERSATION_PATH}/messages/msg-1"]["content"] == "hola de nuevo"
+    assert "tenants/tenant-1/message_search_terms/muelas/postings/msg-0" in client.documents
+    client.write_log.clear()
+
+    assert repository.list_recent_messages("tenant-1", "conv-1", limit=5) == recent_messages
+    assert client.write_log == []
+
+
+def test_failed_legacy_migration_keeps_embedded_messages_readable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    client.documents[CONVERSATION_PATH]["messages"] = [build_message(0).model_dump(mode="python")]
+
+    def failing_apply_writes(
+        writes: list[tuple[str, fake_firestore.FakeDocumentReference, fake_firestore.DocumentData]],
+    ) -> None:
+        raise google_api_exceptions.ServiceUnavailable(  # type: ignore[no-untyped-call]
+            f"firestore unavailable for {len(writes)} writes"
+        )
+
+    monkeypatch.setattr(client, "apply_writes", failing_apply_writes)
+
+    messages = repository.list_messages("tenant-1", "conv-1")
+
+    assert [message.id for message in messages] == ["msg-0"]
+    assert client.documents[CONVERSATION_PATH]["messages"] == [
+        build_message(0).model_dump(mode="python")
+    ]
+    assert f"{CONVERSATION_PATH}/messages/msg-0" not in client.documents
+
+
+def test_save_conversation_appends_message_ids_with_array_union() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    conversation = build_conversation()
+    conversation.append_message("msg-0", "hola 0", STARTED_AT)
+    repository.save_conversation(conversation)
+
+    conversation.append_message("msg-1", "hola 1", STARTED_AT + datetime.timedelta(minutes=1))
+    repository.save_conversation(conversation)
+
+    operation, path, update_data = client.write_log[-2]
+    assert (operation, path) == ("update", CONVERSATION_PATH)
+    assert isinstance(update_data["message_ids"], google_cloud_firestore.ArrayUnion)
+    assert update_data["message_ids"].values == ["msg-1"]
+    assert client.documents[CONVERSATION_PATH]["message_ids"] == ["msg-0", "msg-1"]
+
+    conversation.message_ids = []
+    repository.save_conversation(conversation)
+
+    assert client.documents[CONVERSATION_PATH]["message_ids"] == []
+
+
+def test_get_latest_subsession_reads_only_the_last_archived_subsession() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    conversation = build_conversation()
+    for index in range(3):
+        conversation.archive_current_session(
+            scheduling_request_id=f"req-{index}",
+            calendar_event_id=f"evt-{index}",
+            messages=[build_message(index)],
+            now=STARTED_AT + datetime.timedelta(days=index),
+        )
+    repository.save_conversation(conversation)
+
+    latest_subsession = repository.get_latest_subsession("tenant-1", "conv-1")
+
+    assert latest_subsession is not None
+    assert latest_subsession.scheduling_request_id == "req-2"
+    assert [message.id for message in latest_subsession.messages] == ["msg-2"]
+    assert repository.get_latest_subsession("tenant-1", "conv-2") is None
+
+
+def test_save_conversation_merges_only_dirty_summary_fields_into_projection() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    repository.list_conversation_summaries("tenant-1")
+    stale_conversation = repository.get_conversation_by_id("tenant-1", "conv-1")
+    fresh_conversation = repository.get_conversation_by_id("tenant-1", "conv-1")
+    assert stale_conversation is not None
+    assert fresh_conversation is not None
+
+    fresh_conversation.set_control_mode("HUMAN", STARTED_AT + datetime.timedelta(minutes=1))
+    repository.save_conversation(fresh_conversation)
+    stale_conversation.append_message("msg-1", "hola", STARTED_AT + datetime.timedelta(minutes=2))
+    repository.save_conversation(stale_conversation)
+
+    summaries = repository.list_conversation_summaries("tenant-1")
+    assert [(summary.control_mode, summary.last_message_preview) for summary in summaries] == [
+        ("HUMAN", "hola")
+    ]
+
+
+def test_summary_backfill_creates_missing_projections_without_overwriting() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    newer_conversation = build_conversation()
+    newer_conversation.id = "conv-2"
+    newer_conversation.whatsapp_user_id = "wa-2"
+    repository.save_conversation(newer_conversation)
+    del client.documents["tenants/tenant-1/conversation_summaries/conv-1"]
+    client.documents["tenants/tenant-1/conversation_summaries/conv-2"]["control_mode"] = "HUMAN"
+
+    summaries = repository.list_conversation_summaries("tenant-1")
+
+    assert sorted((summary.id, summary.control_mode) for summary in summaries) == [
+        ("conv-1", "AI"),
+        ("conv-2", "HUMAN"),
+    ]
+
+
+def test_save_message_indexes_search_postings_off_the_message_write() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    search_index_runner = fake_adapters.FakeBackgroundTaskRunner()
+    repository = build_repository(client, search_index_runner=search_index_runner)
+    repository.save_conversation(build_conversation())
+    long_content = " ".join(f"palabra{index}" for index in range(40))
+
+    repository.save_message(build_message(0, content=long_content))
+
+    assert f"{CONVERSATION_PATH}/messages/msg-0" in client.documents
+    assert not [path for path in client.documents if "/postings/" in path]
+
+    search_index_runner.run_all()
+
+    assert len([path for path in client.documents if "/postings/" in path]) == 40
+
+
+def test_save_message_logs_search_index_failure_after_message_is_saved(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    original_apply_writes = client.apply_writes
+
+    def failing_posting_writes(
+        writes: list[tuple[str, fake_firestore.FakeDocumentReference, fake_firestore.DocumentData]],
+    ) -> None:
+        if any("/postings/" in reference.path for _, reference, _ in writes):
+            raise google_api_exceptions.ServiceUnavailable(  # type: ignore[no-untyped-call]
+                "firestore unavailable"
+            )
+        original_apply_writes(writes)
+
+    monkeypatch.setattr(client, "apply_writes", failing_posting_writes)
+
+    repository.save_message(build_message(0, content="quiero una cita"))
+
+    assert f"{CONVERSATION_PATH}/messages/msg-0" in client.documents
+    assert not [path for path in client.documents if "/postings/" in path]
+
+
+def test_saving_older_conversation_before_backfill_keeps_its_summary_complete() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repository = build_repository(client)
+    repository.save_conversation(build_conversation())
+    human_conversation = build_conversation()
+    human_conversation.id = "conv-2"
+    human_conversation.whatsapp_user_id = "wa-2"
+    repository.save_conversation(human_conversation)
+    for conversation_id in ["conv-1", "conv-2"]:
+        del client.documents[f"tenants/tenant-1/conversation_summaries/{conversation_id}"]
+    client.documents["tenants/tenant-1/conversations/conv-2"]["control_mode"] = "HUMAN"
+    client.documents["tenants/tenant-1/conversation_summaries/conv-3"] = {
+        "id": "conv-3",
+        "tenant_id": "tenant-1",
+        "whatsapp_user_id": "wa-3",
+        "control_mode": "HUMAN",
+    }
+    partial_conversation = build_conversation()
+    partial_conversation.id = "conv-3"
+    partial_conversation.whatsapp_user_id = "wa-3"
+    partial_conversation.control_mode = "HUMAN"
+    partial_conversation.last_message_preview = "hola 3"
+    client.documents["tenants/tenant-1/conversations/conv-3"] = partial_conversation.model_dump(
+        mode="python", exclude={"messages", "message_seq", "subsessions"}
+    )
+
+    older_conversation = repository.get_conversation_by_id("tenant-1", "conv-1")
+    older_human_conversation = repository.get_conversation_by_id("tenant-1", "conv-2")
+    assert older_conversation is not None
+    assert older_human_conversation is not None
+    older_conversation.set_control_mode("HUMAN", STARTED_AT + datetime.timedelta(minutes=1))
+    repository.save_conversation(older_conversation)
+    older_human_conversation.append_message(
+        "msg-1", "hola", STARTED_AT + datetime.timedelta(minutes=2)
+    )
+    repository.save_conversation(older_human_conversation)
+
+    summaries = repository.list_conversation_summaries("tenant-1")
+
+    assert sorted(
+        (summary.id, summary.control_mode, summary.last_message_preview) for summary in summaries
+    ) == [
+        ("conv-1", "HUMAN", None),
+        ("conv-2", "HUMAN", "hola"),
+        ("conv-3", "HUMAN", "hola 3"),
+    ]
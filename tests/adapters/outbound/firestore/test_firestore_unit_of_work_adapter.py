@@ -0,0 +1,167 @@
+import datetime
+import threading
+import typing
+
+import google.cloud.firestore as google_cloud_firestore
+import pytest
+
+import src.adapters.outbound.firestore.conversation_repository_adapter as conversation_repository_adapter
+import src.adapters.outbound.firestore.paths as firestore_paths
+import src.adapters.outbound.firestore.processed_webhook_event_repository_adapter as processed_webhook_event_repository_adapter
+import src.adapters.outbound.firestore.unit_of_work_adapter as unit_of_work_adapter
+import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.message as message_entity
+import src.domain.entities.whatsapp_user as whatsapp_user_entity
+import tests.fakes.fake_adapters as fake_adapters
+import tests.fakes.fake_firestore as fake_firestore
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+WHATSAPP_USER_PATH = "tenants/tenant-1/whatsapp_users/wa-1"
+CONVERSATION_PATH = "tenants/tenant-1/conversations/conv-1"
+MESSAGE_PATH = f"{CONVERSATION_PATH}/messages/msg-1"
+
+
+class Repositories(typing.NamedTuple):
+    unit_of_work: unit_of_work_adapter.FirestoreUnitOfWorkAdapter
+    conversations: conversation_repository_adapter.FirestoreConversationRepositoryAdapter
+    processed_events: (
+        processed_webhook_event_repository_adapter.FirestoreProcessedWebhookEventRepositoryAdapter
+    )
+
+
+def build_repositories(client: fake_firestore.FakeFirestoreClient) -> Repositories:
+    firestore_client = typing.cast(google_cloud_firestore.Client, client)
+    unit_of_work = unit_of_work_adapter.FirestoreUnitOfWorkAdapter(firestore_client)
+    return Repositories(
+        unit_of_work=unit_of_work,
+        conversations=conversation_repository_adapter.FirestoreConversationRepositoryAdapter(
+            firestore_client,
+            unit_of_work=unit_of_work,
+            search_index_runner=fake_adapters.FakeBackgroundTaskRunner(),
+        ),
+        processed_events=processed_webhook_event_repository_adapter.FirestoreProcessedWebhookEventRepositoryAdapter(
+            firestore_client, unit_of_work=unit_of_work
+        ),
+    )
+
+
+def persist_incoming_message(repositories: Repositories) -> None:
+    repositories.conversations.save_whatsapp_user(
+        whatsapp_user_entity.WhatsappUser(
+            id="wa-1", tenant_id="tenant-1", display_name="Ana", created_at=NOW
+        )
+    )
+    repositories.conversations.save_conversation(
+        conversation_entity.Conversation(
+            id="conv-1",
+            tenant_id="tenant-1",
+            whatsapp_user_id="wa-1",
+            started_at=NOW,
+            updated_at=NOW,
+            last_message_preview=None,
+            message_ids=[],
+        )
+    )
+    repositories.conversations.save_message(
+        message_entity.Message(
+            id="msg-1",
+            conversation_id="conv-1",
+            tenant_id="tenant-1",
+            direction="INBOUND",
+            role="user",
+            content="hola",
+            provider_message_id="wamid-1",
+            created_at=NOW,
+        )
+    )
+    repositories.processed_events.mark_processed("tenant-1", "evt-1", NOW)
+
+
+def test_atomic_commits_enlisted_adapter_writes_on_clean_exit() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repositories = build_repositories(client)
+
+    with repositories.unit_of_work.atomic():
+        persist_incoming_message(repositories)
+        assert client.write_log == []
+
+    assert repositories.unit_of_work.current_batch() is None
+    written_paths = [path for _, path, _ in client.write_log]
+    assert WHATSAPP_USER_PATH in written_paths
+    assert CONVERSATION_PATH in written_paths
+    assert MESSAGE_PATH in written_paths
+    processed_event_document = firestore_paths.tenant_processed_webhook_event_document(
+        typing.cast(google_cloud_firestore.Client, client), "tenant-1", "evt-1"
+    )
+    assert processed_event_document.path in written_paths
+    assert client.documents[CONVERSATION_PATH]["message_seq"] == 1
+
+
+def test_atomic_discards_pending_writes_when_the_block_raises() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repositories = build_repositories(client)
+
+    with pytest.raises(ValueError), repositories.unit_of_work.atomic():
+        persist_incoming_message(repositories)
+        raise ValueError("simulated failure")
+
+    assert client.write_log == []
+    assert repositories.unit_of_work.current_batch() is None
+
+
+def test_atomic_skips_commit_when_nothing_was_enlisted() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repositories = build_repositories(client)
+    batches: list[fake_firestore.FakeWriteBatch] = []
+    original_batch = client.batch
+
+    def recording_batch() -> fake_firestore.FakeWriteBatch:
+        batch = original_batch()
+        batches.append(batch)
+        return batch
+
+    client.batch = recording_batch  # type: ignore[method-assign]
+
+    with repositories.unit_of_work.atomic():
+        pass
+
+    assert len(batches) == 1
+    assert client.write_log == []
+
+
+def test_nested_atomic_joins_the_outer_batch() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repositories = build_repositories(client)
+
+    with repositories.unit_of_work.atomic():
+        outer_batch = repositories.unit_of_work.current_batch()
+        with repositories.unit_of_work.atomic():
+            assert repositories.unit_of_work.current_batch() is outer_batch
+            persist_incoming_message(repositories)
+        assert client.write_log == []
+        assert repositories.unit_of_work.current_batch() is outer_batch
+
+    assert MESSAGE_PATH in client.documents
+
+
+def test_atomic_batch_is_local_to_the_thread() -> None:
+    client = fake_firestore.FakeFirestoreClient()
+    repositories = build_repositories(client)
+    other_thread_batches: list[object] = []
+
+    def save_whatsapp_user_from_other_thread() -> None:
+        other_thread_batches.append(repositories.unit_of_work.current_batch())
+        repositories.conversations.save_whatsapp_user(
+            whatsapp_user_entity.WhatsappUser(
+                id="wa-2", tenant_id="tenant-1", display_name=None, created_at=NOW
+            )
+        )
+
+    with repositories.unit_of_work.atomic():
+        other_thread = threading.Thread(target=save_whatsapp_user_from_other_thread)
+        other_thread.start()
+        other_thread.join()
+        assert "tenants/tenant-1/whatsapp_users/wa-2" in client.documents
+        assert repositories.unit_of_work.current_batch() is not None
+
+    assert other_thread_batches == [None]
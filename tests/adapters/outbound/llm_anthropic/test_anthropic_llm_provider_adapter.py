@@ -0,0 +1,42 @@
+import asyncio
+import json
+
+import httpx
+
+import src.adapters.outbound.llm_anthropic.anthropic_llm_provider_adapter as anthropic_llm_provider_adapter
+import src.services.dto.llm_dto as llm_dto
+
+
+def test_agenerate_reply_posts_messages_and_parses_text_reply() -> None:
+    requests: list[httpx.Request] = []
+
+    def handle_request(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"content": [{"type": "text", "text": " Hola Ana "}]})
+
+    adapter = anthropic_llm_provider_adapter.AnthropicLlmProviderAdapter(
+        api_key="test-key",
+        model="claude-test",
+        api_version="2023-06-01",
+        max_tokens=256,
+    )
+    adapter._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handle_request))
+
+    async def generate_and_close() -> llm_dto.AgentReplyDTO:
+        reply = await adapter.agenerate_reply(
+            llm_dto.GenerateReplyInputDTO(
+                system_prompt="Eres un asistente.",
+                messages=[llm_dto.ChatMessageDTO(role="user", content="hola")],
+            )
+        )
+        await adapter.aclose()
+        return reply
+
+    reply = asyncio.run(generate_and_close())
+
+    assert reply.content == "Hola Ana"
+    assert requests[0].headers["x-api-key"] == "test-key"
+    assert json.loads(requests[0].content)["messages"] == [
+        {"role": "user", "content": [{"type": "text", "text": "hola"}]}
+    ]
+    assert adapter._async_client.is_closed
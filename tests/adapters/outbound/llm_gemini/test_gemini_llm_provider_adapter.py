@@ -0,0 +1,162 @@
+import asyncio
+import collections.abc
+import typing
+
+import google.genai.types as genai_types
+from google import genai
+
+import src.adapters.outbound.llm_gemini.gemini_llm_provider_adapter as gemini_llm_provider_adapter
+import src.infra.langsmith_tracer as langsmith_tracer
+import src.services.dto.llm_dto as llm_dto
+
+
+class StubAsyncModels:
+    def __init__(self, response: genai_types.GenerateContentResponse) -> None:
+        self.response = response
+        self.calls: list[dict[str, typing.Any]] = []
+
+    async def generate_content(self, **request: typing.Any) -> genai_types.GenerateContentResponse:
+        self.calls.append(request)
+        return self.response
+
+
+class StubAsyncClient:
+    def __init__(self, models: StubAsyncModels) -> None:
+        self.models = models
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class StubModels:
+    def __init__(self, responses: list[genai_types.GenerateContentResponse]) -> None:
+        self.responses = responses
+
+    def generate_content_stream(
+        self, **request: typing.Any
+    ) -> collections.abc.Iterator[genai_types.GenerateContentResponse]:
+        yield from self.responses
+
+
+class StubClient:
+    def __init__(self, aio: StubAsyncClient, models: StubModels | None = None) -> None:
+        self.aio = aio
+        self.models = models
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class StubRunTree:
+    def __init__(self) -> None:
+        self.end_calls: list[dict[str, typing.Any]] = []
+        self.patch_count = 0
+
+    def end(self, **result: typing.Any) -> None:
+        self.end_calls.append(result)
+
+    def patch(self) -> None:
+        self.patch_count += 1
+
+
+class RecordingTracer(langsmith_tracer.LangsmithTracer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.run_trees: list[StubRunTree] = []
+
+    def start_run(self, **trace_arguments: typing.Any) -> langsmith_tracer.LangsmithTraceRun:
+        run_tree = StubRunTree()
+        self.run_trees.append(run_tree)
+        return langsmith_tracer.LangsmithTraceRun(run_tree, patch_on_end=True)
+
+
+def build_text_response(text: str) -> genai_types.GenerateContentResponse:
+    return genai_types.GenerateContentResponse(
+        candidates=[
+            genai_types.Candidate(
+                content=genai_types.Content(role="model", parts=[genai_types.Part(text=text)])
+            )
+        ]
+    )
+
+
+def test_stream_reply_records_outcome_when_consumer_closes_stream_early() -> None:
+    tracer = RecordingTracer()
+    adapter = gemini_llm_provider_adapter.GeminiLlmProviderAdapter(
+        project_id="project-1",
+        location="us-central1",
+        model="gemini-test",
+        max_output_tokens=256,
+        tracer=tracer,
+    )
+    adapter._client = typing.cast(
+        genai.Client,
+        StubClient(
+            StubAsyncClient(StubAsyncModels(build_text_response("unused"))),
+            StubModels([build_text_response("Hola"), build_text_response(" Ana")]),
+        ),
+    )
+    prompt_input = llm_dto.GenerateReplyInputDTO(
+        system_prompt="Eres un asistente.",
+        messages=[llm_dto.ChatMessageDTO(role="user", content="hola")],
+    )
+
+    reply_stream = adapter.stream_reply(prompt_input)
+    assert next(reply_stream).text == "Hola"
+    assert tracer.run_trees[0].end_calls == []
+    reply_stream.close()
+    completed_chunks = list(adapter.stream_reply(prompt_input))
+
+    closed_run, completed_run = tracer.run_trees
+    assert closed_run.end_calls[0]["outputs"]["stream_outcome"] == "closed_by_consumer"
+    assert closed_run.patch_count == 1
+    assert [chunk.text for chunk in completed_chunks] == ["Hola", " Ana"]
+    assert completed_run.end_calls == [
+        {
+            "outputs": {
+                "stream_outcome": "completed",
+                "has_text_reply": True,
+                "function_calls_count": 0,
+                "first_chunk_ms": completed_run.end_calls[0]["outputs"]["first_chunk_ms"],
+            }
+        }
+    ]
+
+
+def test_agenerate_reply_awaits_async_client_and_parses_reply() -> None:
+    async_models = StubAsyncModels(
+        genai_types.GenerateContentResponse(
+            candidates=[
+                genai_types.Candidate(
+                    content=genai_types.Content(role="model", parts=[genai_types.Part(text="Hola")])
+                )
+            ]
+        )
+    )
+    stub_client = StubClient(StubAsyncClient(async_models))
+    adapter = gemini_llm_provider_adapter.GeminiLlmProviderAdapter(
+        project_id="project-1",
+        location="us-central1",
+        model="gemini-test",
+        max_output_tokens=256,
+    )
+    adapter._client = typing.cast(genai.Client, stub_client)
+
+    async def generate_and_close() -> llm_dto.AgentReplyDTO:
+        reply = await adapter.agenerate_reply(
+            llm_dto.GenerateReplyInputDTO(
+                system_prompt="Eres un asistente.",
+                messages=[llm_dto.ChatMessageDTO(role="user", content="hola")],
+            )
+        )
+        await adapter.aclose()
+        return reply
+
+    reply = asyncio.run(generate_and_close())
+
+    assert reply.content == "Hola"
+    assert async_models.calls[0]["model"] == "gemini-test"
+    assert async_models.calls[0]["config"]["system_instruction"] == "Eres un asistente."
+    assert stub_client.aio.closed and stub_client.closed
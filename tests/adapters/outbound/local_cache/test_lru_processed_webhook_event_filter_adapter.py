@@ -0,0 +1,30 @@
+import src.adapters.outbound.local_cache.lru_processed_webhook_event_filter_adapter as filter_adapter
+
+
+def test_filter_reports_remembered_events_and_counts_hits_and_misses() -> None:
+    adapter = filter_adapter.LruProcessedWebhookEventFilterAdapter(capacity=10)
+
+    assert adapter.is_known_processed("tenant-1", "evt-1") is False
+    adapter.remember_processed("tenant-1", ["evt-1", "evt-2"])
+
+    assert adapter.is_known_processed("tenant-1", "evt-1") is True
+    assert adapter.is_known_processed("tenant-2", "evt-1") is False
+    metrics = adapter.get_metrics()
+    assert metrics.hit_total == 1
+    assert metrics.miss_total == 2
+    assert metrics.tracked_event_count == 2
+
+
+def test_filter_forgets_failed_events_and_evicts_least_recent() -> None:
+    adapter = filter_adapter.LruProcessedWebhookEventFilterAdapter(capacity=2)
+    adapter.remember_processed("tenant-1", ["evt-1", "evt-2"])
+    adapter.forget("tenant-1", "evt-2")
+    adapter.remember_processed("tenant-1", ["evt-3", "evt-4"])
+
+    assert adapter.is_known_processed("tenant-1", "evt-1") is False
+    assert adapter.is_known_processed("tenant-1", "evt-2") is False
+    assert adapter.is_known_processed("tenant-1", "evt-3") is True
+    assert adapter.is_known_processed("tenant-1", "evt-4") is True
+    metrics = adapter.get_metrics()
+    assert metrics.tracked_event_count == 2
+    assert metrics.eviction_total == 1
@@ -0,0 +1,73 @@
+import datetime
+
+import src.adapters.outbound.local_cache.ttl_lru_classification_cache_adapter as cache_adapter
+import src.ports.classification_cache_store_port as classification_cache_store_port
+import src.services.classification_cache_keys as classification_cache_keys
+import tests.fakes.fake_adapters as fake_adapters
+
+
+class InMemoryClassificationCacheStore(
+    classification_cache_store_port.ClassificationCacheStorePort
+):
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[str, datetime.datetime]] = {}
+
+    def get(self, cache_key: str, now: datetime.datetime) -> str | None:
+        entry = self.entries.get(cache_key)
+        if entry is None or entry[1] <= now:
+            return None
+        return entry[0]
+
+    def put(self, cache_key: str, value: str, expires_at: datetime.datetime) -> None:
+        self.entries[cache_key] = (value, expires_at)
+
+
+def test_cache_evicts_least_recent_and_expires_entries() -> None:
+    clock = fake_adapters.FixedClock(datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC))
+    adapter = cache_adapter.TtlLruClassificationCacheAdapter(
+        capacity=2,
+        ttl_seconds=60,
+        clock=clock,
+        key_namespace="gemini-test",
+    )
+    adapter.put("key-1", "NO")
+    adapter.put("key-2", "2")
+    assert adapter.get("key-1") == "NO"
+    adapter.put("key-3", "NINGUNA")
+
+    assert adapter.get("key-2") is None
+    assert adapter.get("key-3") == "NINGUNA"
+    clock.advance(61)
+    assert adapter.get("key-1") is None
+
+    metrics = adapter.get_metrics()
+    assert metrics.hit_total == 2
+    assert metrics.miss_total == 2
+    assert metrics.entry_count == 1
+    assert metrics.hit_rate == 0.5
+
+
+def test_cache_reads_through_persistent_store_shared_by_namespace() -> None:
+    clock = fake_adapters.FixedClock(datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC))
+    store = InMemoryClassificationCacheStore()
+    writer = cache_adapter.TtlLruClassificationCacheAdapter(
+        capacity=10, ttl_seconds=60, clock=clock, key_namespace="gemini-test", store=store
+    )
+    reader = cache_adapter.TtlLruClassificationCacheAdapter(
+        capacity=10, ttl_seconds=60, clock=clock, key_namespace="gemini-test", store=store
+    )
+    other_model_reader = cache_adapter.TtlLruClassificationCacheAdapter(
+        capacity=10, ttl_seconds=60, clock=clock, key_namespace="gemini-other", store=store
+    )
+    cache_key = classification_cache_keys.build_classification_cache_key(
+        system_prompt="prompt", user_text="  Dale! ", context="HUMAN"
+    )
+    writer.put(cache_key, "NO")
+
+    assert cache_key == classification_cache_keys.build_classification_cache_key(
+        system_prompt="prompt", user_text="dale", context="HUMAN"
+    )
+    assert reader.get(cache_key) == "NO"
+    assert reader.get(cache_key) == "NO"
+    assert other_model_reader.get(cache_key) is None
+    assert reader.get_metrics().store_hit_total == 1
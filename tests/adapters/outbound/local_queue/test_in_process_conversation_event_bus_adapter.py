@@ -0,0 +1,79 @@
+import asyncio
+import datetime
+import threading
+
+import src.adapters.outbound.local_queue.in_process_conversation_event_bus_adapter as event_bus_adapter
+import src.services.dto.conversation_dto as conversation_dto
+
+
+def build_event(
+    tenant_id: str, conversation_id: str
+) -> conversation_dto.ConversationStreamEventDTO:
+    return conversation_dto.ConversationStreamEventDTO(
+        event_type="control_mode_changed",
+        tenant_id=tenant_id,
+        conversation_id=conversation_id,
+        occurred_at=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+        control_mode="HUMAN",
+    )
+
+
+def test_event_bus_fans_out_events_to_tenant_subscribers_only() -> None:
+    adapter = event_bus_adapter.InProcessConversationEventBusAdapter(max_subscribers_per_tenant=2)
+    first_subscription_id = adapter.subscribe("tenant-1")
+    second_subscription_id = adapter.subscribe("tenant-1")
+    other_tenant_subscription_id = adapter.subscribe("tenant-2")
+    assert first_subscription_id is not None
+    assert second_subscription_id is not None
+    assert other_tenant_subscription_id is not None
+    assert adapter.subscribe("tenant-1") is None
+
+    adapter.publish(build_event("tenant-1", "conv-1"))
+
+    first_event = adapter.next_event(first_subscription_id, timeout_seconds=1)
+    second_event = adapter.next_event(second_subscription_id, timeout_seconds=1)
+    assert first_event is not None and first_event.conversation_id == "conv-1"
+    assert second_event is not None and second_event.conversation_id == "conv-1"
+    assert adapter.next_event(other_tenant_subscription_id, timeout_seconds=0) is None
+
+    adapter.unsubscribe(first_subscription_id)
+    assert adapter.is_active(first_subscription_id) is False
+    assert adapter.subscribe("tenant-1") is not None
+
+
+def test_event_bus_closes_slow_subscribers_and_rejects_after_shutdown() -> None:
+    adapter = event_bus_adapter.InProcessConversationEventBusAdapter(
+        max_subscribers_per_tenant=1,
+        subscriber_queue_size=1,
+    )
+    subscription_id = adapter.subscribe("tenant-1")
+    assert subscription_id is not None
+
+    adapter.publish(build_event("tenant-1", "conv-1"))
+    adapter.publish(build_event("tenant-1", "conv-2"))
+
+    assert adapter.is_active(subscription_id) is False
+    assert adapter.subscribe("tenant-1") is not None
+
+    adapter.shutdown()
+    assert adapter.subscribe("tenant-1") is None
+
+
+def test_event_bus_wakes_async_waiter_on_publish_from_another_thread() -> None:
+    adapter = event_bus_adapter.InProcessConversationEventBusAdapter(max_subscribers_per_tenant=1)
+    subscription_id = adapter.subscribe("tenant-1")
+    assert subscription_id is not None
+
+    async def wait_for_published_event() -> conversation_dto.ConversationStreamEventDTO | None:
+        asyncio.get_running_loop().call_later(
+            0.05,
+            lambda: threading.Thread(
+                target=adapter.publish, args=(build_event("tenant-1", "conv-1"),)
+            ).start(),
+        )
+        return await adapter.anext_event(subscription_id, timeout_seconds=5)
+
+    stream_event = asyncio.run(wait_for_published_event())
+
+    assert stream_event is not None and stream_event.conversation_id == "conv-1"
+    assert asyncio.run(adapter.anext_event(subscription_id, timeout_seconds=0.01)) is None
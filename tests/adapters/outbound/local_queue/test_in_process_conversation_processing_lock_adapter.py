@@ -0,0 +1,31 @@
+import datetime
+
+import src.adapters.outbound.local_queue.in_process_conversation_processing_lock_adapter as in_process_conversation_processing_lock_adapter
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+def test_lock_is_exclusive_per_conversation_until_released() -> None:
+    lock = (
+        in_process_conversation_processing_lock_adapter.InProcessConversationProcessingLockAdapter()
+    )
+
+    assert lock.try_acquire("tenant-1", "conv-1", "holder-1", NOW) is True
+    assert lock.try_acquire("tenant-1", "conv-1", "holder-2", NOW) is False
+    assert lock.try_acquire("tenant-1", "conv-2", "holder-2", NOW) is True
+
+    lock.release("tenant-1", "conv-1", "holder-1", NOW)
+
+    assert lock.try_acquire("tenant-1", "conv-1", "holder-2", NOW) is True
+
+
+def test_release_by_another_holder_keeps_the_lock() -> None:
+    lock = (
+        in_process_conversation_processing_lock_adapter.InProcessConversationProcessingLockAdapter()
+    )
+    lock.try_acquire("tenant-1", "conv-1", "holder-1", NOW)
+
+    lock.release("tenant-1", "conv-1", "holder-2", NOW)
+
+    assert lock.try_acquire("tenant-1", "conv-1", "holder-2", NOW) is False
+    assert lock.delete_expired(NOW, limit=10) == 0
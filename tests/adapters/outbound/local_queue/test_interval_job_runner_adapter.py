@@ -0,0 +1,23 @@
+import threading
+
+import src.adapters.outbound.local_queue.interval_job_runner_adapter as interval_job_runner_adapter
+
+
+def test_interval_job_runner_keeps_running_after_job_failure() -> None:
+    run_count = 0
+    second_run = threading.Event()
+
+    def flaky_job() -> None:
+        nonlocal run_count
+        run_count += 1
+        if run_count == 1:
+            raise RuntimeError("boom")
+        second_run.set()
+
+    runner = interval_job_runner_adapter.IntervalJobRunnerAdapter(
+        interval_seconds=0.01, name="test"
+    )
+    runner.start(flaky_job)
+
+    assert second_run.wait(timeout=5)
+    runner.shutdown(timeout_seconds=5)
@@ -0,0 +1,111 @@
+import threading
+
+import src.adapters.outbound.local_queue.thread_pool_webhook_event_queue_adapter as queue_adapter
+import src.services.dto.webhook_dto as webhook_dto
+
+
+def build_event(provider_event_id: str) -> webhook_dto.IncomingMessageEventDTO:
+    return webhook_dto.IncomingMessageEventDTO(
+        provider_event_id=provider_event_id,
+        phone_number_id="phone-1",
+        whatsapp_user_id="wa-user-1",
+        whatsapp_user_name="Jane",
+        message_id=f"wamid-{provider_event_id}",
+        message_type="text",
+        source="CUSTOMER",
+        message_text="hello",
+    )
+
+
+def test_queue_processes_submitted_events_and_drains_on_shutdown() -> None:
+    handled_event_ids: list[str] = []
+    adapter = queue_adapter.ThreadPoolWebhookEventQueueAdapter(worker_count=2, max_queue_size=10)
+    adapter.start(lambda event: handled_event_ids.append(event.provider_event_id))
+
+    assert adapter.submit(build_event("evt-1"))
+    assert adapter.submit(build_event("evt-2"))
+    adapter.shutdown(drain_timeout_seconds=5)
+
+    assert sorted(handled_event_ids) == ["evt-1", "evt-2"]
+    metrics = adapter.get_metrics()
+    assert metrics.accepting is False
+    assert metrics.submitted_total == 2
+    assert metrics.completed_total == 2
+    assert metrics.queue_depth == 0
+    assert metrics.in_flight == 0
+
+
+def test_queue_rejects_events_when_full() -> None:
+    release_handler = threading.Event()
+    handler_started = threading.Event()
+
+    def blocking_handler(event: webhook_dto.IncomingMessageEventDTO) -> None:
+        del event
+        handler_started.set()
+        release_handler.wait(timeout=5)
+
+    adapter = queue_adapter.ThreadPoolWebhookEventQueueAdapter(worker_count=1, max_queue_size=1)
+    adapter.start(blocking_handler)
+
+    assert adapter.submit(build_event("evt-1"))
+    assert handler_started.wait(timeout=5)
+    assert adapter.submit(build_event("evt-2"))
+    assert adapter.submit(build_event("evt-3")) is False
+
+    metrics = adapter.get_metrics()
+    assert metrics.rejected_total == 1
+    assert metrics.in_flight == 1
+    assert metrics.queue_depth == 1
+
+    release_handler.set()
+    adapter.shutdown(drain_timeout_seconds=5)
+    assert adapter.get_metrics().completed_total == 2
+
+
+def test_queue_counts_handler_failures_and_keeps_worker_alive() -> None:
+    handled_event_ids: list[str] = []
+
+    def flaky_handler(event: webhook_dto.IncomingMessageEventDTO) -> None:
+        if event.provider_event_id == "evt-1":
+            raise RuntimeError("boom")
+        handled_event_ids.append(event.provider_event_id)
+
+    adapter = queue_adapter.ThreadPoolWebhookEventQueueAdapter(worker_count=1, max_queue_size=10)
+    adapter.start(flaky_handler)
+
+    adapter.submit(build_event("evt-1"))
+    adapter.submit(build_event("evt-2"))
+    adapter.shutdown(drain_timeout_seconds=5)
+
+    assert handled_event_ids == ["evt-2"]
+    metrics = adapter.get_metrics()
+    assert metrics.failed_total == 1
+    assert metrics.completed_total == 1
+
+
+def test_queue_rejects_submissions_after_shutdown() -> None:
+    adapter = queue_adapter.ThreadPoolWebhookEventQueueAdapter(worker_count=1, max_queue_size=10)
+    adapter.start(lambda event: None)
+    adapter.shutdown(drain_timeout_seconds=1)
+
+    assert adapter.submit(build_event("evt-1")) is False
+
+
+def test_queue_processes_events_of_same_conversation_in_order() -> None:
+    handled_event_ids: list[str] = []
+    handled_thread_names: set[str] = set()
+
+    def recording_handler(event: webhook_dto.IncomingMessageEventDTO) -> None:
+        handled_event_ids.append(event.provider_event_id)
+        handled_thread_names.add(threading.current_thread().name)
+
+    adapter = queue_adapter.ThreadPoolWebhookEventQueueAdapter(worker_count=4, max_queue_size=40)
+    adapter.start(recording_handler)
+
+    expected_event_ids = [f"evt-{index}" for index in range(10)]
+    for provider_event_id in expected_event_ids:
+        assert adapter.submit(build_event(provider_event_id))
+    adapter.shutdown(drain_timeout_seconds=5)
+
+    assert handled_event_ids == expected_event_ids
+    assert len(handled_thread_names) == 1
@@ -0,0 +1,63 @@
+import threading
+
+import src.adapters.outbound.local_queue.timer_wheel_debounce_scheduler_adapter as scheduler_adapter
+import src.ports.conversation_debounce_scheduler_port as conversation_debounce_scheduler_port
+
+
+def test_scheduler_resets_deadline_and_fires_once_per_conversation() -> None:
+    fired_labels: list[str] = []
+    fired = threading.Event()
+
+    def build_callback(
+        label: str,
+    ) -> conversation_debounce_scheduler_port.DebouncedCallback:
+        def callback() -> None:
+            fired_labels.append(label)
+            fired.set()
+
+        return callback
+
+    adapter = scheduler_adapter.TimerWheelDebounceSchedulerAdapter(
+        worker_count=1,
+        tick_seconds=0.01,
+        wheel_size=8,
+    )
+
+    assert adapter.schedule("tenant-1", "conversation-1", 0.2, build_callback("first")) is False
+    assert adapter.schedule("tenant-1", "conversation-1", 0.2, build_callback("second")) is True
+    assert adapter.pending_count() == 1
+
+    assert fired.wait(timeout=5)
+    adapter.shutdown(drain_timeout_seconds=5)
+
+    assert fired_labels == ["second"]
+    assert adapter.pending_count() == 0
+
+
+def test_scheduler_fires_pending_timers_on_shutdown() -> None:
+    fired_conversation_ids: list[str] = []
+    adapter = scheduler_adapter.TimerWheelDebounceSchedulerAdapter(worker_count=2)
+
+    adapter.schedule("tenant-1", "conversation-1", 30, lambda: fired_conversation_ids.append("c1"))
+    adapter.schedule("tenant-1", "conversation-2", 30, lambda: fired_conversation_ids.append("c2"))
+    adapter.shutdown(drain_timeout_seconds=5)
+
+    assert sorted(fired_conversation_ids) == ["c1", "c2"]
+    assert adapter.pending_count() == 0
+
+
+def test_scheduler_keeps_running_after_callback_failure() -> None:
+    fired = threading.Event()
+
+    def failing_callback() -> None:
+        raise RuntimeError("boom")
+
+    adapter = scheduler_adapter.TimerWheelDebounceSchedulerAdapter(
+        worker_count=1,
+        tick_seconds=0.01,
+    )
+    adapter.schedule("tenant-1", "conversation-1", 0.01, failing_callback)
+    adapter.schedule("tenant-1", "conversation-2", 0.05, fired.set)
+
+    assert fired.wait(timeout=5)
+    adapter.shutdown(drain_timeout_seconds=5)
@@ -1,10 +1,17 @@
+import collections.abc
+import contextlib
 import datetime
 import typing
 
+import src.ports.background_task_runner_port as background_task_runner_port
 import src.ports.clock_port as clock_port
+import src.ports.conversation_debounce_scheduler_port as conversation_debounce_scheduler_port
 import src.ports.google_calendar_provider_port as google_calendar_provider_port
 import src.ports.id_generator_port as id_generator_port
 import src.ports.llm_provider_port as llm_provider_port
+import src.ports.unit_of_work_port as unit_of_work_port
+import src.ports.webhook_event_context_loader_port as webhook_event_context_loader_port
+import src.ports.webhook_event_queue_port as webhook_event_queue_port
 import src.ports.whatsapp_provider_port as whatsapp_provider_port
 import src.services.dto.google_calendar_dto as google_calendar_dto
 import src.services.dto.llm_dto as llm_dto
@@ -50,6 +57,7 @@ class FakeLlmProvider(llm_provider_port.LlmProviderPort):
         self.should_fail = False
         self.queued_replies: list[llm_dto.AgentReplyDTO] = []
         self.queued_errors: list[service_exceptions.ExternalProviderError] = []
+        self.closed = False
 
     def generate_reply(self, prompt_input: llm_dto.GenerateReplyInputDTO) -> llm_dto.AgentReplyDTO:
         if self.should_fail:
@@ -61,6 +69,23 @@ class FakeLlmProvider(llm_provider_port.LlmProviderPort):
             return self.queued_replies.pop(0)
         return llm_dto.AgentReplyDTO(content=self.reply_content)
 
+    async def agenerate_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> llm_dto.AgentReplyDTO:
+        return self.generate_reply(prompt_input)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    def stream_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> collections.abc.Generator[llm_dto.ReplyStreamChunkDTO, None, None]:
+        reply = self.generate_reply(prompt_input)
+        if reply.content:
+            yield llm_dto.ReplyStreamChunkDTO(text=reply.content)
+        for function_call in reply.function_calls:
+            yield llm_dto.ReplyStreamChunkDTO(function_call=function_call)
+
 
 class FakeWhatsappProvider(whatsapp_provider_port.WhatsappProviderPort):
     def __init__(self) -> None:
@@ -124,6 +149,123 @@ class FakeWhatsappProvider(whatsapp_provider_port.WhatsappProviderPort):
         return list(self.events)
 
 
+class FakeWebhookEventQueue(webhook_event_queue_port.WebhookEventQueuePort):
+    def __init__(self) -> None:
+        self.handler: webhook_event_queue_port.WebhookEventHandler | None = None
+        self.submitted_events: list[webhook_dto.IncomingMessageEventDTO] = []
+        self.accept_submissions = True
+        self.rejected_total = 0
+        self.shutdown_calls: list[float] = []
+
+    def start(self, handler: webhook_event_queue_port.WebhookEventHandler) -> None:
+        self.handler = handler
+
+    def submit(self, event: webhook_dto.IncomingMessageEventDTO) -> bool:
+        if not self.accept_submissions:
+            self.rejected_total += 1
+            return False
+        self.submitted_events.append(event)
+        return True
+
+    def get_metrics(self) -> webhook_dto.WebhookEventQueueMetricsDTO:
+        return webhook_dto.WebhookEventQueueMetricsDTO(
+            accepting=self.accept_submissions,
+            worker_count=1,
+            max_queue_size=10,
+            queue_depth=len(self.submitted_events),
+            in_flight=0,
+            submitted_total=len(self.submitted_events),
+            completed_total=0,
+            failed_total=0,
+            rejected_total=self.rejected_total,
+            dropped_total=0,
+        )
+
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        self.shutdown_calls.append(drain_timeout_seconds)
+
+    def drain(self) -> None:
+        while self.submitted_events:
+            event = self.submitted_events.pop(0)
+            if self.handler is not None:
+                self.handler(event)
+
+
+class FakeConversationDebounceScheduler(
+    conversation_debounce_scheduler_port.ConversationDebounceSchedulerPort
+):
+    def __init__(self) -> None:
+        self.pending_callbacks: dict[
+            tuple[str, str], conversation_debounce_scheduler_port.DebouncedCallback
+        ] = {}
+        self.scheduled_delays: list[float] = []
+        self.shutdown_calls: list[float] = []
+
+    def schedule(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        delay_seconds: float,
+        callback: conversation_debounce_scheduler_port.DebouncedCallback,
+    ) -> bool:
+        key = (tenant_id, conversation_id)
+        deadline_reset = key in self.pending_callbacks
+        self.pending_callbacks[key] = callback
+        self.scheduled_delays.append(delay_seconds)
+        return deadline_reset
+
+    def pending_count(self) -> int:
+        return len(self.pending_callbacks)
+
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        self.shutdown_calls.append(drain_timeout_seconds)
+
+    def fire_all(self) -> None:
+        while self.pending_callbacks:
+            key = next(iter(self.pending_callbacks))
+            callback = self.pending_callbacks.pop(key)
+            callback()
+
+
+class FakeUnitOfWork(unit_of_work_port.UnitOfWorkPort):
+    def __init__(self) -> None:
+        self.active = False
+        self.committed_total = 0
+        self.rolled_back_errors: list[BaseException] = []
+
+    @contextlib.contextmanager
+    def atomic(self) -> collections.abc.Iterator[None]:
+        self.active = True
+        try:
+            yield
+        except BaseException as error:
+            self.rolled_back_errors.append(error)
+            raise
+        finally:
+            self.active = False
+        self.committed_total += 1
+
+
+class FakeBackgroundTaskRunner(background_task_runner_port.BackgroundTaskRunnerPort):
+    def __init__(self) -> None:
+        self.pending_tasks: dict[str, background_task_runner_port.BackgroundTask] = {}
+        self.shutdown_calls: list[float] = []
+
+    def submit(self, task_key: str, task: background_task_runner_port.BackgroundTask) -> bool:
+        if task_key in self.pending_tasks:
+            return False
+        self.pending_tasks[task_key] = task
+        return True
+
+    def shutdown(self, drain_timeout_seconds: float) -> None:
+        self.shutdown_calls.append(drain_timeout_seconds)
+
+    def run_all(self) -> None:
+        while self.pending_tasks:
+            task_key = next(iter(self.pending_tasks))
+            self.pending_tasks.pop(task_key)()
+
+
 class FakeGoogleCalendarProvider(google_calendar_provider_port.GoogleCalendarProviderPort):
     def __init__(self) -> None:
         self.oauth_url_state: list[str] = []
@@ -246,3 +388,21 @@ class FakeGoogleCalendarProvider(google_calendar_provider_port.GoogleCalendarPro
         )
         self.updated_events.append(event)
         return event.model_copy(deep=True)
+
+
+class FakeWebhookEventContextLoader(
+    webhook_event_context_loader_port.WebhookEventContextLoaderPort
+):
+    def __init__(self, context: webhook_dto.WebhookEventContextDTO | None) -> None:
+        self.context = context
+        self.load_calls: list[tuple[str, str]] = []
+
+    def load(
+        self,
+        phone_number_id: str,
+        whatsapp_user_id: str,
+    ) -> webhook_dto.WebhookEventContextDTO | None:
+        self.load_calls.append((phone_number_id, whatsapp_user_id))
+        if self.context is None:
+            return None
+        return self.context.model_copy(deep=True)
@@ -0,0 +1,309 @@
+import collections.abc
+import copy
+import datetime
+import functools
+import operator
+import typing
+
+import google.api_core.exceptions as google_api_exceptions
+import google.cloud.firestore as google_cloud_firestore
+
+DocumentData = dict[str, object]
+
+_ORDERED_OPERATORS: dict[str, typing.Callable[[typing.Any, typing.Any], object]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class FakeFirestoreClient:
+    """Dict-backed stand-in for the subset of the Firestore client the adapters use."""
+
+    def __init__(self) -> None:
+        self.documents: dict[str, DocumentData] = {}
+        self.read_log: list[tuple[str, list[str] | None]] = []
+        self.write_log: list[tuple[str, str, DocumentData]] = []
+        self.query_log: list[str] = []
+
+    def collection(self, name: str) -> "FakeCollectionReference":
+        return FakeCollectionReference(self, name)
+
+    def batch(self) -> "FakeWriteBatch":
+        return FakeWriteBatch(self)
+
+    def get_all(
+        self, references: list["FakeDocumentReference"]
+    ) -> collections.abc.Iterator["FakeDocumentSnapshot"]:
+        for reference in references:
+            yield reference.get()
+
+    def apply_writes(self, writes: list[tuple[str, "FakeDocumentReference", DocumentData]]) -> None:
+        # Preconditions see the writes queued before them in the same batch.
+        existing_paths = set(self.documents)
+        for operation, reference, _ in writes:
+            if operation == "create" and reference.path in existing_paths:
+                raise google_api_exceptions.AlreadyExists(  # type: ignore[no-untyped-call]
+                    f"document {reference.path} exists"
+                )
+            if operation == "update" and reference.path not in existing_paths:
+                raise google_api_exceptions.NotFound(  # type: ignore[no-untyped-call]
+                    f"document {reference.path} not found"
+                )
+            if operation == "delete":
+                existing_paths.discard(reference.path)
+            else:
+                existing_paths.add(reference.path)
+        for operation, reference, data in writes:
+            self.write_log.append((operation, reference.path, data))
+            if operation == "delete":
+                self.documents.pop(reference.path, None)
+                continue
+            if operation in {"create", "set"}:
+                current_data: DocumentData = {}
+            else:
+                current_data = self.documents.get(reference.path, {})
+            self.documents[reference.path] = _apply_fields(current_data, data)
+
+
+class FakeWriteBatch:
+    def __init__(self, client: FakeFirestoreClient) -> None:
+        self._client = client
+        self._writes: list[tuple[str, FakeDocumentReference, DocumentData]] = []
+
+    def __len__(self) -> int:
+        return len(self._writes)
+
+    def create(self, reference: "FakeDocumentReference", data: DocumentData) -> None:
+        self._writes.append(("create", reference, data))
+
+    def set(
+        self,
+        reference: "FakeDocumentReference",
+        data: DocumentData,
+        merge: bool | list[str] = False,
+    ) -> None:
+        self._writes.append(("merge" if merge else "set", reference, data))
+
+    def update(self, reference: "FakeDocumentReference", data: DocumentData) -> None:
+        self._writes.append(("update", reference, data))
+
+    def delete(self, reference: "FakeDocumentReference") -> None:
+        self._writes.append(("delete", reference, {}))
+
+    def commit(self) -> None:
+        writes = self._writes
+        self._writes = []
+        self._client.apply_writes(writes)
+
+
+class FakeDocumentSnapshot:
+    def __init__(
+        self,
+        reference: "FakeDocumentReference",
+        data: DocumentData | None,
+        field_paths: list[str] | None,
+    ) -> None:
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+        self._field_paths = field_paths
+
+    def to_dict(self) -> DocumentData | None:
+        if self._data is None:
+            return None
+        data = copy.deepcopy(self._data)
+        if self._field_paths is None:
+            return data
+        return {key: value for key, value in data.items() if key in self._field_paths}
+
+
+class FakeDocumentReference:
+    def __init__(self, client: FakeFirestoreClient, path: str) -> None:
+        self._client = client
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def collection(self, name: str) -> "FakeCollectionReference":
+        return FakeCollectionReference(self._client, f"{self.path}/{name}")
+
+    def get(
+        self,
+        field_paths: list[str] | None = None,
+        transaction: object | None = None,
+    ) -> FakeDocumentSnapshot:
+        del transaction
+        self._client.read_log.append((self.path, field_paths))
+        return FakeDocumentSnapshot(self, self._client.documents.get(self.path), field_paths)
+
+    def create(self, data: DocumentData) -> None:
+        self._client.apply_writes([("create", self, data)])
+
+    def set(self, data: DocumentData, merge: bool | list[str] = False) -> None:
+        self._client.apply_writes([("merge" if merge else "set", self, data)])
+
+    def update(self, data: DocumentData) -> None:
+        self._client.apply_writes([("update", self, data)])
+
+    def delete(self) -> None:
+        self._client.apply_writes([("delete", self, {})])
+
+
+class FakeQuery:
+    def __init__(
+        self,
+        client: FakeFirestoreClient,
+        collection_path: str,
+        filters: tuple[tuple[str, str, object], ...] = (),
+        orders: tuple[tuple[str, str], ...] = (),
+        cursor: DocumentData | None = None,
+        limit_count: int | None = None,
+        field_paths: list[str] | None = None,
+    ) -> None:
+        self._client = client
+        self._collection_path = collection_path
+        self._filters = filters
+        self._orders = orders
+        self._cursor = cursor
+        self._limit_count = limit_count
+        self._field_paths = field_paths
+
+    def where(self, field_path: str, op_string: str, value: object) -> "FakeQuery":
+        return self._copy(filters=(*self._filters, (field_path, op_string, value)))
+
+    def order_by(
+        self, field_path: str, direction: str = google_cloud_firestore.Query.ASCENDING
+    ) -> "FakeQuery":
+        return self._copy(orders=(*self._orders, (field_path, direction)))
+
+    def start_after(self, values: DocumentData) -> "FakeQuery":
+        return self._copy(cursor=dict(values))
+
+    def limit(self, count: int) -> "FakeQuery":
+        return self._copy(limit_count=count)
+
+    def select(self, field_paths: list[str]) -> "FakeQuery":
+        return self._copy(field_paths=list(field_paths))
+
+    def stream(self) -> collections.abc.Iterator[FakeDocumentSnapshot]:
+        self._client.query_log.append(self._collection_path)
+        matched: list[tuple[str, DocumentData]] = [
+            (path, data)
+            for path, data in self._client.documents.items()
+            if path.rsplit("/", 1)[0] == self._collection_path and self._matches(path, data)
+        ]
+        matched.sort(key=functools.cmp_to_key(self._compare))
+        if self._cursor is not None:
+            cursor_values = self._cursor
+            matched = [item for item in matched if self._is_after_cursor(item, cursor_values)]
+        if self._limit_count is not None:
+            matched = matched[: self._limit_count]
+        for path, data in matched:
+            yield FakeDocumentSnapshot(
+                FakeDocumentReference(self._client, path), data, self._field_paths
+            )
+
+    def _copy(self, **changes: object) -> "FakeQuery":
+        query = FakeQuery(
+            self._client,
+            self._collection_path,
+            self._filters,
+            self._orders,
+            self._cursor,
+            self._limit_count,
+            self._field_paths,
+        )
+        for name, value in changes.items():
+            setattr(query, f"_{name}", value)
+        return query
+
+    def _matches(self, path: str, data: DocumentData) -> bool:
+        for field_path, op_string, expected_value in self._filters:
+            actual_value = _field_value(path, data, field_path)
+            if op_string == "==" and actual_value != expected_value:
+                return False
+            if op_string != "==" and (
+                actual_value is None or not _compare_values(actual_value, op_string, expected_value)
+            ):
+                return False
+        return True
+
+    def _compare(self, left: tuple[str, DocumentData], right: tuple[str, DocumentData]) -> int:
+        orders = self._orders or (("__name__", google_cloud_firestore.Query.ASCENDING),)
+        for field_path, direction in orders:
+            left_value = _field_value(left[0], left[1], field_path)
+            right_value = _field_value(right[0], right[1], field_path)
+            if left_value == right_value:
+                continue
+            result = -1 if _compare_values(left_value, "<", right_value) else 1
+            return -result if direction == google_cloud_firestore.Query.DESCENDING else result
+        return 0
+
+    def _is_after_cursor(self, item: tuple[str, DocumentData], cursor_values: DocumentData) -> bool:
+        for field_path, direction in self._orders:
+            if field_path not in cursor_values:
+                return False
+            item_value = _field_value(item[0], item[1], field_path)
+            cursor_value = cursor_values[field_path]
+            if item_value == cursor_value:
+                continue
+            is_less = _compare_values(item_value, "<", cursor_value)
+            return is_less if direction == google_cloud_firestore.Query.DESCENDING else not is_less
+        return False
+
+
+class FakeCollectionReference(FakeQuery):
+    def __init__(self, client: FakeFirestoreClient, path: str) -> None:
+        super().__init__(client, path)
+        self.path = path
+
+    def document(self, document_id: str) -> FakeDocumentReference:
+        return FakeDocumentReference(self._client, f"{self.path}/{document_id}")
+
+    def list_documents(self) -> list[FakeDocumentReference]:
+        document_paths = {
+            path.removeprefix(f"{self.path}/").split("/", 1)[0]
+            for path in self._client.documents
+            if path.startswith(f"{self.path}/")
+        }
+        return [self.document(document_id) for document_id in sorted(document_paths)]
+
+
+def _field_value(path: str, data: DocumentData, field_path: str) -> object:
+    if field_path == "__name__":
+        return path.rsplit("/", 1)[-1]
+    return data.get(field_path)
+
+
+def _compare_values(left: object, op_string: str, right: object) -> bool:
+    compare = _ORDERED_OPERATORS.get(op_string)
+    if compare is None:
+        raise ValueError(f"unsupported fake firestore operator: {op_string}")
+    for value_type in (datetime.datetime, int | float, str):
+        if isinstance(left, value_type) and isinstance(right, value_type):
+            return bool(compare(left, right))
+    raise TypeError(f"unsupported fake firestore comparison: {left!r} {op_string} {right!r}")
+
+
+def _apply_fields(current_data: DocumentData, changes: DocumentData) -> DocumentData:
+    updated_data = copy.deepcopy(current_data)
+    for field_name, value in changes.items():
+        if value is google_cloud_firestore.DELETE_FIELD:
+            updated_data.pop(field_name, None)
+        elif value is google_cloud_firestore.SERVER_TIMESTAMP:
+            updated_data[field_name] = datetime.datetime.now(datetime.UTC)
+        elif isinstance(value, google_cloud_firestore.Increment):
+            current_value = updated_data.get(field_name, 0)
+            if not isinstance(current_value, int):
+                current_value = 0
+            updated_data[field_name] = current_value + value.value
+        elif isinstance(value, google_cloud_firestore.ArrayUnion):
+            current_items = updated_data.get(field_name)
+            merged_items = list(current_items) if isinstance(current_items, list) else []
+            merged_items.extend(item for item in value.values if item not in merged_items)
+            updated_data[field_name] = merged_items
+        else:
+            updated_data[field_name] = copy.deepcopy(value)
+    return updated_data
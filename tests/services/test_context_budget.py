@@ -0,0 +1,42 @@
+import datetime
+
+import src.domain.entities.message as message_entity
+import src.services.agentic.context_budget as context_budget
+import src.services.dto.llm_dto as llm_dto
+
+
+def test_token_budget_context_keeps_newest_messages_that_fit() -> None:
+    builder = context_budget.TokenBudgetContextBuilder(token_budget=60)
+    long_message = message_entity.Message(
+        id="msg-long",
+        conversation_id="conv-1",
+        tenant_id="tenant-1",
+        direction="INBOUND",
+        role="user",
+        content="hola " * 40,
+        provider_message_id="wamid-long",
+        created_at=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+    )
+    assert long_message.token_estimate == 50
+    messages = [
+        llm_dto.ChatMessageDTO(
+            role="user", content=long_message.content, token_estimate=long_message.token_estimate
+        ),
+        llm_dto.ChatMessageDTO(role="assistant", content="Claro, te ayudo con tu cita."),
+        llm_dto.ChatMessageDTO(role="user", content="Para manana"),
+    ]
+
+    selected_messages = builder.select_messages(
+        messages,
+        reserved_tokens=builder.estimate_reserved_tokens(
+            system_prompt="Eres un asistente.",
+            tools=[],
+            function_call_results=[],
+        ),
+    )
+
+    assert [message.content for message in selected_messages] == [
+        "Claro, te ayudo con tu cita.",
+        "Para manana",
+    ]
+    assert builder.select_messages(messages, reserved_tokens=1000) == messages[-1:]
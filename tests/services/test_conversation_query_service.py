@@ -122,3 +122,245 @@ def test_list_messages_returns_ordered_history() -> None:
     assert len(response.items) == 2
     assert response.items[0].message_id == "msg-1"
     assert response.items[1].message_id == "msg-2"
+
+
+def test_list_messages_pages_backwards_with_before_cursor() -> None:
+    service, repository = build_query_service()
+    base_time = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    repository.save_conversation(
+        conversation_entity.Conversation(
+            id="conv-1",
+            tenant_id="tenant-1",
+            whatsapp_user_id="wa-1",
+            started_at=base_time,
+            updated_at=base_time,
+            last_message_preview="hello",
+            message_ids=[],
+        )
+    )
+    for index in range(5):
+        repository.save_message(
+            message_entity.Message(
+                id=f"msg-{index}",
+                conversation_id="conv-1",
+                tenant_id="tenant-1",
+                direction="INBOUND",
+                role="user",
+                content=f"message {index}",
+                provider_message_id=f"p{index}",
+                created_at=base_time + datetime.timedelta(seconds=index),
+            )
+        )
+
+    latest_page = service.list_messages("tenant-1", "conv-1", limit=2)
+    assert latest_page.before_cursor is not None
+    older_page = service.list_messages(
+        "tenant-1", "conv-1", limit=2, before=latest_page.before_cursor
+    )
+    assert older_page.before_cursor is not None
+    oldest_page = service.list_messages(
+        "tenant-1", "conv-1", limit=2, before=older_page.before_cursor
+    )
+    assert oldest_page.after_cursor is not None
+    newer_page = service.list_messages(
+        "tenant-1", "conv-1", limit=2, after=oldest_page.after_cursor
+    )
+
+    assert [item.message_id for item in latest_page.items] == ["msg-3", "msg-4"]
+    assert [item.message_id for item in older_page.items] == ["msg-1", "msg-2"]
+    assert [item.message_id for item in oldest_page.items] == ["msg-0"]
+    assert oldest_page.before_cursor is None
+    assert [item.message_id for item in newer_page.items] == ["msg-1", "msg-2"]
+
+
+def test_list_conversations_pages_with_next_cursor() -> None:
+    service, repository = build_query_service()
+    base_time = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    for index in range(3):
+        repository.save_conversation(
+            conversation_entity.Conversation(
+                id=f"conv-{index}",
+                tenant_id="tenant-1",
+                whatsapp_user_id=f"wa-{index}",
+                started_at=base_time,
+                updated_at=base_time + datetime.timedelta(minutes=index),
+                last_message_preview="hello",
+                message_ids=[],
+            )
+        )
+
+    first_page = service.list_conversations("tenant-1", limit=2)
+    assert first_page.next_cursor is not None
+    second_page = service.list_conversations("tenant-1", limit=2, after=first_page.next_cursor)
+
+    assert [item.conversation_id for item in first_page.items] == ["conv-2", "conv-1"]
+    assert [item.conversation_id for item in second_page.items] == ["conv-0"]
+    assert second_page.next_cursor is None
+    with pytest.raises(service_exceptions.InvalidStateError):
+        service.list_conversations("tenant-1", limit=2, after="not-a-cursor")
+
+
+def test_list_changes_returns_only_activity_after_cursor() -> None:
+    service, repository = build_query_service()
+    base_time = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    conversation = conversation_entity.Conversation(
+        id="conv-1",
+        tenant_id="tenant-1",
+        whatsapp_user_id="wa-1",
+        started_at=base_time,
+        updated_at=base_time,
+        last_message_preview="hello",
+        message_ids=[],
+    )
+    repository.save_conversation(conversation)
+    repository.save_conversation(
+        conversation_entity.Conversation(
+            id="conv-2",
+            tenant_id="tenant-1",
+            whatsapp_user_id="wa-2",
+            started_at=base_time,
+            updated_at=base_time,
+            last_message_preview="quiet",
+            message_ids=[],
+        )
+    )
+
+    bootstrap = service.list_changes("tenant-1")
+    assert bootstrap.conversations == []
+
+    new_message_at = base_time + datetime.timedelta(minutes=1)
+    repository.save_message(
+        message_entity.Message(
+            id="msg-1",
+            conversation_id="conv-1",
+            tenant_id="tenant-1",
+            direction="INBOUND",
+            role="user",
+            content="new activity",
+            provider_message_id="p1",
+            created_at=new_message_at,
+        )
+    )
+    conversation.append_message("msg-1", "new activity", new_message_at)
+    repository.save_conversation(conversation)
+
+    changes = service.list_changes("tenant-1", since=bootstrap.next_cursor)
+    no_changes = service.list_changes("tenant-1", since=changes.next_cursor)
+
+    assert [item.conversation_id for item in changes.conversations] == ["conv-1"]
+    assert [item.message_id for item in changes.messages] == ["msg-1"]
+    assert changes.has_more is False
+    assert no_changes.conversations == []
+    assert no_changes.messages == []
+    assert no_changes.next_cursor == changes.next_cursor
+
+
+def test_list_changes_keeps_sync_lower_bound_across_pages_and_flags_truncation() -> None:
+    service, repository = build_query_service()
+    service._change_feed_message_limit = 1
+    base_time = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    conversations = [
+        conversation_entity.Conversation(
+            id=f"conv-{index}",
+            tenant_id="tenant-1",
+            whatsapp_user_id=f"wa-{index}",
+            started_at=base_time,
+            updated_at=base_time,
+            last_message_preview=None,
+            message_ids=[],
+        )
+        for index in [1, 2]
+    ]
+    for conversation in conversations:
+        repository.save_conversation(conversation)
+    bootstrap = service.list_changes("tenant-1")
+
+    def add_message(
+        conversation: conversation_entity.Conversation, message_id: str, minutes: int
+    ) -> None:
+        created_at = base_time + datetime.timedelta(minutes=minutes)
+        repository.save_message(
+            message_entity.Message(
+                id=message_id,
+                conversation_id=conversation.id,
+                tenant_id="tenant-1",
+                direction="INBOUND",
+                role="user",
+                content=f"mensaje {message_id}",
+                provider_message_id=message_id,
+                created_at=created_at,
+            )
+        )
+        conversation.append_message(message_id, message_id, created_at)
+        repository.save_conversation(conversation)
+
+    add_message(conversations[1], "msg-early", 1)
+    add_message(conversations[0], "msg-a", 2)
+    add_message(conversations[0], "msg-b", 3)
+    conversations[1].set_control_mode("HUMAN", base_time + datetime.timedelta(minutes=4))
+    repository.save_conversation(conversations[1])
+
+    first_page = service.list_changes("tenant-1", since=bootstrap.next_cursor, limit=1)
+    second_page = service.list_changes("tenant-1", since=first_page.next_cursor, limit=1)
+    caught_up = service.list_changes("tenant-1", since=second_page.next_cursor, limit=1)
+
+    assert [item.conversation_id for item in first_page.conversations] == ["conv-1"]
+    assert [item.message_id for item in first_page.messages] == ["msg-a"]
+    assert [item.conversation_id for item in first_page.truncated_conversations] == ["conv-1"]
+    assert first_page.has_more is True
+    assert [item.conversation_id for item in second_page.conversations] == ["conv-2"]
+    assert [item.message_id for item in second_page.messages] == ["msg-early"]
+    assert second_page.truncated_conversations == []
+    assert second_page.has_more is False
+    assert caught_up.conversations == []
+    assert caught_up.messages == []
+    remaining_messages = service.list_messages(
+        "tenant-1",
+        "conv-1",
+        after=first_page.truncated_conversations[0].after_cursor,
+    )
+    assert [item.message_id for item in remaining_messages.items] == ["msg-b"]
+
+
+def test_search_messages_folds_accents_and_ranks_by_matched_terms() -> None:
+    service, repository = build_query_service()
+    base_time = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    for conversation_id, tenant_id in (("conv-1", "tenant-1"), ("conv-2", "tenant-2")):
+        repository.save_conversation(
+            conversation_entity.Conversation(
+                id=conversation_id,
+                tenant_id=tenant_id,
+                whatsapp_user_id=f"wa-{conversation_id}",
+                started_at=base_time,
+                updated_at=base_time,
+                last_message_preview=None,
+                message_ids=[],
+            )
+        )
+    message_contents = (
+        ("conv-1", "tenant-1", "Quiero agendar una cita para mi niño el martes"),
+        ("conv-1", "tenant-1", "La cita quedo confirmada"),
+        ("conv-1", "tenant-1", "Gracias por todo"),
+        ("conv-2", "tenant-2", "Necesito una cita para el nino"),
+    )
+    for index, (conversation_id, tenant_id, content) in enumerate(message_contents):
+        repository.save_message(
+            message_entity.Message(
+                id=f"msg-{index}",
+                conversation_id=conversation_id,
+                tenant_id=tenant_id,
+                direction="INBOUND",
+                role="user",
+                content=content,
+                provider_message_id=f"p{index}",
+                created_at=base_time + datetime.timedelta(seconds=index),
+            )
+        )
+
+    result = service.search_messages("tenant-1", "CITA nino")
+
+    assert [item.message_id for item in result.items] == ["msg-0", "msg-1"]
+    assert "niño" in result.items[0].snippet
+    assert result.items[0].score > result.items[1].score
+    with pytest.raises(service_exceptions.InvalidStateError):
+        service.search_messages("tenant-1", "de la")
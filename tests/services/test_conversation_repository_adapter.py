@@ -0,0 +1,181 @@
+import datetime
+
+import src.adapters.outbound.inmemory.conversation_repository_adapter as conversation_repository_adapter
+import src.adapters.outbound.inmemory.store as in_memory_store
+import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.message as message_entity
+
+
+def test_conversation_repository_lists_recent_messages_and_counts_history() -> None:
+    store = in_memory_store.InMemoryStore()
+    repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(store)
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    repository.save_conversation(
+        conversation_entity.Conversation(
+            id="conv-1",
+            tenant_id="tenant-1",
+            whatsapp_user_id="wa-1",
+            started_at=started_at,
+            updated_at=started_at,
+            last_message_preview=None,
+            message_ids=[],
+        )
+    )
+    for index in range(5):
+        repository.save_message(
+            message_entity.Message(
+                id=f"msg-{index}",
+                conversation_id="conv-1",
+                tenant_id="tenant-1",
+                direction="INBOUND",
+                role="user",
+                content=f"hola {index}",
+                provider_message_id=f"wamid-{index}",
+                created_at=started_at + datetime.timedelta(minutes=index),
+            )
+        )
+
+    recent_messages = repository.list_recent_messages("tenant-1", "conv-1", limit=2)
+
+    assert [message.id for message in recent_messages] == ["msg-3", "msg-4"]
+    assert repository.list_recent_messages("tenant-1", "conv-1", limit=0) == []
+    assert repository.list_recent_messages("tenant-2", "conv-1", limit=2) == []
+
+
+def test_conversation_repository_bumps_message_seq_on_each_append() -> None:
+    store = in_memory_store.InMemoryStore()
+    repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(store)
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    conversation = conversation_entity.Conversation(
+        id="conv-1",
+        tenant_id="tenant-1",
+        whatsapp_user_id="wa-1",
+        started_at=started_at,
+        updated_at=started_at,
+        last_message_preview=None,
+        message_ids=[],
+    )
+    repository.save_conversation(conversation)
+    for index in range(2):
+        repository.save_message(
+            message_entity.Message(
+                id=f"msg-{index}",
+                conversation_id="conv-1",
+                tenant_id="tenant-1",
+                direction="INBOUND",
+                role="user",
+                content=f"hola {index}",
+                provider_message_id=f"wamid-{index}",
+                created_at=started_at + datetime.timedelta(minutes=index),
+            )
+        )
+
+    repository.save_conversation(conversation)
+    repository.delete_messages("tenant-1", "conv-1")
+
+    assert repository.get_message_seq("tenant-1", "conv-1") == 2
+    assert repository.get_message_seq("tenant-2", "conv-1") == 0
+
+
+def test_conversation_dirty_fields_track_changes_since_last_persist() -> None:
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    conversation = conversation_entity.Conversation(
+        id="conv-1",
+        tenant_id="tenant-1",
+        whatsapp_user_id="wa-1",
+        started_at=started_at,
+        updated_at=started_at,
+        last_message_preview=None,
+        message_ids=[],
+    )
+    assert not conversation.is_persisted()
+    assert "tenant_id" in conversation.dirty_fields()
+
+    conversation.mark_persisted()
+    assert conversation.dirty_fields() == []
+
+    changed_at = started_at + datetime.timedelta(minutes=1)
+    conversation.append_message("msg-1", "hola", changed_at)
+    conversation.set_control_mode("HUMAN", changed_at)
+
+    assert sorted(conversation.dirty_fields()) == [
+        "control_mode",
+        "last_message_preview",
+        "message_ids",
+        "updated_at",
+    ]
+    assert conversation.model_copy(deep=True).is_persisted()
+
+
+def test_conversation_archive_keeps_subsession_index_and_lists_subsessions() -> None:
+    store = in_memory_store.InMemoryStore()
+    repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(store)
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    archived_at = started_at + datetime.timedelta(days=1)
+    conversation = conversation_entity.Conversation(
+        id="conv-1",
+        tenant_id="tenant-1",
+        whatsapp_user_id="wa-1",
+        started_at=started_at,
+        updated_at=started_at,
+        last_message_preview=None,
+        message_ids=[],
+    )
+    conversation.archive_current_session(
+        scheduling_request_id="req-1",
+        calendar_event_id="evt-1",
+        messages=[
+            message_entity.Message(
+                id="msg-1",
+                conversation_id="conv-1",
+                tenant_id="tenant-1",
+                direction="INBOUND",
+                role="user",
+                content="quiero una cita",
+                provider_message_id="wamid-1",
+                created_at=started_at,
+            )
+        ],
+        now=archived_at,
+    )
+    repository.save_conversation(conversation)
+
+    subsessions = repository.list_subsessions("tenant-1", "conv-1")
+
+    assert conversation.subsessions_count == 1
+    assert conversation.last_subsession_archived_at == archived_at
+    assert conversation.subsession_request_ids == ["req-1"]
+    assert [subsession.scheduling_request_id for subsession in subsessions] == ["req-1"]
+    assert repository.list_subsessions("tenant-2", "conv-1") == []
+
+
+def test_conversation_repository_lists_summaries_newest_first_after_cursor() -> None:
+    store = in_memory_store.InMemoryStore()
+    repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(store)
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    for index in range(3):
+        updated_at = started_at + datetime.timedelta(minutes=index)
+        repository.save_conversation(
+            conversation_entity.Conversation(
+                id=f"conv-{index}",
+                tenant_id="tenant-1",
+                whatsapp_user_id=f"wa-{index}",
+                started_at=started_at,
+                updated_at=updated_at,
+                last_message_preview=f"hola {index}",
+                message_ids=[],
+            )
+        )
+
+    first_page = repository.list_conversation_summaries("tenant-1", limit=2)
+    second_page = repository.list_conversation_summaries(
+        "tenant-1",
+        limit=2,
+        after_updated_at=first_page[-1].updated_at,
+        after_conversation_id=first_page[-1].id,
+    )
+
+    assert [summary.id for summary in first_page] == ["conv-2", "conv-1"]
+    assert [summary.id for summary in second_page] == ["conv-0"]
+    assert second_page[0].last_message_preview == "hola 0"
+    assert repository.list_conversation_summaries("tenant-2") == []
@@ -0,0 +1,74 @@
+import datetime
+import json
+
+import pytest
+
+import src.adapters.outbound.inmemory.conversation_repository_adapter as conversation_repository_adapter
+import src.adapters.outbound.inmemory.scheduling_repository_adapter as scheduling_repository_adapter
+import src.adapters.outbound.inmemory.store as in_memory_store
+import src.adapters.outbound.local_queue.in_process_conversation_event_bus_adapter as event_bus_adapter
+import src.domain.entities.conversation as conversation_entity
+import src.services.dto.auth_dto as auth_dto
+import src.services.dto.conversation_dto as conversation_dto
+import src.services.exceptions as service_exceptions
+import src.services.use_cases.conversation_control_service as conversation_control_service
+import src.services.use_cases.conversation_stream_service as conversation_stream_service
+import tests.fakes.fake_adapters as fake_adapters
+
+
+def test_stream_emits_control_mode_change_and_heartbeat() -> None:
+    store = in_memory_store.InMemoryStore()
+    repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(store)
+    now_value = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    repository.save_conversation(
+        conversation_entity.Conversation(
+            id="conv-1",
+            tenant_id="tenant-1",
+            whatsapp_user_id="wa-1",
+            started_at=now_value,
+            updated_at=now_value,
+            last_message_preview="hello",
+            message_ids=[],
+        )
+    )
+    event_bus = event_bus_adapter.InProcessConversationEventBusAdapter(max_subscribers_per_tenant=1)
+    control_service = conversation_control_service.ConversationControlService(
+        conversation_repository=repository,
+        scheduling_repository=scheduling_repository_adapter.InMemorySchedulingRepositoryAdapter(
+            store
+        ),
+        clock=fake_adapters.FixedClock(now_value),
+        conversation_event_bus=event_bus,
+    )
+    stream_service = conversation_stream_service.ConversationStreamService(
+        conversation_event_bus=event_bus,
+        heartbeat_seconds=0.01,
+    )
+    subscription_id = stream_service.open_stream("tenant-1")
+    with pytest.raises(service_exceptions.CapacityExceededError):
+        stream_service.open_stream("tenant-1")
+
+    control_service.update_control_mode(
+        claims=auth_dto.TokenClaimsDTO(
+            sub="user-1",
+            tenant_id="tenant-1",
+            role="owner",
+            exp=2_000_000_000,
+            jti="jti-1",
+            token_kind="access",
+        ),
+        conversation_id="conv-1",
+        update_dto=conversation_dto.UpdateConversationControlModeDTO(control_mode="HUMAN"),
+    )
+    frames = stream_service.iter_events(subscription_id)
+    event_frame = next(frames)
+    heartbeat_frame = next(frames)
+    frames.close()
+
+    event_line, data_line, _, _ = event_frame.split("\n")
+    assert event_line == "event: control_mode_changed"
+    payload = json.loads(data_line.removeprefix("data: "))
+    assert payload["conversation_id"] == "conv-1"
+    assert payload["control_mode"] == "HUMAN"
+    assert heartbeat_frame == ": heartbeat\n\n"
+    assert event_bus.is_active(subscription_id) is False
@@ -0,0 +1,163 @@
+import datetime
+
+import src.adapters.outbound.inmemory.conversation_repository_adapter as conversation_repository_adapter
+import src.adapters.outbound.inmemory.store as in_memory_store
+import src.domain.entities.conversation as conversation_entity
+import src.domain.entities.message as message_entity
+import src.services.agentic.prompt_builder as prompt_builder
+import src.services.agentic.state_models as agentic_state_models
+import src.services.use_cases.conversation_summary_service as conversation_summary_service
+import tests.fakes.fake_adapters as fake_adapters
+
+
+def test_refresh_folds_overflow_into_running_summary_and_keeps_recent_tail() -> None:
+    store = in_memory_store.InMemoryStore()
+    repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(store)
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    repository.save_conversation(
+        conversation_entity.Conversation(
+            id="conv-1",
+            tenant_id="tenant-1",
+            whatsapp_user_id="wa-1",
+            started_at=started_at,
+            updated_at=started_at,
+            last_message_preview=None,
+            message_ids=[],
+        )
+    )
+    for index in range(6):
+        repository.save_message(
+            message_entity.Message(
+                id=f"msg-{index}",
+                conversation_id="conv-1",
+                tenant_id="tenant-1",
+                direction="INBOUND" if index % 2 == 0 else "OUTBOUND",
+                role="user" if index % 2 == 0 else "assistant",
+                content=f"mensaje {index}",
+                provider_message_id=f"wamid-{index}",
+                created_at=started_at + datetime.timedelta(minutes=index),
+            )
+        )
+    llm_provider = fake_adapters.FakeLlmProvider("Paciente Ana, consulta por ansiedad.")
+    summary_service = conversation_summary_service.ConversationSummaryService(
+        conversation_repository=repository,
+        llm_provider=llm_provider,
+        task_runner=None,
+        history_token_budget=1000,
+        context_message_limit=4,
+    )
+
+    assert summary_service.needs_refresh(repository.list_messages("tenant-1", "conv-1"))
+    assert summary_service.refresh("tenant-1", "conv-1") is True
+    assert summary_service.refresh("tenant-1", "conv-1") is False
+
+    conversation = repository.get_conversation_by_id("tenant-1", "conv-1")
+    assert conversation is not None
+    assert conversation.running_summary == "Paciente Ana, consulta por ansiedad."
+    assert conversation.summarized_through_message_id == "msg-3"
+    assert conversation.updated_at == started_at
+    assert len(llm_provider.calls) == 1
+    summary_prompt = llm_provider.calls[0].messages[0].content
+    assert "Paciente: mensaje 0" in summary_prompt
+    assert "Asistente: mensaje 3" in summary_prompt
+    assert "mensaje 4" not in summary_prompt
+
+    runtime_prompt = prompt_builder.RuntimePromptBuilder().build_runtime_system_prompt(
+        runtime_context=agentic_state_models.RuntimePromptContext(
+            state="NO_ACTIVE_REQUEST",
+            enabled_tool_names=[],
+        ),
+        known_patient=None,
+        conversation_summary=conversation.running_summary,
+    )
+    assert "Paciente Ana, consulta por ansiedad." in runtime_prompt
+
+
+def test_refresh_keeps_previous_summary_when_llm_fails() -> None:
+    store = in_memory_store.InMemoryStore()
+    repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(store)
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    repository.save_conversation(
+        conversation_entity.Conversation(
+            id="conv-1",
+            tenant_id="tenant-1",
+            whatsapp_user_id="wa-1",
+            started_at=started_at,
+            updated_at=started_at,
+            last_message_preview=None,
+            message_ids=[],
+        )
+    )
+    for index in range(3):
+        repository.save_message(
+            message_entity.Message(
+                id=f"msg-{index}",
+                conversation_id="conv-1",
+                tenant_id="tenant-1",
+                direction="INBOUND",
+                role="user",
+                content=f"mensaje {index}",
+                provider_message_id=f"wamid-{index}",
+                created_at=started_at + datetime.timedelta(minutes=index),
+            )
+        )
+    llm_provider = fake_adapters.FakeLlmProvider("resumen")
+    llm_provider.should_fail = True
+    summary_service = conversation_summary_service.ConversationSummaryService(
+        conversation_repository=repository,
+        llm_provider=llm_provider,
+        task_runner=None,
+        history_token_budget=1000,
+        context_message_limit=2,
+    )
+
+    assert summary_service.refresh("tenant-1", "conv-1") is False
+
+    conversation = repository.get_conversation_by_id("tenant-1", "conv-1")
+    assert conversation is not None
+    assert conversation.running_summary is None
+    assert conversation.summarized_through_at is None
+
+
+def test_refresh_keeps_newest_turn_when_history_exactly_fills_a_page() -> None:
+    store = in_memory_store.InMemoryStore()
+    repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(store)
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    repository.save_conversation(
+        conversation_entity.Conversation(
+            id="conv-1",
+            tenant_id="tenant-1",
+            whatsapp_user_id="wa-1",
+            started_at=started_at,
+            updated_at=started_at,
+            last_message_preview=None,
+            message_ids=[],
+        )
+    )
+    for index in range(3):
+        repository.save_message(
+            message_entity.Message(
+                id=f"msg-{index}",
+                conversation_id="conv-1",
+                tenant_id="tenant-1",
+                direction="INBOUND",
+                role="user",
+                content=f"mensaje {index}",
+                provider_message_id=f"wamid-{index}",
+                created_at=started_at + datetime.timedelta(minutes=index),
+            )
+        )
+    summary_service = conversation_summary_service.ConversationSummaryService(
+        conversation_repository=repository,
+        llm_provider=fake_adapters.FakeLlmProvider("resumen"),
+        task_runner=None,
+        history_token_budget=1000,
+        context_message_limit=2,
+    )
+    summary_service._page_size = 3
+
+    assert summary_service.refresh("tenant-1", "conv-1") is True
+
+    conversation = repository.get_conversation_by_id("tenant-1", "conv-1")
+    assert conversation is not None
+    assert conversation.summarized_through_message_id == "msg-1"
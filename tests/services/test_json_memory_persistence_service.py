@@ -9,6 +9,7 @@ import src.adapters.outbound.inmemory.refresh_token_repository_adapter as refres
 import src.adapters.outbound.inmemory.scheduling_repository_adapter as scheduling_repository_adapter
 import src.adapters.outbound.inmemory.store as in_memory_store
 import src.adapters.outbound.inmemory.tenant_repository_adapter as tenant_repository_adapter
+import src.adapters.outbound.inmemory.unit_of_work_adapter as unit_of_work_adapter
 import src.adapters.outbound.inmemory.user_repository_adapter as user_repository_adapter
 import src.adapters.outbound.inmemory.whatsapp_connection_repository_adapter as whatsapp_connection_repository_adapter
 import src.adapters.outbound.security.jwt_provider_adapter as jwt_provider_adapter
@@ -234,3 +235,39 @@ def test_calendar_and_scheduling_state_persist_across_restart() -> None:
         assert restored_request.slots[0].id == "slot-1"
         assert restored_patient is not None
         assert restored_patient.first_name == "Jane"
+
+
+def test_unit_of_work_writes_json_memory_snapshot_once_on_commit() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_snapshot_path = pathlib.Path(temp_dir) / "memory.json"
+        store = in_memory_store.InMemoryStore(persistence_file_path=str(memory_snapshot_path))
+        patient_repository = patient_repository_adapter.InMemoryPatientRepositoryAdapter(store)
+        unit_of_work = unit_of_work_adapter.InMemoryUnitOfWorkAdapter(store)
+        now_value = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+        with unit_of_work.atomic():
+            for whatsapp_user_id in ["wa-user-1", "wa-user-2"]:
+                patient_repository.save(
+                    patient_entity.Patient(
+                        tenant_id="tenant-1",
+                        whatsapp_user_id=whatsapp_user_id,
+                        first_name="Jane",
+                        last_name="Doe",
+                        email="jane@example.com",
+                        age=30,
+                        consultation_reason="Ansiedad",
+                        location="Bogota",
+                        phone="3001234567",
+                        created_at=now_value,
+                    )
+                )
+            assert memory_snapshot_path.exists() is False
+
+        assert memory_snapshot_path.exists()
+        restarted_store = in_memory_store.InMemoryStore(
+            persistence_file_path=str(memory_snapshot_path)
+        )
+        restarted_patient_repository = patient_repository_adapter.InMemoryPatientRepositoryAdapter(
+            restarted_store
+        )
+        assert len(restarted_patient_repository.list_by_tenant("tenant-1")) == 2
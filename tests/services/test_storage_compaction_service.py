@@ -0,0 +1,41 @@
+import datetime
+
+import src.adapters.outbound.inmemory.conversation_processing_lock_adapter as conversation_processing_lock_adapter
+import src.adapters.outbound.inmemory.processed_webhook_event_repository_adapter as processed_webhook_event_repository_adapter
+import src.adapters.outbound.inmemory.store as in_memory_store
+import src.services.use_cases.storage_compaction_service as storage_compaction_service
+import tests.fakes.fake_adapters as fake_adapters
+
+
+def test_compact_expired_deletes_only_expired_events_and_locks() -> None:
+    store = in_memory_store.InMemoryStore()
+    event_repository = (
+        processed_webhook_event_repository_adapter.InMemoryProcessedWebhookEventRepositoryAdapter(
+            store
+        )
+    )
+    processing_lock = (
+        conversation_processing_lock_adapter.InMemoryConversationProcessingLockAdapter(store)
+    )
+    started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    event_repository.mark_processed("tenant-1", "evt-old", started_at)
+    event_repository.mark_processed("tenant-1", "evt-new", started_at + datetime.timedelta(days=7))
+    assert processing_lock.try_acquire("tenant-1", "conv-1", "holder-1", started_at)
+    processing_lock.release("tenant-1", "conv-1", "holder-1", released_at=started_at)
+    assert processing_lock.try_acquire(
+        "tenant-1", "conv-2", "holder-2", started_at + datetime.timedelta(days=9)
+    )
+    service = storage_compaction_service.StorageCompactionService(
+        processed_webhook_event_repository=event_repository,
+        conversation_processing_lock=processing_lock,
+        clock=fake_adapters.FixedClock(started_at + datetime.timedelta(days=9)),
+    )
+
+    service.compact_expired()
+
+    assert event_repository.exists("tenant-1", "evt-old") is False
+    assert event_repository.exists("tenant-1", "evt-new") is True
+    assert event_repository.claim_for_processing(
+        "tenant-1", "evt-old", started_at + datetime.timedelta(days=9)
+    )
+    assert list(store.conversation_processing_locks) == [("tenant-1", "conv-2")]
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 import typing
@@ -11,10 +12,13 @@ import src.adapters.outbound.inmemory.patient_repository_adapter as patient_repo
 import src.adapters.outbound.inmemory.processed_webhook_event_repository_adapter as processed_webhook_event_repository_adapter
 import src.adapters.outbound.inmemory.store as in_memory_store
 import src.adapters.outbound.inmemory.whatsapp_connection_repository_adapter as whatsapp_connection_repository_adapter
+import src.adapters.outbound.local_cache.lru_processed_webhook_event_filter_adapter as lru_processed_webhook_event_filter_adapter
 import src.domain.entities.agent_profile as agent_profile_entity
 import src.domain.entities.blacklist_entry as blacklist_entry_entity
+import src.domain.entities.message as message_entity
 import src.domain.entities.patient as patient_entity
 import src.domain.entities.whatsapp_connection as whatsapp_connection_entity
+import src.ports.processed_webhook_event_filter_port as processed_webhook_event_filter_port
 import src.services.dto.llm_dto as llm_dto
 import src.services.dto.scheduling_dto as scheduling_dto
 import src.services.dto.webhook_dto as webhook_dto
@@ -29,6 +33,14 @@ def build_webhook_service(
     id_values: list[str],
     sleep_seconds: typing.Callable[[float], None] | None = None,
     existing_patient: patient_entity.Patient | None = None,
+    event_queue: fake_adapters.FakeWebhookEventQueue | None = None,
+    debounce_scheduler: fake_adapters.FakeConversationDebounceScheduler | None = None,
+    message_debounce_delay_seconds: int = 0,
+    payload_partition_concurrency: int = 1,
+    processed_event_filter: processed_webhook_event_filter_port.ProcessedWebhookEventFilterPort
+    | None = None,
+    event_context_loader: fake_adapters.FakeWebhookEventContextLoader | None = None,
+    unit_of_work: fake_adapters.FakeUnitOfWork | None = None,
 ) -> tuple[
     webhook_service.WebhookService,
     fake_adapters.FakeWhatsappProvider,
@@ -72,6 +84,7 @@ def build_webhook_service(
             tenant_id="tenant-1",
             system_prompt="tenant custom prompt",
             updated_at=now_value,
+            message_debounce_delay_seconds=message_debounce_delay_seconds,
         )
     )
     if existing_patient is not None:
@@ -97,7 +110,15 @@ def build_webhook_service(
         default_system_prompt="default prompt",
         context_message_limit=8,
         sleep_seconds=sleep_seconds,
+        event_queue=event_queue,
+        debounce_scheduler=debounce_scheduler,
+        payload_partition_concurrency=payload_partition_concurrency,
+        processed_event_filter=processed_event_filter,
+        event_context_loader=event_context_loader,
+        unit_of_work=unit_of_work,
     )
+    if event_queue is not None:
+        event_queue.start(service.process_queued_event)
 
     return (
         service,
@@ -112,11 +133,12 @@ def build_webhook_service(
 def build_customer_text_event(
     provider_event_id: str = "evt-1",
     message_id: str = "wamid-in-1",
+    whatsapp_user_id: str = "wa-user-1",
 ) -> webhook_dto.IncomingMessageEventDTO:
     return webhook_dto.IncomingMessageEventDTO(
         provider_event_id=provider_event_id,
         phone_number_id="phone-1",
-        whatsapp_user_id="wa-user-1",
+        whatsapp_user_id=whatsapp_user_id,
         whatsapp_user_name="Jane",
         message_id=message_id,
         message_type="text",
@@ -571,6 +593,519 @@ def test_process_payload_logs_ai_failure(caplog: pytest.LogCaptureFixture) -> No
     assert "webhook.ai_reply_fallback_sent" in events
 
 
+def test_accept_payload_enqueues_events_and_defers_processing() -> None:
+    event_queue = fake_adapters.FakeWebhookEventQueue()
+    (
+        service,
+        provider,
+        _,
+        conversation_repository,
+        processed_repository,
+        _,
+    ) = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"],
+        event_queue=event_queue,
+    )
+    provider.events = [build_customer_text_event()]
+
+    result = service.accept_payload({})
+
+    assert result.status == "accepted"
+    assert len(event_queue.submitted_events) == 1
+    assert len(provider.sent_messages) == 0
+    assert (
+        conversation_repository.get_conversation_by_whatsapp_user("tenant-1", "wa-user-1") is None
+    )
+
+    event_queue.drain()
+
+    assert len(provider.sent_messages) == 1
+    assert processed_repository.exists("tenant-1", "evt-1")
+
+
+def test_accept_payload_processes_inline_when_queue_applies_backpressure() -> None:
+    event_queue = fake_adapters.FakeWebhookEventQueue()
+    event_queue.accept_submissions = False
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"],
+        event_queue=event_queue,
+    )
+    provider.events = [build_customer_text_event()]
+
+    result = service.accept_payload({})
+
+    assert result.status == "processed"
+    assert event_queue.rejected_total == 1
+    assert len(provider.sent_messages) == 1
+    assert processed_repository.exists("tenant-1", "evt-1")
+
+
+def test_accept_payload_without_queue_processes_synchronously() -> None:
+    service, provider, _, _, _, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"]
+    )
+    provider.events = [build_customer_text_event()]
+
+    result = service.accept_payload({})
+
+    assert result.status == "processed"
+    assert len(provider.sent_messages) == 1
+
+
+def test_aaccept_payload_claims_events_on_the_event_loop_before_processing() -> None:
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"]
+    )
+    provider.events = [build_customer_text_event(), build_customer_text_event()]
+
+    result = asyncio.run(service.aaccept_payload({}))
+    redelivered_result = asyncio.run(service.aaccept_payload({}))
+
+    assert result.status == "processed"
+    assert redelivered_result.status == "processed"
+    assert len(provider.sent_messages) == 1
+    assert processed_repository.exists("tenant-1", "evt-1")
+
+
+def test_process_queued_event_marks_event_failed_without_raising() -> None:
+    event_queue = fake_adapters.FakeWebhookEventQueue()
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1"],
+        event_queue=event_queue,
+    )
+    provider.events = [build_customer_text_event()]
+
+    service.accept_payload({})
+    event_queue.drain()
+
+    assert len(provider.sent_messages) == 0
+    assert processed_repository.exists("tenant-1", "evt-1")
+
+
+def test_process_payload_runs_conversation_partitions_concurrently() -> None:
+    service, provider, _, conversation_repository, processed_repository, _ = build_webhook_service(
+        [f"id-{index}" for index in range(12)],
+        payload_partition_concurrency=4,
+    )
+    provider.events = [
+        build_customer_text_event(
+            provider_event_id="evt-1", message_id="wamid-in-1", whatsapp_user_id="wa-user-1"
+        ),
+        build_customer_text_event(
+            provider_event_id="evt-2", message_id="wamid-in-2", whatsapp_user_id="wa-user-2"
+        ),
+        build_customer_text_event(
+            provider_event_id="evt-3", message_id="wamid-in-3", whatsapp_user_id="wa-user-3"
+        ),
+    ]
+
+    result = service.process_payload({})
+
+    assert result.status == "processed"
+    assert sorted(message["whatsapp_user_id"] for message in provider.sent_messages) == [
+        "wa-user-1",
+        "wa-user-2",
+        "wa-user-3",
+    ]
+    for provider_event_id in ["evt-1", "evt-2", "evt-3"]:
+        assert processed_repository.exists("tenant-1", provider_event_id)
+    for whatsapp_user_id in ["wa-user-1", "wa-user-2", "wa-user-3"]:
+        assert (
+            conversation_repository.get_conversation_by_whatsapp_user("tenant-1", whatsapp_user_id)
+            is not None
+        )
+
+
+def test_process_payload_failed_partition_does_not_abort_other_conversations() -> None:
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1", "conversation-2"]
+    )
+    provider.events = [
+        build_customer_text_event(
+            provider_event_id="evt-1", message_id="wamid-in-1", whatsapp_user_id="wa-user-1"
+        ),
+        build_customer_text_event(
+            provider_event_id="evt-2", message_id="wamid-in-2", whatsapp_user_id="wa-user-2"
+        ),
+        build_customer_text_event(
+            provider_event_id="evt-3", message_id="wamid-in-3", whatsapp_user_id="wa-user-2"
+        ),
+    ]
+
+    with pytest.raises(ValueError):
+        service.process_payload({})
+
+    now_value = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    assert len(provider.sent_messages) == 1
+    assert provider.sent_messages[0]["whatsapp_user_id"] == "wa-user-1"
+    assert processed_repository.claim_for_processing("tenant-1", "evt-1", now_value) is False
+    assert processed_repository.claim_for_processing("tenant-1", "evt-2", now_value) is True
+    assert processed_repository.claim_for_processing("tenant-1", "evt-3", now_value) is True
+
+
+def test_process_payload_failed_partition_keeps_already_processed_event_processed() -> None:
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"]
+    )
+    provider.events = [
+        build_customer_text_event(provider_event_id="evt-1", message_id="wamid-in-1"),
+    ]
+    service.process_payload({})
+    provider.events = [
+        build_customer_text_event(provider_event_id="evt-2", message_id="wamid-in-2"),
+        build_customer_text_event(provider_event_id="evt-1", message_id="wamid-in-1"),
+    ]
+
+    with pytest.raises(ValueError):
+        service.process_payload({})
+
+    now_value = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    assert len(provider.sent_messages) == 1
+    assert processed_repository.claim_for_processing("tenant-1", "evt-1", now_value) is False
+    assert processed_repository.claim_for_processing("tenant-1", "evt-2", now_value) is True
+
+
+def advance_clock_after_each_send(
+    monkeypatch: pytest.MonkeyPatch,
+    service: webhook_service.WebhookService,
+    provider: fake_adapters.FakeWhatsappProvider,
+    seconds: int,
+) -> None:
+    clock = typing.cast(fake_adapters.FixedClock, service._clock)
+    original_send_text_message = provider.send_text_message
+
+    def slow_send_text_message(
+        access_token: str,
+        phone_number_id: str,
+        whatsapp_user_id: str,
+        text: str,
+    ) -> str:
+        outbound_id = original_send_text_message(
+            access_token, phone_number_id, whatsapp_user_id, text
+        )
+        clock.advance(seconds)
+        return outbound_id
+
+    monkeypatch.setattr(provider, "send_text_message", slow_send_text_message)
+
+
+def test_process_payload_refreshes_stale_claims_during_long_partition(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1", "in-msg-2", "out-msg-2"]
+    )
+    advance_clock_after_each_send(monkeypatch, service, provider, seconds=90)
+    repository_calls: list[tuple[str, list[str]]] = []
+    original_refresh_claim = processed_repository.refresh_claim
+    original_mark_processed_many = processed_repository.mark_processed_many
+
+    def recording_refresh_claim(
+        tenant_id: str,
+        provider_event_id: str,
+        claimed_at: datetime.datetime,
+    ) -> bool:
+        repository_calls.append(("refresh_claim", [provider_event_id]))
+        return original_refresh_claim(tenant_id, provider_event_id, claimed_at)
+
+    def recording_mark_processed_many(
+        tenant_id: str,
+        provider_event_ids: list[str],
+        processed_at: datetime.datetime,
+    ) -> None:
+        repository_calls.append(("mark_processed_many", list(provider_event_ids)))
+        original_mark_processed_many(tenant_id, provider_event_ids, processed_at)
+
+    monkeypatch.setattr(processed_repository, "refresh_claim", recording_refresh_claim)
+    monkeypatch.setattr(processed_repository, "mark_processed_many", recording_mark_processed_many)
+    provider.events = [
+        build_customer_text_event(provider_event_id="evt-1", message_id="wamid-in-1"),
+        build_customer_text_event(provider_event_id="evt-2", message_id="wamid-in-2"),
+    ]
+
+    service.process_payload({})
+
+    # evt-1's deferred processed mark is flushed before evt-2's claim is refreshed.
+    assert repository_calls == [
+        ("mark_processed_many", ["evt-1"]),
+        ("refresh_claim", ["evt-2"]),
+        ("mark_processed_many", ["evt-2"]),
+    ]
+    assert len(provider.sent_messages) == 2
+
+
+def test_process_payload_skips_event_whose_claim_was_lost_mid_partition(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1", "in-msg-2", "out-msg-2"]
+    )
+    advance_clock_after_each_send(monkeypatch, service, provider, seconds=90)
+    monkeypatch.setattr(
+        processed_repository,
+        "refresh_claim",
+        lambda tenant_id, provider_event_id, claimed_at: False,
+    )
+    provider.events = [
+        build_customer_text_event(provider_event_id="evt-1", message_id="wamid-in-1"),
+        build_customer_text_event(provider_event_id="evt-2", message_id="wamid-in-2"),
+    ]
+
+    service.process_payload({})
+
+    now_value = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    assert len(provider.sent_messages) == 1
+    assert provider.sent_messages[0]["text"] == "assistant reply"
+    # evt-2 was neither processed nor released: it stays with whoever took the claim over.
+    assert processed_repository.claim_for_processing("tenant-1", "evt-2", now_value) is False
+
+
+def test_process_payload_claims_payload_events_in_one_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"]
+    )
+    claim_calls: list[list[str]] = []
+    original_claim_many = processed_repository.claim_many
+
+    def recording_claim_many(
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        claim_calls.append(list(provider_event_ids))
+        return original_claim_many(tenant_id, provider_event_ids, claimed_at)
+
+    monkeypatch.setattr(processed_repository, "claim_many", recording_claim_many)
+    provider.events = [
+        build_customer_text_event(provider_event_id="evt-1", message_id="wamid-in-1"),
+        build_customer_text_event(provider_event_id="evt-1", message_id="wamid-in-1"),
+    ]
+
+    service.process_payload({})
+
+    assert claim_calls == [["evt-1", "evt-1"]]
+    assert len(provider.sent_messages) == 1
+    assert processed_repository.exists("tenant-1", "evt-1")
+
+
+def test_process_payload_skips_locally_known_duplicate_without_claiming(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    processed_event_filter = (
+        lru_processed_webhook_event_filter_adapter.LruProcessedWebhookEventFilterAdapter(
+            capacity=100
+        )
+    )
+    service, provider, _, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"],
+        processed_event_filter=processed_event_filter,
+    )
+    provider.events = [build_customer_text_event()]
+    service.process_payload({})
+
+    claim_calls: list[list[str]] = []
+
+    def recording_claim_many(
+        tenant_id: str,
+        provider_event_ids: list[str],
+        claimed_at: datetime.datetime,
+    ) -> dict[str, bool]:
+        del tenant_id, claimed_at
+        claim_calls.append(list(provider_event_ids))
+        return {}
+
+    monkeypatch.setattr(processed_repository, "claim_many", recording_claim_many)
+    service.process_payload({})
+
+    assert claim_calls == []
+    assert len(provider.sent_messages) == 1
+    metrics = service.get_dedup_filter_metrics()
+    assert metrics.hit_total == 1
+
+
+def test_process_payload_uses_preloaded_event_context() -> None:
+    now_value = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    event_context_loader = fake_adapters.FakeWebhookEventContextLoader(
+        webhook_dto.WebhookEventContextDTO(
+            connection=whatsapp_connection_entity.WhatsappConnection(
+                tenant_id="tenant-1",
+                phone_number_id="phone-1",
+                business_account_id="business-1",
+                access_token="wa-token-1",
+                status="CONNECTED",
+                embedded_signup_state=None,
+                updated_at=now_value,
+            ),
+            is_blacklisted=True,
+            whatsapp_user=None,
+            conversation=None,
+            known_patient=None,
+            agent_profile=None,
+        )
+    )
+    service, provider, _, conversation_repository, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"],
+        event_context_loader=event_context_loader,
+    )
+    provider.events = [build_customer_text_event()]
+
+    service.process_payload({})
+
+    assert event_context_loader.load_calls == [("phone-1", "wa-user-1")]
+    assert len(provider.sent_messages) == 0
+    assert (
+        conversation_repository.get_conversation_by_whatsapp_user("tenant-1", "wa-user-1") is None
+    )
+    assert processed_repository.exists("tenant-1", "evt-1")
+
+
+def test_process_payload_persists_incoming_event_in_one_unit_of_work(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    unit_of_work = fake_adapters.FakeUnitOfWork()
+    service, provider, _, conversation_repository, _, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"],
+        unit_of_work=unit_of_work,
+    )
+    saved_messages: list[tuple[str, bool]] = []
+    original_save_message = conversation_repository.save_message
+
+    def recording_save_message(message: message_entity.Message) -> None:
+        saved_messages.append((message.direction, unit_of_work.active))
+        original_save_message(message)
+
+    monkeypatch.setattr(conversation_repository, "save_message", recording_save_message)
+    provider.events = [build_customer_text_event()]
+
+    service.process_payload({})
+
+    assert saved_messages == [("INBOUND", True), ("OUTBOUND", False)]
+    assert unit_of_work.committed_total == 1
+    assert unit_of_work.rolled_back_errors == []
+
+
+def test_process_payload_leaves_unit_of_work_uncommitted_when_persisting_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    unit_of_work = fake_adapters.FakeUnitOfWork()
+    service, provider, _, conversation_repository, _, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"],
+        unit_of_work=unit_of_work,
+    )
+
+    def failing_save_message(message: message_entity.Message) -> None:
+        raise ValueError(f"cannot save {message.id}")
+
+    monkeypatch.setattr(conversation_repository, "save_message", failing_save_message)
+    provider.events = [build_customer_text_event()]
+
+    with pytest.raises(ValueError):
+        service.process_payload({})
+
+    assert unit_of_work.committed_total == 0
+    assert [str(error) for error in unit_of_work.rolled_back_errors] == ["cannot save in-msg-1"]
+    assert provider.sent_messages == []
+
+
+def test_process_payload_skips_duplicate_before_loading_event_context() -> None:
+    now_value = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    event_context_loader = fake_adapters.FakeWebhookEventContextLoader(
+        webhook_dto.WebhookEventContextDTO(
+            connection=whatsapp_connection_entity.WhatsappConnection(
+                tenant_id="tenant-1",
+                phone_number_id="phone-1",
+                business_account_id="business-1",
+                access_token="wa-token-1",
+                status="CONNECTED",
+                embedded_signup_state=None,
+                updated_at=now_value,
+            ),
+            is_blacklisted=True,
+            whatsapp_user=None,
+            conversation=None,
+            known_patient=None,
+            agent_profile=None,
+        )
+    )
+    service, provider, _, _, _, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "out-msg-1"],
+        event_context_loader=event_context_loader,
+    )
+    provider.events = [build_customer_text_event()]
+    service.process_payload({})
+
+    service.process_payload({})
+
+    assert event_context_loader.load_calls == [("phone-1", "wa-user-1")]
+
+
+def test_process_payload_skips_event_when_context_loader_finds_no_connection() -> None:
+    event_context_loader = fake_adapters.FakeWebhookEventContextLoader(None)
+    service, provider, _, _, _, _ = build_webhook_service(
+        ["conversation-1"],
+        event_context_loader=event_context_loader,
+    )
+    provider.events = [build_customer_text_event()]
+
+    result = service.process_payload({})
+
+    assert result.status == "processed"
+    assert len(provider.sent_messages) == 0
+
+
+def test_debounce_scheduler_coalesces_burst_into_single_ai_reply() -> None:
+    debounce_scheduler = fake_adapters.FakeConversationDebounceScheduler()
+    sleep_calls: list[float] = []
+    service, provider, llm_provider, _, processed_repository, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1", "in-msg-2", "out-msg-1"],
+        sleep_seconds=sleep_calls.append,
+        debounce_scheduler=debounce_scheduler,
+        message_debounce_delay_seconds=3,
+    )
+    provider.events = [
+        build_customer_text_event(provider_event_id="evt-1", message_id="wamid-in-1"),
+        build_customer_text_event(provider_event_id="evt-2", message_id="wamid-in-2"),
+    ]
+
+    service.process_payload({})
+
+    assert debounce_scheduler.scheduled_delays == [3, 3]
+    assert debounce_scheduler.pending_count() == 1
+    assert len(provider.sent_messages) == 0
+    assert processed_repository.exists("tenant-1", "evt-1")
+    assert processed_repository.exists("tenant-1", "evt-2")
+
+    debounce_scheduler.fire_all()
+
+    assert sleep_calls == []
+    assert len(provider.sent_messages) == 1
+    assert len(llm_provider.calls) == 1
+
+
+def test_debounce_scheduler_skips_reply_when_conversation_moved_to_human() -> None:
+    debounce_scheduler = fake_adapters.FakeConversationDebounceScheduler()
+    service, provider, _, conversation_repository, _, _ = build_webhook_service(
+        ["conversation-1", "in-msg-1"],
+        debounce_scheduler=debounce_scheduler,
+        message_debounce_delay_seconds=3,
+    )
+    provider.events = [build_customer_text_event()]
+    service.process_payload({})
+
+    conversation = conversation_repository.get_conversation_by_whatsapp_user(
+        "tenant-1", "wa-user-1"
+    )
+    assert conversation is not None
+    conversation.set_control_mode("HUMAN", conversation.updated_at)
+    conversation_repository.save_conversation(conversation)
+
+    debounce_scheduler.fire_all()
+
+    assert len(provider.sent_messages) == 0
+
+
 def test_compute_missing_confirmation_fields_does_not_require_phone_with_whatsapp_id() -> None:
     service, _, _, _, _, _ = build_webhook_service(["conversation-1"])
     request = scheduling_dto.SchedulingRequestSummaryDTO(
@@ -1,3 +1,4 @@
+import collections.abc
 import datetime
 import typing
 
@@ -27,6 +28,24 @@ import src.services.use_cases.webhook_service as webhook_service
 import tests.fakes.fake_adapters as fake_adapters
 
 
+class StreamingFakeLlmProvider(fake_adapters.FakeLlmProvider):
+    def __init__(self, chunks: list[llm_dto.ReplyStreamChunkDTO]) -> None:
+        super().__init__(reply_content="unused")
+        self.chunks = chunks
+        self.stream_events: list[str] = []
+
+    def stream_reply(
+        self, prompt_input: llm_dto.GenerateReplyInputDTO
+    ) -> collections.abc.Generator[llm_dto.ReplyStreamChunkDTO, None, None]:
+        self.calls.append(prompt_input)
+        try:
+            for chunk in self.chunks:
+                self.stream_events.append("chunk_yielded")
+                yield chunk
+        finally:
+            self.stream_events.append("stream_closed")
+
+
 def test_webhook_processes_function_call_and_then_sends_text_reply() -> None:
     store = in_memory_store.InMemoryStore()
     conversation_repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(
@@ -165,6 +184,139 @@ def test_webhook_processes_function_call_and_then_sends_text_reply() -> None:
     ]
 
 
+def test_webhook_streaming_dispatches_function_call_before_stream_ends() -> None:
+    store = in_memory_store.InMemoryStore()
+    conversation_repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(
+        store
+    )
+    connection_repository = (
+        whatsapp_connection_repository_adapter.InMemoryWhatsappConnectionRepositoryAdapter(store)
+    )
+    processed_repository = (
+        processed_webhook_event_repository_adapter.InMemoryProcessedWebhookEventRepositoryAdapter(
+            store
+        )
+    )
+    blacklist_repository = blacklist_repository_adapter.InMemoryBlacklistRepositoryAdapter(store)
+    agent_profile_repository = (
+        agent_profile_repository_adapter.InMemoryAgentProfileRepositoryAdapter(store)
+    )
+    scheduling_repository = scheduling_repository_adapter.InMemorySchedulingRepositoryAdapter(store)
+    patient_repository = patient_repository_adapter.InMemoryPatientRepositoryAdapter(store)
+    calendar_connection_repository = google_calendar_connection_repository_adapter.InMemoryGoogleCalendarConnectionRepositoryAdapter(
+        store
+    )
+
+    now_value = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    connection_repository.save(
+        whatsapp_connection_entity.WhatsappConnection(
+            tenant_id="tenant-1",
+            phone_number_id="phone-1",
+            business_account_id="business-1",
+            access_token="wa-token-1",
+            status="CONNECTED",
+            embedded_signup_state=None,
+            updated_at=now_value,
+        )
+    )
+    calendar_connection_repository.save(
+        google_calendar_connection_entity.GoogleCalendarConnection(
+            tenant_id="tenant-1",
+            professional_user_id="user-1",
+            status="CONNECTED",
+            calendar_id="primary",
+            timezone="America/Bogota",
+            access_token="google-access",
+            refresh_token="google-refresh",
+            token_expires_at=datetime.datetime(2026, 1, 1, 2, 0, tzinfo=datetime.UTC),
+            oauth_state=None,
+            scope="calendar",
+            updated_at=now_value,
+            connected_at=now_value,
+        )
+    )
+    agent_profile_repository.save(
+        agent_profile_entity.AgentProfile(
+            tenant_id="tenant-1",
+            system_prompt="tenant custom prompt",
+            updated_at=now_value,
+        )
+    )
+
+    provider = fake_adapters.FakeWhatsappProvider()
+    llm_provider = StreamingFakeLlmProvider(
+        [
+            llm_dto.ReplyStreamChunkDTO(
+                function_call=llm_dto.FunctionCallDTO(
+                    name="submit_consultation_reason_for_review",
+                    args={
+                        "consultation_reason": "Ansiedad",
+                    },
+                    call_id="call-1",
+                )
+            ),
+            llm_dto.ReplyStreamChunkDTO(text="never consumed"),
+        ]
+    )
+    id_generator = fake_adapters.SequenceIdGenerator(
+        ["conversation-1", "in-msg-1", "req-1", "out-msg-1"]
+    )
+    clock = fake_adapters.FixedClock(now_value)
+    google_provider = fake_adapters.FakeGoogleCalendarProvider()
+    google_service = google_calendar_onboarding_service.GoogleCalendarOnboardingService(
+        google_calendar_connection_repository=calendar_connection_repository,
+        google_calendar_provider=google_provider,
+        id_generator=id_generator,
+        clock=clock,
+    )
+    scheduling_use_case = scheduling_service.SchedulingService(
+        scheduling_repository=scheduling_repository,
+        conversation_repository=conversation_repository,
+        google_calendar_onboarding_service=google_service,
+        id_generator=id_generator,
+        clock=clock,
+    )
+
+    service = webhook_service.WebhookService(
+        whatsapp_connection_repository=connection_repository,
+        conversation_repository=conversation_repository,
+        patient_repository=patient_repository,
+        processed_webhook_event_repository=processed_repository,
+        blacklist_repository=blacklist_repository,
+        agent_profile_repository=agent_profile_repository,
+        scheduling_service=scheduling_use_case,
+        llm_provider=llm_provider,
+        whatsapp_provider=provider,
+        id_generator=id_generator,
+        clock=clock,
+        default_system_prompt="default prompt",
+        context_message_limit=8,
+        stream_llm_replies=True,
+    )
+    provider.events = [
+        webhook_dto.IncomingMessageEventDTO(
+            provider_event_id="evt-1",
+            phone_number_id="phone-1",
+            whatsapp_user_id="wa-user-1",
+            whatsapp_user_name="Jane",
+            message_id="wamid-in-1",
+            message_type="text",
+            source="CUSTOMER",
+            message_text="hola quiero una cita",
+        )
+    ]
+
+    service.process_payload({})
+
+    saved_requests = scheduling_repository.list_requests_by_tenant("tenant-1")
+    assert len(saved_requests) == 1
+    assert saved_requests[0].status == "AWAITING_CONSULTATION_REVIEW"
+    assert len(provider.sent_messages) == 1
+    assert "dame un momento" in provider.sent_messages[0]["text"].lower()
+    assert len(llm_provider.calls) == 1
+    assert llm_provider.stream_events == ["chunk_yielded", "stream_closed"]
+
+
 def test_webhook_recovers_when_reason_tool_is_called_again_after_approval() -> None:
     store = in_memory_store.InMemoryStore()
     conversation_repository = conversation_repository_adapter.InMemoryConversationRepositoryAdapter(